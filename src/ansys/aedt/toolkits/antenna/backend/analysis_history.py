@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from datetime import datetime
+import hashlib
+import json
+from pathlib import Path
+import threading
+
+# Default analysis history, shared by the backend and the CLI
+DEFAULT_HISTORY_FILE = Path.home() / ".ansys" / "antenna_toolkit" / "analysis_history.jsonl"
+
+
+def design_key(antenna, synthesis):
+    """Get the key identifying an antenna design.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna model name.
+    synthesis : dict
+        Synthesis properties.
+
+    Returns
+    -------
+    str
+        Short hash of the antenna model and the synthesis properties.
+    """
+    content = json.dumps({"antenna": antenna, "synthesis": synthesis}, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode(), usedforsecurity=False).hexdigest()[:12]
+
+
+class AnalysisHistory(object):
+    """Stores one record per analysis in a JSON Lines file.
+
+    Each record holds the solver profile and the convergence of an analysis, keyed by the antenna model
+    and its synthesis properties, so that the cost of a new design can be estimated from previous runs.
+
+    Parameters
+    ----------
+    history_file : str or :class:`pathlib.Path`, optional
+        JSON Lines file. The default is ``None``, in which case ``DEFAULT_HISTORY_FILE`` is used.
+    """
+
+    def __init__(self, history_file=None):
+        self.history_file = Path(history_file) if history_file else DEFAULT_HISTORY_FILE
+        self._lock = threading.Lock()
+
+    def add(self, antenna, synthesis, parameters=None, **profile):
+        """Add an analysis record.
+
+        Parameters
+        ----------
+        antenna : str
+            Antenna model name.
+        synthesis : dict
+            Synthesis properties.
+        parameters : dict, optional
+            Synthesized antenna parameters.
+        **profile
+            Solver profile and convergence values.
+
+        Returns
+        -------
+        dict
+            Stored record.
+        """
+        record = {
+            "key": design_key(antenna, synthesis),
+            "antenna": antenna,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "synthesis": synthesis,
+            "parameters": parameters or {},
+        }
+        record.update(profile)
+
+        with self._lock:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.history_file.open("a", encoding="utf-8") as history_handler:
+                history_handler.write(json.dumps(record, default=str) + "\n")
+        return record
+
+    def farfield_directory(self, key):
+        """Get the directory of the stored far field export of a design.
+
+        Parameters
+        ----------
+        key : str
+            Design key.
+
+        Returns
+        -------
+        :class:`pathlib.Path`
+            Directory next to the history file.
+        """
+        return self.history_file.with_name(self.history_file.stem + "_farfields") / key
+
+    def query(self, antenna=None, key=None, limit=None):
+        """Get analysis records, the most recent first.
+
+        Parameters
+        ----------
+        antenna : str, optional
+            Antenna model name. The default is ``None``, in which case all antennas are returned.
+        key : str, optional
+            Design key. The default is ``None``, in which case all designs are returned.
+        limit : int, optional
+            Maximum number of records. The default is ``None``, in which case all records are returned.
+
+        Returns
+        -------
+        list
+            Analysis records.
+        """
+        if not self.history_file.is_file():
+            return []
+
+        records = []
+        with self._lock:
+            with self.history_file.open(encoding="utf-8") as history_handler:
+                for line in history_handler:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Keep the history readable if a write was interrupted
+                        continue
+                    if antenna and record.get("antenna") != antenna:
+                        continue
+                    if key and record.get("key") != key:
+                        continue
+                    records.append(record)
+
+        records.reverse()
+        if limit:
+            records = records[:limit]
+        return records
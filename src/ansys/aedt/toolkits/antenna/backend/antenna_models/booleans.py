@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+class BooleanPlan(object):
+    """Collects the boolean operations of a model builder and applies them at once.
+
+    Consecutive operations of the same type on the same blank are merged, so that a builder that
+    unites or subtracts one tool per loop iteration runs a single ``unite`` or ``subtract`` with all
+    the tools. AEDT then runs one geometry kernel operation and adds one history node instead of one
+    per tool. United objects keep the name of the blank.
+
+    Parameters
+    ----------
+    modeler : :class:`ansys.aedt.core.modeler.modeler_3d.Modeler3D`
+        Modeler of the design.
+    deferred : bool, optional
+        Whether the operations wait for :meth:`apply`. The default is ``True``. When ``False``, each
+        operation is applied when it is added.
+
+    Examples
+    --------
+    >>> plan = BooleanPlan(hfss.modeler)
+    >>> for tooth in teeth:
+    ...     plan.unite(arm, tooth)
+    >>> plan.apply()
+    """
+
+    def __init__(self, modeler, deferred=True):
+        self._modeler = modeler
+        self.deferred = deferred
+        self.operations = []
+
+    def unite(self, blank, tools):
+        """Unite tools to a blank.
+
+        Parameters
+        ----------
+        blank : str or :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d`
+            Object that keeps its name.
+        tools : str, :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d` or list
+            Objects united to the blank.
+        """
+        self._add("unite", blank, tools)
+
+    def subtract(self, blank, tools):
+        """Subtract tools from a blank. The tools are deleted.
+
+        Parameters
+        ----------
+        blank : str or :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d`
+            Object to subtract the tools from.
+        tools : str, :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d` or list
+            Objects subtracted from the blank.
+        """
+        self._add("subtract", blank, tools)
+
+    def _add(self, operation, blank, tools):
+        blank = getattr(blank, "name", blank)
+        if not isinstance(tools, (list, tuple)):
+            tools = [tools]
+        tools = [getattr(tool, "name", tool) for tool in tools]
+        if self.operations and self.operations[-1][0] == operation and self.operations[-1][1] == blank:
+            self.operations[-1][2].extend(tools)
+        else:
+            self.operations.append((operation, blank, tools))
+        if not self.deferred:
+            self.apply()
+
+    def apply(self):
+        """Apply the collected operations, in the order they were added.
+
+        Returns
+        -------
+        int
+            Number of boolean operations run in AEDT.
+        """
+        operations, self.operations = self.operations, []
+        for operation, blank, tools in operations:
+            if operation == "unite":
+                self._modeler.unite([blank] + tools)
+            else:
+                self._modeler.subtract(blank, tools, keep_originals=False)
+        return len(operations)
@@ -32,6 +32,7 @@ from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import TransmissionLine
 from ansys.aedt.toolkits.antenna.backend.antenna_models.patch import CommonPatch
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class BowTieNormal(CommonPatch):
@@ -114,32 +115,22 @@ class BowTieNormal(CommonPatch):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         tl = TransmissionLine()
         eff_permittivity = tl.suspended_strip_calculator(wavelength, wavelength / 80.0, sub_meters, sub_permittivity)
 
         eff_wl_meters = wavelength / math.sqrt(eff_permittivity)
-        eff_wl_working_units = constants.unit_converter(eff_wl_meters, output_units=self.length_unit)
+        eff_wl_working_units = unit_converter(eff_wl_meters, output_units=self.length_unit)
         correction_factor = 0.65
         arm_length = correction_factor * math.sqrt(
             math.pow(eff_wl_working_units / 4.0, 2) - math.pow(eff_wl_working_units / 80.0 / 2.0, 2)
@@ -177,10 +168,7 @@ class BowTieNormal(CommonPatch):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -256,6 +244,7 @@ class BowTieNormal(CommonPatch):
         self.object_list[ant.name] = ant
         self.object_list[ant2.name] = ant2
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [ant2])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
         return True
@@ -352,32 +341,22 @@ class BowTieRounded(CommonPatch):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         tl = TransmissionLine()
         eff_permittivity = tl.suspended_strip_calculator(wavelength, wavelength / 80.0, sub_meters, sub_permittivity)
 
         eff_wl_meters = wavelength / math.sqrt(eff_permittivity)
-        eff_wl_working_units = constants.unit_converter(eff_wl_meters, output_units=self.length_unit)
+        eff_wl_working_units = unit_converter(eff_wl_meters, output_units=self.length_unit)
         correction_factor = 0.58
         arm_length = round(
             correction_factor
@@ -419,10 +398,7 @@ class BowTieRounded(CommonPatch):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -501,6 +477,7 @@ class BowTieRounded(CommonPatch):
         self.object_list[ant.name] = ant
         self.object_list[ant2.name] = ant2
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [ant2])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
         return True
@@ -597,32 +574,22 @@ class BowTieSlot(CommonPatch):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         tl = TransmissionLine()
         eff_permittivity = tl.suspended_strip_calculator(wavelength, wavelength / 80.0, sub_meters, sub_permittivity)
 
         eff_wl_meters = wavelength / math.sqrt(eff_permittivity)
-        eff_wl_working_units = constants.unit_converter(eff_wl_meters, output_units=self.length_unit)
+        eff_wl_working_units = unit_converter(eff_wl_meters, output_units=self.length_unit)
         correction_factor = 1.275
         arm_length = round(
             correction_factor
@@ -664,10 +631,7 @@ class BowTieSlot(CommonPatch):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -799,6 +763,7 @@ class BowTieSlot(CommonPatch):
         self.object_list[slot.name] = slot
         self.object_list[ref.name] = ref
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [ref])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
         return True
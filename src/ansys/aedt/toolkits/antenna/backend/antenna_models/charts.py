@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import bisect
+
+import numpy as np
+
+
+class DesignChart(object):
+    """Design curve tabulated at sorted abscissas.
+
+    The tabulated points are stored once as NumPy arrays. Values between the points are interpolated and
+    values outside the chart are clamped to its end points, as when reading a printed design chart.
+
+    Parameters
+    ----------
+    x : list or :class:`numpy.ndarray`
+        Abscissas of the tabulated points. They are sorted when the chart is created.
+    y : list or :class:`numpy.ndarray`
+        Ordinates of the tabulated points. A two-dimensional array tabulates one curve per column.
+    method : str, optional
+        Interpolation method, ``"linear"`` or ``"spline"`` for a natural cubic spline.
+        The default is ``"linear"``.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.antenna.backend.antenna_models.charts import DesignChart
+    >>> chart = DesignChart([1.0, 2.0, 3.0], [10.0, 20.0, 40.0])
+    >>> chart(2.5)
+    30.0
+    """
+
+    def __init__(self, x, y, method="linear"):
+        if method not in ("linear", "spline"):
+            raise ValueError("Interpolation method must be 'linear' or 'spline'.")
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.ndim != 1 or len(x) < 2 or len(y) != len(x):
+            raise ValueError("A design chart needs at least two points with one ordinate per abscissa.")
+        order = np.argsort(x, kind="stable")
+        self.x = x[order]
+        self.y = y[order]
+        if np.any(np.diff(self.x) <= 0.0):
+            raise ValueError("Design chart abscissas must be unique.")
+        self.method = method
+        self._curvatures = self._spline_curvatures() if method == "spline" else np.zeros_like(self.y)
+
+    def _spline_curvatures(self):
+        """Get the second derivatives of the natural cubic spline at the tabulated points."""
+        h = np.diff(self.x)
+        slopes = np.diff(self.y, axis=0) / (h if self.y.ndim == 1 else h[:, None])
+        curvatures = np.zeros_like(self.y)
+        if len(self.x) > 2:
+            system = np.diag(2.0 * (h[:-1] + h[1:])) + np.diag(h[1:-1], 1) + np.diag(h[1:-1], -1)
+            curvatures[1:-1] = np.linalg.solve(system, 6.0 * np.diff(slopes, axis=0))
+        return curvatures
+
+    def __call__(self, values):
+        """Interpolate the chart.
+
+        Parameters
+        ----------
+        values : float, list or :class:`numpy.ndarray`
+            Abscissas to read the chart at.
+
+        Returns
+        -------
+        float or :class:`numpy.ndarray`
+            Interpolated ordinates. A float is returned for a scalar abscissa of a single curve.
+        """
+        values = np.asarray(values, dtype=float)
+        clamped = np.clip(values, self.x[0], self.x[-1])
+        index = np.clip(np.searchsorted(self.x, clamped, side="right") - 1, 0, len(self.x) - 2)
+        width = self.x[index + 1] - self.x[index]
+        right = (clamped - self.x[index]) / width
+        left = 1.0 - right
+        bend = width**2 / 6.0
+        if self.y.ndim == 2:
+            left, right, bend = left[..., None], right[..., None], bend[..., None]
+        result = left * self.y[index] + right * self.y[index + 1]
+        if self.method == "spline":
+            result = (
+                result
+                + ((left**3 - left) * self._curvatures[index] + (right**3 - right) * self._curvatures[index + 1]) * bend
+            )
+        if result.ndim == 0:
+            return float(result)
+        return result
+
+
+class BandChart(object):
+    """Table of entries selected by the band that contains a value.
+
+    The band edges are sorted once and bands are found by bisection, so selecting a design for a whole
+    array of values does not scan the table for every value.
+
+    Parameters
+    ----------
+    edges : list or :class:`numpy.ndarray`
+        Band edge of every entry.
+    entries : list or :class:`numpy.ndarray`
+        Entries of the chart, in the order of ``edges``.
+    side : str, optional
+        ``"lower"`` when the edges are the lower limits of the bands, so that a value selects the entry with
+        the greatest edge lower than or equal to it. ``"upper"`` when the edges are the upper limits of the
+        bands, so that a value selects the entry with the smallest edge greater than or equal to it.
+        Values outside the chart select the first or the last entry. The default is ``"lower"``.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.antenna.backend.antenna_models.charts import BandChart
+    >>> chart = BandChart([0.0, 1.0, 2.0], ["low", "mid", "high"])
+    >>> chart.select([0.5, 1.5, 9.0])
+    ['low', 'mid', 'high']
+    """
+
+    def __init__(self, edges, entries, side="lower"):
+        if side not in ("lower", "upper"):
+            raise ValueError("Band edge side must be 'lower' or 'upper'.")
+        if not len(edges) or len(edges) != len(entries):
+            raise ValueError("A band chart needs one edge per entry.")
+        order = np.argsort(np.asarray(edges, dtype=float), kind="stable")
+        self._edges = np.asarray(edges, dtype=float)[order]
+        self.edges = self._edges.tolist()
+        if isinstance(entries, np.ndarray):
+            self.entries = entries[order]
+        else:
+            self.entries = [entries[index] for index in order]
+        self.side = side
+
+    def index(self, values):
+        """Get the index of the band of the values.
+
+        Parameters
+        ----------
+        values : float, list or :class:`numpy.ndarray`
+            Values to locate.
+
+        Returns
+        -------
+        int or :class:`numpy.ndarray`
+            Index of the selected entry of every value.
+        """
+        last = len(self.edges) - 1
+        if np.ndim(values) == 0:
+            if self.side == "lower":
+                index = bisect.bisect_right(self.edges, float(values)) - 1
+            else:
+                index = bisect.bisect_left(self.edges, float(values))
+            return min(max(index, 0), last)
+        values = np.asarray(values, dtype=float)
+        if self.side == "lower":
+            index = np.searchsorted(self._edges, values, side="right") - 1
+        else:
+            index = np.searchsorted(self._edges, values, side="left")
+        return np.clip(index, 0, last)
+
+    def select(self, values):
+        """Select the entries of the bands of the values.
+
+        Parameters
+        ----------
+        values : float, list or :class:`numpy.ndarray`
+            Values to locate.
+
+        Returns
+        -------
+        object, list or :class:`numpy.ndarray`
+            Entry of a scalar value. Entries of an array of values, in a NumPy array when the entries
+            are stored in a NumPy array, or in a list otherwise.
+        """
+        index = self.index(values)
+        if isinstance(index, int) or isinstance(self.entries, np.ndarray):
+            return self.entries[index]
+        return [self.entries[item] for item in index.tolist()]
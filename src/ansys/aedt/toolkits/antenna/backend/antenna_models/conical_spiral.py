@@ -28,8 +28,135 @@ import math
 import ansys.aedt.core.generic.constants as constants
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
+import numpy as np
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+
+
+def _polar_points(radius, angle):
+    """Get the points at polar coordinates on the XY plane as an (N, 3) array."""
+    radius, angle = np.broadcast_arrays(np.asarray(radius, dtype=float), np.asarray(angle, dtype=float))
+    return np.column_stack([radius * np.cos(angle), radius * np.sin(angle), np.zeros(radius.shape)])
+
+
+def archimedean_arm(phi, inner_radius, expansion_coefficient, exponent):
+    """Get the points of an Archimedean spiral arm edge, ``r = inner_radius + expansion_coefficient * phi**exponent``.
+
+    Parameters
+    ----------
+    phi : :class:`numpy.ndarray`
+        Spiral angles in radians.
+    inner_radius : float
+        Radius at ``phi = 0``.
+    expansion_coefficient : float
+        Radius growth.
+    exponent : float
+        Exponent of the angle.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        (N, 3) array of points.
+    """
+    phi = np.asarray(phi, dtype=float)
+    return _polar_points(inner_radius + expansion_coefficient * np.power(phi, exponent), phi)
+
+
+def log_arm(phi, inner_radius, growth):
+    """Get the points of a logarithmic spiral arm edge, ``r = inner_radius * exp(growth * phi)``.
+
+    Parameters
+    ----------
+    phi : :class:`numpy.ndarray`
+        Spiral angles in radians.
+    inner_radius : float
+        Radius at ``phi = 0``.
+    growth : float
+        Growth of the logarithm of the radius per radian.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        (N, 3) array of points.
+    """
+    phi = np.asarray(phi, dtype=float)
+    return _polar_points(inner_radius * np.exp(growth * phi), phi)
+
+
+def sinuous_arm(radius, outer_radius, growth_rate, cells, alpha, delta, rotation=0.0):
+    """Get the points of a sinuous arm edge.
+
+    The cells are bounded by the radii ``outer_radius * growth_rate**i``. Inside each cell, the arm
+    swings by ``alpha`` around the angle ``delta + rotation``, in alternate directions.
+
+    Parameters
+    ----------
+    radius : :class:`numpy.ndarray`
+        Radii of the points.
+    outer_radius : float
+        Outer radius of the arm.
+    growth_rate : float
+        Ratio between consecutive cell radii.
+    cells : int
+        Number of cells.
+    alpha : float
+        Angular width of the swing in radians.
+    delta : float
+        Angular offset of the edge in radians.
+    rotation : float, optional
+        Rotation of the arm in radians. The default is ``0.0``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        (N, 3) array of points.
+    """
+    radius = np.asarray(radius, dtype=float)
+    cell_position = np.log(radius / outer_radius) / math.log(growth_rate)
+    cell = np.clip(np.floor(cell_position), 0, max(cells - 2, 0))
+    angle = (-1.0) ** (cell + 1) * alpha * np.sin((cell_position - cell) * math.pi) + delta + rotation
+    return _polar_points(radius, angle)
+
+
+def circular_arc(angle, radius):
+    """Get the points of a circular arc centered at the origin.
+
+    Parameters
+    ----------
+    angle : :class:`numpy.ndarray`
+        Angles in radians.
+    radius : float
+        Radius of the arc.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        (N, 3) array of points.
+    """
+    return _polar_points(radius, angle)
+
+
+def _arm_polygon(edge, tip, angle):
+    """Get the closed polygon of a flat arm bounded by an edge and the same edge rotated by an angle.
+
+    Parameters
+    ----------
+    edge : :class:`numpy.ndarray`
+        (N, 3) array of the edge points, from the feed to the tip of the arm.
+    tip : :class:`numpy.ndarray`
+        (N, 3) array of the tip points, from the end of the edge to the end of the rotated edge.
+    angle : float
+        Rotation angle in radians around the Z axis.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        (N, 3) array of the polygon points, the first point is repeated at the end.
+    """
+    cos, sin = math.cos(angle), math.sin(angle)
+    rotation = np.array([[cos, -sin, 0.0], [sin, cos, 0.0], [0.0, 0.0, 1.0]])
+    return np.vstack([edge, tip[1:-1], (edge @ rotation.T)[::-1], edge[:1]])
 
 
 class CommonConicalSpiral(CommonAntenna):
@@ -51,11 +178,7 @@ class CommonConicalSpiral(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 if value != self.material and self.object_list:
@@ -207,8 +330,8 @@ class Archimedean(CommonConicalSpiral):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        stop_freq_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        stop_freq_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
 
         expansion_coefficient = 1.0
         offset_angle = 90.0
@@ -218,12 +341,12 @@ class Archimedean(CommonConicalSpiral):
         port_extension = 0.1
 
         outer_rad_calc = light_speed / (2 * math.pi * start_freq_hz)
-        outer_rad_calc = constants.unit_converter(outer_rad_calc, "Length", "meter", self.length_unit)
-        outer_rad_calc_cm = constants.unit_converter(outer_rad_calc, "Length", self.length_unit, "cm")
+        outer_rad_calc = unit_converter(outer_rad_calc, "Length", "meter", self.length_unit)
+        outer_rad_calc_cm = unit_converter(outer_rad_calc, "Length", self.length_unit, "cm")
         inner_rad_calc = light_speed / (2 * math.pi * stop_freq_hz)
-        inner_rad = constants.unit_converter(inner_rad_calc, "Length", "meter", self.length_unit)
-        inner_rad_cm = constants.unit_converter(inner_rad, "Length", self.length_unit, "cm")
-        port_extension = constants.unit_converter(port_extension, "Length", "cm", self.length_unit)
+        inner_rad = unit_converter(inner_rad_calc, "Length", "meter", self.length_unit)
+        inner_rad_cm = unit_converter(inner_rad, "Length", self.length_unit, "cm")
+        port_extension = unit_converter(port_extension, "Length", "cm", self.length_unit)
 
         parameters["expansion_coefficient"] = expansion_coefficient
         parameters["offset_angle"] = offset_angle
@@ -255,10 +378,7 @@ class Archimedean(CommonConicalSpiral):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -295,11 +415,10 @@ class Archimedean(CommonConicalSpiral):
         turns_adj = turns_number + 1.0 / n_per_turn
         max_phi_rad = math.radians(360.0 * turns_adj)
         step = max_phi_rad / n
-
-        phi = [i * step for i in range(n)]
+        phi_end = step * (n - 1)
 
         # Outer radius at end of spiral (needed for conical operations)
-        r_max = inner_rad + a * math.pow(phi[n - 1], sc)
+        r_max = inner_rad + a * math.pow(phi_end, sc)
 
         # ---------------------------------------------------------------
         # Port1: closed polygon at inner_rad, z=cone_height (built at origin)
@@ -331,36 +450,24 @@ class Archimedean(CommonConicalSpiral):
 
         # Build the closed flat arm polygon at origin
         outer_facets = max(1, int(n_per_turn / 4))
-        num_points = int(2 * n + outer_facets)
-        num_segments = num_points - 1
-
-        positions = [None] * num_points
-
-        for i in range(n):
-            # Outer edge of arm (curve 1)
-            r = inner_rad + a * math.pow(phi[i], sc)
-            positions[i] = [r * math.cos(phi[i]), r * math.sin(phi[i]), 0]
-            # Inner edge of arm (curve 2, reversed, offset by 'offset')
-            j = n - i - 1
-            r2 = inner_rad + a * math.pow(phi[j], sc)
-            positions[i + n + outer_facets - 1] = [
-                r2 * math.cos(phi[j] + offset),
-                r2 * math.sin(phi[j] + offset),
-                0,
-            ]
 
-        # Outer tip facets connecting outer curve end to inner curve start
-        outer_facet_angle_step = offset / outer_facets
-        r_outer = inner_rad + a * math.pow(phi[n - 1], sc)
-        for k in range(1, outer_facets):
-            angle = phi[n - 1] + outer_facet_angle_step * k
-            positions[n + k - 1] = [r_outer * math.cos(angle), r_outer * math.sin(angle), 0]
+        def spiral(phi):
+            return archimedean_arm(phi, inner_rad, a, sc)
 
-        # Close the polygon (repeat first point)
-        positions[num_segments] = list(positions[0])
+        def tip(angle):
+            return circular_arc(angle, r_max)
 
+        # Outer edge of arm (curve 1), the inner edge (curve 2) is the outer edge rotated by 'offset'
+        edge = self._sample_curve(
+            "arm_edge", spiral, 0.0, phi_end, n - 1, initial_segments=max(8, int(8 * turns_adj))
+        ).points
+        # Outer tip facets connecting outer curve end to inner curve start
+        tip_facets = self._sample_curve(
+            "arm_tip", tip, phi_end, phi_end + offset, outer_facets, initial_segments=2
+        ).points
+        positions = _arm_polygon(edge, tip_facets, offset)
         arm1 = self._app.modeler.create_polyline(
-            points=positions,
+            points=positions.tolist(),
             cover_surface=True,
             close_surface=True,
             name="ant_AntennaArm1_base_" + antenna_name,
@@ -399,8 +506,8 @@ class Archimedean(CommonConicalSpiral):
             actual_cone_h = cone_height * r_max / (r_max - inner_rad)
             face_z = eps
             face_r = (actual_cone_h - eps) / actual_cone_h * r_max
-            face_x = face_r * math.cos(phi[n - 1])
-            face_y = face_r * math.sin(phi[n - 1])
+            face_x = face_r * math.cos(phi_end)
+            face_y = face_r * math.sin(phi_end)
 
             face_id = self._app.modeler.get_faceid_from_position([face_x, face_y, face_z], arm1.name, self.length_unit)
 
@@ -456,6 +563,9 @@ class Archimedean(CommonConicalSpiral):
 
         port1.group_name = antenna_name
         self.object_list[port1.name] = port1
+        if arms_number % 2 == 0:
+            # The port bridges the first arm and the opposite one
+            self._declare_port(port1, ["ant_AntennaArm{}_{}".format(arms_number // 2 + 1, antenna_name)])
 
         # Move all objects to final position
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
@@ -555,8 +665,8 @@ class Log(CommonConicalSpiral):
             Analytical parameters.
         """
         parameters = {}
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        stop_freq_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        stop_freq_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
         scale_factor = 1.1
         turns_number = 2
         offset_angle = 90.0
@@ -565,9 +675,9 @@ class Log(CommonConicalSpiral):
         arms = 2
 
         outer_rad_calc = scale_factor * 3e10 / (2 * math.pi * start_freq_hz)
-        outer_rad_calc = constants.unit_converter(outer_rad_calc, "Length", "cm", self.length_unit)
+        outer_rad_calc = unit_converter(outer_rad_calc, "Length", "cm", self.length_unit)
         inner_rad_calc = scale_factor * 3e10 / (2 * math.pi * stop_freq_hz)
-        inner_rad = constants.unit_converter(inner_rad_calc, "Length", "cm", self.length_unit)
+        inner_rad = unit_converter(inner_rad_calc, "Length", "cm", self.length_unit)
         expansion_coefficient = round(math.pow(outer_rad_calc / inner_rad, 1.0 / turns_number), 2)
 
         parameters["expansion_coefficient"] = expansion_coefficient
@@ -599,10 +709,7 @@ class Log(CommonConicalSpiral):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -640,11 +747,10 @@ class Log(CommonConicalSpiral):
         turns_adj = turns_number + 1.0 / n_per_turn
         max_phi_rad = math.radians(360.0 * turns_adj)
         step = max_phi_rad / n
-
-        phi = [i * step for i in range(n)]
+        phi_end = step * (n - 1)
 
         # Outer radius at end of spiral (needed for conical operations)
-        r_max = inner_rad * math.exp(a * phi[n - 1])
+        r_max = inner_rad * math.exp(a * phi_end)
 
         # Port1: closed polygon at inner_rad, z=cone_height (built at origin)
         port_pts = [
@@ -677,36 +783,25 @@ class Log(CommonConicalSpiral):
         outer_facets = max(1, int(n_per_turn / 4))
         if outer_facets % 2 != 0:
             outer_facets += 1
-        num_points = int(2 * n + outer_facets)
-        num_segments = num_points - 1
-
-        positions = [None] * num_points
-
-        for i in range(n):
-            # Outer edge of arm (curve 1)
-            r = inner_rad * math.exp(a * phi[i])
-            positions[i] = [r * math.cos(phi[i]), r * math.sin(phi[i]), 0]
-            # Inner edge of arm (curve 2, reversed, offset by 'offset')
-            j = n - i - 1
-            r2 = inner_rad * math.exp(a * phi[j])
-            positions[i + n + outer_facets - 1] = [
-                r2 * math.cos(phi[j] + offset),
-                r2 * math.sin(phi[j] + offset),
-                0,
-            ]
 
-        # Outer tip facets connecting outer curve end to inner curve start
-        outer_facet_angle_step = offset / outer_facets
-        r_outer = inner_rad * math.exp(a * phi[n - 1])
-        for k in range(1, outer_facets):
-            angle = phi[n - 1] + outer_facet_angle_step * k
-            positions[n + k - 1] = [r_outer * math.cos(angle), r_outer * math.sin(angle), 0]
+        def spiral(phi):
+            return log_arm(phi, inner_rad, a)
 
-        # Close the polygon (repeat first point)
-        positions[num_segments] = list(positions[0])
+        def tip(angle):
+            return circular_arc(angle, r_max)
+
+        # Outer edge of arm (curve 1), the inner edge (curve 2) is the outer edge rotated by 'offset'
+        edge = self._sample_curve(
+            "arm_edge", spiral, 0.0, phi_end, n - 1, initial_segments=max(8, int(8 * turns_adj))
+        ).points
+        # Outer tip facets connecting outer curve end to inner curve start
+        tip_facets = self._sample_curve(
+            "arm_tip", tip, phi_end, phi_end + offset, outer_facets, initial_segments=2
+        ).points
+        positions = _arm_polygon(edge, tip_facets, offset)
 
         arm1 = self._app.modeler.create_polyline(
-            points=positions,
+            points=positions.tolist(),
             cover_surface=True,
             close_surface=True,
             name="ant_AntennaArm1_base_" + antenna_name,
@@ -745,8 +840,8 @@ class Log(CommonConicalSpiral):
             actual_cone_h = cone_height * r_max / (r_max - inner_rad)
             face_z = eps
             face_r = (actual_cone_h - eps) / actual_cone_h * r_max
-            face_x = face_r * math.cos(phi[n - 1])
-            face_y = face_r * math.sin(phi[n - 1])
+            face_x = face_r * math.cos(phi_end)
+            face_y = face_r * math.sin(phi_end)
 
             face_id = self._app.modeler.get_faceid_from_position([face_x, face_y, face_z], arm1.name, self.length_unit)
             if not face_id:
@@ -797,6 +892,9 @@ class Log(CommonConicalSpiral):
 
         port1.group_name = antenna_name
         self.object_list[port1.name] = port1
+        if arms_number % 2 == 0:
+            # The port bridges the first arm and the opposite one
+            self._declare_port(port1, ["ant_AntennaArm{}_{}".format(arms_number // 2 + 1, antenna_name)])
 
         # Move all objects to final position
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
@@ -897,8 +995,8 @@ class Sinuous(CommonConicalSpiral):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        stop_freq_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        stop_freq_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
 
         scale_factor = 1.25
         cell_number = 8
@@ -911,7 +1009,7 @@ class Sinuous(CommonConicalSpiral):
         outer_rad_calc = (
             scale_factor * light_speed / start_freq_hz / 4.0 / (math.radians(alpha_angle) + math.radians(delta_angle))
         )
-        outer_rad = constants.unit_converter(outer_rad_calc, "Length", "meter", self.length_unit)
+        outer_rad = unit_converter(outer_rad_calc, "Length", "meter", self.length_unit)
         inner_rad_calc = (
             scale_factor
             * light_speed
@@ -920,8 +1018,8 @@ class Sinuous(CommonConicalSpiral):
             / 2.0
             / (math.radians(alpha_angle) + math.radians(delta_angle))
         )
-        inner_rad = constants.unit_converter(inner_rad_calc, "Length", "meter", self.length_unit)
-        port_extension = constants.unit_converter(port_extension, "Length", "cm", self.length_unit)
+        inner_rad = unit_converter(inner_rad_calc, "Length", "meter", self.length_unit)
+        port_extension = unit_converter(port_extension, "Length", "cm", self.length_unit)
 
         parameters["alpha_angle"] = alpha_angle
         parameters["delta_angle"] = delta_angle
@@ -953,10 +1051,7 @@ class Sinuous(CommonConicalSpiral):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -985,85 +1080,44 @@ class Sinuous(CommonConicalSpiral):
         delta_rad = math.radians(delta_deg)
         rotation = 0.0
         t = growth_rate  # T (grow rate)
-        r = outer_rad  # R (current radius, decremented)
 
         step_size = outer_rad / n_points
 
-        # Build RP array: RP[i] = outer_rad * T^i
-        rp = [0.0] * (cells + 1)
-        rp[0] = outer_rad
-        last_i = 0
-        for i in range(1, cells):
-            rp[i] = rp[i - 1] * t
-            last_i = i
-        min_rp = rp[last_i]
-        rp[cells] = min_rp
-
-        # Build phi1, phi2 and rad arrays
-        phi1 = [0.0] * n_points
-        phi2 = [0.0] * n_points
-        rad = [0.0] * n_points
-        q = 0
-
-        for i in range(cells):
-            p = i + 1
-            while r <= rp[i] and r >= rp[i + 1]:
-                phi1[q] = (
-                    ((-1.0) ** p) * alpha_rad * math.sin(math.log(r / rp[i]) / math.log(t) * math.pi)
-                    + delta_rad
-                    + rotation
-                )
-                phi2[q] = (
-                    ((-1.0) ** p) * alpha_rad * math.sin(math.log(r / rp[i]) / math.log(t) * math.pi)
-                    - delta_rad
-                    + rotation
-                )
-                r -= step_size
-                q += 1
-
-        max_phi = q  # actual number of points used
-        rad[0] = outer_rad
-        for i in range(1, max_phi):
-            rad[i] = rad[i - 1] - step_size
-
-        inner_rad = rad[max_phi - 1]
-
-        # Build arm polygon (NoOfPoints = 2*max_phi + OuterFacets)
+        # Cell boundaries RP[i] = outer_rad * T^i, the arm ends at the last radius step above the innermost one
+        boundaries = outer_rad * np.power(t, np.arange(1, cells - 1))
+        min_rp = outer_rad * math.pow(t, max(cells - 1, 0))
+        max_phi = int(math.floor((outer_rad - min_rp) / step_size + 1e-9)) + 1
+        inner_rad = outer_rad - (max_phi - 1) * step_size
+
+        def sinuous(radius):
+            return sinuous_arm(radius, outer_rad, t, cells, alpha_rad, delta_rad, rotation)
+
+        def tip(angle):
+            return circular_arc(angle, outer_rad)
+
+        # Edge of arm (curve 1) from the feed to the tip, the other edge (curve 2) is rotated by -2*delta
+        edge = self._sample_curve(
+            "arm_edge",
+            sinuous,
+            inner_rad,
+            outer_rad,
+            max_phi - 1,
+            initial_segments=8 * cells,
+            breaks=boundaries,
+        ).points
+        # Outer facets connecting both edges at the outer radius
         outer_facets = 100
-        num_points = 2 * max_phi + outer_facets
-        num_segments = num_points - 1
-
-        positions = [None] * num_points
-
-        for i in range(max_phi):
-            positions[i] = [
-                rad[i] * math.cos(phi1[i]),
-                rad[i] * math.sin(phi1[i]),
-                0,
-            ]
-
-        for i in range(1, max_phi + 1):
-            idx = max_phi - i
-            positions[i + max_phi - 1] = [
-                rad[idx] * math.cos(phi2[idx]),
-                rad[idx] * math.sin(phi2[idx]),
-                0,
-            ]
-
-        outer_facet_angle_step = delta_rad / outer_facets * 2.0
-        for i in range(max_phi * 2, num_segments):
-            step_num = i - max_phi * 2 + 1
-            positions[i] = [
-                outer_rad * math.cos(rotation - delta_rad + outer_facet_angle_step * step_num),
-                outer_rad * math.sin(rotation - delta_rad + outer_facet_angle_step * step_num),
-                0,
-            ]
+        tip_facets = self._sample_curve(
+            "arm_tip", tip, rotation + delta_rad, rotation - delta_rad, outer_facets, initial_segments=2
+        ).points
+        positions = _arm_polygon(edge, tip_facets, -2.0 * delta_rad)
 
-        # Close polygon
-        positions[num_segments] = list(positions[0])
+        # Inner ends of both edges, the feed gap is between them
+        feed_angle = math.atan2(edge[0][1], edge[0][0])
+        feed_x, feed_y = ((positions[0, :2] + positions[-2, :2]) / 2.0).tolist()
 
         arm1 = self._app.modeler.create_polyline(
-            points=positions,
+            points=positions.tolist(),
             cover_surface=True,
             close_surface=True,
             name="ant_AntennaArm1_base_" + antenna_name,
@@ -1101,8 +1155,8 @@ class Sinuous(CommonConicalSpiral):
             actual_cone_h = cone_height * outer_rad / (outer_rad - inner_rad)
             face_z = eps
             face_r = (actual_cone_h - eps) / actual_cone_h * outer_rad
-            face_x = face_r * math.cos(phi1[max_phi - 1])
-            face_y = face_r * math.sin(phi1[max_phi - 1])
+            face_x = face_r * math.cos(feed_angle)
+            face_y = face_r * math.sin(feed_angle)
 
             face_id = self._app.modeler.get_faceid_from_position([face_x, face_y, face_z], arm1.name, self.length_unit)
             if not face_id:
@@ -1111,10 +1165,10 @@ class Sinuous(CommonConicalSpiral):
 
             arm_sheet = self._app.modeler.create_object_from_face(face_id)
 
-            # Top face: midpoint between positions[max_phi-1] and positions[max_phi]
+            # Top face: midpoint between the inner ends of both edges
             top_z = cone_height
-            top_x = (positions[max_phi - 1][0] + positions[max_phi][0]) / 2.0 + eps
-            top_y = (positions[max_phi - 1][1] + positions[max_phi][1]) / 2.0 + eps
+            top_x = feed_x + eps
+            top_y = feed_y + eps
             top_face_id = self._app.modeler.get_faceid_from_position([top_x, top_y, top_z], arm1.name, self.length_unit)
             top_sheet = self._app.modeler.create_object_from_face(top_face_id)
 
@@ -1150,8 +1204,8 @@ class Sinuous(CommonConicalSpiral):
                 self.object_list[new_name] = dup_obj
 
         # Port positions: inner gap midpoint of arm1 at origin
-        mid_dx = (positions[max_phi - 1][0] + positions[max_phi][0]) / 2.0
-        mid_dy = (positions[max_phi - 1][1] + positions[max_phi][1]) / 2.0
+        mid_dx = feed_x
+        mid_dy = feed_y
         mid_z = cone_height
 
         angle_step_rad = math.radians(360.0 / arms_number)
@@ -1172,6 +1226,7 @@ class Sinuous(CommonConicalSpiral):
             obj_edge1.color = (255, 0, 0)
             obj_edge1.group_name = antenna_name
             self.object_list[obj_edge1.name] = obj_edge1
+            self._declare_port(obj_edge1, [arm3_name])
         else:
             port1_pts = [
                 [mid_dx, mid_dy, mid_z],
@@ -1186,6 +1241,7 @@ class Sinuous(CommonConicalSpiral):
             port1.color = (255, 0, 0)
             port1.group_name = antenna_name
             self.object_list[port1.name] = port1
+            self._declare_port(port1, [arm3_name])
 
         if arms_number == 4:
             # Port 2: arm2 (index 1) and arm4 (index 3) — opposite pair, rotated 90 and 270 deg
@@ -1232,6 +1288,7 @@ class Sinuous(CommonConicalSpiral):
                     obj_edge2a.color = (255, 0, 0)
                     obj_edge2a.group_name = antenna_name
                     self.object_list[obj_edge2a.name] = obj_edge2a
+                    self._declare_port(obj_edge2a, [obj_edge4])
                 else:
                     port2_pts = [
                         [mid2_dx, mid2_dy, mid_z + port_ext],
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import re
+
+import numpy as np
+
+# Curve parameter of the AEDT equation-based curves, not matched inside variable names
+_PARAMETER_RE = re.compile(r"(?<![\w.])_t(?![\w])")
+
+
+class ParametricCurve(object):
+    """Planar curve defined by one expression per coordinate of the curve parameter ``_t``.
+
+    The curve is drawn as a single AEDT equation-based curve, so that AEDT evaluates five expressions
+    when a design variable changes instead of one expression per coordinate of every polyline vertex.
+    It can also be sampled into polyline vertices for the fallback polygons.
+
+    Parameters
+    ----------
+    x_t : str
+        Expression of the X coordinate.
+    y_t : str
+        Expression of the Y coordinate.
+    z_t : str
+        Expression of the Z coordinate.
+    t_start : str or float
+        Start value of ``_t``.
+    t_end : str or float
+        End value of ``_t``.
+    reverse : bool, optional
+        Whether the curve is traversed from ``t_end`` to ``t_start`` when it bounds a sheet.
+        The default is ``False``.
+    """
+
+    def __init__(self, x_t, y_t, z_t, t_start, t_end, reverse=False):
+        self.functions = [str(x_t), str(y_t), str(z_t)]
+        self.t_start = t_start
+        self.t_end = t_end
+        self.reverse = reverse
+
+    def point(self, t):
+        """Point expressions at a parameter value.
+
+        Parameters
+        ----------
+        t : str or float
+            Parameter value or expression.
+
+        Returns
+        -------
+        list
+            Coordinate expressions.
+        """
+        return [_PARAMETER_RE.sub(lambda _: "({})".format(t), function) for function in self.functions]
+
+    @property
+    def start(self):
+        """First point in the traversal direction."""
+        return self.point(self.t_end if self.reverse else self.t_start)
+
+    @property
+    def end(self):
+        """Last point in the traversal direction."""
+        return self.point(self.t_start if self.reverse else self.t_end)
+
+    def points(self, segments):
+        """Sample the curve into polyline vertices.
+
+        Parameters
+        ----------
+        segments : int or list
+            Number of segments evenly spaced in ``_t``, or fractions of the ``_t`` range from ``0`` to ``1``
+            of each vertex.
+
+        Returns
+        -------
+        list
+            Points in the traversal direction.
+        """
+        if isinstance(segments, int):
+            fractions = [f"{index}/{segments}" for index in range(segments + 1)]
+        else:
+            fractions = [repr(round(float(fraction), 9)) for fraction in segments]
+        if self.reverse:
+            fractions.reverse()
+        return [self.point(f"({self.t_start})+(({self.t_end})-({self.t_start}))*{fraction}") for fraction in fractions]
+
+    def create(self, modeler, name=None, num_points=0):
+        """Create the equation-based curve.
+
+        Parameters
+        ----------
+        modeler : :class:`ansys.aedt.core.modeler.modeler_3d.Modeler3D`
+            Modeler of the design.
+        name : str, optional
+            Curve name. The default is ``None``.
+        num_points : int, optional
+            Number of vertices of a segmented curve. The default is ``0``, in which case the
+            curve is smooth.
+
+        Returns
+        -------
+        :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d` or bool
+            Curve object, ``False`` when it is not created.
+        """
+        x_t, y_t, z_t = self.functions
+        return modeler.create_equationbased_curve(
+            x_t=x_t,
+            y_t=y_t,
+            z_t=z_t,
+            t_start=self.t_start,
+            t_end=self.t_end,
+            num_points=num_points,
+            name=name,
+        )
+
+
+def _vertex_count(segments):
+    return segments + 1 if isinstance(segments, int) else len(segments)
+
+
+def _set_coordinate_system(app, obj, operation, coordinate_system):
+    app.set_oo_property_value(
+        aedt_object=app.get_oo_object(app.oeditor, obj.name),
+        object_name=operation,
+        prop_name="Coordinate System",
+        value=coordinate_system,
+    )
+
+
+def polygon_points(boundary, segments):
+    """Get the vertices of a sheet boundary, with its curves sampled into polyline vertices.
+
+    Parameters
+    ----------
+    boundary : list
+        :class:`ParametricCurve` objects and points, in boundary order.
+    segments : int or list
+        Number of segments of each curve, or fractions of the parameter range of each vertex.
+
+    Returns
+    -------
+    list
+        Vertex expressions.
+    """
+    points = []
+    for item in boundary:
+        if isinstance(item, ParametricCurve):
+            points.extend(item.points(segments))
+        else:
+            points.append(item)
+    return points
+
+
+def create_polygon(app, name, boundary, coordinate_system, segments):
+    """Create a covered polygon from a sheet boundary, sampling its curves into vertices.
+
+    Parameters
+    ----------
+    app : :class:`ansys.aedt.core.Hfss`
+        HFSS application.
+    name : str
+        Sheet name.
+    boundary : list
+        :class:`ParametricCurve` objects and points, in boundary order.
+    coordinate_system : str
+        Coordinate system of the sheet.
+    segments : int or list
+        Number of segments of each curve, or fractions of the parameter range of each vertex.
+
+    Returns
+    -------
+    :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d`
+        Sheet object.
+    """
+    polygon = app.modeler.create_polyline(
+        polygon_points(boundary, segments), cover_surface=True, close_surface=True, name=name
+    )
+    _set_coordinate_system(app, polygon, "CreatePolyline:1", coordinate_system)
+    return polygon
+
+
+def create_curve_sheet(app, name, boundary, coordinate_system, segments, equation_curves=True):
+    """Create a covered sheet bounded by equation-based curves and straight segments.
+
+    The curves are joined by polylines through the points that are between them in the boundary, the
+    wires are united and covered. When ``equation_curves`` is ``False`` or a curve cannot be created,
+    the sheet is a polygon with the curves sampled into vertices.
+
+    Parameters
+    ----------
+    app : :class:`ansys.aedt.core.Hfss`
+        HFSS application.
+    name : str
+        Sheet name.
+    boundary : list
+        :class:`ParametricCurve` objects and points, in boundary order. The boundary is closed from the
+        last item to the first one.
+    coordinate_system : str
+        Coordinate system of the sheet.
+    segments : int or list
+        Number of segments of each curve, or fractions of the parameter range of each vertex. The
+        equation-based curves have the same number of vertices, evenly spaced in ``_t``.
+    equation_curves : bool, optional
+        Whether to draw the curves as equation-based curves. The default is ``True``.
+
+    Returns
+    -------
+    :class:`ansys.aedt.core.modeler.cad.object_3d.Object3d`
+        Sheet object.
+    """
+    curve_indexes = [index for index, item in enumerate(boundary) if isinstance(item, ParametricCurve)]
+    if not equation_curves or not curve_indexes:
+        return create_polygon(app, name, boundary, coordinate_system, segments)
+
+    # Rotate the boundary so that it starts with a curve, the straight chains then sit between curves
+    boundary = boundary[curve_indexes[0] :] + boundary[: curve_indexes[0]]
+    wires = []
+    for index, item in enumerate(boundary):
+        if not isinstance(item, ParametricCurve):
+            continue
+        curve = item.create(app.modeler, name=name if not wires else None, num_points=_vertex_count(segments))
+        if not curve:
+            if wires:
+                app.modeler.delete([wire.name for wire in wires])
+            app.logger.warning("Equation-based curve not created. Drawing the curve with a polyline.")
+            return create_polygon(app, name, boundary, coordinate_system, segments)
+        _set_coordinate_system(app, curve, "CreateEquationCurve:1", coordinate_system)
+        wires.append(curve)
+
+        chain = [item.end]
+        for following in boundary[index + 1 :] + boundary[:1]:
+            if isinstance(following, ParametricCurve):
+                chain.append(following.start)
+                break
+            chain.append(following)
+        if len(chain) == 2 and chain[0] == chain[1]:
+            continue
+        line = app.modeler.create_polyline(chain)
+        _set_coordinate_system(app, line, "CreatePolyline:1", coordinate_system)
+        wires.append(line)
+
+    app.modeler.unite([wire.name for wire in wires])
+    app.modeler.cover_lines(wires[0].name)
+    return app.modeler[wires[0].name]
+
+
+class SampledCurve(object):
+    """Vertices of a curve sampled by :func:`sample_curve`.
+
+    Parameters
+    ----------
+    parameters : :class:`numpy.ndarray`
+        Curve parameter of each vertex.
+    points : :class:`numpy.ndarray`
+        Vertex coordinates, one row per vertex.
+    max_deviation : float
+        Largest distance between the curve and its chords.
+    tolerance : float, optional
+        Chord deviation tolerance. The default is ``None``, in which case the vertices are evenly spaced.
+    """
+
+    def __init__(self, parameters, points, max_deviation, tolerance=None):
+        self.parameters = parameters
+        self.points = points
+        self.max_deviation = max_deviation
+        self.tolerance = tolerance
+
+    @property
+    def vertex_count(self):
+        """Number of vertices."""
+        return len(self.parameters)
+
+    @property
+    def fractions(self):
+        """Vertex positions as fractions of the parameter range."""
+        return (self.parameters - self.parameters[0]) / (self.parameters[-1] - self.parameters[0])
+
+    def report(self):
+        """Vertex count, largest chord deviation and tolerance of the curve.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "vertices": self.vertex_count,
+            "max_deviation": self.max_deviation,
+            "tolerance": self.tolerance,
+        }
+
+
+def _curve_points(function, parameters):
+    """Evaluate a vectorized curve as an array with one point per row."""
+    points = function(parameters)
+    if isinstance(points, np.ndarray) and points.ndim == 2:
+        return points
+    return np.column_stack(points)
+
+
+def chord_deviation(function, parameters, probes=3):
+    """Get the largest distance between a curve and each chord of consecutive vertices.
+
+    Parameters
+    ----------
+    function : callable
+        Vectorized curve, returns the coordinate arrays or an (N, D) array of points at an array
+        of parameter values.
+    parameters : :class:`numpy.ndarray`
+        Curve parameter of each vertex, sorted.
+    probes : int, optional
+        Number of curve points checked inside each segment. The default is ``3``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Deviation of each segment.
+    """
+    vertices = _curve_points(function, parameters)
+    fractions = np.arange(1, probes + 1) / (probes + 1)
+    inner = parameters[:-1, None] + np.diff(parameters)[:, None] * fractions
+    curve = _curve_points(function, inner.ravel()).reshape(inner.shape + (vertices.shape[1],))
+
+    chords = np.diff(vertices, axis=0)
+    offsets = curve - vertices[:-1, None, :]
+    lengths = np.einsum("ij,ij->i", chords, chords)
+    projection = np.einsum("ikj,ij->ik", offsets, chords) / np.where(lengths > 0, lengths, 1.0)[:, None]
+    projection = np.clip(projection, 0.0, 1.0)
+    distances = np.linalg.norm(offsets - projection[..., None] * chords[:, None, :], axis=2)
+    return distances.max(axis=1)
+
+
+def sample_curve(function, t_start, t_end, tolerance=None, segments=8, breaks=None, uniform=False, max_vertices=10001):
+    """Sample a curve with vertices that keep the chord deviation below a tolerance.
+
+    The samples start evenly spaced. Each segment whose chord deviates from the curve by more than the
+    tolerance is split into as many even pieces as the deviation requires, until all the segments are
+    within the tolerance, so that the vertices gather where the curvature is large. With ``uniform``,
+    all the segments are split the same way instead, for curves that AEDT segments evenly.
+
+    Parameters
+    ----------
+    function : callable
+        Vectorized curve, returns the coordinate arrays or an (N, D) array of points at an array
+        of parameter values.
+    t_start : float
+        Start parameter.
+    t_end : float
+        End parameter.
+    tolerance : float, optional
+        Largest chord deviation. The default is ``None``, in which case the curve is sampled
+        with ``segments`` even segments.
+    segments : int, optional
+        Initial number of segments. The default is ``8``.
+    breaks : list, optional
+        Parameters where the curve is not smooth, which are kept as vertices. The default is ``None``.
+    uniform : bool, optional
+        Whether the vertices stay evenly spaced. The default is ``False``.
+    max_vertices : int, optional
+        Largest number of vertices. The default is ``10001``.
+
+    Returns
+    -------
+    :class:`SampledCurve`
+        Sampled curve.
+    """
+    parameters = np.linspace(t_start, t_end, segments + 1)
+    if breaks is not None and len(breaks):
+        breaks = np.asarray(breaks, dtype=float)
+        breaks = breaks[(breaks > min(t_start, t_end)) & (breaks < max(t_start, t_end))]
+        parameters = np.union1d(parameters, breaks)
+        if t_end < t_start:
+            parameters = parameters[::-1]
+    deviation = chord_deviation(function, parameters)
+    while tolerance is not None and deviation.max() > tolerance:
+        # The chord deviation of a smooth curve scales with the square of the segment length
+        pieces = np.ceil(np.sqrt(deviation / tolerance) * 1.05).astype(int)
+        pieces[deviation <= tolerance] = 1
+        if uniform:
+            pieces[:] = pieces.max()
+        pieces = np.maximum(pieces, 1)
+        if pieces.sum() + 1 > max_vertices:
+            break
+        starts = np.repeat(parameters[:-1], pieces)
+        steps = np.repeat(np.diff(parameters) / pieces, pieces)
+        offsets = np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+        parameters = np.append(starts + steps * offsets, parameters[-1])
+        deviation = chord_deviation(function, parameters)
+    points = _curve_points(function, parameters)
+    return SampledCurve(parameters, points, float(deviation.max()), tolerance)
@@ -24,11 +24,11 @@
 
 from collections import OrderedDict
 
-import ansys.aedt.core.generic.constants as constants
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.patch import CommonPatch
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class GPSPatchCeramic(CommonPatch):
@@ -106,14 +106,14 @@ class GPSPatchCeramic(CommonPatch):
             position keys ``pos_x``, ``pos_y``, and ``pos_z`` taken directly
             from ``self.origin``.
         """
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         scale = self._reference_frequency_ghz / freq_ghz
         length_unit = self.length_unit
 
         parameters = {}
         for name, value in self._reference_dimensions_mm.items():
             scaled_value = value * scale
-            parameters[name] = constants.unit_converter(scaled_value, "Length", "mm", length_unit)
+            parameters[name] = unit_converter(scaled_value, "Length", "mm", length_unit)
 
         parameters["pos_x"] = self.origin[0]
         parameters["pos_y"] = self.origin[1]
@@ -133,10 +133,7 @@ class GPSPatchCeramic(CommonPatch):
         """
         if not self._app:
             return
-        if (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
+        if self._design.has_material(self.material):
             return
 
         material = self._app.materials.add_material(self.material)
@@ -145,6 +142,7 @@ class GPSPatchCeramic(CommonPatch):
                 material.permittivity = self.material_properties["permittivity"]
             if "dielectric_loss_tangent" in self.material_properties:
                 material.dielectric_loss_tangent = self.material_properties["dielectric_loss_tangent"]
+        self._design.add_material(self.material, (self.material_properties or {}).get("permittivity"))
 
     @pyaedt_function_handler()
     def model_hfss(self):
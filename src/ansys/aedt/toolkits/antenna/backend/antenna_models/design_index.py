@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import re
+
+from ansys.aedt.toolkits.antenna.backend.metrics import aedt_queries_avoided_total
+from ansys.aedt.toolkits.antenna.backend.metrics import record_cache
+
+# A variable set to a number, with or without units, stays independent
+_VALUE_RE = re.compile(r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*[a-zA-Z]*\s*$")
+
+# Design indexes by AEDT process, project, and design
+_indexes = {}
+
+
+class DesignIndex(object):
+    """Index of the design state that the antenna models query repeatedly.
+
+    The index keeps the objects of each group, the design variables, and the material names and
+    permittivities of a design. Each part is read from AEDT the first time that it is needed and is
+    then updated by the toolkit when it creates objects, variables, and materials, so that later
+    lookups do not query AEDT. Changes made outside the toolkit are only seen after :meth:`refresh`.
+
+    Materials and independent variables that are not in the index are read again from AEDT before
+    they are reported as missing, because they may have been created after the index was loaded.
+
+    Parameters
+    ----------
+    app : :class:`ansys.aedt.core.Hfss`
+        HFSS application connected to the design.
+
+    Examples
+    --------
+    >>> index = design_index(hfss)
+    >>> index.has_material("FR4_epoxy")
+    True
+    >>> index.queries_avoided
+    0
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.queries_avoided = 0
+        self._groups = {}
+        self._variables = None
+        self._independent_variables = None
+        self._materials = None
+        self._permittivities = {}
+
+    def _lookup(self, index, hit):
+        # Each lookup counts in the hit ratio of the index, hits avoid an AEDT query
+        record_cache("design_index_{}".format(index), hit)
+        if hit:
+            self.queries_avoided += 1
+            aedt_queries_avoided_total.inc(index=index)
+
+    def refresh(self):
+        """Discard the indexed state, which is read again from AEDT when it is needed."""
+        self._groups = {}
+        self._variables = None
+        self._independent_variables = None
+        self._materials = None
+        self._permittivities = {}
+
+    def group_objects(self, group):
+        """Get the names of the objects in a group.
+
+        Parameters
+        ----------
+        group : str
+            Group name.
+
+        Returns
+        -------
+        set
+            Object names.
+        """
+        self._lookup("objects", group in self._groups)
+        if group not in self._groups:
+            self._groups[group] = set(self.app.modeler.oeditor.GetObjectsInGroup(group))
+        return set(self._groups[group])
+
+    def add_objects(self, group, names):
+        """Add objects created by the toolkit to a group.
+
+        Groups that were not read yet are not updated, they are read from AEDT when they are needed.
+
+        Parameters
+        ----------
+        group : str
+            Group name.
+        names : list
+            Object names.
+        """
+        if group in self._groups:
+            self._groups[group].update(names)
+
+    def move_objects(self, names, group):
+        """Move objects to another group.
+
+        Parameters
+        ----------
+        names : list
+            Object names.
+        group : str
+            New group name.
+        """
+        for objects in self._groups.values():
+            objects.difference_update(names)
+        self.add_objects(group, names)
+
+    def forget_group(self, group):
+        """Discard a group, which is read again from AEDT when it is needed.
+
+        Parameters
+        ----------
+        group : str
+            Group name.
+        """
+        self._groups.pop(group, None)
+
+    def _load_variables(self):
+        self._variables = set(self.app.variable_manager.variables.keys())
+        self._independent_variables = set(self.app.variable_manager.independent_variable_names)
+
+    def variable_names(self):
+        """Get the names of the project and design variables.
+
+        Returns
+        -------
+        set
+            Variable names.
+        """
+        self._lookup("variables", self._variables is not None)
+        if self._variables is None:
+            self._load_variables()
+        return set(self._variables)
+
+    def is_independent_variable(self, name):
+        """Check whether a variable exists and is independent.
+
+        Parameters
+        ----------
+        name : str
+            Variable name.
+
+        Returns
+        -------
+        bool
+        """
+        if self._variables is not None and name in self._independent_variables:
+            self._lookup("variables", True)
+            return True
+        self._lookup("variables", False)
+        self._load_variables()
+        return name in self._independent_variables
+
+    def add_variable(self, name, value=None):
+        """Add a variable set by the toolkit.
+
+        Parameters
+        ----------
+        name : str
+            Variable name.
+        value : str, optional
+            Value of the variable. The default is ``None``, in which case the variable is a number.
+            Variables set to an expression are dependent.
+        """
+        if self._variables is None:
+            return
+        self._variables.add(name)
+        if value is None or _VALUE_RE.match(str(value)):
+            self._independent_variables.add(name)
+        else:
+            self._independent_variables.discard(name)
+
+    def _load_materials(self):
+        self._materials = {name.lower(): name for name in self.app.materials.mat_names_aedt}
+
+    def has_material(self, name):
+        """Check whether a material exists, ignoring the case of the name.
+
+        Parameters
+        ----------
+        name : str
+            Material name.
+
+        Returns
+        -------
+        bool
+        """
+        if not name:
+            return False
+        if self._materials is not None and name.lower() in self._materials:
+            self._lookup("materials", True)
+            return True
+        self._lookup("materials", False)
+        self._load_materials()
+        return name.lower() in self._materials
+
+    def material_permittivity(self, name):
+        """Get the relative permittivity of a material.
+
+        Parameters
+        ----------
+        name : str
+            Material name.
+
+        Returns
+        -------
+        float or str
+            Relative permittivity, as AEDT returns it.
+        """
+        key = name.lower()
+        self._lookup("materials", key in self._permittivities)
+        if key not in self._permittivities:
+            self._permittivities[key] = self.app.materials[name].permittivity.value
+        return self._permittivities[key]
+
+    def add_material(self, name, permittivity=None):
+        """Add a material created by the toolkit.
+
+        Parameters
+        ----------
+        name : str
+            Material name.
+        permittivity : float, optional
+            Relative permittivity. The default is ``None``, in which case it is read from AEDT when
+            it is needed.
+        """
+        if self._materials is not None:
+            self._materials[name.lower()] = name
+        if permittivity is None:
+            self._permittivities.pop(name.lower(), None)
+        else:
+            self._permittivities[name.lower()] = permittivity
+
+
+def _design_key(app):
+    desktop = getattr(app, "desktop_class", None)
+    return getattr(desktop, "aedt_process_id", None), getattr(app, "project_name", None), app.design_name
+
+
+def design_index(app):
+    """Get the index of the design of an application.
+
+    The index is kept for the AEDT session, project, and design, so that it is shared by the
+    antennas of the design and by later connections to it.
+
+    Parameters
+    ----------
+    app : :class:`ansys.aedt.core.Hfss`
+        HFSS application.
+
+    Returns
+    -------
+    :class:`DesignIndex`
+        Design index.
+    """
+    key = _design_key(app)
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = DesignIndex(app)
+    else:
+        index.app = app
+    return index
+
+
+def refresh_design_indexes():
+    """Discard the indexes of all designs, which are read again from AEDT when they are needed.
+
+    Returns
+    -------
+    int
+        Number of discarded indexes.
+    """
+    count = len(_indexes)
+    _indexes.clear()
+    return count
@@ -33,6 +33,7 @@ from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import TransmissionLine
 from ansys.aedt.toolkits.antenna.backend.antenna_models.patch import CommonPatch
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class PlanarDipole(CommonPatch):
@@ -68,29 +69,20 @@ class PlanarDipole(CommonPatch):
         """Antenna synthesis."""
         parameters = {}
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         tl = TransmissionLine(self.frequency, self.frequency_unit)
         eff_permittivity = tl.suspended_strip_calculator(wavelength, wavelength / 80.0, sub_meters, sub_permittivity)
         eff_wl_meters = wavelength / math.sqrt(eff_permittivity)
-        eff_wl_working_units = constants.unit_converter(eff_wl_meters, output_units=self.length_unit)
+        eff_wl_working_units = unit_converter(eff_wl_meters, output_units=self.length_unit)
         correction_factor = 0.92
 
         parameters["dipole_length"] = round(correction_factor * eff_wl_working_units / 2.0, 2)
@@ -114,10 +106,7 @@ class PlanarDipole(CommonPatch):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -178,6 +167,7 @@ class PlanarDipole(CommonPatch):
         self.object_list[ant.name] = ant
         self.object_list[ant2.name] = ant2
         self.object_list[port.name] = port
+        self._declare_port(port, [ant2])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
         return True
@@ -211,6 +201,7 @@ class WireDipole(CommonAntenna):
         "frequency_unit": "GHz",
         "outer_boundary": "",
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonAntenna.antenna_type = "Dipole"
@@ -224,8 +215,8 @@ class WireDipole(CommonAntenna):
         """Antenna synthesis."""
         parameters = {}
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
-        wavelength = constants.unit_converter(light_speed / freq_hz, "Length", "meter", self.length_unit)
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        wavelength = unit_converter(light_speed / freq_hz, "Length", "meter", self.length_unit)
 
         parameters["dipole_length"] = round(0.45 * wavelength, 2)
         parameters["port_gap"] = round(0.0075 * wavelength, 3)
@@ -288,6 +279,7 @@ class WireDipole(CommonAntenna):
         self.object_list[wire.name] = wire
         self.object_list[wire2.name] = wire2
         self.object_list[port.name] = port
+        self._declare_port(port, [wire2])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
         return True
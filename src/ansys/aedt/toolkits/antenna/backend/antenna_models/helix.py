@@ -32,6 +32,7 @@ from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonHelix(CommonAntenna):
@@ -54,11 +55,7 @@ class CommonHelix(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 if value != self.material and self.object_list:
@@ -140,10 +137,7 @@ class CommonHelix(CommonAntenna):
         return OrderedDict([(i, parameters[i]) for i in my_keys])
 
     def _validate_material(self):
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
         return True
@@ -151,7 +145,7 @@ class CommonHelix(CommonAntenna):
     def _set_unitless_parameter(self, parameter_name):
         parameter = getattr(self.synthesis_parameters, parameter_name, None)
         if parameter:
-            self._app[parameter.hfss_variable] = str(parameter.value)
+            self._set_variable(parameter.hfss_variable, str(parameter.value))
 
     def _single_feed_model(self, radius_change="0"):
         if self.object_list:
@@ -441,6 +435,7 @@ class CommonHelix(CommonAntenna):
                 obj = self._app.modeler[obj.name]
             obj.color = (128, 0, 0)
             objects.append(obj)
+            self._declare_port(obj, [gnd])
 
         if shorted:
             short_1 = self._app.modeler.create_cylinder(
@@ -569,21 +564,21 @@ class AxialMode(CommonHelix):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         wl_meters = light_speed / freq_hz
         gain_value_db = self.gain
         gain_value_mag = math.pow(10.0, gain_value_db / 10.0)
 
-        groundx = constants.unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", "mm")
-        groundy = constants.unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", "mm")
-        helix_diameter = constants.unit_converter(1.128 * (3.33 / freq_ghz), "Length", "in", "mm")
-        helix_spacing = constants.unit_converter(0.786 * (3.33 / freq_ghz), "Length", "in", "mm")
-        helix_wiredia = constants.unit_converter(0.2 * (3.33 / freq_ghz), "Length", "in", "mm")
-        helix_coax_inner_radius = constants.unit_converter(0.082 * (3.33 / freq_ghz) / 2, "Length", "in", "mm")
-        helix_coax_outer_radius = constants.unit_converter(0.275 * (3.33 / freq_ghz) / 2, "Length", "in", "mm")
-        helix_feed_pinl = constants.unit_converter(0.05 * (3.33 / freq_ghz), "Length", "in", "mm")
-        helix_feed_pind = constants.unit_converter(0.082 * (3.33 / freq_ghz), "Length", "in", "mm")
+        groundx = unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", "mm")
+        groundy = unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", "mm")
+        helix_diameter = unit_converter(1.128 * (3.33 / freq_ghz), "Length", "in", "mm")
+        helix_spacing = unit_converter(0.786 * (3.33 / freq_ghz), "Length", "in", "mm")
+        helix_wiredia = unit_converter(0.2 * (3.33 / freq_ghz), "Length", "in", "mm")
+        helix_coax_inner_radius = unit_converter(0.082 * (3.33 / freq_ghz) / 2, "Length", "in", "mm")
+        helix_coax_outer_radius = unit_converter(0.275 * (3.33 / freq_ghz) / 2, "Length", "in", "mm")
+        helix_feed_pinl = unit_converter(0.05 * (3.33 / freq_ghz), "Length", "in", "mm")
+        helix_feed_pind = unit_converter(0.082 * (3.33 / freq_ghz), "Length", "in", "mm")
 
         helix_diameter_syn = wl_meters / math.pi * 0.9
         helix_spacing_syn = math.pi * helix_diameter_syn * math.tan(math.radians(12.5))
@@ -623,10 +618,7 @@ class AxialMode(CommonHelix):
             logger.debug("This antenna is already defined")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -644,7 +636,7 @@ class AxialMode(CommonHelix):
         feed_pind = self.synthesis_parameters.feed_pinD.hfss_variable
         feeder_length = self.synthesis_parameters.feeder_length.hfss_variable
         number_of_turns = self.synthesis_parameters.number_of_turns.hfss_variable
-        self._app[number_of_turns] = str(self.synthesis_parameters.number_of_turns.value)
+        self._set_variable(number_of_turns, str(self.synthesis_parameters.number_of_turns.value))
 
         pos_x = self.synthesis_parameters.pos_x.hfss_variable
         pos_y = self.synthesis_parameters.pos_y.hfss_variable
@@ -852,25 +844,21 @@ class AxialModeTaper(CommonHelix):
     def synthesis(self):
         parameters = {}
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         wl_meters = light_speed / freq_hz
         gain_value_mag = math.pow(10.0, self.gain / 10.0)
 
-        groundx = constants.unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        groundy = constants.unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        helix_diameter = constants.unit_converter(1.128 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        helix_spacing = constants.unit_converter(0.786 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        helix_wiredia = constants.unit_converter(0.2 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        helix_coax_inner_radius = constants.unit_converter(
-            0.082 * (3.33 / freq_ghz) / 2.0, "Length", "in", self.length_unit
-        )
-        helix_coax_outer_radius = constants.unit_converter(
-            0.275 * (3.33 / freq_ghz) / 2.0, "Length", "in", self.length_unit
-        )
-        helix_feed_pinl = constants.unit_converter(0.05 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        helix_feed_pind = constants.unit_converter(0.082 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
-        default_feeder_length = constants.unit_converter(1.005 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        groundx = unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        groundy = unit_converter(4.0 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        helix_diameter = unit_converter(1.128 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        helix_spacing = unit_converter(0.786 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        helix_wiredia = unit_converter(0.2 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        helix_coax_inner_radius = unit_converter(0.082 * (3.33 / freq_ghz) / 2.0, "Length", "in", self.length_unit)
+        helix_coax_outer_radius = unit_converter(0.275 * (3.33 / freq_ghz) / 2.0, "Length", "in", self.length_unit)
+        helix_feed_pinl = unit_converter(0.05 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        helix_feed_pind = unit_converter(0.082 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
+        default_feeder_length = unit_converter(1.005 * (3.33 / freq_ghz), "Length", "in", self.length_unit)
 
         helix_diameter_syn = wl_meters / math.pi * 0.9
         helix_spacing_syn = math.pi * helix_diameter_syn * math.tan(math.radians(12.5))
@@ -887,9 +875,7 @@ class AxialModeTaper(CommonHelix):
         parameters["feed_pinL"] = helix_feed_pinl
         parameters["feed_pinD"] = helix_feed_pind
         parameters["number_of_turns"] = helix_turns_syn
-        parameters["radius_change"] = constants.unit_converter(
-            helix_radius_change_syn, "Length", "meter", self.length_unit
-        )
+        parameters["radius_change"] = unit_converter(helix_radius_change_syn, "Length", "meter", self.length_unit)
         parameters["feeder_length"] = self.feeder_length or default_feeder_length
 
         parameters["pos_x"] = self.origin[0]
@@ -947,7 +933,7 @@ class NormalMode(CommonHelix):
     def synthesis(self):
         parameters = {}
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wl_meters = light_speed / freq_hz
 
         groundx_syn = wl_meters
@@ -968,21 +954,21 @@ class NormalMode(CommonHelix):
         helix_feed_pind_syn = helix_coax_inner_radius_syn * 2.0
         default_feeder_length = 5 * helix_feed_pind_syn
 
-        parameters["groundx"] = constants.unit_converter(groundx_syn, "Length", "meter", self.length_unit)
-        parameters["groundy"] = constants.unit_converter(groundy_syn, "Length", "meter", self.length_unit)
-        parameters["diameter"] = constants.unit_converter(helix_diameter_syn, "Length", "meter", self.length_unit)
-        parameters["spacing"] = constants.unit_converter(helix_spacing_syn, "Length", "meter", self.length_unit)
-        parameters["wire_diameter"] = constants.unit_converter(helix_wiredia_syn, "Length", "meter", self.length_unit)
-        parameters["coax_inner_radius"] = constants.unit_converter(
+        parameters["groundx"] = unit_converter(groundx_syn, "Length", "meter", self.length_unit)
+        parameters["groundy"] = unit_converter(groundy_syn, "Length", "meter", self.length_unit)
+        parameters["diameter"] = unit_converter(helix_diameter_syn, "Length", "meter", self.length_unit)
+        parameters["spacing"] = unit_converter(helix_spacing_syn, "Length", "meter", self.length_unit)
+        parameters["wire_diameter"] = unit_converter(helix_wiredia_syn, "Length", "meter", self.length_unit)
+        parameters["coax_inner_radius"] = unit_converter(
             helix_coax_inner_radius_syn, "Length", "meter", self.length_unit
         )
-        parameters["coax_outer_radius"] = constants.unit_converter(
+        parameters["coax_outer_radius"] = unit_converter(
             helix_coax_outer_radius_syn, "Length", "meter", self.length_unit
         )
-        parameters["feed_pinL"] = constants.unit_converter(helix_feed_pinl_syn, "Length", "meter", self.length_unit)
-        parameters["feed_pinD"] = constants.unit_converter(helix_feed_pind_syn, "Length", "meter", self.length_unit)
+        parameters["feed_pinL"] = unit_converter(helix_feed_pinl_syn, "Length", "meter", self.length_unit)
+        parameters["feed_pinD"] = unit_converter(helix_feed_pind_syn, "Length", "meter", self.length_unit)
         parameters["number_of_turns"] = helix_turns_syn
-        parameters["feeder_length"] = self.feeder_length or constants.unit_converter(
+        parameters["feeder_length"] = self.feeder_length or unit_converter(
             default_feeder_length, "Length", "meter", self.length_unit
         )
 
@@ -1040,14 +1026,14 @@ class QuadrifilarOpen(CommonHelix):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
-
-        parameters["groundx"] = constants.unit_converter(60 * (1 / freq_ghz), "Length", "mm", self.length_unit)
-        parameters["groundy"] = constants.unit_converter(60 * (1 / freq_ghz), "Length", "mm", self.length_unit)
-        parameters["diameter"] = constants.unit_converter(43.2 * (1 / freq_ghz), "Length", "mm", self.length_unit)
-        parameters["spacing"] = constants.unit_converter(139 * (1 / freq_ghz), "Length", "mm", self.length_unit)
-        parameters["wire_diameter"] = constants.unit_converter(1.6 * (1 / freq_ghz), "Length", "mm", self.length_unit)
-        parameters["port_height"] = constants.unit_converter(3.2 * (1 / freq_ghz), "Length", "mm", self.length_unit)
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+
+        parameters["groundx"] = unit_converter(60 * (1 / freq_ghz), "Length", "mm", self.length_unit)
+        parameters["groundy"] = unit_converter(60 * (1 / freq_ghz), "Length", "mm", self.length_unit)
+        parameters["diameter"] = unit_converter(43.2 * (1 / freq_ghz), "Length", "mm", self.length_unit)
+        parameters["spacing"] = unit_converter(139 * (1 / freq_ghz), "Length", "mm", self.length_unit)
+        parameters["wire_diameter"] = unit_converter(1.6 * (1 / freq_ghz), "Length", "mm", self.length_unit)
+        parameters["port_height"] = unit_converter(3.2 * (1 / freq_ghz), "Length", "mm", self.length_unit)
         parameters["number_of_turns"] = 1.1
 
         parameters["pos_x"] = self.origin[0]
@@ -1104,16 +1090,16 @@ class QuadrifilarShort(CommonHelix):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         syn_resonant_freq = 0.9322
         scaling = syn_resonant_freq / freq_ghz
 
-        parameters["groundx"] = constants.unit_converter(100 * scaling, "Length", "mm", self.length_unit)
-        parameters["groundy"] = constants.unit_converter(100 * scaling, "Length", "mm", self.length_unit)
-        parameters["diameter"] = constants.unit_converter(52.2 * scaling, "Length", "mm", self.length_unit)
-        parameters["spacing"] = constants.unit_converter(255 * scaling, "Length", "mm", self.length_unit)
-        parameters["wire_diameter"] = constants.unit_converter(15 * scaling, "Length", "mm", self.length_unit)
-        parameters["port_height"] = constants.unit_converter(3.2 * scaling, "Length", "mm", self.length_unit)
+        parameters["groundx"] = unit_converter(100 * scaling, "Length", "mm", self.length_unit)
+        parameters["groundy"] = unit_converter(100 * scaling, "Length", "mm", self.length_unit)
+        parameters["diameter"] = unit_converter(52.2 * scaling, "Length", "mm", self.length_unit)
+        parameters["spacing"] = unit_converter(255 * scaling, "Length", "mm", self.length_unit)
+        parameters["wire_diameter"] = unit_converter(15 * scaling, "Length", "mm", self.length_unit)
+        parameters["port_height"] = unit_converter(3.2 * scaling, "Length", "mm", self.length_unit)
         parameters["number_of_turns"] = 0.5
 
         parameters["pos_x"] = self.origin[0]
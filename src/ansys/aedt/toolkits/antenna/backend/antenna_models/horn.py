@@ -30,6 +30,7 @@ from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import StandardWaveguide
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonHorn(CommonAntenna):
@@ -52,11 +53,7 @@ class CommonHorn(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 if value != self.material and self.object_list:
@@ -167,9 +164,9 @@ class Conical(CommonHorn):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
-        wavelength_in = constants.unit_converter(wavelength, "Length", "meter", "in")
+        wavelength_in = unit_converter(wavelength, "Length", "meter", "in")
 
         wg_radius_in = 0.5 * wavelength_in
         wg_length_in = 0.4 * wavelength_in
@@ -177,15 +174,15 @@ class Conical(CommonHorn):
         horn_length_in = 2 * wavelength_in
         wall_thickness_in = 0.02 * wavelength_in
 
-        wg_radius = constants.unit_converter(wg_radius_in, "Length", "in", self.length_unit)
+        wg_radius = unit_converter(wg_radius_in, "Length", "in", self.length_unit)
         parameters["wg_radius"] = wg_radius
-        wg_length = constants.unit_converter(wg_length_in, "Length", "in", self.length_unit)
+        wg_length = unit_converter(wg_length_in, "Length", "in", self.length_unit)
         parameters["wg_length"] = wg_length
-        horn_radius = constants.unit_converter(horn_radius_in, "Length", "in", self.length_unit)
+        horn_radius = unit_converter(horn_radius_in, "Length", "in", self.length_unit)
         parameters["horn_radius"] = horn_radius
-        horn_length = constants.unit_converter(horn_length_in, "Length", "in", self.length_unit)
+        horn_length = unit_converter(horn_length_in, "Length", "in", self.length_unit)
         parameters["horn_length"] = horn_length
-        wall_thickness = constants.unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
+        wall_thickness = unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
         parameters["wall_thickness"] = wall_thickness
 
         parameters["pos_x"] = self.origin[0]
@@ -208,10 +205,7 @@ class Conical(CommonHorn):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -435,6 +429,7 @@ class PyramidalRidged(CommonHorn):
         "material": "pec",
         "outer_boundary": "",
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonHorn.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -453,7 +448,7 @@ class PyramidalRidged(CommonHorn):
             Analytical parameters.
         """
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
         def scale(x):
             return (1.0 / freq_ghz) * x
@@ -473,23 +468,23 @@ class PyramidalRidged(CommonHorn):
         ridge_width = scale_value(14.64)
         ridge_spacing = scale_value(2)
 
-        aperture_height = constants.unit_converter(aperture_height, "Length", "mm", self.length_unit)
+        aperture_height = unit_converter(aperture_height, "Length", "mm", self.length_unit)
         parameters["aperture_height"] = aperture_height
-        aperture_width = constants.unit_converter(aperture_width, "Length", "mm", self.length_unit)
+        aperture_width = unit_converter(aperture_width, "Length", "mm", self.length_unit)
         parameters["aperture_width"] = aperture_width
-        flare_length = constants.unit_converter(flare_length, "Length", "mm", self.length_unit)
+        flare_length = unit_converter(flare_length, "Length", "mm", self.length_unit)
         parameters["flare_length"] = flare_length
-        wall_thickness = constants.unit_converter(wall_thickness, "Length", "mm", self.length_unit)
+        wall_thickness = unit_converter(wall_thickness, "Length", "mm", self.length_unit)
         parameters["wall_thickness"] = wall_thickness
-        wg_height = constants.unit_converter(wg_height, "Length", "mm", self.length_unit)
+        wg_height = unit_converter(wg_height, "Length", "mm", self.length_unit)
         parameters["wg_height"] = wg_height
-        wg_width = constants.unit_converter(wg_width, "Length", "mm", self.length_unit)
+        wg_width = unit_converter(wg_width, "Length", "mm", self.length_unit)
         parameters["wg_width"] = wg_width
-        wg_length = constants.unit_converter(wg_length, "Length", "mm", self.length_unit)
+        wg_length = unit_converter(wg_length, "Length", "mm", self.length_unit)
         parameters["wg_length"] = wg_length
-        ridge_width = constants.unit_converter(ridge_width, "Length", "mm", self.length_unit)
+        ridge_width = unit_converter(ridge_width, "Length", "mm", self.length_unit)
         parameters["ridge_width"] = ridge_width
-        ridge_spacing = constants.unit_converter(ridge_spacing, "Length", "mm", self.length_unit)
+        ridge_spacing = unit_converter(ridge_spacing, "Length", "mm", self.length_unit)
         parameters["ridge_spacing"] = ridge_spacing
 
         parameters["pos_x"] = self.origin[0]
@@ -512,10 +507,7 @@ class PyramidalRidged(CommonHorn):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -1161,7 +1153,7 @@ class Corrugated(CommonHorn):
             Analytical parameters.
         """
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
         wg_radius_mm = round(11.7 * 10.4 / freq_ghz, 3)
         wg_length_mm = round(30.0 * 10.4 / freq_ghz, 3)
@@ -1172,19 +1164,19 @@ class Corrugated(CommonHorn):
         notch_depth_mm = round(7.5 * 10.4 / freq_ghz, 3)
         tooth_width_mm = round(2.0 * 10.4 / freq_ghz, 3)
 
-        wg_radius = constants.unit_converter(wg_radius_mm, "Length", "mm", self.length_unit)
+        wg_radius = unit_converter(wg_radius_mm, "Length", "mm", self.length_unit)
         parameters["wg_radius"] = wg_radius
-        wg_length = constants.unit_converter(wg_length_mm, "Length", "mm", self.length_unit)
+        wg_length = unit_converter(wg_length_mm, "Length", "mm", self.length_unit)
         parameters["wg_length"] = wg_length
-        wall_thickness = constants.unit_converter(wall_thickness_mm, "Length", "mm", self.length_unit)
+        wall_thickness = unit_converter(wall_thickness_mm, "Length", "mm", self.length_unit)
         parameters["wall_thickness"] = wall_thickness
         parameters["flare_angle"] = flare_angle
         parameters["notches"] = notches
-        notch_width = constants.unit_converter(notch_width_mm, "Length", "mm", self.length_unit)
+        notch_width = unit_converter(notch_width_mm, "Length", "mm", self.length_unit)
         parameters["notch_width"] = notch_width
-        notch_depth = constants.unit_converter(notch_depth_mm, "Length", "mm", self.length_unit)
+        notch_depth = unit_converter(notch_depth_mm, "Length", "mm", self.length_unit)
         parameters["notch_depth"] = notch_depth
-        tooth_width = constants.unit_converter(tooth_width_mm, "Length", "mm", self.length_unit)
+        tooth_width = unit_converter(tooth_width_mm, "Length", "mm", self.length_unit)
         parameters["tooth_width"] = tooth_width
 
         parameters["pos_x"] = self.origin[0]
@@ -1207,10 +1199,7 @@ class Corrugated(CommonHorn):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -1228,10 +1217,8 @@ class Corrugated(CommonHorn):
         wall_thickness = self.synthesis_parameters.wall_thickness.hfss_variable
         wg_length = self.synthesis_parameters.wg_length.hfss_variable
         wg_radius = self.synthesis_parameters.wg_radius.hfss_variable
-        self._app[self.synthesis_parameters.flare_angle.hfss_variable] = (
-            str(self.synthesis_parameters.flare_angle.value) + "deg"
-        )
         flare_angle = self.synthesis_parameters.flare_angle.hfss_variable
+        self._set_variable(flare_angle, str(self.synthesis_parameters.flare_angle.value) + "deg")
 
         notch_width = self.synthesis_parameters.notch_width.hfss_variable
         notch_depth = self.synthesis_parameters.notch_depth.hfss_variable
@@ -1455,9 +1442,9 @@ class Elliptical(CommonHorn):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
-        wavelength_in = constants.unit_converter(wavelength, "Length", "meter", "in")
+        wavelength_in = unit_converter(wavelength, "Length", "meter", "in")
 
         wg_radius_in = 0.5 * wavelength_in
         wg_length_in = wavelength_in
@@ -1466,15 +1453,15 @@ class Elliptical(CommonHorn):
         wall_thickness_in = 0.02 * wavelength_in
         ellipse_ratio = 0.6
 
-        wg_radius = constants.unit_converter(wg_radius_in, "Length", "in", self.length_unit)
+        wg_radius = unit_converter(wg_radius_in, "Length", "in", self.length_unit)
         parameters["wg_radius"] = wg_radius
-        wg_length = constants.unit_converter(wg_length_in, "Length", "in", self.length_unit)
+        wg_length = unit_converter(wg_length_in, "Length", "in", self.length_unit)
         parameters["wg_length"] = wg_length
-        horn_radius = constants.unit_converter(horn_radius_in, "Length", "in", self.length_unit)
+        horn_radius = unit_converter(horn_radius_in, "Length", "in", self.length_unit)
         parameters["horn_radius"] = horn_radius
-        horn_length = constants.unit_converter(horn_length_in, "Length", "in", self.length_unit)
+        horn_length = unit_converter(horn_length_in, "Length", "in", self.length_unit)
         parameters["horn_length"] = horn_length
-        wall_thickness = constants.unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
+        wall_thickness = unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
         parameters["wall_thickness"] = wall_thickness
         parameters["ellipse_ratio"] = ellipse_ratio
 
@@ -1498,10 +1485,7 @@ class Elliptical(CommonHorn):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -1728,6 +1712,7 @@ class EPlane(CommonHorn):
         "material_properties": {},
         "outer_boundary": None,
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonHorn.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -1746,14 +1731,10 @@ class EPlane(CommonHorn):
             Analytical parameters.
         """
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
-
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+
+        if self._app and self._design.has_material(self.material):
+            permittivity = self._design.material_permittivity(self.material)
             self._input_parameters.material_properties["permittivity"] = permittivity
 
         elif isinstance(self.material_properties, dict):
@@ -1783,17 +1764,17 @@ class EPlane(CommonHorn):
             wall_thickness = wg_dim_in[2]
         else:
             wg_a_in = scale_value(0.9)
-            wg_a = constants.unit_converter(wg_a_in, "Length", "in", self.length_unit)
+            wg_a = unit_converter(wg_a_in, "Length", "in", self.length_unit)
             wg_b_in = scale_value(0.4)
-            wg_b = constants.unit_converter(wg_b_in, "Length", "in", self.length_unit)
+            wg_b = unit_converter(wg_b_in, "Length", "in", self.length_unit)
             wall_thickness_in = scale_value(0.02)
-            wall_thickness = constants.unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
+            wall_thickness = unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
 
-        wg_length = constants.unit_converter(wg_length_in, "Length", "in", self.length_unit)
+        wg_length = unit_converter(wg_length_in, "Length", "in", self.length_unit)
         parameters["wg_length"] = wg_length
-        flare = constants.unit_converter(flare_in, "Length", "in", self.length_unit)
+        flare = unit_converter(flare_in, "Length", "in", self.length_unit)
         parameters["flare"] = flare
-        horn_length = constants.unit_converter(horn_length_in, "Length", "in", self.length_unit)
+        horn_length = unit_converter(horn_length_in, "Length", "in", self.length_unit)
         parameters["horn_length"] = horn_length
         parameters["wg_width"] = wg_a
         parameters["wg_height"] = wg_b
@@ -1819,10 +1800,7 @@ class EPlane(CommonHorn):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -2108,6 +2086,7 @@ class HPlane(CommonHorn):
         "material": "pec",
         "outer_boundary": None,
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonHorn.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -2126,7 +2105,7 @@ class HPlane(CommonHorn):
             Analytical parameters.
         """
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
         def scale(x):
             return (10.0 / freq_ghz) * x
@@ -2149,17 +2128,17 @@ class HPlane(CommonHorn):
             wall_thickness = wg_dim_in[2]
         else:
             wg_a_in = scale_value(0.9)
-            wg_a = constants.unit_converter(wg_a_in, "Length", "in", self.length_unit)
+            wg_a = unit_converter(wg_a_in, "Length", "in", self.length_unit)
             wg_b_in = scale_value(0.4)
-            wg_b = constants.unit_converter(wg_b_in, "Length", "in", self.length_unit)
+            wg_b = unit_converter(wg_b_in, "Length", "in", self.length_unit)
             wall_thickness_in = scale_value(0.02)
-            wall_thickness = constants.unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
+            wall_thickness = unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
 
-        wg_length = constants.unit_converter(wg_length_in, "Length", "in", self.length_unit)
+        wg_length = unit_converter(wg_length_in, "Length", "in", self.length_unit)
         parameters["wg_length"] = wg_length
-        flare = constants.unit_converter(flare_in, "Length", "in", self.length_unit)
+        flare = unit_converter(flare_in, "Length", "in", self.length_unit)
         parameters["flare"] = flare
-        horn_length = constants.unit_converter(horn_length_in, "Length", "in", self.length_unit)
+        horn_length = unit_converter(horn_length_in, "Length", "in", self.length_unit)
         parameters["horn_length"] = horn_length
         parameters["wg_width"] = wg_a
         parameters["wg_height"] = wg_b
@@ -2185,10 +2164,7 @@ class HPlane(CommonHorn):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
 
             return False
@@ -2475,6 +2451,7 @@ class Pyramidal(CommonHorn):
         "material": "pec",
         "outer_boundary": None,
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonHorn.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -2493,7 +2470,7 @@ class Pyramidal(CommonHorn):
             Analytical parameters.
         """
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
         def scale(x):
             return (10.0 / freq_ghz) * x
@@ -2517,19 +2494,19 @@ class Pyramidal(CommonHorn):
             wall_thickness = wg_dim_in[2]
         else:
             wg_a_in = scale_value(0.9)
-            wg_a = constants.unit_converter(wg_a_in, "Length", "in", self.length_unit)
+            wg_a = unit_converter(wg_a_in, "Length", "in", self.length_unit)
             wg_b_in = scale_value(0.4)
-            wg_b = constants.unit_converter(wg_b_in, "Length", "in", self.length_unit)
+            wg_b = unit_converter(wg_b_in, "Length", "in", self.length_unit)
             wall_thickness_in = scale_value(0.02)
-            wall_thickness = constants.unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
+            wall_thickness = unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
 
-        wg_length = constants.unit_converter(wg_length_in, "Length", "in", self.length_unit)
+        wg_length = unit_converter(wg_length_in, "Length", "in", self.length_unit)
         parameters["wg_length"] = wg_length
-        flare_a = constants.unit_converter(flare_a_in, "Length", "in", self.length_unit)
+        flare_a = unit_converter(flare_a_in, "Length", "in", self.length_unit)
         parameters["flare_a"] = flare_a
-        flare_b = constants.unit_converter(flare_b_in, "Length", "in", self.length_unit)
+        flare_b = unit_converter(flare_b_in, "Length", "in", self.length_unit)
         parameters["flare_b"] = flare_b
-        horn_length = constants.unit_converter(horn_length_in, "Length", "in", self.length_unit)
+        horn_length = unit_converter(horn_length_in, "Length", "in", self.length_unit)
         parameters["horn_length"] = horn_length
         parameters["wg_width"] = wg_a
         parameters["wg_height"] = wg_b
@@ -2555,10 +2532,7 @@ class Pyramidal(CommonHorn):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -2850,6 +2824,7 @@ class QuadRidged(CommonHorn):
         "material": "pec",
         "outer_boundary": None,
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonHorn.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -2868,7 +2843,7 @@ class QuadRidged(CommonHorn):
             Analytical parameters.
         """
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
         def scale(x):
             return (5.0 / freq_ghz) * x
@@ -2897,37 +2872,37 @@ class QuadRidged(CommonHorn):
         ridge_height_10 = scale_value(9.92)
 
         parameters["aperture_width"] = aperture_width
-        flare_length = constants.unit_converter(flare_length, "Length", "mm", self.length_unit)
+        flare_length = unit_converter(flare_length, "Length", "mm", self.length_unit)
         parameters["flare_length"] = flare_length
-        wall_thickness = constants.unit_converter(wall_thickness, "Length", "mm", self.length_unit)
+        wall_thickness = unit_converter(wall_thickness, "Length", "mm", self.length_unit)
         parameters["wall_thickness"] = wall_thickness
-        wg_width = constants.unit_converter(wg_width, "Length", "mm", self.length_unit)
+        wg_width = unit_converter(wg_width, "Length", "mm", self.length_unit)
         parameters["wg_width"] = wg_width
-        wg_length = constants.unit_converter(wg_length, "Length", "mm", self.length_unit)
+        wg_length = unit_converter(wg_length, "Length", "mm", self.length_unit)
         parameters["wg_length"] = wg_length
-        ridge_width = constants.unit_converter(ridge_width, "Length", "mm", self.length_unit)
+        ridge_width = unit_converter(ridge_width, "Length", "mm", self.length_unit)
         parameters["ridge_width"] = ridge_width
-        ridge_spacing = constants.unit_converter(ridge_spacing, "Length", "mm", self.length_unit)
+        ridge_spacing = unit_converter(ridge_spacing, "Length", "mm", self.length_unit)
         parameters["ridge_spacing"] = ridge_spacing
-        ridge_height_1 = constants.unit_converter(ridge_height_1, "Length", "mm", self.length_unit)
+        ridge_height_1 = unit_converter(ridge_height_1, "Length", "mm", self.length_unit)
         parameters["ridge_height_1"] = ridge_height_1
-        ridge_height_2 = constants.unit_converter(ridge_height_2, "Length", "mm", self.length_unit)
+        ridge_height_2 = unit_converter(ridge_height_2, "Length", "mm", self.length_unit)
         parameters["ridge_height_2"] = ridge_height_2
-        ridge_height_3 = constants.unit_converter(ridge_height_3, "Length", "mm", self.length_unit)
+        ridge_height_3 = unit_converter(ridge_height_3, "Length", "mm", self.length_unit)
         parameters["ridge_height_3"] = ridge_height_3
-        ridge_height_4 = constants.unit_converter(ridge_height_4, "Length", "mm", self.length_unit)
+        ridge_height_4 = unit_converter(ridge_height_4, "Length", "mm", self.length_unit)
         parameters["ridge_height_4"] = ridge_height_4
-        ridge_height_5 = constants.unit_converter(ridge_height_5, "Length", "mm", self.length_unit)
+        ridge_height_5 = unit_converter(ridge_height_5, "Length", "mm", self.length_unit)
         parameters["ridge_height_5"] = ridge_height_5
-        ridge_height_6 = constants.unit_converter(ridge_height_6, "Length", "mm", self.length_unit)
+        ridge_height_6 = unit_converter(ridge_height_6, "Length", "mm", self.length_unit)
         parameters["ridge_height_6"] = ridge_height_6
-        ridge_height_7 = constants.unit_converter(ridge_height_7, "Length", "mm", self.length_unit)
+        ridge_height_7 = unit_converter(ridge_height_7, "Length", "mm", self.length_unit)
         parameters["ridge_height_7"] = ridge_height_7
-        ridge_height_8 = constants.unit_converter(ridge_height_8, "Length", "mm", self.length_unit)
+        ridge_height_8 = unit_converter(ridge_height_8, "Length", "mm", self.length_unit)
         parameters["ridge_height_8"] = ridge_height_8
-        ridge_height_9 = constants.unit_converter(ridge_height_9, "Length", "mm", self.length_unit)
+        ridge_height_9 = unit_converter(ridge_height_9, "Length", "mm", self.length_unit)
         parameters["ridge_height_9"] = ridge_height_9
-        ridge_height_10 = constants.unit_converter(ridge_height_10, "Length", "mm", self.length_unit)
+        ridge_height_10 = unit_converter(ridge_height_10, "Length", "mm", self.length_unit)
         parameters["ridge_height_10"] = ridge_height_10
 
         parameters["pos_x"] = self.origin[0]
@@ -2950,10 +2925,7 @@ class QuadRidged(CommonHorn):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -3485,9 +3457,9 @@ class ConicalSpecial(CommonHorn):
         """
         parameters = {}
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
-        wavelength_in = constants.unit_converter(wavelength, "Length", "meter", "in")
+        wavelength_in = unit_converter(wavelength, "Length", "meter", "in")
 
         wg_radius_in = 0.5 * wavelength_in
         wg_length_in = 0.4 * wavelength_in
@@ -3495,15 +3467,15 @@ class ConicalSpecial(CommonHorn):
         horn_length_in = 2 * wavelength_in
         wall_thickness_in = 0.02 * wavelength_in
 
-        wg_radius = constants.unit_converter(wg_radius_in, "Length", "in", self.length_unit)
+        wg_radius = unit_converter(wg_radius_in, "Length", "in", self.length_unit)
         parameters["wg_radius"] = wg_radius
-        wg_length = constants.unit_converter(wg_length_in, "Length", "in", self.length_unit)
+        wg_length = unit_converter(wg_length_in, "Length", "in", self.length_unit)
         parameters["wg_length"] = wg_length
-        horn_radius = constants.unit_converter(horn_radius_in, "Length", "in", self.length_unit)
+        horn_radius = unit_converter(horn_radius_in, "Length", "in", self.length_unit)
         parameters["horn_radius"] = horn_radius
-        horn_length = constants.unit_converter(horn_length_in, "Length", "in", self.length_unit)
+        horn_length = unit_converter(horn_length_in, "Length", "in", self.length_unit)
         parameters["horn_length"] = horn_length
-        wall_thickness = constants.unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
+        wall_thickness = unit_converter(wall_thickness_in, "Length", "in", self.length_unit)
         parameters["wall_thickness"] = wall_thickness
 
         parameters["pos_x"] = self.origin[0]
@@ -3526,10 +3498,7 @@ class ConicalSpecial(CommonHorn):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
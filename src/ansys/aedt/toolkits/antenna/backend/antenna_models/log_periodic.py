@@ -31,8 +31,13 @@ from ansys.aedt.core.generic.constants import Plane
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
+from ansys.aedt.toolkits.antenna.backend.antenna_models.booleans import BooleanPlan
+from ansys.aedt.toolkits.antenna.backend.antenna_models.charts import DesignChart
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import ParametricCurve
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import create_curve_sheet
 from ansys.aedt.toolkits.antenna.backend.antenna_models.patch import CommonPatch
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonLogPeriodic(CommonAntenna):
@@ -214,20 +219,6 @@ class CommonPrintedLogPeriodic(CommonPatch):
     def _sync_center_frequency(self):
         self._input_parameters.frequency = (self.start_frequency + self.stop_frequency) / 2.0
 
-    def _get_material_permittivity(self):
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            permittivity = self._app.materials[self.material].permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-            return float(permittivity)
-        if self.material_properties:
-            return float(self.material_properties["permittivity"])
-        if self._app:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
-        return None
-
     def _effective_permittivity(self, high_wavelength, substrate_height, permittivity):
         effective_area = high_wavelength / 8.0
         if effective_area / 4.0 > substrate_height:
@@ -259,6 +250,17 @@ class CommonPrintedLogPeriodic(CommonPatch):
             value=coordinate_system,
         )
 
+    def _arc_curve(self, radius, start_angle, end_angle, elevation, reverse=False):
+        angle = f"(({start_angle})+(({end_angle})-({start_angle}))*_t)"
+        return ParametricCurve(
+            f"({radius})*cos(({angle})deg)",
+            f"({radius})*sin(({angle})deg)",
+            elevation,
+            0,
+            1,
+            reverse=reverse,
+        )
+
     def _arc_points(
         self,
         radius,
@@ -268,29 +270,22 @@ class CommonPrintedLogPeriodic(CommonPatch):
         segments=12,
         reverse=False,
     ):
+        if not all(isinstance(value, (int, float)) for value in [radius, start_angle, end_angle, elevation]):
+            return self._arc_curve(radius, start_angle, end_angle, elevation, reverse=reverse).points(segments)
+
         points = []
         index_range = range(segments + 1)
         if reverse:
             index_range = reversed(list(index_range))
         for index in index_range:
-            if all(isinstance(value, (int, float)) for value in [radius, start_angle, end_angle, elevation]):
-                angle = start_angle + (end_angle - start_angle) * index / segments
-                points.append(
-                    [
-                        radius * math.cos(math.radians(angle)),
-                        radius * math.sin(math.radians(angle)),
-                        elevation,
-                    ]
-                )
-            else:
-                angle = f"(({start_angle})+((({end_angle})-({start_angle}))*{index}/{segments}))"
-                points.append(
-                    [
-                        f"({radius})*cos(({angle})deg)",
-                        f"({radius})*sin(({angle})deg)",
-                        elevation,
-                    ]
-                )
+            angle = start_angle + (end_angle - start_angle) * index / segments
+            points.append(
+                [
+                    radius * math.cos(math.radians(angle)),
+                    radius * math.sin(math.radians(angle)),
+                    elevation,
+                ]
+            )
         return points
 
     def _create_polygon(self, name, points, coordinate_system):
@@ -313,18 +308,26 @@ class CommonPrintedLogPeriodic(CommonPatch):
         elevation,
         coordinate_system,
     ):
-        points = self._arc_points(
-            outer_radius,
-            start_angle,
-            end_angle,
-            elevation,
-        )
         is_zero_radius = False
         if isinstance(inner_radius, (int, float)):
             is_zero_radius = math.isclose(float(inner_radius), 0.0)
         else:
             is_zero_radius = str(inner_radius).strip("() ") in {"0", "0.0"}
 
+        if self.equation_curves:
+            boundary = [self._arc_curve(outer_radius, start_angle, end_angle, elevation)]
+            if is_zero_radius:
+                boundary.append(["0", "0", elevation])
+            else:
+                boundary.append(self._arc_curve(inner_radius, start_angle, end_angle, elevation, reverse=True))
+            return create_curve_sheet(self._app, name, boundary, coordinate_system, 12)
+
+        points = self._arc_points(
+            outer_radius,
+            start_angle,
+            end_angle,
+            elevation,
+        )
         if is_zero_radius:
             points.append(["0", "0", elevation])
         else:
@@ -400,6 +403,7 @@ class CommonPrintedLogPeriodic(CommonPatch):
 
         port.color = (128, 0, 0)
         port.transparency = 0.25
+        self._declare_port(port, [lower_arm])
         return port
 
     def _finalize_planar_model(
@@ -543,19 +547,19 @@ class LogPeriodicToothed(CommonPrintedLogPeriodic):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        permittivity = self._get_material_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
         start_frequency = min(self.start_frequency, self.stop_frequency)
         stop_frequency = max(self.start_frequency, self.stop_frequency)
-        freq_low_hz = constants.unit_converter(
+        freq_low_hz = unit_converter(
             start_frequency,
             "Freq",
             self.frequency_unit,
             "Hz",
         )
-        freq_high_hz = constants.unit_converter(
+        freq_high_hz = unit_converter(
             stop_frequency,
             "Freq",
             self.frequency_unit,
@@ -563,7 +567,7 @@ class LogPeriodicToothed(CommonPrintedLogPeriodic):
         )
         wl_low_meters = constants.SpeedOfLight / freq_low_hz
         wl_high_meters = constants.SpeedOfLight / freq_high_hz
-        sub_meters = constants.unit_converter(
+        sub_meters = unit_converter(
             self.substrate_height,
             "Length",
             self.length_unit,
@@ -579,13 +583,13 @@ class LogPeriodicToothed(CommonPrintedLogPeriodic):
         wl_low_meters = correction_factor * constants.SpeedOfLight / freq_low_hz / math.sqrt(eff_permittivity)
         wl_high_meters = correction_factor * constants.SpeedOfLight / freq_high_hz / math.sqrt(eff_permittivity)
 
-        outer_radius = constants.unit_converter(
+        outer_radius = unit_converter(
             wl_low_meters / math.pi,
             "Length",
             "meter",
             self.length_unit,
         )
-        inner_radius = constants.unit_converter(
+        inner_radius = unit_converter(
             wl_high_meters / math.pi,
             "Length",
             "meter",
@@ -617,10 +621,7 @@ class LogPeriodicToothed(CommonPrintedLogPeriodic):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -662,8 +663,8 @@ class LogPeriodicToothed(CommonPrintedLogPeriodic):
             is_covered=True,
             new_properties={"Coordinate System": coordinate_system},
         )
-        self._app.modeler.subtract(upper_arm, port_cutout, keep_originals=False)
-        upper_arm = self._app.modeler[upper_arm.name]
+        booleans = BooleanPlan(self._app.modeler, self.defer_booleans)
+        booleans.subtract(upper_arm, port_cutout)
 
         port_opening = port_gap_width / 2.0
         port_extent = math.hypot(port_opening, port_width)
@@ -692,12 +693,14 @@ class LogPeriodicToothed(CommonPrintedLogPeriodic):
                 sub_h,
                 coordinate_system,
             )
-            self._app.modeler.unite([upper_arm.name, tooth.name])
-            upper_arm = self._app.modeler[upper_arm.name]
+            booleans.unite(upper_arm, tooth)
             current_outer = next_outer
             current_inner = next_inner
             tooth_index += 1
 
+        booleans.apply()
+        upper_arm = self._app.modeler[upper_arm.name]
+
         return self._finalize_planar_model(
             antenna_name,
             coordinate_system,
@@ -787,19 +790,19 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        permittivity = self._get_material_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
         start_frequency = min(self.start_frequency, self.stop_frequency)
         stop_frequency = max(self.start_frequency, self.stop_frequency)
-        freq_low_hz = constants.unit_converter(
+        freq_low_hz = unit_converter(
             start_frequency,
             "Freq",
             self.frequency_unit,
             "Hz",
         )
-        freq_high_hz = constants.unit_converter(
+        freq_high_hz = unit_converter(
             stop_frequency,
             "Freq",
             self.frequency_unit,
@@ -807,7 +810,7 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
         )
         wl_low_meters = constants.SpeedOfLight / freq_low_hz
         wl_high_meters = constants.SpeedOfLight / freq_high_hz
-        sub_meters = constants.unit_converter(
+        sub_meters = unit_converter(
             self.substrate_height,
             "Length",
             self.length_unit,
@@ -826,13 +829,13 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
         beta_half = math.radians(self._input_parameters.beta_angle / 2.0)
         delta_angle = math.radians(self._input_parameters.delta_angle)
         taper_divisor = math.tan(beta_half) + math.tan(beta_half + delta_angle)
-        outer_length = constants.unit_converter(
+        outer_length = unit_converter(
             wl_low_meters / 2.0 / taper_divisor,
             "Length",
             "meter",
             self.length_unit,
         )
-        inner_length = constants.unit_converter(
+        inner_length = unit_converter(
             wl_high_meters / 2.0 / taper_divisor,
             "Length",
             "meter",
@@ -864,10 +867,7 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -903,6 +903,7 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
             coordinate_system,
         )
 
+        booleans = BooleanPlan(self._app.modeler, self.defer_booleans)
         current_outer = outer_length
         current_inner = outer_length * sigma_ratio
         tooth_index = 1
@@ -930,8 +931,7 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
                 tooth_points,
                 coordinate_system,
             )
-            self._app.modeler.unite([upper_arm.name, tooth.name])
-            upper_arm = self._app.modeler[upper_arm.name]
+            booleans.unite(upper_arm, tooth)
 
             if tooth_index % 2:
                 next_outer = current_inner
@@ -944,6 +944,9 @@ class LogPeriodicTrapezoidal(CommonPrintedLogPeriodic):
             current_inner = next_inner
             tooth_index += 1
 
+        booleans.apply()
+        upper_arm = self._app.modeler[upper_arm.name]
+
         return self._finalize_planar_model(
             antenna_name,
             coordinate_system,
@@ -1042,31 +1045,21 @@ class LogPeriodicArray(CommonLogPeriodic):
         "num_sides": 6,
     }
 
+    # Optimum scale factor of the dipole array against its directivity, in dBi
+    _tau_chart = DesignChart(
+        [7.0, 7.5, 8.0, 8.5, 9.0, 9.5, 10.0, 10.5, 11.0],
+        [0.78, 0.824, 0.865, 0.895, 0.917, 0.925, 0.942, 0.955, 0.967],
+    )
+
     def __init__(self, *args, **kwargs):
         CommonLogPeriodic.__init__(self, self._default_input_parameters, *args, **kwargs)
         self._parameters = self.synthesis()
         self.update_synthesis_parameters(self._parameters)
         self.antenna_type = "LogPeriodicArray"
 
-    @staticmethod
-    def _find_tau_sigma(directivity):
-        directivity = min(max(directivity, 7.0), 11.0)
-        if 7.0 <= directivity < 7.5:
-            tau = 0.78 + (directivity - 7.0) / 0.5 * 0.044
-        elif 7.5 <= directivity < 8.0:
-            tau = 0.824 + (directivity - 7.5) / 0.5 * 0.041
-        elif 8.0 <= directivity < 8.5:
-            tau = 0.865 + (directivity - 8.0) / 0.5 * 0.03
-        elif 8.5 <= directivity < 9.0:
-            tau = 0.895 + (directivity - 8.5) / 0.5 * 0.022
-        elif 9.0 <= directivity < 9.5:
-            tau = 0.917 + (directivity - 9.0) / 0.5 * 0.008
-        elif 9.5 <= directivity < 10.0:
-            tau = 0.925 + (directivity - 9.5) / 0.5 * 0.017
-        elif 10.0 <= directivity < 10.5:
-            tau = 0.942 + (directivity - 10.0) / 0.5 * 0.013
-        else:
-            tau = 0.955 + (directivity - 10.5) / 0.5 * 0.012
+    @classmethod
+    def _find_tau_sigma(cls, directivity):
+        tau = cls._tau_chart(directivity)
         sigma = 0.237838 * tau - 0.047484
         return tau, sigma
 
@@ -1124,10 +1117,7 @@ class LogPeriodicArray(CommonLogPeriodic):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -1226,6 +1216,7 @@ class LogPeriodicArray(CommonLogPeriodic):
             is_covered=True,
         )
         feed_sheet.color = (128, 0, 0)
+        self._declare_port(feed_sheet, [lower_boom])
 
         load_sheet = self._app.modeler.create_rectangle(
             orientation=Plane.YZ,
@@ -0,0 +1,435 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import functools
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+# Vacuum permittivity in F/m
+VACUUM_PERMITTIVITY = 8.8541878128e-12
+
+# Materials of the AEDT system library used by the antenna models: permittivity, loss tangent, and
+# conductivity in S/m
+DEFAULT_MATERIALS = {
+    "vacuum": (1.0, 0.0, 0.0),
+    "air": (1.0006, 0.0, 0.0),
+    "pec": (1.0, 0.0, 1e30),
+    "copper": (1.0, 0.0, 58000000.0),
+    "aluminum": (1.0, 0.0, 38000000.0),
+    "gold": (1.0, 0.0, 41000000.0),
+    "FR4_epoxy": (4.4, 0.02, 0.0),
+    "Rogers RT/duroid 5880 (tm)": (2.2, 0.0009, 0.0),
+    "Rogers RT/duroid 5870 (tm)": (2.33, 0.0012, 0.0),
+    "Rogers RT/duroid 6002 (tm)": (2.94, 0.0012, 0.0),
+    "Rogers RT/duroid 6010/6010LM (tm)": (10.2, 0.0023, 0.0),
+    "Rogers RO4003 (tm)": (3.55, 0.0027, 0.0),
+    "Duroid (tm)": (2.2, 0.0009, 0.0),
+    "Teflon (tm)": (2.1, 0.001, 0.0),
+    "polystyrene": (2.6, 0.0, 0.0),
+}
+
+# Conductivity in S/m above which a material is a conductor, as in AEDT
+CONDUCTOR_THRESHOLD = 100000.0
+
+
+def _number(value):
+    """Convert a material property to a float, ``None`` when it is an expression or a tensor."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _values(frequencies, values):
+    """Return a float for scalar frequencies and an array otherwise."""
+    return float(values) if np.ndim(frequencies) == 0 else values
+
+
+class DjordjevicSarkar(object):
+    """Djordjevic-Sarkar wideband dielectric model.
+
+    The model is defined as in AEDT by the permittivity and the loss tangent at a measurement frequency,
+    the DC conductivity, and the high-frequency corner. The permittivity decreases and the loss tangent
+    stays almost constant between the low-frequency corner, which follows from the measurement, and the
+    high-frequency corner.
+
+    Parameters
+    ----------
+    permittivity : float
+        Relative permittivity at the measurement frequency.
+    loss_tangent : float
+        Loss tangent at the measurement frequency.
+    frequency : float, optional
+        Measurement frequency in Hz. The default is ``1e9``.
+    dc_conductivity : float, optional
+        Conductivity at DC in S/m. The default is ``1e-12``.
+    high_frequency : float, optional
+        High-frequency corner in Hz. The default is ``159.15494e9``.
+    """
+
+    def __init__(self, permittivity, loss_tangent, frequency=1e9, dc_conductivity=1e-12, high_frequency=159.15494e9):
+        self.frequency = float(frequency)
+        self.dc_conductivity = float(dc_conductivity)
+        self.high_frequency = float(high_frequency)
+        self.slope = (
+            permittivity * loss_tangent - dc_conductivity / (2.0 * np.pi * frequency * VACUUM_PERMITTIVITY)
+        ) / np.arctan(high_frequency / frequency)
+        self.high_permittivity = permittivity - self.slope / 2.0 * np.log(high_frequency**2 / frequency**2 + 1.0)
+        self.low_frequency = high_frequency / np.exp(10.0 * loss_tangent * self.high_permittivity / self.slope)
+
+    def permittivity(self, frequencies):
+        """Get the relative permittivity.
+
+        Parameters
+        ----------
+        frequencies : float or :class:`numpy.ndarray`
+            Frequencies in Hz.
+
+        Returns
+        -------
+        float or :class:`numpy.ndarray`
+            Relative permittivity at each frequency.
+        """
+        f2 = np.asarray(frequencies, dtype=float) ** 2
+        permittivity = self.high_permittivity + self.slope / 2.0 * np.log(
+            (self.high_frequency**2 + f2) / (self.low_frequency**2 + f2)
+        )
+        return _values(frequencies, permittivity)
+
+    def conductivity(self, frequencies):
+        """Get the equivalent conductivity of the dielectric losses.
+
+        Parameters
+        ----------
+        frequencies : float or :class:`numpy.ndarray`
+            Frequencies in Hz.
+
+        Returns
+        -------
+        float or :class:`numpy.ndarray`
+            Conductivity in S/m at each frequency.
+        """
+        f = np.asarray(frequencies, dtype=float)
+        conductivity = self.dc_conductivity + 2.0 * np.pi * f * VACUUM_PERMITTIVITY * self.slope * (
+            np.arctan(f / self.low_frequency) - np.arctan(f / self.high_frequency)
+        )
+        return _values(frequencies, conductivity)
+
+    def loss_tangent(self, frequencies):
+        """Get the loss tangent.
+
+        Parameters
+        ----------
+        frequencies : float or :class:`numpy.ndarray`
+            Frequencies in Hz.
+
+        Returns
+        -------
+        float or :class:`numpy.ndarray`
+            Loss tangent at each frequency.
+        """
+        f = np.asarray(frequencies, dtype=float)
+        loss_tangent = np.asarray(self.conductivity(f)) / (
+            2.0 * np.pi * f * VACUUM_PERMITTIVITY * np.asarray(self.permittivity(f))
+        )
+        return _values(frequencies, loss_tangent)
+
+    def to_dict(self):
+        """Convert the model to a dictionary without the values at the measurement frequency."""
+        return {
+            "frequency": self.frequency,
+            "dc_conductivity": self.dc_conductivity,
+            "high_frequency": self.high_frequency,
+        }
+
+
+class Material(object):
+    """Material of the offline material library.
+
+    Parameters
+    ----------
+    name : str
+        Material name.
+    permittivity : float, optional
+        Relative permittivity. The default is ``1.0``.
+    loss_tangent : float, optional
+        Dielectric loss tangent. The default is ``0.0``.
+    conductivity : float, optional
+        Bulk conductivity in S/m. The default is ``0.0``.
+    dispersion : :class:`DjordjevicSarkar`, optional
+        Frequency dispersion of the permittivity and loss tangent. The default is ``None``, in which
+        case they do not depend on the frequency.
+    """
+
+    def __init__(self, name, permittivity=1.0, loss_tangent=0.0, conductivity=0.0, dispersion=None):
+        self.name = name
+        self.permittivity = float(permittivity)
+        self.loss_tangent = float(loss_tangent)
+        self.conductivity = float(conductivity)
+        self.dispersion = dispersion
+
+    def is_conductor(self):
+        """Check whether the material is a conductor.
+
+        Returns
+        -------
+        bool
+        """
+        return self.conductivity > CONDUCTOR_THRESHOLD
+
+    def permittivity_at(self, frequencies):
+        """Get the relative permittivity.
+
+        Parameters
+        ----------
+        frequencies : float or :class:`numpy.ndarray`
+            Frequencies in Hz.
+
+        Returns
+        -------
+        float or :class:`numpy.ndarray`
+            Relative permittivity at each frequency.
+        """
+        if self.dispersion:
+            return self.dispersion.permittivity(frequencies)
+        return _values(frequencies, np.full(np.shape(frequencies), self.permittivity))
+
+    def loss_tangent_at(self, frequencies):
+        """Get the dielectric loss tangent.
+
+        Parameters
+        ----------
+        frequencies : float or :class:`numpy.ndarray`
+            Frequencies in Hz.
+
+        Returns
+        -------
+        float or :class:`numpy.ndarray`
+            Loss tangent at each frequency.
+        """
+        if self.dispersion:
+            return self.dispersion.loss_tangent(frequencies)
+        return _values(frequencies, np.full(np.shape(frequencies), self.loss_tangent))
+
+    @classmethod
+    def from_dict(cls, name, data):
+        """Create a material from a dictionary.
+
+        The keys are the AEDT property names, ``permittivity``, ``dielectric_loss_tangent``, and
+        ``conductivity``, and the optional ``djordjevic_sarkar`` model parameters.
+
+        Parameters
+        ----------
+        name : str
+            Material name.
+        data : dict
+            Material properties.
+
+        Returns
+        -------
+        :class:`Material` or None
+            Material, ``None`` when the permittivity is not a number, for example an expression.
+        """
+        permittivity = _number(data.get("permittivity", 1.0))
+        if permittivity is None:
+            return None
+        loss_tangent = _number(data.get("dielectric_loss_tangent", 0.0)) or 0.0
+        conductivity = _number(data.get("conductivity", 0.0)) or 0.0
+        dispersion = None
+        if data.get("djordjevic_sarkar"):
+            dispersion = DjordjevicSarkar(permittivity, loss_tangent, **data["djordjevic_sarkar"])
+        return cls(name, permittivity, loss_tangent, conductivity, dispersion)
+
+    def to_dict(self):
+        """Convert the material to a dictionary.
+
+        Returns
+        -------
+        dict
+            Material properties.
+        """
+        data = {
+            "permittivity": self.permittivity,
+            "dielectric_loss_tangent": self.loss_tangent,
+            "conductivity": self.conductivity,
+        }
+        if self.dispersion:
+            data["djordjevic_sarkar"] = self.dispersion.to_dict()
+        return data
+
+
+class MaterialLibrary(object):
+    """In-memory material library used to synthesize antennas without AEDT.
+
+    Materials are found by name, ignoring the case as AEDT does. The library is loaded from JSON files,
+    including the files exported by ``Hfss.materials.export_materials_to_file``, and from TOML files
+    with the same ``materials`` table.
+
+    Parameters
+    ----------
+    materials : list, optional
+        Materials. The default is ``None``.
+
+    Examples
+    --------
+    >>> library = default_material_library()
+    >>> library.load("substrates.toml")
+    >>> library.get("FR4_epoxy").permittivity_at(np.array([1e9, 10e9]))
+    array([4.4, 4.4])
+    """
+
+    def __init__(self, materials=None):
+        self._materials = {}
+        for material in materials or []:
+            self.add(material)
+
+    def __contains__(self, name):
+        """Check whether a material is in the library."""
+        return bool(name) and name.lower() in self._materials
+
+    def __len__(self):
+        """Get the number of materials."""
+        return len(self._materials)
+
+    @property
+    def names(self):
+        """Material names.
+
+        Returns
+        -------
+        list
+        """
+        return [material.name for material in self._materials.values()]
+
+    def add(self, material):
+        """Add a material, replacing the material with the same name.
+
+        Parameters
+        ----------
+        material : :class:`Material`
+            Material.
+        """
+        self._materials[material.name.lower()] = material
+
+    def get(self, name):
+        """Get a material by name.
+
+        Parameters
+        ----------
+        name : str
+            Material name.
+
+        Returns
+        -------
+        :class:`Material` or None
+            Material, ``None`` when it is not in the library.
+        """
+        return self._materials.get(name.lower()) if name else None
+
+    def load(self, material_file):
+        """Load the materials of a JSON or TOML file.
+
+        Materials whose permittivity is not a number, such as AEDT expressions, are skipped.
+
+        Parameters
+        ----------
+        material_file : str or :class:`pathlib.Path`
+            File with a ``materials`` table of material properties by name.
+
+        Returns
+        -------
+        int
+            Number of loaded materials.
+        """
+        material_file = Path(material_file)
+        if material_file.suffix.lower() == ".toml":
+            with material_file.open("rb") as file_handler:
+                data = tomllib.load(file_handler)
+        else:
+            data = json.loads(material_file.read_text(encoding="utf-8"))
+        count = 0
+        for name, properties in data.get("materials", {}).items():
+            material = Material.from_dict(name, properties)
+            if material:
+                self.add(material)
+                count += 1
+        return count
+
+    def save(self, material_file):
+        """Save the materials to a JSON file.
+
+        Parameters
+        ----------
+        material_file : str or :class:`pathlib.Path`
+            JSON file.
+        """
+        data = {"materials": {material.name: material.to_dict() for material in self._materials.values()}}
+        Path(material_file).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def default_material_library():
+    """Create a material library with the AEDT system materials used by the antenna models.
+
+    Returns
+    -------
+    :class:`MaterialLibrary`
+        Material library.
+    """
+    return MaterialLibrary([Material(name, *values) for name, values in DEFAULT_MATERIALS.items()])
+
+
+@functools.lru_cache(maxsize=8)
+def _file_library(material_file, modified):
+    library = default_material_library()
+    library.load(material_file)
+    return library
+
+
+def load_material_library(material_file=None):
+    """Get the default material library extended with the materials of a file.
+
+    The library of a file is kept until the file is modified.
+
+    Parameters
+    ----------
+    material_file : str or :class:`pathlib.Path`, optional
+        JSON or TOML file. The default is ``None``, in which case the default library is returned.
+
+    Returns
+    -------
+    :class:`MaterialLibrary`
+        Material library.
+    """
+    if not material_file:
+        return default_material_library()
+    material_file = Path(material_file)
+    return _file_library(str(material_file.resolve()), material_file.stat().st_mtime_ns)
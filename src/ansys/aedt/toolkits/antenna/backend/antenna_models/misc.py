@@ -24,12 +24,12 @@
 
 from collections import OrderedDict
 
-import ansys.aedt.core.generic.constants as constants
 from ansys.aedt.core.generic.constants import Plane
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonMisc(CommonAntenna):
@@ -47,11 +47,7 @@ class CommonMisc(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 if value != self.material and self.object_list:
@@ -114,6 +110,7 @@ class Bicone(CommonMisc):
         "material": "pec",
         "outer_boundary": "",
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonMisc.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -124,14 +121,14 @@ class Bicone(CommonMisc):
     @pyaedt_function_handler()
     def synthesis(self):
         """Antenna synthesis."""
-        frequency_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        frequency_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         length_unit = self.length_unit
 
-        inner_radius = constants.unit_converter(round(0.125 * (0.8 / frequency_ghz), 3), "Length", "cm", length_unit)
-        outer_radius = constants.unit_converter(round(3.0 * (0.8 / frequency_ghz), 2), "Length", "cm", length_unit)
-        cone_height = constants.unit_converter(round(5.0 * (0.8 / frequency_ghz), 2), "Length", "cm", length_unit)
-        port_gap = constants.unit_converter(round(0.25 * (0.8 / frequency_ghz), 3), "Length", "cm", length_unit)
-        port_width = constants.unit_converter(round(0.25 * (0.8 / frequency_ghz), 3), "Length", "cm", length_unit)
+        inner_radius = unit_converter(round(0.125 * (0.8 / frequency_ghz), 3), "Length", "cm", length_unit)
+        outer_radius = unit_converter(round(3.0 * (0.8 / frequency_ghz), 2), "Length", "cm", length_unit)
+        cone_height = unit_converter(round(5.0 * (0.8 / frequency_ghz), 2), "Length", "cm", length_unit)
+        port_gap = unit_converter(round(0.25 * (0.8 / frequency_ghz), 3), "Length", "cm", length_unit)
+        port_width = unit_converter(round(0.25 * (0.8 / frequency_ghz), 3), "Length", "cm", length_unit)
 
         parameters = OrderedDict(
             [
@@ -241,6 +238,7 @@ class Bicone(CommonMisc):
         self.object_list[top_cone.name] = top_cone
         self.object_list[bottom_cone.name] = bottom_cone
         self.object_list[port_lump.name] = port_lump
+        self._declare_port(port_lump, [bottom_cone])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
@@ -295,6 +293,7 @@ class Discone(CommonMisc):
         "material": "pec",
         "outer_boundary": "",
     }
+    scale_invariant = True
 
     def __init__(self, *args, **kwargs):
         CommonMisc.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -305,15 +304,15 @@ class Discone(CommonMisc):
     @pyaedt_function_handler()
     def synthesis(self):
         """Antenna synthesis."""
-        frequency_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        frequency_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         length_unit = self.length_unit
 
-        inner_radius = constants.unit_converter(round(0.125 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
-        outer_radius = constants.unit_converter(round(6.0 * (1.0 / frequency_ghz), 2), "Length", "cm", length_unit)
-        cone_height = constants.unit_converter(round(10.0 * (1.0 / frequency_ghz), 2), "Length", "cm", length_unit)
-        disk_radius = constants.unit_converter(round(3.5 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
-        port_gap = constants.unit_converter(round(0.25 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
-        port_width = constants.unit_converter(round(0.25 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
+        inner_radius = unit_converter(round(0.125 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
+        outer_radius = unit_converter(round(6.0 * (1.0 / frequency_ghz), 2), "Length", "cm", length_unit)
+        cone_height = unit_converter(round(10.0 * (1.0 / frequency_ghz), 2), "Length", "cm", length_unit)
+        disk_radius = unit_converter(round(3.5 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
+        port_gap = unit_converter(round(0.25 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
+        port_width = unit_converter(round(0.25 * (1.0 / frequency_ghz), 3), "Length", "cm", length_unit)
 
         parameters = OrderedDict(
             [
@@ -407,6 +406,7 @@ class Discone(CommonMisc):
         self.object_list[ground_disk.name] = ground_disk
         self.object_list[cone.name] = cone
         self.object_list[port_lump.name] = port_lump
+        self._declare_port(port_lump, [ground_disk])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         self._app.modeler.fit_all()
@@ -30,6 +30,7 @@ from ansys.aedt.core.generic.constants import Plane
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonMonopole(CommonAntenna):
@@ -42,7 +43,7 @@ class CommonMonopole(CommonAntenna):
 
     def _length_value(self, value, unit="meter"):
         """Convert a length value into the active antenna length unit."""
-        return constants.unit_converter(value, "Length", unit, self.length_unit)
+        return unit_converter(value, "Length", unit, self.length_unit)
 
     def _sorted_parameters(self, parameters):
         """Return a parameter dictionary sorted alphabetically by key."""
@@ -141,7 +142,7 @@ class BladeAntenna(CommonMonopole):
         collections.OrderedDict
             Synthesized geometric parameters in the active length unit.
         """
-        scale = 1.2 / constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        scale = 1.2 / unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         parameters = {
             "flare_angle": 40.0,
             "width_blade_base": 23.6 * scale,
@@ -310,6 +311,7 @@ class BladeAntenna(CommonMonopole):
         self.object_list[antenna.name] = antenna
         self.object_list[ground.name] = ground
         self.object_list[port.name] = port
+        self._declare_port(port, [ground])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
 
@@ -390,10 +392,8 @@ class CircularDiscMonopole(CommonMonopole):
         collections.OrderedDict
             Synthesized geometric parameters in the active length unit.
         """
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
-        wavelength = constants.SpeedOfLight / constants.unit_converter(
-            self.frequency, "Freq", self.frequency_unit, "Hz"
-        )
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        wavelength = constants.SpeedOfLight / unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = self._length_value(wavelength)
         pin_height = 1.17 / freq_ghz
         pin_diameter = 1.17 / freq_ghz
@@ -483,6 +483,7 @@ class CircularDiscMonopole(CommonMonopole):
         self.object_list[antenna.name] = antenna
         self.object_list[ground.name] = ground
         self.object_list[port.name] = port
+        self._declare_port(port, [ground])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
 
@@ -565,10 +566,8 @@ class EllipticalBaseStripMonopole(CommonMonopole):
         collections.OrderedDict
             Synthesized geometric parameters in the active length unit.
         """
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
-        wavelength = constants.SpeedOfLight / constants.unit_converter(
-            self.frequency, "Freq", self.frequency_unit, "Hz"
-        )
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        wavelength = constants.SpeedOfLight / unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = self._length_value(wavelength)
         strip_width = 54.855 / freq_ghz
         pin_height = 1.4628 / freq_ghz
@@ -682,6 +681,7 @@ class EllipticalBaseStripMonopole(CommonMonopole):
         self.object_list[antenna.name] = antenna
         self.object_list[ground.name] = ground
         self.object_list[port.name] = port
+        self._declare_port(port, [ground])
         self.object_list[feed_pin.name] = feed_pin
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
@@ -765,10 +765,8 @@ class VerticalTrapezoidalMonopole(CommonMonopole):
         collections.OrderedDict
             Synthesized geometric parameters in the active length unit.
         """
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
-        wavelength = constants.SpeedOfLight / constants.unit_converter(
-            self.frequency, "Freq", self.frequency_unit, "Hz"
-        )
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        wavelength = constants.SpeedOfLight / unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = self._length_value(wavelength)
         pin_height = 3.358 / freq_ghz
         parameters = {
@@ -875,6 +873,7 @@ class VerticalTrapezoidalMonopole(CommonMonopole):
         self.object_list[antenna.name] = antenna
         self.object_list[ground.name] = ground
         self.object_list[port.name] = port
+        self._declare_port(port, [ground])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
 
@@ -950,9 +949,7 @@ class WireMonopole(CommonMonopole):
         collections.OrderedDict
             Synthesized geometric parameters in the active length unit.
         """
-        wavelength = constants.SpeedOfLight / constants.unit_converter(
-            self.frequency, "Freq", self.frequency_unit, "Hz"
-        )
+        wavelength = constants.SpeedOfLight / unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = self._length_value(wavelength)
         correction_factor = 0.893
         port_gap = correction_factor * 0.0075 * wavelength
@@ -1024,6 +1021,7 @@ class WireMonopole(CommonMonopole):
         self.object_list[wire.name] = wire
         self.object_list[ground.name] = ground
         self.object_list[port.name] = port
+        self._declare_port(port, [ground])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
 
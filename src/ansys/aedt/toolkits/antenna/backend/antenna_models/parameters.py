@@ -23,8 +23,27 @@
 # SOFTWARE.
 
 import copy
+import functools
 import re
 
+# Values that can be shared between instances because they cannot be modified in place
+_IMMUTABLE_TYPES = (str, int, float, complex, bool, type(None))
+
+
+def _copy_value(value):
+    """Copy a parameter value, sharing immutable values instead of deep-copying them."""
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, tuple) and all(isinstance(item, _IMMUTABLE_TYPES) for item in value):
+        return value
+    return copy.deepcopy(value)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_attributes(cls):
+    """Get the attribute names of a class, including the inherited ones."""
+    return frozenset(dir(cls))
+
 
 class FrozenClass(object):
     __isfrozen = False
@@ -32,7 +51,7 @@ class FrozenClass(object):
     def __setattr__(self, key, value):
         """Prevent adding attributes after the object is frozen."""
         if self.__isfrozen:
-            if key not in dir(self):
+            if key not in self.__dict__ and key not in _class_attributes(type(self)):
                 raise AttributeError(
                     "{} is a frozen class. This key does not exist: {}".format(type(self).__name__, key)
                 )
@@ -46,6 +65,8 @@ class FrozenClass(object):
 
 
 class Property:
+    __slots__ = ("value", "_owner", "_name")
+
     def __init__(self, value, owner, name):
         """Initialize a property container."""
         self.value = value
@@ -79,7 +100,7 @@ class SynthesisParameters:
         self._name = ""
 
     def add_parameter(self, name, value):
-        setattr(self, name, Property(copy.deepcopy(value), self, name))
+        setattr(self, name, Property(_copy_value(value), self, name))
 
     @property
     def name(self):
@@ -96,9 +117,10 @@ class SynthesisParameters:
 class InputParameters(FrozenClass):
     def __init__(self, default_parameters):
         """Initialize input parameters and freeze their shape."""
-        self.__default_properties = copy.deepcopy(default_parameters)
-        for key, value in self.__default_properties.items():
-            setattr(self, key, copy.deepcopy(value))
+        # Immutable defaults are shared, mutable ones are copied once per instance
+        self.__default_properties = default_parameters
+        for key, value in default_parameters.items():
+            setattr(self, key, _copy_value(value))
         self._freeze()  # no new attributes after this point.
 
 
@@ -29,9 +29,11 @@ import ansys.aedt.core.generic.constants as constants
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
+from ansys.aedt.toolkits.antenna.backend.antenna_models.booleans import BooleanPlan
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import TransmissionLine
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import properties
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonPatch(CommonAntenna):
@@ -43,7 +45,7 @@ class CommonPatch(CommonAntenna):
         CommonAntenna.antenna_type = "Patch"
         CommonAntenna.__init__(self, default_input_parameters, *args, **kwargs)
         if "substrate_height" not in kwargs:
-            self.substrate_height = constants.unit_converter(
+            self.substrate_height = unit_converter(
                 self.substrate_height, "Length", default_input_parameters["length_unit"], self.length_unit
             )
         self._transmission_line_calculator = TransmissionLine(self.frequency, self.frequency_unit)
@@ -61,11 +63,7 @@ class CommonPatch(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 if value != self.material and self.object_list:
@@ -210,29 +208,14 @@ class CommonPatch(CommonAntenna):
     def element_4_port_phase(self, value):
         self._set_patch_property("element_4_port_phase", value)
 
-    def _material_permittivity(self):
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-            return permittivity
-        if self.material_properties:
-            return self.material_properties["permittivity"]
-        if self._app:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
-        return None
-
     def _patch_synthesis_base(self):
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = constants.SpeedOfLight / freq_hz
         permittivity = self._material_permittivity()
         if permittivity is None:
             return {}
         sub_permittivity = float(permittivity)
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         patch_width = 3.0e8 / ((2.0 * freq_hz) * math.sqrt((sub_permittivity + 1.0) / 2.0))
         eff_permittivity = (sub_permittivity + 1.0) / 2.0 + (sub_permittivity - 1.0) / 2.0 * math.pow(
             1.0 + 12.0 * sub_meters / patch_width, -0.5
@@ -287,17 +270,7 @@ class CommonPatch(CommonAntenna):
             port_lump = port = port_cap = None
             if f"port_lump_{self.name}" in item:
                 port_lump = self.object_list[item]
-                terminal_references = [
-                    i
-                    for i in port_lump.touching_objects
-                    if self._app.modeler[i]
-                    and (
-                        self._app.modeler[i].object_type == "Sheet"
-                        or self._app.materials[self._app.modeler[i].material_name].is_conductor()
-                    )
-                ]
-                if len(terminal_references) > 1:
-                    terminal_references = terminal_references[1:]
+                terminal_references = self._port_references(item, prefer_ground=False)
             elif f"port_{self.name}" in item and not item.startswith("port_cap_"):
                 port = self.object_list[item]
                 port_suffix = item.replace(f"port_{self.name}", "", 1)
@@ -426,26 +399,16 @@ class RectangularPatchProbe(CommonPatch):
         parameters = {}
         length_unit = self.length_unit
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         patch_width = 3.0e8 / ((2.0 * freq_hz) * math.sqrt((sub_permittivity + 1.0) / 2.0))
 
@@ -471,36 +434,36 @@ class RectangularPatchProbe(CommonPatch):
         res = 1.0 / (2.0 * g)
         offset_pin_pos = patch_length / math.pi * math.asin(math.sqrt(50.0 / res))
 
-        patch_x = constants.unit_converter(patch_width, "Length", "meter", length_unit)
+        patch_x = unit_converter(patch_width, "Length", "meter", length_unit)
         parameters["patch_x"] = patch_x
 
-        patch_y = constants.unit_converter(patch_length, "Length", "meter", length_unit)
+        patch_y = unit_converter(patch_length, "Length", "meter", length_unit)
         parameters["patch_y"] = patch_y
 
         feed_x = 0.0
         parameters["feed_x"] = feed_x
 
-        feed_y = constants.unit_converter(offset_pin_pos, "Length", "meter", length_unit)
+        feed_y = unit_converter(offset_pin_pos, "Length", "meter", length_unit)
         parameters["feed_y"] = feed_y
 
         sub_h = self.substrate_height
         parameters["sub_h"] = sub_h
 
-        sub_x = constants.unit_converter(1.5 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
+        sub_x = unit_converter(1.5 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
 
         parameters["sub_x"] = sub_x
 
-        sub_y = constants.unit_converter(1.5 * patch_length + 6.0 * sub_meters, "Length", "meter", length_unit)
+        sub_y = unit_converter(1.5 * patch_length + 6.0 * sub_meters, "Length", "meter", length_unit)
         parameters["sub_y"] = sub_y
 
-        coax_inner_rad = constants.unit_converter(0.025 * (1e8 / freq_hz), "Length", "meter", length_unit)
+        coax_inner_rad = unit_converter(0.025 * (1e8 / freq_hz), "Length", "meter", length_unit)
 
         parameters["coax_inner_rad"] = coax_inner_rad
 
-        coax_outer_rad = constants.unit_converter(0.085 * (1e8 / freq_hz), "Length", "meter", length_unit)
+        coax_outer_rad = unit_converter(0.085 * (1e8 / freq_hz), "Length", "meter", length_unit)
         parameters["coax_outer_rad"] = coax_outer_rad
 
-        feed_length = constants.unit_converter(wavelength / 6.0, "Length", "meter", length_unit)
+        feed_length = unit_converter(wavelength / 6.0, "Length", "meter", length_unit)
         parameters["feed_length"] = feed_length
 
         gnd_x = sub_x
@@ -530,10 +493,7 @@ class RectangularPatchProbe(CommonPatch):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -745,19 +705,19 @@ class EllipticalEdge(EllipticalPatchMixin, CommonPatch):
             base["sub_meters"], base["sub_permittivity"], 50.0, 150.0
         )
 
-        parameters["patch_x"] = constants.unit_converter(base["patch_width"], "Length", "meter", length_unit)
-        parameters["patch_y"] = constants.unit_converter(base["patch_length"], "Length", "meter", length_unit)
+        parameters["patch_x"] = unit_converter(base["patch_width"], "Length", "meter", length_unit)
+        parameters["patch_y"] = unit_converter(base["patch_length"], "Length", "meter", length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(
             1.5 * base["patch_width"] + 6.0 * base["sub_meters"], "Length", "meter", length_unit
         )
-        parameters["sub_y"] = constants.unit_converter(
+        parameters["sub_y"] = unit_converter(
             2.1 * (u_strip2[1] + u_strip1[1] + base["patch_length"] / 2), "Length", "meter", length_unit
         )
-        parameters["edge_feed_width"] = constants.unit_converter(u_strip1[0], "Length", "meter", length_unit)
-        parameters["edge_feed_length"] = constants.unit_converter(u_strip1[1], "Length", "meter", length_unit)
-        parameters["feed_width"] = constants.unit_converter(u_strip2[0], "Length", "meter", length_unit)
-        parameters["feed_length"] = constants.unit_converter(u_strip2[1], "Length", "meter", length_unit)
+        parameters["edge_feed_width"] = unit_converter(u_strip1[0], "Length", "meter", length_unit)
+        parameters["edge_feed_length"] = unit_converter(u_strip1[1], "Length", "meter", length_unit)
+        parameters["feed_width"] = unit_converter(u_strip2[0], "Length", "meter", length_unit)
+        parameters["feed_length"] = unit_converter(u_strip2[1], "Length", "meter", length_unit)
         parameters["pos_x"] = self.origin[0]
         parameters["pos_y"] = self.origin[1]
         parameters["pos_z"] = self.origin[2]
@@ -768,10 +728,7 @@ class EllipticalEdge(EllipticalPatchMixin, CommonPatch):
         if self.object_list:
             self._app.logger.warning("This antenna already exists.")
             return False
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -840,6 +797,7 @@ class EllipticalEdge(EllipticalPatchMixin, CommonPatch):
         self.object_list[gnd.name] = gnd
         self.object_list[ant.name] = ant
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [gnd])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         for obj in self.object_list.values():
             obj.group_name = antenna_name
@@ -890,20 +848,20 @@ class EllipticalInset(EllipticalPatchMixin, CommonPatch):
         microstrip_width = u_strip[0]
         microstrip_length = u_strip[1]
 
-        parameters["patch_x"] = constants.unit_converter(base["patch_width"], "Length", "meter", length_unit)
-        parameters["patch_y"] = constants.unit_converter(base["patch_length"], "Length", "meter", length_unit)
+        parameters["patch_x"] = unit_converter(base["patch_width"], "Length", "meter", length_unit)
+        parameters["patch_y"] = unit_converter(base["patch_length"], "Length", "meter", length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(
             1.5 * base["patch_width"] + 6.0 * base["sub_meters"], "Length", "meter", length_unit
         )
-        parameters["sub_y"] = constants.unit_converter(
+        parameters["sub_y"] = unit_converter(
             2.1 * (microstrip_length + base["patch_length"] / 2), "Length", "meter", length_unit
         )
-        parameters["inset_distance"] = constants.unit_converter(
+        parameters["inset_distance"] = unit_converter(
             base["patch_length"] / 2 - base["offset_pin_pos"], "Length", "meter", length_unit
         )
-        microstrip_width = constants.unit_converter(microstrip_width, "Length", "meter", length_unit)
-        microstrip_length = constants.unit_converter(microstrip_length, "Length", "meter", length_unit)
+        microstrip_width = unit_converter(microstrip_width, "Length", "meter", length_unit)
+        microstrip_length = unit_converter(microstrip_length, "Length", "meter", length_unit)
         parameters["inset_gap"] = round(microstrip_width / 2, 3)
         parameters["feed_width"] = round(microstrip_width, 3)
         parameters["feed_length"] = round(microstrip_length, 3)
@@ -917,10 +875,7 @@ class EllipticalInset(EllipticalPatchMixin, CommonPatch):
         if self.object_list:
             self._app.logger.warning("This antenna already exists.")
             return False
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -989,6 +944,7 @@ class EllipticalInset(EllipticalPatchMixin, CommonPatch):
         self.object_list[gnd.name] = gnd
         self.object_list[ant.name] = ant
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [gnd])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         for obj in self.object_list.values():
             obj.group_name = antenna_name
@@ -1033,25 +989,21 @@ class EllipticalProbe(EllipticalPatchMixin, CommonPatch):
             return parameters
 
         length_unit = self.length_unit
-        patch_size = constants.unit_converter(base["patch_length"], "Length", "meter", length_unit)
+        patch_size = unit_converter(base["patch_length"], "Length", "meter", length_unit)
         parameters["patch_x"] = patch_size
         parameters["patch_y"] = patch_size
-        parameters["feed_x"] = constants.unit_converter(base["offset_pin_pos"], "Length", "meter", length_unit)
+        parameters["feed_x"] = unit_converter(base["offset_pin_pos"], "Length", "meter", length_unit)
         parameters["feed_y"] = 0.0
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(
             base["patch_length"] + 6.0 * base["sub_meters"], "Length", "meter", length_unit
         )
-        parameters["sub_y"] = constants.unit_converter(
+        parameters["sub_y"] = unit_converter(
             base["patch_length"] + 6.0 * base["sub_meters"], "Length", "meter", length_unit
         )
-        parameters["coax_inner_rad"] = constants.unit_converter(
-            0.025 * (1e8 / base["freq_hz"]), "Length", "meter", length_unit
-        )
-        parameters["coax_outer_rad"] = constants.unit_converter(
-            0.085 * (1e8 / base["freq_hz"]), "Length", "meter", length_unit
-        )
-        parameters["feed_length"] = constants.unit_converter(base["wavelength"] / 6.0, "Length", "meter", length_unit)
+        parameters["coax_inner_rad"] = unit_converter(0.025 * (1e8 / base["freq_hz"]), "Length", "meter", length_unit)
+        parameters["coax_outer_rad"] = unit_converter(0.085 * (1e8 / base["freq_hz"]), "Length", "meter", length_unit)
+        parameters["feed_length"] = unit_converter(base["wavelength"] / 6.0, "Length", "meter", length_unit)
         parameters["gnd_x"] = parameters["sub_x"]
         parameters["gnd_y"] = parameters["sub_y"]
         parameters["pos_x"] = self.origin[0]
@@ -1064,10 +1016,7 @@ class EllipticalProbe(EllipticalPatchMixin, CommonPatch):
         if self.object_list:
             logger.debug("This antenna already exists")
             return False
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -1222,36 +1171,36 @@ class MbyNPatchArray(CommonPatch):
         length_unit = self.length_unit
         patch_count_x = int(self.number_of_patches_x)
         patch_count_y = int(self.number_of_patches_y)
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
         parameters["patch_count_x"] = patch_count_x
         parameters["patch_count_y"] = patch_count_y
-        parameters["patch_x"] = constants.unit_converter(base["patch_width"], "Length", "meter", length_unit)
-        parameters["patch_y"] = constants.unit_converter(base["patch_length"], "Length", "meter", length_unit)
+        parameters["patch_x"] = unit_converter(base["patch_width"], "Length", "meter", length_unit)
+        parameters["patch_y"] = unit_converter(base["patch_length"], "Length", "meter", length_unit)
         parameters["feed_x"] = 0.0
-        parameters["feed_y"] = constants.unit_converter(base["offset_pin_pos"], "Length", "meter", length_unit)
+        parameters["feed_y"] = unit_converter(base["offset_pin_pos"], "Length", "meter", length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(
             (patch_count_x - 1) * (1.5 * base["patch_width"] + 6.0 * base["sub_meters"]) + 2.0 * base["patch_width"],
             "Length",
             "meter",
             length_unit,
         )
-        parameters["sub_y"] = constants.unit_converter(
+        parameters["sub_y"] = unit_converter(
             (patch_count_y - 1) * (1.5 * base["patch_length"] + 6.0 * base["sub_meters"]) + 2.0 * base["patch_length"],
             "Length",
             "meter",
             length_unit,
         )
-        parameters["patch_spacing_x"] = constants.unit_converter(
+        parameters["patch_spacing_x"] = unit_converter(
             1.5 * base["patch_width"] + 6.0 * base["sub_meters"], "Length", "meter", length_unit
         )
-        parameters["patch_spacing_y"] = constants.unit_converter(
+        parameters["patch_spacing_y"] = unit_converter(
             1.5 * base["patch_length"] + 6.0 * base["sub_meters"], "Length", "meter", length_unit
         )
-        parameters["coax_inner_rad"] = constants.unit_converter(0.25 * (10.0 / freq_ghz), "Length", "mm", length_unit)
-        parameters["coax_outer_rad"] = constants.unit_converter(0.85 * (10.0 / freq_ghz), "Length", "mm", length_unit)
-        parameters["feed_length"] = constants.unit_converter(base["wavelength"] / 6.0, "Length", "meter", length_unit)
+        parameters["coax_inner_rad"] = unit_converter(0.25 * (10.0 / freq_ghz), "Length", "mm", length_unit)
+        parameters["coax_outer_rad"] = unit_converter(0.85 * (10.0 / freq_ghz), "Length", "mm", length_unit)
+        parameters["feed_length"] = unit_converter(base["wavelength"] / 6.0, "Length", "meter", length_unit)
         parameters["gnd_x"] = parameters["sub_x"]
         parameters["gnd_y"] = parameters["sub_y"]
         parameters["pos_x"] = self.origin[0]
@@ -1264,10 +1213,7 @@ class MbyNPatchArray(CommonPatch):
         if self.object_list:
             self._app.logger.warning("This antenna already exists.")
             return False
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -1315,6 +1261,7 @@ class MbyNPatchArray(CommonPatch):
         self.object_list[sub.name] = sub
         self.object_list[gnd.name] = gnd
 
+        booleans = BooleanPlan(self._app.modeler, self.defer_booleans)
         for i in range(patch_count_x):
             for j in range(patch_count_y):
                 x_index = i - (patch_count_x - 1) / 2
@@ -1339,7 +1286,7 @@ class MbyNPatchArray(CommonPatch):
                     name=f"void_{antenna_name}_{i}_{j}",
                     new_properties={"Coordinate System": coordinate_system},
                 )
-                self._app.modeler.subtract(gnd, void, False)
+                booleans.subtract(gnd, void)
                 feed_pin = self._app.modeler.create_cylinder(
                     orientation=2,
                     origin=feed_origin,
@@ -1392,6 +1339,7 @@ class MbyNPatchArray(CommonPatch):
                 for obj in [ant, feed_pin, feed_coax, coax, port_cap, port]:
                     self.object_list[obj.name] = obj
 
+        booleans.apply()
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         for obj in self.object_list.values():
             obj.group_name = antenna_name
@@ -1440,12 +1388,12 @@ class SeqRotated2Patch(CommonPatch):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         scale = 5.0 / freq_ghz
         length_unit = self.length_unit
 
         def scaled(value):
-            return constants.unit_converter(scale * value, "Length", "mm", length_unit)
+            return unit_converter(scale * value, "Length", "mm", length_unit)
 
         parameters["sub_h"] = self.substrate_height
         parameters["sub_x"] = scaled(80.0)
@@ -1456,9 +1404,9 @@ class SeqRotated2Patch(CommonPatch):
         parameters["notch_length"] = scaled(1.502)
         parameters["notch_width"] = scaled(3.004)
         parameters["feed_pin_offset"] = scaled(3.663)
-        parameters["coax_inner_rad"] = constants.unit_converter(0.25, "Length", "mm", length_unit)
-        parameters["coax_outer_rad"] = constants.unit_converter(0.85, "Length", "mm", length_unit)
-        parameters["feed_length"] = constants.unit_converter(2.5, "Length", "mm", length_unit)
+        parameters["coax_inner_rad"] = unit_converter(0.25, "Length", "mm", length_unit)
+        parameters["coax_outer_rad"] = unit_converter(0.85, "Length", "mm", length_unit)
+        parameters["feed_length"] = unit_converter(2.5, "Length", "mm", length_unit)
         parameters["feed_rotation_angle"] = self.feed_rotation_angle
         parameters["element_1_rotation_angle"] = self.element_1_rotation_angle
         parameters["element_2_rotation_angle"] = self.element_2_rotation_angle
@@ -1478,10 +1426,7 @@ class SeqRotated2Patch(CommonPatch):
         if self.object_list:
             self._app.logger.warning("This antenna already exists.")
             return False
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -1538,6 +1483,7 @@ class SeqRotated2Patch(CommonPatch):
         self.object_list[sub.name] = sub
         self.object_list[gnd.name] = gnd
 
+        booleans = BooleanPlan(self._app.modeler, self.defer_booleans)
         for idx, (center, rotation_angle) in enumerate(zip(centers, rotations)):
             ant = self._app.modeler.create_circle(
                 orientation=2,
@@ -1630,11 +1576,12 @@ class SeqRotated2Patch(CommonPatch):
                 [feed_pin.name, feed_coax.name, coax.name, port_cap.name, port.name, void.name],
                 center,
             )
-            self._app.modeler.subtract(gnd, void, False)
+            booleans.subtract(gnd, void)
 
             for obj in [ant, feed_pin, feed_coax, coax, port_cap, port]:
                 self.object_list[obj.name] = obj
 
+        booleans.apply()
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         for obj in self.object_list.values():
             obj.group_name = antenna_name
@@ -1742,28 +1689,18 @@ class RectangularPatchInset(CommonPatch):
         parameters = {}
         length_unit = self.length_unit
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
 
         patch_width = 3.0e8 / ((2.0 * freq_hz) * math.sqrt((sub_permittivity + 1.0) / 2.0))
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         eff_permittivity = (sub_permittivity + 1.0) / 2.0 + (sub_permittivity - 1.0) / 2.0 * math.pow(
             1.0 + 12.0 * sub_meters / patch_width, -0.5
@@ -1794,30 +1731,28 @@ class RectangularPatchInset(CommonPatch):
         microstrip_width = u_strip[0]
         microstrip_length = u_strip[1]
 
-        patch_x = constants.unit_converter(patch_width, "Length", "meter", length_unit)
+        patch_x = unit_converter(patch_width, "Length", "meter", length_unit)
         parameters["patch_x"] = patch_x
 
-        patch_y = constants.unit_converter(patch_length, "Length", "meter", length_unit)
+        patch_y = unit_converter(patch_length, "Length", "meter", length_unit)
         parameters["patch_y"] = patch_y
 
         sub_h = self.substrate_height
         parameters["sub_h"] = sub_h
 
-        sub_x = constants.unit_converter(1.5 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
+        sub_x = unit_converter(1.5 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
         parameters["sub_x"] = sub_x
 
-        sub_y = constants.unit_converter(2.1 * (microstrip_length + patch_length / 2), "Length", "meter", length_unit)
+        sub_y = unit_converter(2.1 * (microstrip_length + patch_length / 2), "Length", "meter", length_unit)
 
         parameters["sub_y"] = sub_y
 
-        inset_distance = constants.unit_converter(
-            patch_length / 2 - inset_distance_meter, "Length", "meter", length_unit
-        )
+        inset_distance = unit_converter(patch_length / 2 - inset_distance_meter, "Length", "meter", length_unit)
 
         parameters["inset_distance"] = inset_distance
 
-        microstrip_length = constants.unit_converter(microstrip_length, "Length", "meter", length_unit)
-        microstrip_width = constants.unit_converter(microstrip_width, "Length", "meter", length_unit)
+        microstrip_length = unit_converter(microstrip_length, "Length", "meter", length_unit)
+        microstrip_width = unit_converter(microstrip_width, "Length", "meter", length_unit)
 
         inset_gap = round(microstrip_width / 2, 3)
         parameters["inset_gap"] = inset_gap
@@ -1848,10 +1783,7 @@ class RectangularPatchInset(CommonPatch):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -1959,6 +1891,7 @@ class RectangularPatchInset(CommonPatch):
         self.object_list[gnd.name] = gnd
         self.object_list[ant.name] = ant
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [gnd])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
 
@@ -2057,28 +1990,18 @@ class RectangularPatchEdge(CommonPatch):
         parameters = {}
         length_unit = self.length_unit
         light_speed = constants.SpeedOfLight  # m/s
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-
-        elif self.material_properties:
-            permittivity = self.material_properties["permittivity"]
-        else:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
+        permittivity = self._material_permittivity()
+        if permittivity is None:
             return parameters
 
         sub_permittivity = float(permittivity)
 
         patch_width = 3.0e8 / ((2.0 * freq_hz) * math.sqrt((sub_permittivity + 1.0) / 2.0))
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
 
         eff_permittivity = (sub_permittivity + 1.0) / 2.0 + (sub_permittivity - 1.0) / 2.0 * math.pow(
             1.0 + 12.0 * sub_meters / patch_width, -0.5
@@ -2116,19 +2039,19 @@ class RectangularPatchEdge(CommonPatch):
         microstrip_width = u_strip2[0]
         microstrip_length = u_strip2[1]
 
-        patch_x = constants.unit_converter(patch_width, "Length", "meter", length_unit)
+        patch_x = unit_converter(patch_width, "Length", "meter", length_unit)
         parameters["patch_x"] = patch_x
 
-        patch_y = constants.unit_converter(patch_length, "Length", "meter", length_unit)
+        patch_y = unit_converter(patch_length, "Length", "meter", length_unit)
         parameters["patch_y"] = patch_y
 
         sub_h = self.substrate_height
         parameters["sub_h"] = sub_h
 
-        sub_x = constants.unit_converter(1.5 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
+        sub_x = unit_converter(1.5 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
         parameters["sub_x"] = sub_x
 
-        sub_y = constants.unit_converter(
+        sub_y = unit_converter(
             2.1 * (microstrip_length + microstrip_edge_length + patch_length / 2),
             "Length",
             "meter",
@@ -2136,18 +2059,18 @@ class RectangularPatchEdge(CommonPatch):
         )
         parameters["sub_y"] = sub_y
 
-        edge_feed_width = constants.unit_converter(microstrip_edge_width, "Length", "meter", length_unit)
+        edge_feed_width = unit_converter(microstrip_edge_width, "Length", "meter", length_unit)
 
         parameters["edge_feed_width"] = edge_feed_width
 
-        edge_feed_length = constants.unit_converter(microstrip_edge_length, "Length", "meter", length_unit)
+        edge_feed_length = unit_converter(microstrip_edge_length, "Length", "meter", length_unit)
         parameters["edge_feed_length"] = edge_feed_length
 
-        feed_width = constants.unit_converter(microstrip_width, "Length", "meter", length_unit)
+        feed_width = unit_converter(microstrip_width, "Length", "meter", length_unit)
 
         parameters["feed_width"] = feed_width
 
-        feed_length = constants.unit_converter(microstrip_length, "Length", "meter", length_unit)
+        feed_length = unit_converter(microstrip_length, "Length", "meter", length_unit)
         parameters["feed_length"] = feed_length
 
         parameters["pos_x"] = self.origin[0]
@@ -2170,10 +2093,7 @@ class RectangularPatchEdge(CommonPatch):
             self._app.logger.warning("This antenna already exists.")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -2279,6 +2199,7 @@ class RectangularPatchEdge(CommonPatch):
         self.object_list[gnd.name] = gnd
         self.object_list[ant.name] = ant
         self.object_list[p1.name] = p1
+        self._declare_port(p1, [gnd])
 
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
 
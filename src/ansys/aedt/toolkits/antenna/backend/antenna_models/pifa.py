@@ -30,6 +30,7 @@ from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonPIFA(CommonAntenna):
@@ -39,7 +40,7 @@ class CommonPIFA(CommonAntenna):
         CommonAntenna.antenna_type = "PIFA"
         CommonAntenna.__init__(self, _default_input_parameters, *args, **kwargs)
         if "substrate_height" not in kwargs:
-            self.substrate_height = constants.unit_converter(
+            self.substrate_height = unit_converter(
                 self.substrate_height, "Length", _default_input_parameters["length_unit"], self.length_unit
             )
 
@@ -51,11 +52,7 @@ class CommonPIFA(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 if value != self.material and self.object_list:
@@ -90,23 +87,6 @@ class CommonPIFA(CommonAntenna):
             self.update_synthesis_parameters(parameters)
             self.set_variables_in_hfss()
 
-    def _get_permittivity(self):
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-            return float(permittivity)
-
-        if self.material_properties:
-            return float(self.material_properties["permittivity"])
-
-        if self._app:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
-        return None
-
     @staticmethod
     def _effective_permittivity(trace_width, substrate_height, permittivity):
         return (permittivity + 1.0) / 2.0 + (permittivity - 1.0) / 2.0 * math.pow(
@@ -328,27 +308,27 @@ class PlanarInvertedF(CommonPIFA):
     def synthesis(self):
         parameters = {}
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         wavelength = light_speed / freq_hz
-        permittivity = self._get_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         eff_permittivity = self._effective_permittivity(wavelength / 80.0, sub_meters, permittivity)
         scale = (2.4 / freq_ghz / math.sqrt(eff_permittivity)) * 1.13
 
-        parameters["length1"] = constants.unit_converter(2.49 * scale, "Length", "cm", self.length_unit)
-        parameters["length2"] = constants.unit_converter(0.8 * scale, "Length", "cm", self.length_unit)
-        parameters["trace_width"] = constants.unit_converter(0.15 * scale, "Length", "cm", self.length_unit)
-        parameters["antenna_offset"] = constants.unit_converter(0.45 * scale, "Length", "cm", self.length_unit)
-        parameters["feed_offset"] = constants.unit_converter(-0.5 * scale, "Length", "cm", self.length_unit)
-        parameters["feed_length"] = constants.unit_converter(0.015 * scale, "Length", "cm", self.length_unit)
-        parameters["feed_width"] = constants.unit_converter(0.15 * scale, "Length", "cm", self.length_unit)
+        parameters["length1"] = unit_converter(2.49 * scale, "Length", "cm", self.length_unit)
+        parameters["length2"] = unit_converter(0.8 * scale, "Length", "cm", self.length_unit)
+        parameters["trace_width"] = unit_converter(0.15 * scale, "Length", "cm", self.length_unit)
+        parameters["antenna_offset"] = unit_converter(0.45 * scale, "Length", "cm", self.length_unit)
+        parameters["feed_offset"] = unit_converter(-0.5 * scale, "Length", "cm", self.length_unit)
+        parameters["feed_length"] = unit_converter(0.015 * scale, "Length", "cm", self.length_unit)
+        parameters["feed_width"] = unit_converter(0.15 * scale, "Length", "cm", self.length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(5.0 * scale, "Length", "cm", self.length_unit)
-        parameters["sub_y"] = constants.unit_converter(10.0 * scale, "Length", "cm", self.length_unit)
+        parameters["sub_x"] = unit_converter(5.0 * scale, "Length", "cm", self.length_unit)
+        parameters["sub_y"] = unit_converter(10.0 * scale, "Length", "cm", self.length_unit)
         parameters["pos_x"] = self.origin[0]
         parameters["pos_y"] = self.origin[1]
         parameters["pos_z"] = self.origin[2]
@@ -361,10 +341,7 @@ class PlanarInvertedF(CommonPIFA):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -468,6 +445,7 @@ class PlanarInvertedF(CommonPIFA):
             new_properties={"Coordinate System": coordinate_system},
         )
         port_lump.color = (255, 128, 65)
+        self._declare_port(port_lump, [gnd])
 
         objects = {
             sub.name: sub,
@@ -554,14 +532,14 @@ class ShortingPin(CommonPIFA):
         parameters = {}
         length_unit = self.length_unit
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         wavelength = light_speed / freq_hz
-        permittivity = self._get_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         patch_width = 3.0e8 / ((2.0 * freq_hz) * math.sqrt((permittivity + 1.0) / 2.0))
         eff_permittivity = self._effective_permittivity(patch_width, sub_meters, permittivity)
         effective_length = 3.0e8 / (2.0 * freq_hz * math.sqrt(eff_permittivity))
@@ -578,22 +556,18 @@ class ShortingPin(CommonPIFA):
         patch_length /= 2.63
         offset_pin_pos -= patch_length / 2.0
 
-        parameters["patch_x"] = constants.unit_converter(patch_width, "Length", "meter", length_unit)
-        parameters["patch_y"] = constants.unit_converter(patch_length, "Length", "meter", length_unit)
+        parameters["patch_x"] = unit_converter(patch_width, "Length", "meter", length_unit)
+        parameters["patch_y"] = unit_converter(patch_length, "Length", "meter", length_unit)
         parameters["short_x"] = 0.0
-        parameters["short_y"] = constants.unit_converter(-patch_length / 2.0, "Length", "meter", length_unit)
+        parameters["short_y"] = unit_converter(-patch_length / 2.0, "Length", "meter", length_unit)
         parameters["feed_x"] = 0.0
-        parameters["feed_y"] = constants.unit_converter(offset_pin_pos, "Length", "meter", length_unit)
+        parameters["feed_y"] = unit_converter(offset_pin_pos, "Length", "meter", length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
-            2.0 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit
-        )
-        parameters["sub_y"] = constants.unit_converter(
-            2.0 * patch_length + 6.0 * sub_meters, "Length", "meter", length_unit
-        )
-        parameters["coax_inner_rad"] = constants.unit_converter(0.13 * (3.0 / freq_ghz), "Length", "cm", length_unit)
-        parameters["coax_outer_rad"] = constants.unit_converter(0.44 * (3.0 / freq_ghz), "Length", "cm", length_unit)
-        parameters["feed_length"] = constants.unit_converter(wavelength / 6.0, "Length", "meter", length_unit)
+        parameters["sub_x"] = unit_converter(2.0 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
+        parameters["sub_y"] = unit_converter(2.0 * patch_length + 6.0 * sub_meters, "Length", "meter", length_unit)
+        parameters["coax_inner_rad"] = unit_converter(0.13 * (3.0 / freq_ghz), "Length", "cm", length_unit)
+        parameters["coax_outer_rad"] = unit_converter(0.44 * (3.0 / freq_ghz), "Length", "cm", length_unit)
+        parameters["feed_length"] = unit_converter(wavelength / 6.0, "Length", "meter", length_unit)
         parameters["gnd_x"] = parameters["sub_x"]
         parameters["gnd_y"] = parameters["sub_y"]
         parameters["pos_x"] = self.origin[0]
@@ -608,10 +582,7 @@ class ShortingPin(CommonPIFA):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -708,14 +679,14 @@ class ShortingPlate(CommonPIFA):
         parameters = {}
         length_unit = self.length_unit
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         wavelength = light_speed / freq_hz
-        permittivity = self._get_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         patch_width = 3.0e8 / ((2.0 * freq_hz) * math.sqrt((permittivity + 1.0) / 2.0))
         eff_permittivity = self._effective_permittivity(patch_width, sub_meters, permittivity)
         effective_length = 3.0e8 / (2.0 * freq_hz * math.sqrt(eff_permittivity))
@@ -732,22 +703,18 @@ class ShortingPlate(CommonPIFA):
         patch_length = patch_length / 2.0 * 0.95
         offset_pin_pos -= patch_length / 2.0
 
-        parameters["patch_x"] = constants.unit_converter(patch_width, "Length", "meter", length_unit)
-        parameters["patch_y"] = constants.unit_converter(patch_length, "Length", "meter", length_unit)
-        parameters["plate_w"] = constants.unit_converter(patch_width, "Length", "meter", length_unit)
+        parameters["patch_x"] = unit_converter(patch_width, "Length", "meter", length_unit)
+        parameters["patch_y"] = unit_converter(patch_length, "Length", "meter", length_unit)
+        parameters["plate_w"] = unit_converter(patch_width, "Length", "meter", length_unit)
         parameters["short_x"] = "-" + "patch_x"  # placeholder overwritten below
         parameters["feed_x"] = 0.0
-        parameters["feed_y"] = constants.unit_converter(offset_pin_pos, "Length", "meter", length_unit)
+        parameters["feed_y"] = unit_converter(offset_pin_pos, "Length", "meter", length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
-            2.0 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit
-        )
-        parameters["sub_y"] = constants.unit_converter(
-            2.0 * patch_length + 6.0 * sub_meters, "Length", "meter", length_unit
-        )
-        parameters["coax_inner_rad"] = constants.unit_converter(0.13 * (3.0 / freq_ghz), "Length", "cm", length_unit)
-        parameters["coax_outer_rad"] = constants.unit_converter(0.44 * (3.0 / freq_ghz), "Length", "cm", length_unit)
-        parameters["feed_length"] = constants.unit_converter(wavelength / 6.0, "Length", "meter", length_unit)
+        parameters["sub_x"] = unit_converter(2.0 * patch_width + 6.0 * sub_meters, "Length", "meter", length_unit)
+        parameters["sub_y"] = unit_converter(2.0 * patch_length + 6.0 * sub_meters, "Length", "meter", length_unit)
+        parameters["coax_inner_rad"] = unit_converter(0.13 * (3.0 / freq_ghz), "Length", "cm", length_unit)
+        parameters["coax_outer_rad"] = unit_converter(0.44 * (3.0 / freq_ghz), "Length", "cm", length_unit)
+        parameters["feed_length"] = unit_converter(wavelength / 6.0, "Length", "meter", length_unit)
         parameters["gnd_x"] = parameters["sub_x"]
         parameters["gnd_y"] = parameters["sub_y"]
         parameters["pos_x"] = self.origin[0]
@@ -764,10 +731,7 @@ class ShortingPlate(CommonPIFA):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
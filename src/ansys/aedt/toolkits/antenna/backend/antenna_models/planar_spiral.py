@@ -32,6 +32,7 @@ from ansys.aedt.toolkits.common.backend.logger_handler import logger
 from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import Archimedean as ConicalArchimedean
 from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import Log as ConicalLog
 from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import Sinuous as ConicalSinuous
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 def _ordered_parameters(parameters):
@@ -60,9 +61,9 @@ class _PlanarSpiralCavityMixin:
     }
 
     def _cavity_parameters(self, outer_radius):
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = constants.SpeedOfLight / start_freq_hz
-        wavelength = constants.unit_converter(wavelength, "Length", "meter", self.length_unit)
+        wavelength = unit_converter(wavelength, "Length", "meter", self.length_unit)
 
         cavity_height = self._input_parameters.cavity_height or wavelength / 4.0
         cavity_diameter = self._input_parameters.cavity_diameter or outer_radius * 2.0 * 1.05
@@ -79,10 +80,7 @@ class _PlanarSpiralCavityMixin:
         }
 
     def _resolve_material(self, material_name, fallback="vacuum"):
-        if (
-            material_name in self._app.materials.mat_names_aedt
-            or material_name.lower() in self._app.materials.mat_names_aedt_lower
-        ):
+        if self._design.has_material(material_name):
             return material_name
         logger.warning(f"Material {material_name} not found. Using {fallback} instead.")
         return fallback
@@ -219,16 +217,16 @@ class PlanarArchimedean(ConicalArchimedean):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        stop_freq_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        stop_freq_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
         center_freq_hz = (stop_freq_hz - start_freq_hz) / 2.0 + start_freq_hz
 
-        light_speed_cm = constants.unit_converter(constants.SpeedOfLight, "Length", "meter", "cm")
+        light_speed_cm = unit_converter(constants.SpeedOfLight, "Length", "meter", "cm")
         wavelength = constants.SpeedOfLight / center_freq_hz
-        wavelength = constants.unit_converter(wavelength, "Length", "meter", self.length_unit)
+        wavelength = unit_converter(wavelength, "Length", "meter", self.length_unit)
         outer_radius_cm = light_speed_cm / (2 * math.pi * start_freq_hz)
         inner_radius_cm = light_speed_cm / (2 * math.pi * stop_freq_hz)
-        inner_radius = constants.unit_converter(inner_radius_cm, "Length", "cm", self.length_unit)
+        inner_radius = unit_converter(inner_radius_cm, "Length", "cm", self.length_unit)
         turns_number = round((outer_radius_cm - inner_radius_cm) / 2.0 / math.pi / 0.1, 2)
         points = max(32, int(math.ceil(turns_number * 32)))
 
@@ -313,9 +311,9 @@ class PlanarArchimedeanCavity(_PlanarSpiralCavityMixin, PlanarArchimedean):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = dict(super().synthesis())
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
         outer_radius = constants.SpeedOfLight / (2 * math.pi * start_freq_hz)
-        outer_radius = constants.unit_converter(outer_radius, "Length", "meter", self.length_unit)
+        outer_radius = unit_converter(outer_radius, "Length", "meter", self.length_unit)
         parameters.update(self._cavity_parameters(outer_radius))
         return _ordered_parameters(parameters)
 
@@ -387,15 +385,15 @@ class PlanarLog(ConicalLog):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        stop_freq_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        stop_freq_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
 
         scale_factor = 1.25
         turns_number = 1.25
-        light_speed_cm = constants.unit_converter(constants.SpeedOfLight, "Length", "meter", "cm")
+        light_speed_cm = unit_converter(constants.SpeedOfLight, "Length", "meter", "cm")
         outer_radius_cm = scale_factor * light_speed_cm / (2 * math.pi * start_freq_hz)
         inner_radius_cm = scale_factor * light_speed_cm / (2 * math.pi * stop_freq_hz)
-        inner_radius = constants.unit_converter(inner_radius_cm, "Length", "cm", self.length_unit)
+        inner_radius = unit_converter(inner_radius_cm, "Length", "cm", self.length_unit)
         expansion_coefficient = round(math.pow(outer_radius_cm / inner_radius_cm, 1.0 / turns_number), 2)
         points = max(32, int(math.ceil(turns_number * 32)))
 
@@ -553,8 +551,8 @@ class PlanarSinuous(ConicalSinuous):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        start_freq_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        stop_freq_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        start_freq_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        stop_freq_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
 
         scale_factor = 1.25
         cell_number = 8
@@ -562,10 +560,10 @@ class PlanarSinuous(ConicalSinuous):
         delta_angle = 22.5
         angle_sum = math.radians(alpha_angle) + math.radians(delta_angle)
         outer_radius = scale_factor * constants.SpeedOfLight / start_freq_hz / 4.0 / angle_sum
-        outer_radius = constants.unit_converter(outer_radius, "Length", "meter", self.length_unit)
+        outer_radius = unit_converter(outer_radius, "Length", "meter", self.length_unit)
         inner_radius = scale_factor * constants.SpeedOfLight / stop_freq_hz / 4.0 / 2.0 / angle_sum
-        inner_radius = constants.unit_converter(inner_radius, "Length", "meter", self.length_unit)
-        port_extension = constants.unit_converter(0.1, "Length", "cm", self.length_unit)
+        inner_radius = unit_converter(inner_radius, "Length", "meter", self.length_unit)
+        port_extension = unit_converter(0.1, "Length", "cm", self.length_unit)
 
         parameters["alpha_angle"] = alpha_angle
         parameters["arms_number"] = 4
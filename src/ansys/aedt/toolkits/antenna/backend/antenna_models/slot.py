@@ -31,6 +31,7 @@ from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import TransmissionLine
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 def _ordered_parameters(parameters):
@@ -57,7 +58,7 @@ class CommonPrintedSlot(CommonSlot):
     def __init__(self, default_input_parameters, *args, **kwargs):
         CommonSlot.__init__(self, default_input_parameters, *args, **kwargs)
         if "substrate_height" not in kwargs:
-            self.substrate_height = constants.unit_converter(
+            self.substrate_height = unit_converter(
                 self.substrate_height, "Length", default_input_parameters["length_unit"], self.length_unit
             )
         self._transmission_line_calculator = TransmissionLine(self.frequency, self.frequency_unit)
@@ -69,11 +70,7 @@ class CommonPrintedSlot(CommonSlot):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
             else:
                 self._input_parameters.material = value
@@ -100,19 +97,6 @@ class CommonPrintedSlot(CommonSlot):
             self.update_synthesis_parameters(parameters)
             self.set_variables_in_hfss()
 
-    def _substrate_permittivity(self):
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-            return float(permittivity)
-        if self.material_properties:
-            return float(self.material_properties["permittivity"])
-        return None
-
     @staticmethod
     def _suspended_microstrip_permittivity(wavelength, trace_width, substrate_height, permittivity):
         ratio = trace_width / substrate_height if substrate_height else 0.0
@@ -188,35 +172,33 @@ class SlotGap(CommonPrintedSlot):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        permittivity = self._substrate_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = constants.SpeedOfLight / freq_hz
-        substrate_height = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        substrate_height = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         eff_permittivity = self._suspended_microstrip_permittivity(
             wavelength, wavelength / 80.0, substrate_height, permittivity
         )
         eff_wavelength = wavelength / math.sqrt(eff_permittivity)
         correction_factor = 1.15
 
-        parameters["slot_length"] = constants.unit_converter(
+        parameters["slot_length"] = unit_converter(
             correction_factor * eff_wavelength / 2.0, "Length", "meter", self.length_unit
         )
-        parameters["slot_width"] = constants.unit_converter(
+        parameters["slot_width"] = unit_converter(
             correction_factor * eff_wavelength / 40.0, "Length", "meter", self.length_unit
         )
-        parameters["feed_offset"] = constants.unit_converter(
+        parameters["feed_offset"] = unit_converter(
             correction_factor * eff_wavelength * (1.0 / 4.0 - 1.0 / 9.0), "Length", "meter", self.length_unit
         )
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(
             correction_factor * 0.75 * eff_wavelength, "Length", "meter", self.length_unit
         )
-        parameters["sub_y"] = constants.unit_converter(
-            correction_factor * eff_wavelength, "Length", "meter", self.length_unit
-        )
+        parameters["sub_y"] = unit_converter(correction_factor * eff_wavelength, "Length", "meter", self.length_unit)
         parameters["pos_x"] = self.origin[0]
         parameters["pos_y"] = self.origin[1]
         parameters["pos_z"] = self.origin[2]
@@ -229,10 +211,7 @@ class SlotGap(CommonPrintedSlot):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -289,6 +268,7 @@ class SlotGap(CommonPrintedSlot):
         self.object_list[gnd.name] = gnd
         self.object_list[split_gnd.name] = split_gnd
         self.object_list[port.name] = port
+        self._declare_port(port, [gnd])
 
         _set_group_and_move(self, sub, gnd, port)
         return True
@@ -359,13 +339,13 @@ class SlotMicrostrip(CommonPrintedSlot):
     @pyaedt_function_handler()
     def synthesis(self):
         parameters = {}
-        permittivity = self._substrate_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = constants.SpeedOfLight / freq_hz
-        substrate_height = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        substrate_height = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         eff_permittivity = self._suspended_microstrip_permittivity(
             wavelength, wavelength / 80.0, substrate_height, permittivity
         )
@@ -375,26 +355,22 @@ class SlotMicrostrip(CommonPrintedSlot):
         )
         correction_factor = 1.15
 
-        parameters["slot_length"] = constants.unit_converter(
+        parameters["slot_length"] = unit_converter(
             correction_factor * eff_wavelength / 2.0, "Length", "meter", self.length_unit
         )
-        parameters["slot_width"] = constants.unit_converter(
+        parameters["slot_width"] = unit_converter(
             correction_factor * eff_wavelength / 40.0, "Length", "meter", self.length_unit
         )
-        parameters["feed_offset"] = constants.unit_converter(
+        parameters["feed_offset"] = unit_converter(
             correction_factor * eff_wavelength * (1.0 / 4.0 - 1.0 / 9.0), "Length", "meter", self.length_unit
         )
-        parameters["microstrip_width"] = constants.unit_converter(microstrip_width, "Length", "meter", self.length_unit)
-        parameters["microstrip_offset"] = constants.unit_converter(
-            microstrip_length, "Length", "meter", self.length_unit
-        )
+        parameters["microstrip_width"] = unit_converter(microstrip_width, "Length", "meter", self.length_unit)
+        parameters["microstrip_offset"] = unit_converter(microstrip_length, "Length", "meter", self.length_unit)
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(
             correction_factor * 0.75 * eff_wavelength, "Length", "meter", self.length_unit
         )
-        parameters["sub_y"] = constants.unit_converter(
-            correction_factor * eff_wavelength, "Length", "meter", self.length_unit
-        )
+        parameters["sub_y"] = unit_converter(correction_factor * eff_wavelength, "Length", "meter", self.length_unit)
         parameters["pos_x"] = self.origin[0]
         parameters["pos_y"] = self.origin[1]
         parameters["pos_z"] = self.origin[2]
@@ -407,10 +383,7 @@ class SlotMicrostrip(CommonPrintedSlot):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
@@ -478,6 +451,7 @@ class SlotMicrostrip(CommonPrintedSlot):
         self.object_list[gnd.name] = gnd
         self.object_list[microstrip.name] = microstrip
         self.object_list[port.name] = port
+        self._declare_port(port, [gnd])
 
         _set_group_and_move(self, sub, gnd, microstrip, port)
         return True
@@ -538,7 +512,7 @@ class SlotTBar(CommonSlot):
 
     @pyaedt_function_handler()
     def synthesis(self):
-        design_frequency = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        design_frequency = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         scale = 1.0 / design_frequency
         parameters = {
             "antenna_length": 400.0 * scale,
@@ -654,6 +628,7 @@ class SlotTBar(CommonSlot):
         self.object_list[cavity.name] = cavity
         self.object_list[signal.name] = signal
         self.object_list[port.name] = port
+        self._declare_port(port, [cavity])
 
         _set_group_and_move(self, cavity, signal, port)
         return True
@@ -717,7 +692,7 @@ class SlotCavityBackedArray(CommonSlot):
 
     @pyaedt_function_handler()
     def synthesis(self):
-        design_frequency = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        design_frequency = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         scale = 3.0 / design_frequency
         parameters = {
             "reflector_length": 332.4 * scale,
@@ -883,6 +858,7 @@ class SlotCavityBackedArray(CommonSlot):
         self.object_list[cavity_face.name] = cavity_face
         self.object_list[pin.name] = pin
         self.object_list[port.name] = port
+        self._declare_port(port, [cavity])
 
         _set_group_and_move(self, cavity, cavity_face, pin, port)
         return True
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import functools
+
+import ansys.aedt.core.generic.constants as constants
+
+
+@functools.lru_cache(maxsize=None)
+def conversion_factor(unit_system, input_units, output_units):
+    """Get the scale factors of a linear unit conversion.
+
+    The factors are resolved once per unit system and units from the AEDT unit tables.
+
+    Parameters
+    ----------
+    unit_system : str
+        Unit system, for example ``"Length"`` or ``"Freq"``.
+    input_units : str
+        Input units.
+    output_units : str
+        Output units.
+
+    Returns
+    -------
+    tuple or None
+        Input and output unit scales. A value is converted with ``value * input_scale / output_scale``.
+        ``None`` when the conversion is not linear or the units are unknown.
+    """
+    units = constants.AEDT_UNITS.get(unit_system)
+    if not units or unit_system == "Temperature":
+        return None
+    input_scale = units.get(input_units)
+    output_scale = units.get(output_units)
+    if not isinstance(input_scale, (int, float)) or not isinstance(output_scale, (int, float)):
+        return None
+    return input_scale, output_scale
+
+
+def unit_converter(values, unit_system="Length", input_units="meter", output_units="mm"):
+    """Convert values between units of a unit system.
+
+    This function is a drop-in replacement of ``ansys.aedt.core.generic.constants.unit_converter`` for
+    the synthesis. Linear conversions are applied with cached scale factors. Other conversions, such as
+    temperatures, decibels or unknown units, are delegated to PyAEDT.
+
+    Parameters
+    ----------
+    values : float, list or :class:`numpy.ndarray`
+        Values to convert. Arrays are converted in a single vectorized operation.
+    unit_system : str, optional
+        Unit system. The default is ``"Length"``.
+    input_units : str, optional
+        Input units. The default is ``"meter"``.
+    output_units : str, optional
+        Output units. The default is ``"mm"``.
+
+    Returns
+    -------
+    float, list or :class:`numpy.ndarray`
+        Converted values, of the same type as the input values.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+    >>> unit_converter(0.01, "Length", "meter", "mm")
+    10.0
+    """
+    factor = conversion_factor(unit_system, input_units, output_units)
+    if factor is None:
+        return constants.unit_converter(values, unit_system, input_units, output_units)
+    input_scale, output_scale = factor
+    if isinstance(values, list):
+        return [value * input_scale / output_scale for value in values]
+    return values * input_scale / output_scale
@@ -29,8 +29,13 @@ import ansys.aedt.core.generic.constants as constants
 from ansys.aedt.core.generic.constants import Plane
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
+import numpy as np
 
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import ParametricCurve
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import create_curve_sheet
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import polygon_points
 from ansys.aedt.toolkits.antenna.backend.antenna_models.patch import CommonPatch
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 
 
 class CommonVivaldi(CommonPatch):
@@ -106,53 +111,72 @@ class CommonVivaldi(CommonPatch):
     def _sync_center_frequency(self):
         self._input_parameters.frequency = (self.start_frequency + self.stop_frequency) / 2.0
 
-    def _get_material_permittivity(self):
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            mat_props = self._app.materials[self.material]
-            permittivity = mat_props.permittivity.value
-            self._input_parameters.material_properties["permittivity"] = permittivity
-            return float(permittivity)
-        if self.material_properties:
-            return float(self.material_properties["permittivity"])
-        if self._app:
-            self._app.logger.warning("Material is not found. Create the material before assigning it.")
-        return None
-
     def _point_count_value(self):
         point_count = getattr(self.synthesis_parameters, self._point_parameter_name).value
         return max(2, int(round(float(point_count))))
 
-    def _taper_points(self, stepped=False):
-        point_count = self._point_count_value()
+    def _taper_curve(self):
         total_length = self.synthesis_parameters.sub_y.hfss_variable
         taper_length = self.synthesis_parameters.taper_length.hfss_variable
-        taper_start = f"{total_length}-{taper_length}"
         slot_width = self.synthesis_parameters.slot_width.hfss_variable
         taper_width = self.synthesis_parameters.taper_width.hfss_variable
+        y_t = f"{taper_width}/2*exp((-log({slot_width}/{taper_width})/{taper_length})*((_t)-{total_length}))"
+        return ParametricCurve("_t", y_t, "0", f"{total_length}-{taper_length}", total_length, reverse=True)
+
+    def _taper_segments(self):
+        # Equation-based curves are segmented evenly by AEDT, polygons take the adaptive vertices
+        total_length = self.synthesis_parameters.sub_y.value
+        taper_length = self.synthesis_parameters.taper_length.value
+        taper_width = self.synthesis_parameters.taper_width.value
+        growth = -math.log(self.synthesis_parameters.slot_width.value / taper_width) / taper_length
+
+        def taper(x):
+            return x, taper_width / 2.0 * np.exp(growth * (x - total_length))
+
+        samples = self._sample_curve(
+            "taper",
+            taper,
+            total_length - taper_length,
+            total_length,
+            self._point_count_value(),
+            initial_segments=4,
+            uniform=self.equation_curves,
+        )
+        if self.equation_curves or samples.tolerance is None:
+            return samples.vertex_count - 1
+        return samples.fractions
 
-        def y_expr(x_expr):
-            return (
-                f"{taper_width}/2*exp((-log({slot_width}/{taper_width})/{taper_length})*((({x_expr})-{total_length})))"
-            )
+    def _taper_boundary(self):
+        total_length = self.synthesis_parameters.sub_y.hfss_variable
+        taper_length = self.synthesis_parameters.taper_length.hfss_variable
+        return [
+            self._taper_curve(),
+            [f"{total_length}-{taper_length}", "0", "0"],
+            [total_length, "0", "0"],
+        ]
+
+    def _taper_points(self, stepped=False):
+        point_count = self._point_count_value()
+        if not stepped:
+            return polygon_points(self._taper_boundary(), point_count)
 
+        curve = self._taper_curve()
+        total_length = self.synthesis_parameters.sub_y.hfss_variable
+        taper_length = self.synthesis_parameters.taper_length.hfss_variable
+        taper_start = f"{total_length}-{taper_length}"
         x_points = [f"{taper_start}+{idx}*{taper_length}/{point_count}" for idx in range(point_count + 1)]
 
-        if stepped:
-            points = []
-            for idx in range(point_count, 0, -1):
-                points.append([x_points[idx], y_expr(x_points[idx]), "0"])
-                points.append([x_points[idx - 1], y_expr(x_points[idx]), "0"])
-        else:
-            points = [[x_points[idx], y_expr(x_points[idx]), "0"] for idx in range(point_count, -1, -1)]
+        points = []
+        for idx in range(point_count, 0, -1):
+            y_expr = curve.point(x_points[idx])[1]
+            points.append([x_points[idx], y_expr, "0"])
+            points.append([x_points[idx - 1], y_expr, "0"])
 
         points.extend(
             [
                 [taper_start, "0", "0"],
                 [total_length, "0", "0"],
-                [total_length, y_expr(total_length), "0"],
+                curve.point(total_length),
             ]
         )
         points.append(points[0])
@@ -178,20 +202,31 @@ class CommonVivaldi(CommonPatch):
             new_properties={"Coordinate System": coordinate_system},
         )
 
-        slot_half = self._app.modeler.create_polyline(
-            self._taper_points(stepped=stepped),
-            cover_surface=True,
-            name=f"{name}_slot_half",
-        )
+        if stepped:
+            # Steps are not a smooth curve, the stepped taper stays a polyline
+            slot_half = self._app.modeler.create_polyline(
+                self._taper_points(stepped=True),
+                cover_surface=True,
+                name=f"{name}_slot_half",
+            )
 
-        # Set coordinate system of polyline
-        slot_half_obj = self._app.get_oo_object(self._app.oeditor, slot_half.name)
-        self._app.set_oo_property_value(
-            aedt_object=slot_half_obj,
-            object_name="CreatePolyline:1",
-            prop_name="Coordinate System",
-            value=coordinate_system,
-        )
+            # Set coordinate system of polyline
+            slot_half_obj = self._app.get_oo_object(self._app.oeditor, slot_half.name)
+            self._app.set_oo_property_value(
+                aedt_object=slot_half_obj,
+                object_name="CreatePolyline:1",
+                prop_name="Coordinate System",
+                value=coordinate_system,
+            )
+        else:
+            slot_half = create_curve_sheet(
+                self._app,
+                f"{name}_slot_half",
+                self._taper_boundary(),
+                coordinate_system,
+                self._taper_segments(),
+                self.equation_curves,
+            )
 
         tool_objects = [slot_half.name]
 
@@ -270,18 +305,18 @@ class CommonVivaldi(CommonPatch):
     def synthesis(self):
         """Antenna synthesis."""
         parameters = {}
-        permittivity = self._get_material_permittivity()
+        permittivity = self._material_permittivity()
         if permittivity is None:
             return parameters
 
-        freqlo_hz = constants.unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
-        freqhi_hz = constants.unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
+        freqlo_hz = unit_converter(self.start_frequency, "Freq", self.frequency_unit, "Hz")
+        freqhi_hz = unit_converter(self.stop_frequency, "Freq", self.frequency_unit, "Hz")
         freqmid_hz = (freqhi_hz - freqlo_hz) / 2.0 + freqlo_hz
         light_speed = constants.SpeedOfLight
         wl_meters_low = light_speed / freqlo_hz
         wl_meters_mid = light_speed / freqmid_hz
 
-        sub_meters = constants.unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
+        sub_meters = unit_converter(self.substrate_height, "Length", self.length_unit, "meter")
         stripline_width = self._transmission_line_calculator.stripline_calculator(
             sub_meters, permittivity, impedance=50.0
         )
@@ -289,24 +324,22 @@ class CommonVivaldi(CommonPatch):
 
         length_unit = self.length_unit
         mid_quarter_guided = wl_meters_mid / math.sqrt(permittivity) / 4.0
-        extra_length = constants.unit_converter(5.0, "Length", "mm", "meter")
+        extra_length = unit_converter(5.0, "Length", "mm", "meter")
 
-        parameters["slot_width"] = constants.unit_converter(slot_width, "Length", "meter", length_unit)
+        parameters["slot_width"] = unit_converter(slot_width, "Length", "meter", length_unit)
         parameters["feeder_length"] = self.feeder_length
-        parameters["taper_width"] = constants.unit_converter(wl_meters_low / 2.0, "Length", "meter", length_unit)
-        parameters["taper_length"] = constants.unit_converter(wl_meters_low, "Length", "meter", length_unit)
-        parameters["balun_width"] = constants.unit_converter(mid_quarter_guided, "Length", "meter", length_unit)
-        parameters["balun_length"] = constants.unit_converter(mid_quarter_guided, "Length", "meter", length_unit)
+        parameters["taper_width"] = unit_converter(wl_meters_low / 2.0, "Length", "meter", length_unit)
+        parameters["taper_length"] = unit_converter(wl_meters_low, "Length", "meter", length_unit)
+        parameters["balun_width"] = unit_converter(mid_quarter_guided, "Length", "meter", length_unit)
+        parameters["balun_length"] = unit_converter(mid_quarter_guided, "Length", "meter", length_unit)
         parameters[self._point_parameter_name] = self._point_count
-        parameters["stripline_width"] = constants.unit_converter(stripline_width, "Length", "meter", length_unit)
-        parameters["stripline_length"] = constants.unit_converter(
-            mid_quarter_guided * 1.4, "Length", "meter", length_unit
-        )
-        parameters["stripline_offset"] = constants.unit_converter(mid_quarter_guided, "Length", "meter", length_unit)
+        parameters["stripline_width"] = unit_converter(stripline_width, "Length", "meter", length_unit)
+        parameters["stripline_length"] = unit_converter(mid_quarter_guided * 1.4, "Length", "meter", length_unit)
+        parameters["stripline_offset"] = unit_converter(mid_quarter_guided, "Length", "meter", length_unit)
         parameters["feed_offset"] = 0.0
         parameters["sub_h"] = self.substrate_height
-        parameters["sub_x"] = constants.unit_converter(wl_meters_low, "Length", "meter", length_unit)
-        parameters["sub_y"] = constants.unit_converter(
+        parameters["sub_x"] = unit_converter(wl_meters_low, "Length", "meter", length_unit)
+        parameters["sub_y"] = unit_converter(
             wl_meters_low + mid_quarter_guided + extra_length, "Length", "meter", length_unit
         )
         parameters["pos_x"] = self.origin[0]
@@ -324,10 +357,7 @@ class CommonVivaldi(CommonPatch):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material is not found. Create the material before assigning it.")
             return False
 
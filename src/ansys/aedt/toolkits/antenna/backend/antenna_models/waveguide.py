@@ -25,14 +25,15 @@
 from collections import OrderedDict
 import re
 
-import ansys.aedt.core.generic.constants as constants
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
 
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import StandardWaveguide
 from ansys.aedt.toolkits.antenna.backend.antenna_models.parameters import Property
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
 from ansys.aedt.toolkits.antenna.backend.models import properties
+from ansys.aedt.toolkits.antenna.backend.tracing import traced
 
 _DIMENSIONLESS_PARAMETER_RE = re.compile("|".join(["ratio", "coefficient", "points", "number"]))
 
@@ -52,11 +53,7 @@ class CommonWaveguide(CommonAntenna):
     @material.setter
     def material(self, value):
         if self._app:
-            if (
-                value
-                and value not in self._app.materials.mat_names_aedt
-                and value not in self._app.materials.mat_names_aedt_lower
-            ):
+            if value and not self._design.has_material(value):
                 logger.debug("Material not defined")
                 return
             if value != self.material and self.object_list:
@@ -81,6 +78,7 @@ class CommonWaveguide(CommonAntenna):
         """Waveguide material properties."""
         return self._input_parameters.material_properties
 
+    @traced(category="model")
     @pyaedt_function_handler()
     def set_variables_in_hfss(self, not_used=None):
         """Create HFSS design variables."""
@@ -90,11 +88,11 @@ class CommonWaveguide(CommonAntenna):
             if isinstance(parameter, Property) and parameter.hfss_variable not in not_used:
                 properties.antenna.parameters_hfss[parameter.name] = parameter.hfss_variable
                 if "angle" in parameter.hfss_variable:
-                    self._app[parameter.hfss_variable] = str(parameter.value) + "deg"
+                    self._set_variable(parameter.hfss_variable, str(parameter.value) + "deg")
                 elif _DIMENSIONLESS_PARAMETER_RE.search(parameter.hfss_variable):
-                    self._app[parameter.hfss_variable] = str(int(parameter.value))
+                    self._set_variable(parameter.hfss_variable, str(int(parameter.value)))
                 else:
-                    self._app[parameter.hfss_variable] = str(parameter.value) + self.length_unit
+                    self._set_variable(parameter.hfss_variable, str(parameter.value) + self.length_unit)
 
 
 class CircularWaveguide(CommonWaveguide):
@@ -166,15 +164,15 @@ class CircularWaveguide(CommonWaveguide):
     def synthesis(self):
         """Antenna synthesis."""
         parameters = {}
-        frequency_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        frequency_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
 
-        parameters["wg_length"] = self._input_parameters.wg_length or constants.unit_converter(
+        parameters["wg_length"] = self._input_parameters.wg_length or unit_converter(
             2.0 * (10.0 / frequency_ghz), "Length", "in", self.length_unit
         )
-        parameters["wg_radius"] = self._input_parameters.wg_radius or constants.unit_converter(
+        parameters["wg_radius"] = self._input_parameters.wg_radius or unit_converter(
             0.45 * (10.0 / frequency_ghz), "Length", "in", self.length_unit
         )
-        parameters["wall_thickness"] = self._input_parameters.wall_thickness or constants.unit_converter(
+        parameters["wall_thickness"] = self._input_parameters.wall_thickness or unit_converter(
             0.02 * (10.0 / frequency_ghz), "Length", "in", self.length_unit
         )
         parameters["pos_x"] = self.origin[0]
@@ -190,10 +188,7 @@ class CircularWaveguide(CommonWaveguide):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -344,7 +339,7 @@ class RectangularWaveguide(CommonWaveguide):
     def synthesis(self):
         """Antenna synthesis."""
         parameters = {}
-        frequency_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        frequency_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         waveguide = StandardWaveguide()
         wg_name = self._input_parameters.wg_standard
         if not wg_name or str(wg_name).lower() == "auto":
@@ -354,7 +349,7 @@ class RectangularWaveguide(CommonWaveguide):
         parameters["wg_width"] = self._input_parameters.wg_width or dimensions[0]
         parameters["wg_height"] = self._input_parameters.wg_height or dimensions[1]
         parameters["wall_thickness"] = self._input_parameters.wall_thickness or dimensions[2]
-        parameters["wg_length"] = self._input_parameters.wg_length or constants.unit_converter(
+        parameters["wg_length"] = self._input_parameters.wg_length or unit_converter(
             2.0 * (10.0 / frequency_ghz), "Length", "in", self.length_unit
         )
         parameters["pos_x"] = self.origin[0]
@@ -370,10 +365,7 @@ class RectangularWaveguide(CommonWaveguide):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -564,7 +556,7 @@ class RectangularWaveguideSlotArray(CommonWaveguide):
     def synthesis(self):
         """Antenna synthesis."""
         parameters = {}
-        frequency_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        frequency_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         scale = 10.3 / frequency_ghz
         waveguide = StandardWaveguide()
         wg_name = self._input_parameters.wg_standard
@@ -573,7 +565,7 @@ class RectangularWaveguideSlotArray(CommonWaveguide):
         dimensions = waveguide.get_waveguide_dimensions(wg_name, self.length_unit)
 
         def scaled(default_mm):
-            return constants.unit_converter(default_mm * scale, "Length", "mm", self.length_unit)
+            return unit_converter(default_mm * scale, "Length", "mm", self.length_unit)
 
         slots_number = max(2, int(self._input_parameters.slots_number))
         parameters["wg_width"] = self._input_parameters.wg_width or dimensions[0]
@@ -612,10 +604,7 @@ class RectangularWaveguideSlotArray(CommonWaveguide):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -30,8 +30,78 @@ from ansys.aedt.core.generic.constants import Axis
 from ansys.aedt.core.generic.constants import Plane
 from ansys.aedt.core.generic.general_methods import pyaedt_function_handler
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
+import numpy as np
 
+from ansys.aedt.toolkits.antenna.backend.antenna_models.charts import BandChart
 from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+
+_ViezbickeYagi = namedtuple("ViezbickeYagi", ["reflector_length", "director_spacing", "director_lengths", "gain"])
+
+# Optimized Yagi-Uda designs from Viezbicke (NBS Technical Note 688), in wavelengths
+_VIEZBICKE_DESIGNS = (
+    _ViezbickeYagi(reflector_length=0.482, director_spacing=0.2, director_lengths=(0.424,), gain=9.26),
+    _ViezbickeYagi(
+        reflector_length=0.482,
+        director_spacing=0.2,
+        director_lengths=(0.428, 0.424, 0.428),
+        gain=11.36,
+    ),
+    _ViezbickeYagi(
+        reflector_length=0.482,
+        director_spacing=0.25,
+        director_lengths=(0.428, 0.420, 0.420, 0.428),
+        gain=12.36,
+    ),
+    _ViezbickeYagi(
+        reflector_length=0.482,
+        director_spacing=0.20,
+        director_lengths=(0.432, 0.415, 0.407, 0.398, 0.390, 0.390, 0.390, 0.390, 0.398, 0.407),
+        gain=14.41,
+    ),
+    _ViezbickeYagi(
+        reflector_length=0.482,
+        director_spacing=0.20,
+        director_lengths=(
+            0.428,
+            0.420,
+            0.407,
+            0.398,
+            0.394,
+            0.390,
+            0.386,
+            0.386,
+            0.386,
+            0.386,
+            0.386,
+            0.386,
+            0.386,
+            0.386,
+            0.386,
+        ),
+        gain=15.56,
+    ),
+    _ViezbickeYagi(
+        reflector_length=0.475,
+        director_spacing=0.308,
+        director_lengths=(
+            0.424,
+            0.424,
+            0.420,
+            0.407,
+            0.403,
+            0.398,
+            0.394,
+            0.390,
+            0.390,
+            0.390,
+            0.390,
+            0.390,
+            0.390,
+        ),
+        gain=16.36,
+    ),
+)
 
 
 class CommonYagiUda(CommonAntenna):
@@ -77,22 +147,22 @@ class CommonYagiUda(CommonAntenna):
         if not self._app:
             return self.material
 
-        if (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
+        if self._design.has_material(self.material):
             return self.material
 
         material_name = self.material or f"{self.antenna_type}_material"
-        if material_name in self._app.materials.mat_names_aedt_lower:
+        if self._design.has_material(material_name):
             return material_name
 
         mat = self._app.materials.add_material(material_name)
+        permittivity = None
         if self.material_properties:
             if "permittivity" in self.material_properties:
-                mat.permittivity = float(self.material_properties["permittivity"])
+                permittivity = float(self.material_properties["permittivity"])
+                mat.permittivity = permittivity
             if "conductivity" in self.material_properties:
                 mat.conductivity = float(self.material_properties["conductivity"])
+        self._design.add_material(material_name, permittivity)
         self._input_parameters.material = material_name
         return material_name
 
@@ -180,19 +250,13 @@ class QuasiYagi(CommonYagiUda):
     def synthesis(self):
         """Antenna synthesis."""
         parameters = {}
-        freq_ghz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
+        freq_ghz = unit_converter(self.frequency, "Freq", self.frequency_unit, "GHz")
         scale = self._base_frequency / freq_ghz
 
-        if self._app and (
-            self.material in self._app.materials.mat_names_aedt
-            or self.material in self._app.materials.mat_names_aedt_lower
-        ):
-            self._input_parameters.material_properties["permittivity"] = self._app.materials[
-                self.material
-            ].permittivity.value
+        self._material_permittivity()
 
         for key, value in self._base_dimensions_mm.items():
-            parameters[key] = constants.unit_converter(value * scale, "Length", "mm", self.length_unit)
+            parameters[key] = unit_converter(value * scale, "Length", "mm", self.length_unit)
 
         parameters["sub_h"] = self.substrate_height
         parameters["sub_length"] = (
@@ -303,6 +367,7 @@ class QuasiYagi(CommonYagiUda):
         self.object_list[driver.name] = driver
         self.object_list[launcher.name] = launcher
         self.object_list[port.name] = port
+        self._declare_port(port, [gnd])
         self._app.modeler.move(list(self.object_list.keys()), [pos_x, pos_y, pos_z])
         return True
 
@@ -370,7 +435,9 @@ class WireYagiUda(CommonYagiUda):
         "substrate_height": 0.0,
         "gain": 9.26,
     }
+    scale_invariant = True
     _max_directors = 15
+    _viezbicke_chart = BandChart([design.gain for design in _VIEZBICKE_DESIGNS], _VIEZBICKE_DESIGNS, side="upper")
 
     def __init__(self, *args, **kwargs):
         CommonYagiUda.__init__(self, self._default_input_parameters, *args, **kwargs)
@@ -378,89 +445,19 @@ class WireYagiUda(CommonYagiUda):
         self.update_synthesis_parameters(self._parameters)
         self.antenna_type = "WireYagiUda"
 
-    @staticmethod
-    def _viezbicke_designs():
-        yagi_design = namedtuple("ViezbickeYagi", ["reflector_length", "director_spacing", "director_lengths", "gain"])
-        return [
-            yagi_design(reflector_length=0.482, director_spacing=0.2, director_lengths=[0.424], gain=9.26),
-            yagi_design(
-                reflector_length=0.482,
-                director_spacing=0.2,
-                director_lengths=[0.428, 0.424, 0.428],
-                gain=11.36,
-            ),
-            yagi_design(
-                reflector_length=0.482,
-                director_spacing=0.25,
-                director_lengths=[0.428, 0.420, 0.420, 0.428],
-                gain=12.36,
-            ),
-            yagi_design(
-                reflector_length=0.482,
-                director_spacing=0.20,
-                director_lengths=[0.432, 0.415, 0.407, 0.398, 0.390, 0.390, 0.390, 0.390, 0.398, 0.407],
-                gain=14.41,
-            ),
-            yagi_design(
-                reflector_length=0.482,
-                director_spacing=0.20,
-                director_lengths=[
-                    0.428,
-                    0.420,
-                    0.407,
-                    0.398,
-                    0.394,
-                    0.390,
-                    0.386,
-                    0.386,
-                    0.386,
-                    0.386,
-                    0.386,
-                    0.386,
-                    0.386,
-                    0.386,
-                    0.386,
-                ],
-                gain=15.56,
-            ),
-            yagi_design(
-                reflector_length=0.475,
-                director_spacing=0.308,
-                director_lengths=[
-                    0.424,
-                    0.424,
-                    0.420,
-                    0.407,
-                    0.403,
-                    0.398,
-                    0.394,
-                    0.390,
-                    0.390,
-                    0.390,
-                    0.390,
-                    0.390,
-                    0.390,
-                ],
-                gain=16.36,
-            ),
-        ]
-
-    def _design_for_gain(self, gain):
-        selected_design = self._viezbicke_designs()[-1]
-        for design in self._viezbicke_designs():
-            if design.gain >= gain - 0.01:
-                selected_design = design
-                break
-        return selected_design
+    @classmethod
+    def _design_for_gain(cls, gain):
+        # Smallest design reaching the gain, within the rounding of the tabulated gains
+        return cls._viezbicke_chart.select(np.subtract(gain, 0.01))
 
     @pyaedt_function_handler()
     def synthesis(self):
         """Antenna synthesis."""
         parameters = {}
         light_speed = constants.SpeedOfLight
-        freq_hz = constants.unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
+        freq_hz = unit_converter(self.frequency, "Freq", self.frequency_unit, "Hz")
         wavelength = light_speed / freq_hz
-        wavelength_working = constants.unit_converter(wavelength, "Length", "meter", self.length_unit)
+        wavelength_working = unit_converter(wavelength, "Length", "meter", self.length_unit)
 
         design = self._design_for_gain(self.gain)
         parameters["element_diameter"] = 0.0085 * wavelength_working
@@ -491,10 +488,7 @@ class WireYagiUda(CommonYagiUda):
             logger.debug("This antenna already exists")
             return False
 
-        if (
-            self.material not in self._app.materials.mat_names_aedt
-            and self.material not in self._app.materials.mat_names_aedt_lower
-        ):
+        if not self._design.has_material(self.material):
             self._app.logger.warning("Material not found. Create the material before assigning it.")
             return False
 
@@ -560,6 +554,7 @@ class WireYagiUda(CommonYagiUda):
         self.object_list[driven_bottom.name] = driven_bottom
         self.object_list[reflector.name] = reflector
         self.object_list[port.name] = port
+        self._declare_port(port, [driven_bottom])
 
         for index in range(number_of_directors):
             length_variable = getattr(self.synthesis_parameters, f"director_{index + 1:02d}_length").hfss_variable
@@ -25,7 +25,9 @@
 import gc
 from pathlib import Path
 import re
+import shutil
 import sys
+import time
 
 # isort: off
 sys.path.append(str(Path(__file__).parent))
@@ -34,13 +36,47 @@ from ansys.aedt.toolkits.antenna.backend.models import properties
 # isort: on
 
 from ansys.aedt.core import generate_unique_name
+from ansys.aedt.core.generic.numbers_utils import decompose_variable_value
 from ansys.aedt.core.visualization.advanced.touchstone_parser import find_touchstone_files
 from ansys.aedt.toolkits.common.backend.api import AEDTCommon
 from ansys.aedt.toolkits.common.backend.logger_handler import logger
+import numpy as np
 
 from ansys.aedt.toolkits.antenna.backend import antenna_models
-
-
+from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+from ansys.aedt.toolkits.antenna.backend.analysis_history import design_key
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.antenna_models.design_index import design_index
+from ansys.aedt.toolkits.antenna.backend.antenna_models.design_index import refresh_design_indexes
+from ansys.aedt.toolkits.antenna.backend.antenna_models.materials import load_material_library
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import SynthesisCorrection
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import input_resistance
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import inverse_synthesis as solve_inverse_synthesis
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import load_corrections
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import samples_from_history
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import save_correction
+from ansys.aedt.toolkits.antenna.backend.metrics import measure_methods
+from ansys.aedt.toolkits.antenna.backend.metrics import record_cache
+from ansys.aedt.toolkits.antenna.backend.optimization import OptimizationConfig
+from ansys.aedt.toolkits.antenna.backend.optimization import Optimizer
+from ansys.aedt.toolkits.antenna.backend.scaling import check_scalable
+from ansys.aedt.toolkits.antenna.backend.scaling import find_scaled_solution
+from ansys.aedt.toolkits.antenna.backend.scaling import scale_farfield
+from ansys.aedt.toolkits.antenna.backend.solver_progress import SolverProgress
+from ansys.aedt.toolkits.antenna.backend.solver_progress import parse_convergence
+from ansys.aedt.toolkits.antenna.backend.surrogate import PerformanceSurrogate
+from ansys.aedt.toolkits.antenna.backend.surrogate import load_surrogates
+from ansys.aedt.toolkits.antenna.backend.surrogate import s11_metrics
+from ansys.aedt.toolkits.antenna.backend.surrogate import save_surrogate
+from ansys.aedt.toolkits.antenna.backend.surrogate import training_records
+from ansys.aedt.toolkits.antenna.backend.synthesis import antenna_parameters as synthesis_parameters
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from ansys.aedt.toolkits.antenna.backend.synthesis import update_synthesis
+from ansys.aedt.toolkits.antenna.backend.tracing import tracer
+
+
+@measure_methods()
 class ToolkitBackend(AEDTCommon):
     """Provides methods for controlling the toolkit workflow.
 
@@ -62,13 +98,16 @@ class ToolkitBackend(AEDTCommon):
         self.properties = properties
         self.oantenna = None
         self.antenna_type = None
+        self.solver_progress = SolverProgress()
+        # Results of the last analysis when they were scaled from a solved design instead of solved
+        self.scaled_solution = None
         self.available_antennas = []
         for name, var in vars(antenna_models).items():
             # If the variable is a module, print the module's name
             if isinstance(var, type):
                 self.available_antennas.append(name)
 
-    def get_antenna(self, antenna, synth_only=False):
+    def get_antenna(self, antenna, synth_only=False, synthesis=None):
         """Synthesize and create an antenna in HFSS.
 
         Parameters
@@ -77,6 +116,9 @@ class ToolkitBackend(AEDTCommon):
             Type of antenna to create.
         synth_only : bool, optional
             Whether to only synthesize the anttena. The default is ``False``.
+        synthesis : dict, optional
+            Synthesis properties to update before the synthesis. They are validated at once.
+            The default is ``None``.
 
         Returns
         -------
@@ -110,73 +152,52 @@ class ToolkitBackend(AEDTCommon):
                 logger.debug("HFSS design is not connected.")
                 return False
 
+        if synthesis:
+            self.properties.antenna.synthesis = update_synthesis(self.properties.antenna.synthesis, synthesis)
+
         # Get antenna properties
         freq_units = self.properties.antenna.synthesis.frequency_unit
-        antenna_module = getattr(antenna_models, antenna)
         self.properties.antenna.model = antenna
         self.antenna_type = antenna
 
-        # Create antenna object with default values
-        self.oantenna = antenna_module(
-            self.aedtapp,
-            frequency_unit=freq_units,
-            length_unit=self.properties.antenna.synthesis.length_unit,
-        )
+        # Materials used when the antenna is only synthesized
+        CommonAntenna.material_library = load_material_library(self.properties.antenna.setup.material_library_file)
 
-        # Update antenna properties
-        for antenna_prop in type(self.properties.antenna.synthesis).model_fields:
-            if (
-                antenna_prop == "frequency"
-                and "start_frequency" in self.oantenna.__dir__()
-                and "stop_frequency" in self.oantenna.__dir__()
-            ):
-                pass
-            elif antenna_prop == "material_properties":
-                if self.properties.antenna.synthesis.material_properties:
-                    self.oantenna.material_properties["permittivity"] = (
-                        self.properties.antenna.synthesis.material_properties["permittivity"]
-                    )
-            elif getattr(self.properties.antenna.synthesis, antenna_prop):
-                setattr(self.oantenna, antenna_prop, getattr(self.properties.antenna.synthesis, antenna_prop))
-
-        self.oantenna._parameters = self.oantenna.synthesis()
-        self.oantenna.update_synthesis_parameters(self.oantenna._parameters)
-
-        antenna_parameters = {}
-
-        oantenna_public_parameters = (
-            name for name in self.oantenna.synthesis_parameters.__dict__ if not name.startswith("_")
-        )
-        for param in oantenna_public_parameters:
-            antenna_parameters[param] = self.oantenna.synthesis_parameters.__getattribute__(param).value
+        # Create and synthesize antenna object
+        self.oantenna = create_antenna(antenna, self.properties.antenna.synthesis, self.aedtapp)
+        self.scaled_solution = None
+
+        antenna_parameters = synthesis_parameters(self.oantenna)
         if not synth_only and not self.properties.antenna.is_created:
             if not self.oantenna.object_list:
                 if not self.oantenna.name:
                     self.oantenna.name = generate_unique_name(self.antenna_type)
                     self.set_properties({"name": self.oantenna.name})
-                self.oantenna.init_model()
-                self.oantenna.model_hfss()
-                self.oantenna.setup_hfss()
+                for step in ("init_model", "model_hfss", "setup_hfss"):
+                    with tracer.span("{}.{}".format(antenna, step), "model"):
+                        getattr(self.oantenna, step)()
                 self.properties.antenna.is_created = True
             if self.properties.antenna.setup.lattice_pair:
                 self.oantenna.create_lattice_pair()
             if self.properties.antenna.setup.component_3d:
                 self.oantenna.create_3dcomponent(replace=True)
             if self.properties.antenna.setup.create_setup:
-                freq = float(self.oantenna.frequency)
-                setup = self.aedtapp.create_setup()
-                setup.props["Frequency"] = str(freq) + freq_units
-                if int(self.properties.antenna.setup.sweep) > 0:
-                    sweep1 = setup.add_sweep()
-                    perc_sweep = (int(self.properties.antenna.setup.sweep)) / 100
-                    sweep1.props["RangeStart"] = str(freq * (1 - perc_sweep)) + freq_units
-                    sweep1.props["RangeEnd"] = str(freq * (1 + perc_sweep)) + freq_units
-                    sweep1.update()
+                with tracer.span("create_setup", "aedt"):
+                    freq = float(self.oantenna.frequency)
+                    setup = self.aedtapp.create_setup()
+                    setup.props["Frequency"] = str(freq) + freq_units
+                    if int(self.properties.antenna.setup.sweep) > 0:
+                        sweep1 = setup.add_sweep()
+                        perc_sweep = (int(self.properties.antenna.setup.sweep)) / 100
+                        sweep1.props["RangeStart"] = str(freq * (1 - perc_sweep)) + freq_units
+                        sweep1.props["RangeEnd"] = str(freq * (1 + perc_sweep)) + freq_units
+                        sweep1.update()
         elif synth_only:
             self.oantenna = None
 
         if self.aedtapp:
-            self.aedtapp.save_project()
+            with tracer.span("save_project", "aedt"):
+                self.aedtapp.save_project()
 
         self.properties.antenna.parameters = antenna_parameters
         self.release_aedt(False, False)
@@ -221,7 +242,7 @@ class ToolkitBackend(AEDTCommon):
         if (
             self.aedtapp
             and key in self.properties.antenna.parameters_hfss
-            and self.properties.antenna.parameters_hfss[key] in self.aedtapp.variable_manager.independent_variable_names
+            and design_index(self.aedtapp).is_independent_variable(self.properties.antenna.parameters_hfss[key])
         ):
             ratio_re = re.compile("|".join(["ratio", "coefficient", "points", "number", "count", "phase"]))
             if "angle" in key:  # pragma: no cover
@@ -234,19 +255,50 @@ class ToolkitBackend(AEDTCommon):
                     val = val + self.properties.antenna.synthesis.length_unit
             hfss_parameter = self.properties.antenna.parameters_hfss[key]
             self.aedtapp[hfss_parameter] = val
+            design_index(self.aedtapp).add_variable(hfss_parameter, val)
 
             new_value = self.properties.antenna.parameters
             new_value[key] = val
+            self.scaled_solution = None
             self.release_aedt(False, False)
             return True
         else:
             logger.debug("Parameter does not exist.")
             return False
 
+    def refresh_design_index(self):
+        """Discard the indexed state of the AEDT designs.
+
+        The objects, variables, and materials of a design are indexed when the toolkit reads them,
+        and the index is updated when the toolkit creates them. Refresh the index after the design
+        is modified outside the toolkit.
+
+        Returns
+        -------
+        int
+            Number of discarded design indexes.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.refresh_design_index()
+        """
+        count = refresh_design_indexes()
+        logger.debug("{} design indexes discarded.".format(count))
+        return count
+
     def analyze(self):
         """Analyze the design.
 
         Launch analysis in batch. AEDT is released once it is opened.
+        While the analysis runs, the adaptive passes, delta S, frequency sweep points and memory
+        are stored in ``solver_progress`` every ``progress_interval`` seconds.
+
+        When ``reuse_scaled_solutions`` is enabled and the antenna is a scaled copy of a solved PEC antenna
+        in vacuum, the design is not solved. The results are scaled from the solved design, see
+        :meth:`scaled_results`, and the analysis status is ``"scaled"``. The far field of solved PEC antennas
+        is stored at their synthesis frequency, so that :meth:`export_farfield` scales it too.
 
         Returns
         -------
@@ -263,31 +315,602 @@ class ToolkitBackend(AEDTCommon):
         >>> toolkit.get_antenna("BowTie")
         >>> toolkit.analyze()
         """
+        self.scaled_solution = None
+        if self.properties.antenna.setup.reuse_scaled_solutions:
+            try:
+                self.scaled_solution = self.__find_scaled_solution(
+                    self.properties.antenna.model, self.properties.antenna.synthesis, self.properties.antenna.parameters
+                )
+            except ValueError as e:
+                logger.debug(str(e))
+            record_cache("scaled_solution", bool(self.scaled_solution))
+            if self.scaled_solution:
+                logger.info(
+                    "Analysis skipped, results scaled from design {}.".format(self.scaled_solution["reference"])
+                )
+                self.solver_progress.reset("scaled")
+                return True
+
         if not self.aedtapp:
             # Connect to AEDT design
             self.connect_design()
             if not self.aedtapp:  # pragma: no cover
                 logger.debug("HFSS design is not connected.")
+                self.solver_progress.finish(False)
                 return False
 
         num_cores = properties.antenna.setup.num_cores
+        progress_interval = properties.antenna.setup.progress_interval
+
+        setup_names = self.aedtapp.setup_names
+        self.solver_progress.start(setup_names[0] if setup_names else None)
 
         self.aedtapp.save_project()
 
-        self.aedtapp.analyze(cores=num_cores)
+        success = self.aedtapp.analyze(cores=num_cores, blocking=False)
+
+        while success and self.aedtapp.are_there_simulations_running:
+            self.__update_solver_progress()
+            time.sleep(progress_interval)
+
+        performance = {}
+        if success:
+            self.__update_solver_progress()
+            performance = self.__performance_metrics()
+            if self.properties.antenna.setup.reuse_scaled_solutions:
+                farfield_metadata = self.__store_farfield()
+                if farfield_metadata:
+                    performance["farfield_metadata"] = farfield_metadata
+        self.solver_progress.finish(success)
+        self.__record_analysis(**performance)
 
         gc.collect()
         self.release_aedt(False, False)
-        return True
+        return success
+
+    def analysis_progress(self):
+        """Get the progress of the running or last analysis.
+
+        The progress is a snapshot stored by :meth:`analyze`, so it does not query AEDT.
+
+        Returns
+        -------
+        dict
+            Analysis status, elapsed time in seconds, adaptive pass, delta S, mesh elements,
+            frequency sweep points, peak memory in GB and convergence history.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.analysis_progress()
+        """
+        return self.solver_progress.snapshot()
+
+    def analysis_history(self, antenna=None, key=None, limit=None):
+        """Get the solver profile and convergence of previous analyses.
+
+        Parameters
+        ----------
+        antenna : str, optional
+            Antenna model name. The default is ``None``, in which case all antennas are returned.
+        key : str, optional
+            Design key, a hash of the antenna model and synthesis properties. The default is ``None``,
+            in which case all designs are returned.
+        limit : int, optional
+            Maximum number of records. The default is ``None``, in which case all records are returned.
+
+        Returns
+        -------
+        list
+            Analysis records, the most recent first.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.analysis_history("BowTieNormal", limit=5)
+        """
+        history = AnalysisHistory(self.properties.antenna.setup.history_file)
+        return history.query(antenna=antenna, key=key, limit=limit)
+
+    def fit_synthesis_correction(self, antenna, samples=None):
+        """Fit the correction factors of the synthesis equations of an antenna family.
+
+        The correction is stored in the corrections file and used by :meth:`inverse_synthesis`.
+
+        Parameters
+        ----------
+        antenna : str
+            Antenna model name.
+        samples : list, optional
+            Synthesized and simulated resonant frequencies and input resistances, see
+            :meth:`ansys.aedt.toolkits.antenna.backend.inverse_synthesis.SynthesisCorrection.fit`.
+            The default is ``None``, in which case the samples are taken from the analysis history.
+
+        Returns
+        -------
+        dict or bool
+            Fitted correction, ``False`` when there are no samples.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.fit_synthesis_correction(
+        ...     "RectangularPatchProbe", [{"frequency": 10.0, "simulated_frequency": 9.6, "permittivity": 4.4}]
+        ... )
+        """
+        if samples is None:
+            samples = samples_from_history(self.analysis_history(antenna))
+        try:
+            correction = SynthesisCorrection.fit(antenna, samples)
+        except ValueError as error:
+            logger.error(str(error))
+            return False
+        save_correction(correction, self.properties.antenna.setup.corrections_file)
+        return correction.to_dict()
+
+    def inverse_synthesis(self, antenna, frequencies, resistance=None):
+        """Synthesize an antenna so that its simulated resonance hits target frequencies.
+
+        The fitted correction of the antenna family, if any, is applied before the synthesis, so that
+        fewer HFSS iterations are needed to correct the resonance shift.
+
+        Parameters
+        ----------
+        antenna : str
+            Antenna model name.
+        frequencies : float or list
+            Target resonant frequencies, in the synthesis frequency unit.
+        resistance : float, optional
+            Target input resistance of probe-fed antennas. The default is ``None``.
+
+        Returns
+        -------
+        list or bool
+            Target frequency, corrected design frequency and synthesized parameters of each target.
+            ``False`` when the antenna is not implemented.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.inverse_synthesis("RectangularPatchProbe", [2.4, 5.8])
+        """
+        if antenna not in antenna_models.__dir__():
+            logger.debug("Antenna is not implemented.")
+            return False
+
+        correction = load_corrections(self.properties.antenna.setup.corrections_file).get(
+            antenna, SynthesisCorrection(antenna)
+        )
+        return solve_inverse_synthesis(antenna, self.properties.antenna.synthesis, frequencies, resistance, correction)
+
+    def train_surrogate(self, antenna):
+        """Train the performance surrogate of an antenna family from the analysis history.
+
+        The surrogate is stored in the surrogate file and used by :meth:`predict_performance`.
+
+        Parameters
+        ----------
+        antenna : str
+            Antenna model name.
+
+        Returns
+        -------
+        dict or bool
+            Antenna, number of samples, synthesis properties used as features and trained metrics.
+            ``False`` when there are not enough simulated designs.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.train_surrogate("RectangularPatchProbe")
+        """
+        try:
+            surrogate = PerformanceSurrogate.train(antenna, self.analysis_history(antenna))
+        except ValueError as error:
+            logger.error(str(error))
+            return False
+        save_surrogate(surrogate, self.properties.antenna.setup.surrogate_file)
+        return {
+            "antenna": antenna,
+            "samples": surrogate.samples,
+            "features": surrogate.features,
+            "metrics": list(surrogate.models),
+        }
+
+    def predict_performance(self, antenna=None, synthesis=None):
+        """Predict the simulated performance of a design without running HFSS.
+
+        The stored surrogate of the antenna family is used. It is trained again when the analysis history
+        has more simulated designs with results than the stored surrogate.
+
+        Parameters
+        ----------
+        antenna : str, optional
+            Antenna model name. The default is ``None``, in which case the current antenna model is used.
+        synthesis : dict or list, optional
+            Synthesis properties to update before the prediction, or a list of them to predict several
+            designs at once. The default is ``None``, in which case the current synthesis properties are used.
+
+        Returns
+        -------
+        dict, list or bool
+            Mean and standard deviation of the resonant frequency, bandwidth and peak gain, whether the design
+            is inside the trained region and whether the simulation can be skipped. ``False`` when the
+            surrogate cannot be trained.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.predict_performance("RectangularPatchProbe", {"frequency": 5.8})
+        """
+        antenna = antenna or self.properties.antenna.model
+        surrogate_file = self.properties.antenna.setup.surrogate_file
+        surrogate = load_surrogates(surrogate_file).get(antenna)
+        # Failed analyses are not counted, the surrogate cannot be trained on them
+        records = training_records(antenna, self.analysis_history(antenna))
+        if not surrogate or surrogate.samples < len(records):
+            if not self.train_surrogate(antenna):
+                return False
+            surrogate = load_surrogates(surrogate_file)[antenna]
+
+        designs = synthesis if isinstance(synthesis, list) else [synthesis or {}]
+        designs = [update_synthesis(self.properties.antenna.synthesis, design).model_dump() for design in designs]
+        return surrogate.predict(designs if isinstance(synthesis, list) else designs[0])
+
+    def scaled_results(self, antenna=None, synthesis=None):
+        """Get the results of a design by scaling a solved design, without running HFSS.
+
+        A PEC antenna in vacuum that is a uniformly scaled copy of a solved design has the same solution
+        at frequencies divided by the scale factor. The solved design is searched in the analysis history.
+
+        Parameters
+        ----------
+        antenna : str, optional
+            Antenna model name. The default is ``None``, in which case the current antenna model is used.
+        synthesis : dict, optional
+            Synthesis properties to update before the synthesis of the design. The default is ``None``, in
+            which case the current antenna parameters are used.
+
+        Returns
+        -------
+        dict or bool
+            Reflection coefficient curve, resonant frequency, bandwidth and peak gain of the design, in the
+            synthesis frequency unit. The results are flagged with ``"scaled": True``, the scale factor and
+            the key of the solved design. ``False`` when the antenna has dielectrics or lossy materials, or
+            when no solved design matches.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> toolkit.scaled_results("Pyramidal", {"frequency": 12.0})
+        """
+        antenna = antenna or self.properties.antenna.model
+        if antenna not in antenna_models.__dir__():
+            logger.debug("Antenna is not implemented.")
+            return False
+
+        if synthesis is None and antenna == self.properties.antenna.model and self.properties.antenna.parameters:
+            synthesis = self.properties.antenna.synthesis
+            parameters = self.properties.antenna.parameters
+        else:
+            synthesis = update_synthesis(self.properties.antenna.synthesis, synthesis or {})
+            parameters = synthesis_parameters(create_antenna(antenna, synthesis))
+
+        try:
+            solution = self.__find_scaled_solution(antenna, synthesis, parameters)
+        except ValueError as e:
+            logger.error(str(e))
+            return False
+        if not solution:
+            logger.debug("No solved design matches the design up to a scale factor.")
+            return False
+        return solution
+
+    def optimize(self, config):
+        """Optimize the parameters of the antenna created in HFSS.
+
+        Candidate parameters are set with :meth:`update_hfss_parameters`, solved with :meth:`analyze`, and
+        their reflection coefficient from :meth:`scattering_results` is compared with the goals. The
+        Nelder-Mead method stops when the goals are met, when the simplex is small enough, when the cost does
+        not improve or after the maximum number of evaluations. Every evaluation is stored in the evaluation
+        log, so an interrupted optimization resumes without solving the evaluated designs again. The
+        evaluations are keyed by the parameters, the setup frequency and the sweep range.
+        The best parameters are set in HFSS at the end, and the best design is solved again when it is not
+        the last solved design, so that the results of the design are the results of the best parameters.
+
+        The designs are solved one at a time in the HFSS design of the toolkit. The parallel evaluation
+        of :class:`ansys.aedt.toolkits.antenna.backend.optimization.Optimizer` needs one solver session per
+        worker, and the backend does not open extra AEDT sessions.
+
+        Parameters
+        ----------
+        config : dict
+            Optimization variables, goals and stopping criteria, see
+            :class:`ansys.aedt.toolkits.antenna.backend.optimization.OptimizationConfig`.
+
+        Returns
+        -------
+        dict or bool
+            Best parameters and cost, number of evaluations and solved designs, reason why the optimization
+            stopped and all the evaluations. ``False`` when the optimization failed.
+
+        Examples
+        --------
+        >>> from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        >>> toolkit = ToolkitBackend()
+        >>> msg1 = toolkit_api.launch_thread(toolkit.launch_aedt)
+        >>> idle = toolkit_api.wait_to_be_idle()
+        >>> toolkit.get_antenna("BowTieNormal")
+        >>> toolkit.optimize({"variables": {"arm_length": [12.0, 20.0]}, "goals": ["S11 < -10 dB over 2.4-2.5 GHz"]})
+        """
+        if not self.properties.antenna.parameters_hfss:
+            logger.debug("Antenna was not created in HFSS.")
+            return False
+
+        try:
+            config = OptimizationConfig.from_dict(config)
+            unknown = [name for name in config.variables if name not in self.properties.antenna.parameters_hfss]
+            if unknown:
+                raise ValueError("Parameters not in HFSS: {}.".format(", ".join(unknown)))
+
+            # Parameters of the last solved design, the results of the design are its results
+            solved = {}
+
+            def session(parameters):
+                solved.clear()
+                solved.update({name: parameters[name] for name in config.variables})
+                return self.__evaluate_design(dict(solved))
+
+            optimizer = Optimizer(
+                self.properties.antenna.model,
+                self.properties.antenna.parameters,
+                config,
+                # A single session, the backend drives one HFSS design
+                [session],
+                self.properties.antenna.synthesis.frequency_unit,
+                self.__solver_setup(),
+            )
+            result = optimizer.run()
+        except (ValueError, RuntimeError, TypeError) as error:
+            logger.error("Optimization failed: {}".format(error))
+            return False
+
+        best = {name: result["parameters"][name] for name in config.variables}
+        for name, value in best.items():
+            self.update_hfss_parameters(name, str(value))
+        if best != solved and not self.analyze():
+            logger.error("Best design of the optimization not solved.")
+            return False
+        return result
+
+    def __solver_setup(self):
+        """Get the setup frequency and the sweep range that the toolkit creates for the antenna."""
+        synthesis = self.properties.antenna.synthesis
+        frequency = float(self.oantenna.frequency) if self.oantenna else synthesis.frequency
+        sweep = int(self.properties.antenna.setup.sweep) / 100
+        return {
+            "frequency": frequency,
+            "frequency_unit": synthesis.frequency_unit,
+            "sweep": [frequency * (1 - sweep), frequency * (1 + sweep)] if sweep > 0 else None,
+        }
+
+    def __find_scaled_solution(self, antenna, synthesis, parameters):
+        """Find the scaled results of a design in the analysis history."""
+        return find_scaled_solution(antenna, synthesis.model_dump(), parameters, self.analysis_history(antenna))
+
+    def __store_farfield(self):
+        """Store the far field of a solved PEC antenna at its synthesis frequency for its scaled copies."""
+        antenna = self.properties.antenna.model
+        synthesis = self.properties.antenna.synthesis.model_dump()
+        try:
+            check_scalable(antenna, synthesis)
+        except ValueError:
+            return None
+
+        history = AnalysisHistory(self.properties.antenna.setup.history_file)
+        farfield_directory = history.farfield_directory(design_key(antenna, synthesis))
+        try:
+            frequency = "{}{}".format(synthesis["frequency"], synthesis["frequency_unit"])
+            metadata_file = Path(self.aedtapp.get_antenna_data(frequencies=[frequency]).metadata_file)
+            shutil.copytree(metadata_file.parent, farfield_directory, dirs_exist_ok=True)
+        except Exception as e:  # pragma: no cover
+            logger.debug("Far field not stored: {}".format(e))
+            return None
+        return str(farfield_directory / metadata_file.name)
+
+    def __scaled_farfield(self, frequencies, encode):
+        """Scale the far field stored for the solved design of the last analysis."""
+        solution = self.scaled_solution
+        metadata_file = solution.get("farfield_metadata")
+        if not metadata_file or not Path(metadata_file).is_file():
+            logger.error("Far field of design {} is not stored, analyze it again.".format(solution["reference"]))
+            return False
+
+        synthesis = self.properties.antenna.synthesis
+        history = AnalysisHistory(self.properties.antenna.setup.history_file)
+        metadata_file, available = scale_farfield(
+            metadata_file,
+            solution["scale_factor"],
+            history.farfield_directory(design_key(self.properties.antenna.model, synthesis.model_dump())),
+            solution["reference"],
+        )
+
+        if frequencies is not None:
+            for frequency in frequencies if isinstance(frequencies, list) else [frequencies]:
+                value, units = decompose_variable_value(frequency) if isinstance(frequency, str) else (frequency, "")
+                frequency = unit_converter(float(value), "Freq", units or synthesis.frequency_unit, "Hz")
+                if not np.isclose(frequency, available, rtol=1e-3).any():
+                    logger.error("Scaled far field is only available at {} Hz.".format(available))
+                    return False
+
+        scaled = {"scaled": True, "scale_factor": solution["scale_factor"], "reference": solution["reference"]}
+        if encode:
+            encoded = self.__encode_farfield(metadata_file)
+            if encoded:
+                return *encoded, scaled
+        return metadata_file, available, scaled
+
+    def __encode_farfield(self, metadata_file):
+        """Encode the files of a far field export, ``None`` when it has no geometry."""
+        encoded_json_file = None
+        encoded_geometry_files = []
+        encoded_ffd_files = []
+        encoded_scattering_file = None
+
+        metadata_file = Path(metadata_file)
+        metadata_dir = metadata_file.parent
+
+        if metadata_file.is_file():
+            serialized_file = self.serialize_obj_base64(str(metadata_file))
+            encoded_json_file = serialized_file.decode("utf-8")
+
+        geometry_path = metadata_dir / "geometry"
+        if not geometry_path.exists():
+            return None
+
+        for geometry_file in geometry_path.rglob("*.obj"):
+            serialized_file = self.serialize_obj_base64(str(geometry_file))
+            encoded_geometry_files.append(serialized_file.decode("utf-8"))
+
+        for ffd_file in metadata_dir.rglob("*.ffd"):
+            serialized_file = self.serialize_obj_base64(str(ffd_file))
+            encoded_ffd_files.append(serialized_file.decode("utf-8"))
+
+        snp_file = find_touchstone_files(str(metadata_dir))
+
+        if snp_file:
+            snp_file_key = list(snp_file.keys())[0]
+            serialized_file = self.serialize_obj_base64(snp_file[snp_file_key])
+            encoded_scattering_file = serialized_file.decode("utf-8")
+
+        return encoded_json_file, encoded_geometry_files, encoded_ffd_files, encoded_scattering_file
+
+    def __record_analysis(self, **performance):
+        """Store the solver profile, convergence and performance of the last analysis in the analysis history."""
+        progress = self.solver_progress.snapshot()
+        history = AnalysisHistory(self.properties.antenna.setup.history_file)
+        try:
+            history.add(
+                self.properties.antenna.model,
+                self.properties.antenna.synthesis.model_dump(),
+                parameters=self.properties.antenna.parameters,
+                status=progress["status"],
+                setup=progress["setup"],
+                num_cores=self.properties.antenna.setup.num_cores,
+                elapsed=progress["elapsed"],
+                real_time=progress["real_time"],
+                cpu_time=progress["cpu_time"],
+                adaptive_passes=progress["adaptive_pass"],
+                delta_s=progress["delta_s"],
+                mesh_elements=progress["mesh_elements"],
+                sweep_points=progress["sweep_points"],
+                memory_gb=progress["memory_gb"],
+                convergence=progress["convergence"],
+                **performance,
+            )
+        except OSError as e:  # pragma: no cover
+            logger.error("Analysis history not stored: {}".format(e))
+
+    def __update_solver_progress(self):
+        """Update the solver progress from the convergence and profile data of the first setup."""
+        setup = self.solver_progress.snapshot()["setup"]
+        if not setup:  # pragma: no cover
+            return
+
+        convergence_file = Path(self.aedtapp.working_directory) / "{}_convergence.prop".format(setup)
+        try:
+            if self.aedtapp.export_convergence(setup, output_file=str(convergence_file)):
+                self.solver_progress.update_convergence(parse_convergence(convergence_file.read_text()))
+        except Exception as e:  # pragma: no cover
+            logger.debug("Convergence not available: {}".format(e))
+
+        try:
+            profiles = self.aedtapp.get_profile(setup)
+            if profiles:
+                profile = next(iter(profiles.values()))
+                values = {
+                    "memory_gb": round(profile.max_memory().value, 3),
+                    "real_time": profile.real_time().total_seconds(),
+                    "cpu_time": profile.cpu_time().total_seconds(),
+                }
+                if profile.has_frequency_sweep:
+                    sweep = next(iter(profile.frequency_sweeps.values()))
+                    values["sweep_points"] = len(sweep.frequencies)
+                self.solver_progress.update(**values)
+        except Exception as e:  # pragma: no cover
+            logger.debug("Profile not available: {}".format(e))
+
+    def __performance_metrics(self):
+        """Get the resonance, matched bandwidth, input resistance and peak gain of the last analysis.
+
+        The resonance and the bandwidth are taken from the reflection coefficient and stored in the synthesis
+        frequency unit. The input resistance at resonance is used to fit the synthesis corrections, see
+        :meth:`fit_synthesis_correction`. The peak gain is only available when the design has an infinite sphere.
+        """
+        performance = {}
+        frequency_unit = self.properties.antenna.synthesis.frequency_unit
+        try:
+            solution_data = self.aedtapp.post.get_solution_data()
+            if solution_data:
+                frequencies, s11_db = solution_data.get_expression_data(formula="dB20")
+                sweep_unit = solution_data.units_sweeps.get("Freq") or "GHz"
+                frequencies = unit_converter(np.asarray(frequencies), "Freq", sweep_unit, frequency_unit)
+                performance = s11_metrics(frequencies, s11_db)
+                # The curve is scaled to the frequencies of scaled copies of the design, see :meth:`scaled_results`
+                performance["s11_frequencies"] = frequencies.tolist()
+                performance["s11_db"] = [float(value) for value in s11_db]
+                # Lumped ports are renormalized to 50 ohm, see :meth:`CommonAntenna.setup_hfss`
+                s11_real = np.asarray(solution_data.get_expression_data(formula="real")[1])
+                s11 = s11_real + 1j * np.asarray(solution_data.get_expression_data(formula="imag")[1])
+                performance["input_resistance"] = input_resistance(frequencies, s11, performance["resonant_frequency"])
+        except Exception as e:  # pragma: no cover
+            logger.debug("Scattering results not available: {}".format(e))
+
+        try:
+            spheres = [setup.name for setup in self.aedtapp.field_setups if setup.type == "FarFieldSphere"]
+            if spheres:
+                gain_data = self.aedtapp.post.get_solution_data(
+                    expressions="dB(RealizedGainTotal)", report_category="Far Fields", context=spheres[0]
+                )
+                if gain_data:
+                    performance["peak_gain"] = float(np.max(gain_data.get_expression_data()[1]))
+        except Exception as e:  # pragma: no cover
+            logger.debug("Far field results not available: {}".format(e))
+        return performance
+
+    def __evaluate_design(self, parameters):
+        """Solve a design and get its frequencies and reflection coefficient in dB."""
+        for key, value in parameters.items():
+            if not self.update_hfss_parameters(key, str(value)):
+                raise ValueError("Parameter {} cannot be updated.".format(key))
+        if not self.analyze():
+            raise RuntimeError("Analysis failed.")
+        results = self.scattering_results()
+        if not results:
+            raise RuntimeError("Scattering results not available.")
+        return results
 
     def scattering_results(self):
         """Get antenna scattering results.
 
+        The results scaled by the last analysis are returned when the design was not solved,
+        see :meth:`analyze`.
+
         Returns
         -------
         bool
             ``True`` when successful, ``False`` when failed.
         """
+        if self.scaled_solution:
+            return self.scaled_solution["s11_frequencies"], self.scaled_solution["s11_db"]
+
         if not self.aedtapp:
             # Connect to AEDT design
             self.connect_design()
@@ -324,8 +947,13 @@ class ToolkitBackend(AEDTCommon):
         Returns
         -------
         list or dict
-            List of eep files or encoded data.
+            List of eep files or encoded data. When the results are scaled, see :meth:`analyze`, the far field
+            stored for the solved design is relabeled to the scaled frequency and a dictionary with the
+            ``scaled`` flag, the scale factor and the solved design is appended.
         """
+        if self.scaled_solution:
+            return self.__scaled_farfield(frequencies, encode)
+
         if not self.aedtapp:
             self.connect_design()
 
@@ -337,38 +965,10 @@ class ToolkitBackend(AEDTCommon):
             )
 
             if encode:
-                encoded_json_file = None
-                encoded_geometry_files = []
-                encoded_ffd_files = []
-                encoded_scattering_file = None
-
-                metadata_file = Path(farfield_exporter.metadata_file)
-                metadata_dir = metadata_file.parent
-
-                if metadata_file.is_file():
-                    serialized_file = self.serialize_obj_base64(str(metadata_file))
-                    encoded_json_file = serialized_file.decode("utf-8")
-
-                geometry_path = metadata_dir / "geometry"
-                if geometry_path.exists():
-                    for geometry_file in geometry_path.rglob("*.obj"):
-                        serialized_file = self.serialize_obj_base64(str(geometry_file))
-                        encoded_geometry_files.append(serialized_file.decode("utf-8"))
-
-                    for ffd_file in metadata_dir.rglob("*.ffd"):
-                        serialized_file = self.serialize_obj_base64(str(ffd_file))
-                        encoded_ffd_files.append(serialized_file.decode("utf-8"))
-
-                    snp_file = find_touchstone_files(str(metadata_dir))
-
-                    if snp_file:
-                        snp_file_key = list(snp_file.keys())[0]
-                        serialized_file = self.serialize_obj_base64(snp_file[snp_file_key])
-                        encoded_scattering_file = serialized_file.decode("utf-8")
-
+                encoded = self.__encode_farfield(farfield_exporter.metadata_file)
+                if encoded:
                     self.release_aedt(False, False)
-
-                    return encoded_json_file, encoded_geometry_files, encoded_ffd_files, encoded_scattering_file
+                    return encoded
 
             self.release_aedt(False, False)
             return farfield_exporter.metadata_file, farfield_exporter.frequencies
@@ -0,0 +1,528 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+from ansys.aedt.toolkits.antenna.backend.synthesis import antenna_parameters
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from ansys.aedt.toolkits.antenna.backend.synthesis import update_synthesis
+
+# Fitted correction factors of each antenna family
+DEFAULT_CORRECTIONS_FILE = Path.home() / ".ansys" / "antenna_toolkit" / "synthesis_corrections.json"
+
+# Probe-fed antennas: patch length and feed offset parameters. The input resistance of the probe follows
+# R(y) = R_edge * sin(pi * y / L) ** 2, with y the offset from the patch center.
+PROBE_FEEDS = {
+    "RectangularPatchProbe": ("patch_y", "feed_y"),
+    "EllipticalProbe": ("patch_x", "feed_x"),
+    "MbyNPatchArray": ("patch_y", "feed_y"),
+}
+
+# Input resistance targeted by the synthesis equations
+DESIGN_RESISTANCE = 50.0
+
+
+def solve_monotonic(function, targets, lower, upper, tolerance=1e-10, max_iterations=100):
+    """Solve ``function(x) = targets`` for many targets at once.
+
+    The function must be vectorized and monotonic in each bracket. The Illinois variant of the false
+    position method is applied to all the targets at the same time, so solving thousands of targets
+    costs a few tens of function evaluations.
+
+    Parameters
+    ----------
+    function : callable
+        Vectorized function.
+    targets : float or :class:`numpy.ndarray`
+        Target values.
+    lower : float or :class:`numpy.ndarray`
+        Lower bounds of the brackets.
+    upper : float or :class:`numpy.ndarray`
+        Upper bounds of the brackets.
+    tolerance : float, optional
+        Relative tolerance on the solution. The default is ``1e-10``.
+    max_iterations : int, optional
+        Maximum number of iterations. The default is ``100``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Solutions. Targets without a sign change in their bracket are ``nan``.
+    """
+    targets = np.asarray(targets, dtype=float)
+    lower, upper = np.broadcast_arrays(np.asarray(lower, dtype=float), np.asarray(upper, dtype=float))
+    a = np.broadcast_to(lower, targets.shape).astype(float)
+    b = np.broadcast_to(upper, targets.shape).astype(float)
+    fa = function(a) - targets
+    fb = function(b) - targets
+    bracketed = np.sign(fa) * np.sign(fb) <= 0
+    side = np.zeros(targets.shape, dtype=int)
+
+    x = b.copy()
+    for _ in range(max_iterations):
+        denominator = fb - fa
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(denominator != 0, b - fb * (b - a) / denominator, (a + b) / 2)
+        fx = function(x) - targets
+
+        converged = (np.abs(b - a) <= tolerance * np.maximum(np.abs(x), 1.0)) | (fx == 0)
+        if np.all(converged | ~bracketed):
+            break
+
+        # Keep the root bracketed, halving the value of an end point kept twice in a row
+        move_b = np.sign(fx) == np.sign(fb)
+        b = np.where(move_b, x, b)
+        fb = np.where(move_b, fx, fb)
+        a = np.where(move_b, a, x)
+        fa = np.where(move_b, fa, fx)
+        fa = np.where(move_b & (side == 1), fa / 2, fa)
+        fb = np.where(~move_b & (side == -1), fb / 2, fb)
+        side = np.where(move_b, 1, -1)
+
+    return np.where(bracketed, x, np.nan)
+
+
+def resonance(frequencies, s11_db):
+    """Get the resonant frequency from a reflection coefficient curve.
+
+    The minimum of the curve is refined with a parabola through the three closest points.
+
+    Parameters
+    ----------
+    frequencies : list
+        Frequencies.
+    s11_db : list
+        Reflection coefficient in dB.
+
+    Returns
+    -------
+    float
+        Resonant frequency, in the units of ``frequencies``.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    s11_db = np.asarray(s11_db, dtype=float)
+    index = int(np.argmin(s11_db))
+    if index == 0 or index == len(s11_db) - 1:
+        return float(frequencies[index])
+    x = frequencies[index - 1 : index + 2]
+    y = s11_db[index - 1 : index + 2]
+    curvature, slope, _ = np.polyfit(x, y, 2)
+    if curvature <= 0:
+        return float(frequencies[index])
+    return float(np.clip(-slope / (2 * curvature), x[0], x[-1]))
+
+
+def input_resistance(frequencies, s11, frequency, port_impedance=DESIGN_RESISTANCE):
+    """Get the input resistance at a frequency from a complex reflection coefficient curve.
+
+    Parameters
+    ----------
+    frequencies : list
+        Frequencies.
+    s11 : list
+        Complex reflection coefficient, normalized to ``port_impedance``.
+    frequency : float
+        Frequency of the resistance, in the units of ``frequencies``. It is usually the resonance.
+    port_impedance : float, optional
+        Port impedance. The default is ``50.0``.
+
+    Returns
+    -------
+    float
+        Input resistance.
+    """
+    s11 = np.asarray(s11, dtype=complex)
+    resistance = np.real(port_impedance * (1 + s11) / (1 - s11))
+    return float(np.interp(frequency, np.asarray(frequencies, dtype=float), resistance))
+
+
+def _features(frequency_ghz, permittivity, columns):
+    frequency_ghz, permittivity = np.broadcast_arrays(
+        np.asarray(frequency_ghz, dtype=float), np.asarray(permittivity, dtype=float)
+    )
+    available = {
+        "offset": np.ones(frequency_ghz.shape),
+        "log_frequency": np.log(frequency_ghz),
+        "log_permittivity": np.log(permittivity),
+    }
+    return np.stack([available[column] for column in columns], axis=-1)
+
+
+def _fit_log_ratio(frequency_ghz, permittivity, ratios):
+    """Fit ``log(ratio)`` with a linear model of the log frequency and log permittivity."""
+    columns = ["offset"]
+    if len(ratios) > 2 and np.ptp(np.log(frequency_ghz)) > 1e-9:
+        columns.append("log_frequency")
+    if len(ratios) > len(columns) + 1 and np.ptp(np.log(permittivity)) > 1e-9:
+        columns.append("log_permittivity")
+    matrix = _features(frequency_ghz, permittivity, columns)
+    coefficients, *_ = np.linalg.lstsq(matrix, np.log(ratios), rcond=None)
+    return {"columns": columns, "coefficients": coefficients.tolist()}
+
+
+class SynthesisCorrection(object):
+    """Correction factors of the synthesis equations of an antenna family.
+
+    The ratio between the simulated and the synthesized resonant frequency, and between the simulated
+    and the designed input resistance, are modeled as ``exp(c0 + c1 * log(f) + c2 * log(er))``, with
+    ``f`` the synthesized frequency in GHz and ``er`` the substrate permittivity. Terms are only fitted
+    when the samples span them.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    frequency_model : dict, optional
+        Fitted frequency ratio model. The default is ``None``, in which case no correction is applied.
+    resistance_model : dict, optional
+        Fitted input resistance ratio model. The default is ``None``, in which case no correction is applied.
+    samples : int, optional
+        Number of samples used for the fit. The default is ``0``.
+    """
+
+    def __init__(self, antenna, frequency_model=None, resistance_model=None, samples=0):
+        self.antenna = antenna
+        self.frequency_model = frequency_model
+        self.resistance_model = resistance_model
+        self.samples = samples
+
+    @classmethod
+    def fit(cls, antenna, samples):
+        """Fit the correction factors of an antenna family.
+
+        Parameters
+        ----------
+        antenna : str
+            Antenna class name.
+        samples : list
+            Dictionaries with the synthesized ``frequency``, the ``simulated_frequency``, and optionally
+            the ``frequency_unit`` (``"GHz"`` by default), the substrate ``permittivity``, the
+            ``design_resistance`` (``50.0`` by default) and the ``simulated_resistance``.
+
+        Returns
+        -------
+        :class:`SynthesisCorrection`
+            Fitted correction.
+        """
+        frequency_samples = [sample for sample in samples if sample.get("simulated_frequency")]
+        if not frequency_samples:
+            raise ValueError("No simulated resonant frequency to fit the {} correction.".format(antenna))
+
+        def columns(selected):
+            frequency_ghz = np.array(
+                [
+                    unit_converter(float(sample["frequency"]), "Freq", sample.get("frequency_unit", "GHz"), "GHz")
+                    for sample in selected
+                ]
+            )
+            permittivity = np.array([float(sample.get("permittivity") or 1.0) for sample in selected])
+            return frequency_ghz, permittivity
+
+        frequency_ghz, permittivity = columns(frequency_samples)
+        frequency_ratios = np.array(
+            [float(sample["simulated_frequency"]) / float(sample["frequency"]) for sample in frequency_samples]
+        )
+        frequency_model = _fit_log_ratio(frequency_ghz, permittivity, frequency_ratios)
+
+        resistance_model = None
+        resistance_samples = [sample for sample in samples if sample.get("simulated_resistance")]
+        if resistance_samples:
+            frequency_ghz, permittivity = columns(resistance_samples)
+            resistance_ratios = np.array(
+                [
+                    float(sample["simulated_resistance"]) / float(sample.get("design_resistance", DESIGN_RESISTANCE))
+                    for sample in resistance_samples
+                ]
+            )
+            resistance_model = _fit_log_ratio(frequency_ghz, permittivity, resistance_ratios)
+
+        return cls(antenna, frequency_model, resistance_model, len(samples))
+
+    @staticmethod
+    def _ratio(model, frequency_ghz, permittivity):
+        if not model:
+            return np.ones(np.broadcast(np.asarray(frequency_ghz), np.asarray(permittivity)).shape)
+        matrix = _features(frequency_ghz, permittivity, model["columns"])
+        return np.exp(matrix @ np.asarray(model["coefficients"]))
+
+    def frequency_ratio(self, frequency_ghz, permittivity=1.0):
+        """Get the predicted ratio between the simulated and the synthesized resonant frequency."""
+        return self._ratio(self.frequency_model, frequency_ghz, permittivity)
+
+    def resistance_ratio(self, frequency_ghz, permittivity=1.0):
+        """Get the predicted ratio between the simulated and the designed input resistance."""
+        return self._ratio(self.resistance_model, frequency_ghz, permittivity)
+
+    def design_frequency(self, target_ghz, permittivity=1.0):
+        """Get the frequencies to synthesize so that the simulated resonances hit the targets.
+
+        Parameters
+        ----------
+        target_ghz : float or :class:`numpy.ndarray`
+            Target resonant frequencies in GHz.
+        permittivity : float or :class:`numpy.ndarray`, optional
+            Substrate permittivity. The default is ``1.0``.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Frequencies to synthesize in GHz.
+        """
+        target_ghz = np.asarray(target_ghz, dtype=float)
+        if not self.frequency_model:
+            return target_ghz
+        # Solve in the log domain, where the simulated resonance is monotonic for any fitted slope above -1
+        log_targets = np.log(target_ghz)
+
+        def log_resonance(log_frequency):
+            return log_frequency + np.log(self.frequency_ratio(np.exp(log_frequency), permittivity))
+
+        log_design = solve_monotonic(log_resonance, log_targets, log_targets - np.log(4.0), log_targets + np.log(4.0))
+        return np.exp(log_design)
+
+    def to_dict(self):
+        """Get the correction as a dictionary that can be stored in JSON."""
+        return {
+            "antenna": self.antenna,
+            "frequency_model": self.frequency_model,
+            "resistance_model": self.resistance_model,
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a correction from a dictionary."""
+        return cls(data["antenna"], data.get("frequency_model"), data.get("resistance_model"), data.get("samples", 0))
+
+
+def load_corrections(corrections_file=None):
+    """Load the stored corrections, keyed by antenna class name.
+
+    Parameters
+    ----------
+    corrections_file : str or :class:`pathlib.Path`, optional
+        JSON file. The default is ``None``, in which case ``DEFAULT_CORRECTIONS_FILE`` is used.
+
+    Returns
+    -------
+    dict
+        Corrections.
+    """
+    corrections_file = Path(corrections_file) if corrections_file else DEFAULT_CORRECTIONS_FILE
+    if not corrections_file.is_file():
+        return {}
+    data = json.loads(corrections_file.read_text(encoding="utf-8"))
+    return {antenna: SynthesisCorrection.from_dict(correction) for antenna, correction in data.items()}
+
+
+def save_correction(correction, corrections_file=None):
+    """Store a correction, replacing the previous correction of the antenna family.
+
+    Parameters
+    ----------
+    correction : :class:`SynthesisCorrection`
+        Correction.
+    corrections_file : str or :class:`pathlib.Path`, optional
+        JSON file. The default is ``None``, in which case ``DEFAULT_CORRECTIONS_FILE`` is used.
+    """
+    corrections_file = Path(corrections_file) if corrections_file else DEFAULT_CORRECTIONS_FILE
+    corrections = {antenna: stored.to_dict() for antenna, stored in load_corrections(corrections_file).items()}
+    corrections[correction.antenna] = correction.to_dict()
+    corrections_file.parent.mkdir(parents=True, exist_ok=True)
+    corrections_file.write_text(json.dumps(corrections, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def samples_from_history(records):
+    """Get correction samples from analysis history records.
+
+    Records are used when they have a ``resonant_frequency``. The ``input_resistance`` at resonance is
+    used when it is available. The permittivity is read from the material library like in the synthesis.
+
+    Parameters
+    ----------
+    records : list
+        Analysis history records.
+
+    Returns
+    -------
+    list
+        Correction samples.
+    """
+    samples = []
+    for record in records:
+        synthesis = record.get("synthesis") or {}
+        if not record.get("resonant_frequency") or not synthesis.get("frequency"):
+            continue
+        samples.append(
+            {
+                "frequency": synthesis["frequency"],
+                "frequency_unit": synthesis.get("frequency_unit", "GHz"),
+                "permittivity": _permittivity(record.get("antenna"), synthesis),
+                "simulated_frequency": record["resonant_frequency"],
+                "simulated_resistance": record.get("input_resistance"),
+            }
+        )
+    return samples
+
+
+def probe_feed_offset(patch_length, feed_offset, resistance, design_resistance=DESIGN_RESISTANCE):
+    """Get the probe offsets that match input resistances.
+
+    The edge resistance of the patch is recovered from the synthesized offset, then the offsets are
+    solved for the requested resistances.
+
+    Parameters
+    ----------
+    patch_length : float or :class:`numpy.ndarray`
+        Resonant length of the patch.
+    feed_offset : float or :class:`numpy.ndarray`
+        Synthesized probe offset from the patch center, matching ``design_resistance``.
+    resistance : float or :class:`numpy.ndarray`
+        Requested input resistances.
+    design_resistance : float, optional
+        Input resistance of the synthesized offset. The default is ``50.0``.
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Probe offsets from the patch center, in the units of ``patch_length``.
+    """
+    patch_length = np.asarray(patch_length, dtype=float)
+    edge_resistance = design_resistance / np.sin(np.pi * np.asarray(feed_offset, dtype=float) / patch_length) ** 2
+    resistance = np.minimum(np.asarray(resistance, dtype=float), edge_resistance)
+    return solve_monotonic(
+        lambda offset: edge_resistance * np.sin(np.pi * offset / patch_length) ** 2,
+        resistance,
+        0.0,
+        patch_length / 2,
+    )
+
+
+def _permittivity(antenna, synthesis):
+    """Get the substrate permittivity of a design as the offline synthesis does.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    synthesis : dict
+        Synthesis properties.
+
+    Returns
+    -------
+    float or None
+        Relative permittivity, ``1.0`` for antennas without substrate and ``None`` for unknown antennas.
+    """
+    antenna_class = getattr(antenna_models, antenna or "", None)
+    if antenna_class is None:
+        return (synthesis.get("material_properties") or {}).get("permittivity")
+    defaults = antenna_class._default_input_parameters
+    if "material_properties" not in defaults:
+        return 1.0
+    material = synthesis.get("material")
+    if material and material != defaults.get("material"):
+        # Same lookup as :meth:`CommonAntenna._material_permittivity`
+        permittivity = antenna_class._library_permittivity(
+            material, synthesis.get("frequency", 10.0), synthesis.get("frequency_unit", "GHz")
+        )
+        if permittivity is not None:
+            return float(permittivity)
+    return float((synthesis.get("material_properties") or defaults["material_properties"]).get("permittivity", 1.0))
+
+
+def inverse_synthesis(antenna, synthesis, frequencies, resistance=None, correction=None):
+    """Synthesize antennas whose simulated resonance and input resistance hit the targets.
+
+    The targets are solved at once with the fitted correction of the antenna family. The synthesis
+    equations are then evaluated at the corrected frequencies, and the probe offset of probe-fed
+    antennas is solved for the corrected input resistance.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    synthesis : :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`
+        Synthesis properties. The frequencies are in its frequency unit.
+    frequencies : float or list
+        Target resonant frequencies.
+    resistance : float, optional
+        Target input resistance. The default is ``None``, in which case the synthesis target is kept.
+    correction : :class:`SynthesisCorrection`, optional
+        Correction of the antenna family. The default is ``None``, in which case the stored correction is
+        used if there is one.
+
+    Returns
+    -------
+    list
+        Dictionaries with the ``target_frequency``, the corrected ``design_frequency`` and the synthesized
+        ``parameters`` of each target.
+    """
+    if correction is None:
+        correction = load_corrections().get(antenna, SynthesisCorrection(antenna))
+
+    targets = np.atleast_1d(np.asarray(frequencies, dtype=float))
+    frequency_unit = synthesis.frequency_unit
+    to_ghz = unit_converter(1.0, "Freq", frequency_unit, "GHz")
+    permittivity = _permittivity(antenna, synthesis.model_dump())
+    design_frequencies = correction.design_frequency(targets * to_ghz, permittivity) / to_ghz
+
+    defaults = getattr(antenna_models, antenna)._default_input_parameters
+    wideband = "start_frequency" in defaults and "stop_frequency" in defaults
+    designs = []
+    for target, design_frequency in zip(targets, design_frequencies):
+        if wideband:
+            # Frequency-independent antennas scale their whole band
+            scale = design_frequency / target
+            start = synthesis.start_frequency or defaults["start_frequency"]
+            stop = synthesis.stop_frequency or defaults["stop_frequency"]
+            updates = {"start_frequency": start * scale, "stop_frequency": stop * scale}
+        else:
+            updates = {"frequency": float(design_frequency)}
+        oantenna = create_antenna(antenna, update_synthesis(synthesis, updates))
+        designs.append(
+            {
+                "target_frequency": float(target),
+                "design_frequency": float(design_frequency),
+                "parameters": antenna_parameters(oantenna),
+            }
+        )
+
+    if antenna in PROBE_FEEDS and (resistance is not None or correction.resistance_model):
+        length_name, offset_name = PROBE_FEEDS[antenna]
+        requested = DESIGN_RESISTANCE if resistance is None else float(resistance)
+        design_ghz = design_frequencies * to_ghz
+        design_resistance = requested / correction.resistance_ratio(design_ghz, permittivity)
+        offsets = probe_feed_offset(
+            [design["parameters"][length_name] for design in designs],
+            [design["parameters"][offset_name] for design in designs],
+            design_resistance,
+        )
+        for design, offset in zip(designs, offsets):
+            design["parameters"][offset_name] = float(round(offset, 6))
+    return designs
@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import bisect
+import functools
+import threading
+import time
+
+from ansys.aedt.toolkits.antenna.backend.tracing import tracer
+
+# Latency buckets in seconds, from fast REST handlers to AEDT operations
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join('{}="{}"'.format(name, _escape(value)) for name, value in labels) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(object):
+    metric_type = ""
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError("{} expects the labels {}".format(self.name, list(self.labelnames)))
+        return tuple((name, labels[name]) for name in self.labelnames)
+
+    def samples(self):
+        """Get the samples of the metric as ``(suffix, labels, value)`` tuples."""
+        with self._lock:
+            return [("", key, value) for key, value in sorted(self._values.items())]
+
+    def render(self):
+        lines = [
+            "# HELP {} {}".format(self.name, self.documentation),
+            "# TYPE {} {}".format(self.name, self.metric_type),
+        ]
+        for suffix, labels, value in self.samples():
+            lines.append("{}{}{} {}".format(self.name, suffix, _format_labels(labels), _format_value(value)))
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    metric_type = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Value that goes up and down. A callback can compute the value when the metrics are collected."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name, documentation, labelnames=(), callback=None):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        if self.callback is not None:
+            try:
+                self.set(self.callback())
+            except Exception:  # pragma: no cover
+                pass
+        return super().samples()
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0, 0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels):
+        return self._values.get(self._key(labels), (None, 0.0, 0))[2]
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    samples.append(("_bucket", key + (("le", _format_value(float(bound))),), cumulative))
+                samples.append(("_sum", key, total))
+                samples.append(("_count", key, count))
+        return samples
+
+
+class MetricsRegistry(object):
+    """In-process metrics registry rendered in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                return self._metrics[metric.name]
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=(), callback=None):
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name):
+        """Get a registered metric."""
+        return self._metrics.get(name)
+
+    def render(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+requests_total = registry.counter(
+    "antenna_toolkit_requests_total", "REST requests handled by the backend.", ("method", "route", "status")
+)
+request_duration = registry.histogram(
+    "antenna_toolkit_request_duration_seconds", "REST request latency.", ("method", "route")
+)
+requests_in_progress = registry.gauge("antenna_toolkit_requests_in_progress", "REST requests being handled.")
+backend_calls_total = registry.counter(
+    "antenna_toolkit_backend_calls_total", "ToolkitBackend method calls.", ("method", "result")
+)
+backend_call_duration = registry.histogram(
+    "antenna_toolkit_backend_call_duration_seconds",
+    "ToolkitBackend method duration, including AEDT connect and release.",
+    ("method",),
+)
+cache_requests_total = registry.counter(
+    "antenna_toolkit_cache_requests_total", "Cache lookups by cache and result.", ("cache", "result")
+)
+cache_hit_ratio = registry.gauge("antenna_toolkit_cache_hit_ratio", "Fraction of cache lookups found.", ("cache",))
+aedt_queries_avoided_total = registry.counter(
+    "antenna_toolkit_aedt_queries_avoided_total",
+    "AEDT design queries answered by the design index.",
+    ("index",),
+)
+
+
+def record_cache(cache, hit):
+    """Count a cache lookup.
+
+    Parameters
+    ----------
+    cache : str
+        Cache name.
+    hit : bool
+        Whether the value was found in the cache.
+    """
+    cache_requests_total.inc(cache=cache, result="hit" if hit else "miss")
+    hits = cache_requests_total.value(cache=cache, result="hit")
+    cache_hit_ratio.set(hits / (hits + cache_requests_total.value(cache=cache, result="miss")), cache=cache)
+
+
+def measure_methods(category="backend"):
+    """Count, time and trace every public method of the decorated class, including the inherited ones.
+
+    Each call is wrapped once, the span is only recorded while the tracer is enabled.
+
+    Parameters
+    ----------
+    category : str, optional
+        Span category. The default is ``"backend"``.
+    """
+
+    def decorator(cls):
+        for attribute_name in dir(cls):
+            if attribute_name.startswith("_"):
+                continue
+            attribute = next((vars(klass)[attribute_name] for klass in cls.__mro__ if attribute_name in vars(klass)))
+            if callable(attribute) and not isinstance(attribute, (type, staticmethod, classmethod, property)):
+                span_name = "{}.{}".format(cls.__name__, attribute_name)
+                setattr(cls, attribute_name, _measured(attribute_name, attribute, span_name, category))
+        return cls
+
+    return decorator
+
+
+def _measured(method_name, func, span_name, category):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = tracer.begin(span_name, category)
+        start = time.perf_counter()
+        result = "error"
+        try:
+            value = func(*args, **kwargs)
+            result = "success" if value is not False else "failure"
+            return value
+        finally:
+            backend_call_duration.observe(time.perf_counter() - start, method=method_name)
+            backend_calls_total.inc(method=method_name, result=result)
+            tracer.end(token)
+
+    return wrapper
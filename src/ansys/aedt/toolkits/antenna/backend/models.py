@@ -98,6 +98,12 @@ class Setup(BaseModel, validate_assignment=True):
     lattice_pair: bool = False
     num_cores: int = 4
     sweep: int = 20
+    progress_interval: float = 5.0
+    history_file: str = ""
+    corrections_file: str = ""
+    surrogate_file: str = ""
+    material_library_file: str = ""
+    reuse_scaled_solutions: bool = False
 
 
 class AntennaProperties(BaseModel, validate_assignment=True):
@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import math
+from pathlib import Path
+import queue
+import re
+import threading
+
+import numpy as np
+
+from ansys.aedt.toolkits.antenna.backend.analysis_history import design_key
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import resonance
+
+# Evaluated designs, shared by all the optimization runs so that interrupted runs resume without solving again
+DEFAULT_LOG_FILE = Path.home() / ".ansys" / "antenna_toolkit" / "optimization_log.jsonl"
+
+# Goals written as text, for example "S11 < -10 dB over 2.4-2.5 GHz" or "resonance = 2.45 GHz"
+_NUMBER = r"[-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?"
+_S11_GOAL_RE = re.compile(
+    r"^\s*s11\s*<\s*({0})\s*(?:db)?\s+(?:over|from)\s+({0})\s*(?:-|to)\s*({0})\s*([a-z]*hz)\s*$".format(_NUMBER),
+    re.IGNORECASE,
+)
+_RESONANCE_GOAL_RE = re.compile(r"^\s*resonance\s*=\s*({0})\s*([a-z]*hz)\s*$".format(_NUMBER), re.IGNORECASE)
+_NUMBER_RE = re.compile(_NUMBER)
+_FREQUENCY_UNITS = {"hz": "Hz", "khz": "kHz", "mhz": "MHz", "ghz": "GHz", "thz": "THz"}
+
+
+class Goal(object):
+    """Optimization goal on the reflection coefficient.
+
+    The cost of a goal is zero when it is met. An ``"s11"`` goal costs the root mean square, in dB, of the
+    reflection coefficient above the threshold in the band. A ``"resonance"`` goal costs the distance
+    between the resonance and the target, in percent of the target.
+
+    Parameters
+    ----------
+    kind : str
+        Goal type, ``"s11"`` or ``"resonance"``.
+    start : float
+        Start of the band, or target resonant frequency.
+    stop : float, optional
+        End of the band. The default is ``None``, in which case ``start`` is used.
+    threshold : float, optional
+        Maximum reflection coefficient in dB. The default is ``-10.0``.
+    unit : str, optional
+        Frequency unit. The default is ``"GHz"``.
+    weight : float, optional
+        Weight of the goal in the total cost. The default is ``1.0``.
+    """
+
+    def __init__(self, kind, start, stop=None, threshold=-10.0, unit="GHz", weight=1.0):
+        if kind not in ("s11", "resonance"):
+            raise ValueError("Unknown optimization goal: {}.".format(kind))
+        self.kind = kind
+        self.start = float(start)
+        self.stop = float(stop if stop is not None else start)
+        self.threshold = float(threshold)
+        self.unit = unit
+        self.weight = float(weight)
+
+    @classmethod
+    def parse(cls, goal):
+        """Create a goal from a text or a dictionary.
+
+        Parameters
+        ----------
+        goal : str or dict
+            Goal text, like ``"S11 < -10 dB over 2.4-2.5 GHz"`` or ``"resonance = 2.45 GHz"``, or dictionary
+            with the arguments of the goal.
+
+        Returns
+        -------
+        :class:`Goal`
+            Goal.
+        """
+        if isinstance(goal, dict):
+            return cls(**goal)
+        match = _S11_GOAL_RE.match(goal)
+        if match:
+            threshold, start, stop, unit = match.groups()
+            return cls("s11", start, stop, threshold, _FREQUENCY_UNITS[unit.lower()])
+        match = _RESONANCE_GOAL_RE.match(goal)
+        if match:
+            target, unit = match.groups()
+            return cls("resonance", target, unit=_FREQUENCY_UNITS[unit.lower()])
+        raise ValueError("Unknown optimization goal: {}.".format(goal))
+
+    def cost(self, frequencies, s11_db, frequency_unit="GHz"):
+        """Get the cost of a reflection coefficient curve.
+
+        Parameters
+        ----------
+        frequencies : list
+            Frequencies.
+        s11_db : list
+            Reflection coefficient in dB.
+        frequency_unit : str, optional
+            Unit of ``frequencies``. The default is ``"GHz"``.
+
+        Returns
+        -------
+        float
+            Weighted cost, zero when the goal is met.
+        """
+        frequencies = np.asarray(frequencies, dtype=float)
+        s11_db = np.asarray(s11_db, dtype=float)
+        start, stop = unit_converter([self.start, self.stop], "Freq", self.unit, frequency_unit)
+        if self.kind == "resonance":
+            return self.weight * 100.0 * abs(resonance(frequencies, s11_db) - start) / start
+
+        if start < frequencies.min() or stop > frequencies.max():
+            raise ValueError(
+                "The {}-{} {} band is outside of the frequency sweep.".format(self.start, self.stop, self.unit)
+            )
+        inside = (frequencies > start) & (frequencies < stop)
+        band = np.concatenate([[start], frequencies[inside], [stop]])
+        excess = np.maximum(np.interp(band, frequencies, s11_db) - self.threshold, 0.0)
+        return self.weight * float(np.sqrt(np.mean(excess**2)))
+
+
+class OptimizationConfig(object):
+    """Variables, goals and stopping criteria of an optimization.
+
+    Parameters
+    ----------
+    variables : dict
+        Bounds of each antenna parameter, as a ``[minimum, maximum]`` list or as a dictionary with the
+        ``"bounds"`` and the ``"start"`` value.
+    goals : list
+        Goals, see :meth:`Goal.parse`.
+    max_evaluations : int, optional
+        Maximum number of evaluated designs. The default is ``50``.
+    tolerance : float, optional
+        Size of the simplex, relative to the bounds, below which the optimization stops. The default is ``1e-3``.
+    patience : int, optional
+        Number of evaluations without improvement after which the optimization stops. The default is ``20``.
+    target_cost : float, optional
+        Cost at or below which the optimization stops. The default is ``0.0``, that is, when all goals are met.
+    log_file : str, optional
+        Evaluation log. The default is ``None``, in which case ``DEFAULT_LOG_FILE`` is used.
+    """
+
+    def __init__(
+        self, variables, goals, max_evaluations=50, tolerance=1e-3, patience=20, target_cost=0.0, log_file=None
+    ):
+        if not variables:
+            raise ValueError("The optimization needs at least one variable.")
+        if not goals:
+            raise ValueError("The optimization needs at least one goal.")
+        self.variables = {}
+        for name, variable in variables.items():
+            if not isinstance(variable, dict):
+                variable = {"bounds": variable}
+            minimum, maximum = (float(bound) for bound in variable["bounds"])
+            if not minimum < maximum:
+                raise ValueError("The bounds of {} must be increasing.".format(name))
+            self.variables[name] = {"bounds": (minimum, maximum), "start": variable.get("start")}
+        self.goals = [Goal.parse(goal) for goal in goals]
+        self.max_evaluations = int(max_evaluations)
+        self.tolerance = float(tolerance)
+        self.patience = int(patience)
+        self.target_cost = float(target_cost)
+        self.log_file = Path(log_file) if log_file else DEFAULT_LOG_FILE
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a configuration from a dictionary, for example loaded from a JSON or YAML file."""
+        return cls(**data)
+
+
+class EvaluationLog(object):
+    """Stores the reflection coefficient of each evaluated design in a JSON Lines file.
+
+    Parameters
+    ----------
+    log_file : str or :class:`pathlib.Path`, optional
+        JSON Lines file. The default is ``None``, in which case ``DEFAULT_LOG_FILE`` is used.
+    """
+
+    def __init__(self, log_file=None):
+        self.log_file = Path(log_file) if log_file else DEFAULT_LOG_FILE
+        self._lock = threading.Lock()
+        self._records = {}
+        if self.log_file.is_file():
+            with self.log_file.open(encoding="utf-8") as log_handler:
+                for line in log_handler:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Keep the log readable if a write was interrupted
+                        continue
+                    self._records[record["key"]] = record
+
+    def get(self, key):
+        """Get the record of a design, ``None`` when it was not evaluated."""
+        return self._records.get(key)
+
+    def add(self, key, antenna, parameters, frequencies, s11_db):
+        """Add the record of an evaluated design.
+
+        Parameters
+        ----------
+        key : str
+            Design key.
+        antenna : str
+            Antenna model name.
+        parameters : dict
+            Antenna parameters.
+        frequencies : list
+            Frequencies.
+        s11_db : list
+            Reflection coefficient in dB.
+
+        Returns
+        -------
+        dict
+            Stored record.
+        """
+        record = {
+            "key": key,
+            "antenna": antenna,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "parameters": parameters,
+            "frequencies": [float(frequency) for frequency in frequencies],
+            "s11_db": [float(value) for value in s11_db],
+        }
+        with self._lock:
+            self._records[key] = record
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.log_file.open("a", encoding="utf-8") as log_handler:
+                log_handler.write(json.dumps(record) + "\n")
+        return record
+
+
+def nelder_mead(function, start, max_evaluations=50, tolerance=1e-3, patience=20, target=-math.inf, step=0.1):
+    """Minimize a function in the unit hypercube with the Nelder-Mead method.
+
+    The points of the initial simplex, and the points of a shrink step, are evaluated in a single call,
+    so that they can be evaluated in parallel.
+
+    Parameters
+    ----------
+    function : callable
+        Function that takes a list of points and returns their costs.
+    start : :class:`numpy.ndarray`
+        Starting point, with coordinates between ``0`` and ``1``.
+    max_evaluations : int, optional
+        Maximum number of evaluations. The default is ``50``.
+    tolerance : float, optional
+        Simplex size below which the minimization stops. The default is ``1e-3``.
+    patience : int, optional
+        Number of evaluations without improvement after which the minimization stops. The default is ``20``.
+    target : float, optional
+        Cost at or below which the minimization stops. The default is ``-inf``.
+    step : float, optional
+        Size of the initial simplex. The default is ``0.1``.
+
+    Returns
+    -------
+    tuple
+        Best point, its cost, number of evaluations and reason why the minimization stopped.
+    """
+    start = np.clip(np.asarray(start, dtype=float), 0.0, 1.0)
+    dimension = len(start)
+    state = {"evaluations": 0, "best": math.inf, "since_best": 0}
+
+    def evaluate(points):
+        points = [np.clip(point, 0.0, 1.0) for point in points]
+        costs = [float(cost) for cost in function(points)]
+        for cost in costs:
+            state["evaluations"] += 1
+            if cost < state["best"]:
+                state["best"] = cost
+                state["since_best"] = 0
+            else:
+                state["since_best"] += 1
+        return points, costs
+
+    # Initial simplex, stepping inwards from the bounds
+    vertices = [start]
+    for index in range(dimension):
+        vertex = start.copy()
+        vertex[index] += step if vertex[index] + step <= 1.0 else -step
+        vertices.append(vertex)
+    vertices, costs = evaluate(vertices)
+
+    reason = "max_evaluations"
+    while state["evaluations"] < max_evaluations:
+        order = np.argsort(costs)
+        vertices = [vertices[index] for index in order]
+        costs = [costs[index] for index in order]
+        if costs[0] <= target:
+            reason = "target"
+            break
+        if max(np.max(np.abs(vertex - vertices[0])) for vertex in vertices[1:]) < tolerance:
+            reason = "tolerance"
+            break
+        if state["since_best"] >= patience:
+            reason = "patience"
+            break
+
+        centroid = np.mean(vertices[:-1], axis=0)
+        [reflected], [reflected_cost] = evaluate([2 * centroid - vertices[-1]])
+        if costs[0] <= reflected_cost < costs[-2]:
+            vertices[-1], costs[-1] = reflected, reflected_cost
+        elif reflected_cost < costs[0]:
+            [expanded], [expanded_cost] = evaluate([3 * centroid - 2 * vertices[-1]])
+            if expanded_cost < reflected_cost:
+                vertices[-1], costs[-1] = expanded, expanded_cost
+            else:
+                vertices[-1], costs[-1] = reflected, reflected_cost
+        else:
+            if reflected_cost < costs[-1]:
+                [contracted], [contracted_cost] = evaluate([(centroid + reflected) / 2])
+                accepted = contracted_cost <= reflected_cost
+            else:
+                [contracted], [contracted_cost] = evaluate([(centroid + vertices[-1]) / 2])
+                accepted = contracted_cost < costs[-1]
+            if accepted:
+                vertices[-1], costs[-1] = contracted, contracted_cost
+            else:
+                shrunk, shrunk_costs = evaluate([(vertices[0] + vertex) / 2 for vertex in vertices[1:]])
+                vertices[1:], costs[1:] = shrunk, shrunk_costs
+
+    best = int(np.argmin(costs))
+    return vertices[best], costs[best], state["evaluations"], reason
+
+
+class Optimizer(object):
+    """Closed-loop optimization of antenna parameters.
+
+    Candidate designs are evaluated by solver sessions. Each session is a callable that takes the
+    antenna parameters and returns the frequencies and the reflection coefficient in dB. Candidates
+    that can be evaluated at once are dispatched to the free sessions in parallel, so a single session
+    solves them one at a time. Every evaluation is stored in the evaluation log, and designs found in the
+    log are not solved again.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna model name.
+    parameters : dict
+        Current antenna parameters. Parameters that are not optimized are part of the design key.
+    config : :class:`OptimizationConfig`
+        Optimization configuration.
+    sessions : list
+        Solver sessions.
+    frequency_unit : str, optional
+        Frequency unit of the results of the sessions. The default is ``"GHz"``.
+    setup : dict, optional
+        Solver setup and frequency sweep of the sessions. It is part of the design key, so that results
+        logged with another setup or sweep are not reused. The default is ``None``.
+    """
+
+    def __init__(self, antenna, parameters, config, sessions, frequency_unit="GHz", setup=None):
+        if not sessions:
+            raise ValueError("The optimization needs at least one solver session.")
+        self.antenna = antenna
+        self.parameters = dict(parameters)
+        self.config = config
+        self.sessions = list(sessions)
+        self.frequency_unit = frequency_unit
+        self.setup = setup
+        self.log = EvaluationLog(config.log_file)
+        self.evaluations = []
+        self.solved = 0
+        self._lower = np.array([variable["bounds"][0] for variable in config.variables.values()])
+        self._upper = np.array([variable["bounds"][1] for variable in config.variables.values()])
+
+    def candidate(self, point):
+        """Get the antenna parameters of a point of the unit hypercube."""
+        values = self._lower + np.asarray(point) * (self._upper - self._lower)
+        # Rounding keeps the design keys stable between runs
+        candidate = {name: float("{:.6g}".format(value)) for name, value in zip(self.config.variables, values)}
+        return {**self.parameters, **candidate}
+
+    def design_key(self, candidate):
+        """Get the key of a candidate design in the evaluation log."""
+        if self.setup is None:
+            return design_key(self.antenna, candidate)
+        return design_key(self.antenna, {"parameters": candidate, "setup": self.setup})
+
+    def cost(self, frequencies, s11_db):
+        """Get the total cost of a reflection coefficient curve."""
+        return sum(goal.cost(frequencies, s11_db, self.frequency_unit) for goal in self.config.goals)
+
+    def _start(self):
+        start = []
+        for name, variable in self.config.variables.items():
+            minimum, maximum = variable["bounds"]
+            value = variable["start"]
+            if value is None:
+                # Parameters are numbers or values with units, like "19.354mm"
+                match = _NUMBER_RE.match(str(self.parameters.get(name, "")).strip())
+                value = float(match.group()) if match else (minimum + maximum) / 2
+            start.append((min(max(value, minimum), maximum) - minimum) / (maximum - minimum))
+        return np.array(start)
+
+    def evaluate(self, points):
+        """Evaluate points of the unit hypercube, solving the designs that are not in the log."""
+        candidates = [self.candidate(point) for point in points]
+        keys = [self.design_key(candidate) for candidate in candidates]
+        records = [self.log.get(key) for key in keys]
+        missing = [index for index, record in enumerate(records) if record is None]
+
+        if missing:
+            free_sessions = queue.Queue()
+            for session in self.sessions:
+                free_sessions.put(session)
+
+            def solve(index):
+                session = free_sessions.get()
+                try:
+                    frequencies, s11_db = session(candidates[index])
+                finally:
+                    free_sessions.put(session)
+                return self.log.add(keys[index], self.antenna, candidates[index], frequencies, s11_db)
+
+            with ThreadPoolExecutor(max_workers=min(len(self.sessions), len(missing))) as executor:
+                for index, record in zip(missing, executor.map(solve, missing)):
+                    records[index] = record
+            self.solved += len(missing)
+
+        costs = []
+        for candidate, record in zip(candidates, records):
+            cost = self.cost(record["frequencies"], record["s11_db"])
+            self.evaluations.append({"key": record["key"], "parameters": candidate, "cost": cost})
+            costs.append(cost)
+        return costs
+
+    def run(self):
+        """Run the optimization.
+
+        Returns
+        -------
+        dict
+            Best parameters and cost, number of evaluations, number of solved designs, reason why the
+            optimization stopped and all the evaluations.
+        """
+        point, cost, evaluations, reason = nelder_mead(
+            self.evaluate,
+            self._start(),
+            max_evaluations=self.config.max_evaluations,
+            tolerance=self.config.tolerance,
+            patience=self.config.patience,
+            target=self.config.target_cost,
+        )
+        return {
+            "antenna": self.antenna,
+            "parameters": self.candidate(point),
+            "cost": cost,
+            "evaluations": evaluations,
+            "solved": self.solved,
+            "stopped": reason,
+            "history": self.evaluations,
+        }
@@ -22,17 +22,25 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import atexit
+import os
 import sys
+import time
 
 # isort: off
 
+from ansys.aedt.toolkits.antenna.backend import metrics
 from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+from ansys.aedt.toolkits.antenna.backend.tracing import TRACE_ENVIRONMENT_VARIABLE
+from ansys.aedt.toolkits.antenna.backend.tracing import tracer
 
 from ansys.aedt.toolkits.common.backend.multithreading_server import MultithreadingServer
 from ansys.aedt.toolkits.common.backend.rest_api import app
 from ansys.aedt.toolkits.common.backend.rest_api import jsonify
 from ansys.aedt.toolkits.common.backend.rest_api import logger
 
+from flask import Response
+from flask import g
 from flask import request
 
 # isort: on
@@ -43,6 +51,49 @@ if len(sys.argv) == 3:
     toolkit_api.properties.url = sys.argv[1]
     toolkit_api.properties.port = int(sys.argv[2])
 
+if os.environ.get(TRACE_ENVIRONMENT_VARIABLE):
+    tracer.start()
+    atexit.register(tracer.export, os.environ[TRACE_ENVIRONMENT_VARIABLE])
+
+
+metrics.registry.gauge(
+    "antenna_toolkit_thread_busy",
+    "Whether a long operation is running in the toolkit thread.",
+    callback=lambda: int(bool(toolkit_api.properties.is_toolkit_busy)),
+)
+
+
+@app.before_request
+def begin_request_span():
+    g.trace_span = tracer.begin("[{}] {}".format(request.method, request.path), "rest")
+    g.request_start = time.perf_counter()
+    metrics.requests_in_progress.inc()
+
+
+@app.after_request
+def count_request(response):
+    # Routes are labelled by rule so that unknown paths do not create new series
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    metrics.requests_total.inc(method=request.method, route=route, status=str(response.status_code))
+    return response
+
+
+@app.teardown_request
+def end_request_span(exception=None):
+    tracer.end(g.pop("trace_span", None), error=str(exception) if exception else None)
+    start = g.pop("request_start", None)
+    if start is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.request_duration.observe(time.perf_counter() - start, method=request.method, route=route)
+        metrics.requests_in_progress.dec()
+
+
+@app.route("/metrics", methods=["GET"])
+def get_metrics():
+    logger.debug("[GET] /metrics (Get backend metrics)")
+
+    return Response(metrics.registry.render(), mimetype="text/plain; version=0.0.4")
+
 
 @app.route("/create_antenna", methods=["POST"])
 def create_antenna():
@@ -80,17 +131,123 @@ def update_hfss_parameters():
         return jsonify("Antenna not created"), 500
 
 
+@app.route("/refresh_design_index", methods=["POST"])
+def refresh_design_index():
+    logger.info("[POST] /refresh_design_index (Read the design state again from AEDT)")
+
+    response = toolkit_api.refresh_design_index()
+    return jsonify(response), 200
+
+
 @app.route("/analyze", methods=["POST"])
 def analyze():
     logger.info("[POST] /analyze (analyze AEDT project in batch)")
 
+    body = request.get_json(silent=True) or {}
+
+    if not body.get("blocking", True):
+        # Responses are served by a single thread, the analysis runs in the toolkit thread
+        # so that /analysis_progress can be polled while it solves
+        toolkit_api.solver_progress.start()
+        response = toolkit_api.launch_thread(toolkit_api.analyze)
+        if response:
+            return jsonify("AEDT design analysis started"), 200
+        else:  # pragma: no cover
+            toolkit_api.solver_progress.finish(False)
+            return jsonify("Fail to launch design"), 500
+
     response = toolkit_api.analyze()
-    if response:
+    if response and toolkit_api.scaled_solution:
+        return jsonify("AEDT design results scaled from a solved design"), 200
+    elif response:
         return jsonify("AEDT design analysis finished"), 200
     else:  # pragma: no cover
         return jsonify("Fail to launch design"), 500
 
 
+@app.route("/analysis_progress", methods=["GET"])
+def analysis_progress():
+    logger.debug("[GET] /analysis_progress (Get analysis progress)")
+
+    response = toolkit_api.analysis_progress()
+    return jsonify(response), 200
+
+
+@app.route("/analysis_history", methods=["GET"])
+def analysis_history():
+    logger.info("[GET] /analysis_history (Get solver profile of previous analyses)")
+
+    body = request.get_json(silent=True) or {}
+
+    response = toolkit_api.analysis_history(
+        antenna=body.get("antenna"),
+        key=body.get("key"),
+        limit=body.get("limit"),
+    )
+    return jsonify(response), 200
+
+
+@app.route("/inverse_synthesis", methods=["POST"])
+def inverse_synthesis():
+    logger.info("[POST] /inverse_synthesis (Synthesize antenna for target resonant frequencies)")
+
+    body = request.json
+    if not body or "frequencies" not in body:
+        msg = "body must contain the target frequencies!"
+        logger.error(msg)
+        return jsonify(msg), 500
+
+    antenna = body.get("antenna") or toolkit_api.get_properties()["antenna"]["model"]
+    response = toolkit_api.inverse_synthesis(antenna, body["frequencies"], body.get("resistance"))
+    if response:
+        return jsonify(response), 200
+    else:  # pragma: no cover
+        return jsonify("Antenna not synthesized"), 500
+
+
+@app.route("/predict_performance", methods=["POST"])
+def predict_performance():
+    logger.info("[POST] /predict_performance (Predict simulated performance from previous analyses)")
+
+    body = request.get_json(silent=True) or {}
+
+    response = toolkit_api.predict_performance(body.get("antenna"), body.get("synthesis"))
+    if response:
+        return jsonify(response), 200
+    else:
+        return jsonify("Not enough simulated designs to predict the performance"), 500
+
+
+@app.route("/scaled_results", methods=["POST"])
+def scaled_results():
+    logger.info("[POST] /scaled_results (Scale the results of a solved PEC antenna to the design)")
+
+    body = request.get_json(silent=True) or {}
+
+    response = toolkit_api.scaled_results(body.get("antenna"), body.get("synthesis"))
+    if response:
+        return jsonify(response), 200
+    else:
+        return jsonify("No solved design can be scaled to the design"), 500
+
+
+@app.route("/optimize", methods=["POST"])
+def optimize():
+    logger.info("[POST] /optimize (Optimize antenna parameters in HFSS)")
+
+    body = request.json
+    if not body or "variables" not in body or "goals" not in body:
+        msg = "body must contain the optimization variables and goals!"
+        logger.error(msg)
+        return jsonify(msg), 500
+
+    response = toolkit_api.optimize(body)
+    if response:
+        return jsonify(response), 200
+    else:  # pragma: no cover
+        return jsonify("Optimization failed"), 500
+
+
 @app.route("/scattering_results", methods=["GET"])
 def scattering_results():
     logger.info("[GET] scattering_results (Get antenna scattering results)")
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import math
+from pathlib import Path
+import re
+
+import ansys.aedt.core.generic.constants as constants
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+from ansys.aedt.toolkits.antenna.backend.antenna_models.parameters import is_unitless_parameter
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+
+# Materials whose electromagnetic behavior does not depend on the frequency. Conductors with a finite
+# conductivity are excluded because their skin depth does not scale with the geometry.
+SCALE_INVARIANT_MATERIALS = ("pec", "vacuum")
+
+# Results that are frequencies, divided by the scale factor of the geometry
+FREQUENCY_RESULTS = ("resonant_frequency", "bandwidth")
+
+# Results that do not depend on the size of the geometry
+INVARIANT_RESULTS = ("min_s11_db", "peak_gain")
+
+# Position of the antenna, which does not change its solution
+POSITION_PARAMETERS = ("pos_x", "pos_y", "pos_z")
+
+# Touchstone files are named after their number of ports, like ``design.s1p``
+_TOUCHSTONE_RE = re.compile(r"\.s(\d+)p$", re.IGNORECASE)
+
+_LENGTH_RE = re.compile(r"^\s*([-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)\s*([a-zA-Z]*)\s*$")
+
+
+def check_scalable(antenna, synthesis):
+    """Check that the solution of an antenna can be scaled with its size.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna model name.
+    synthesis : dict
+        Synthesis properties.
+
+    Raises
+    ------
+    ValueError
+        When the antenna model has other materials than its own material and vacuum, or when its material
+        is not PEC or vacuum.
+    """
+    antenna_class = getattr(antenna_models, antenna, None)
+    if not getattr(antenna_class, "scale_invariant", False):
+        raise ValueError("{} may have dielectrics, its solution cannot be scaled.".format(antenna))
+    defaults = antenna_class._default_input_parameters
+    if "material" in defaults:
+        material = synthesis.get("material") or defaults["material"]
+        if str(material).lower() not in SCALE_INVARIANT_MATERIALS:
+            raise ValueError("{} is made of {}, its solution cannot be scaled.".format(antenna, material))
+
+
+def _length(value, length_unit):
+    """Get a length in meters from a number in the length unit or from a value with units."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return unit_converter(float(value), "Length", length_unit, "meter")
+    match = _LENGTH_RE.match(str(value))
+    if not match:
+        return None
+    number, units = match.groups()
+    if units and units not in constants.AEDT_UNITS["Length"]:
+        return None
+    return unit_converter(float(number), "Length", units or length_unit, "meter")
+
+
+def scale_factor(reference, parameters, reference_unit="mm", length_unit="mm", tolerance=1e-3):
+    """Get the uniform scale factor between the geometries of two designs.
+
+    Lengths must have the same ratio, while unitless parameters and angles must be equal. The position of
+    the antenna is ignored. The default tolerance accepts the rounding of the synthesized lengths.
+
+    Parameters
+    ----------
+    reference : dict
+        Synthesis parameters of the reference design.
+    parameters : dict
+        Synthesis parameters of the design.
+    reference_unit : str, optional
+        Length unit of the reference parameters. The default is ``"mm"``.
+    length_unit : str, optional
+        Length unit of the design parameters. The default is ``"mm"``.
+    tolerance : float, optional
+        Relative tolerance of the comparisons. The default is ``1e-3``.
+
+    Returns
+    -------
+    float or None
+        Ratio of the design lengths to the reference lengths. ``None`` when the design is not a uniformly
+        scaled copy of the reference.
+    """
+    if set(reference) != set(parameters):
+        return None
+    lengths = []
+    for name, value in parameters.items():
+        if name in POSITION_PARAMETERS:
+            continue
+        reference_value = reference[name]
+        if is_unitless_parameter(name) or "angle" in name:
+            if isinstance(value, (int, float)) and isinstance(reference_value, (int, float)):
+                if not math.isclose(value, reference_value, rel_tol=tolerance, abs_tol=tolerance):
+                    return None
+            elif value != reference_value:
+                return None
+            continue
+        length = _length(value, length_unit)
+        reference_length = _length(reference_value, reference_unit)
+        if length is None or reference_length is None:
+            if value != reference_value:
+                return None
+        elif reference_length == 0.0 or length == 0.0:
+            if reference_length != length:
+                return None
+        else:
+            lengths.append((reference_length, length))
+    if not lengths:
+        return None
+
+    # The largest length is the least affected by the rounding of the synthesis
+    reference_length, length = max(lengths)
+    factor = length / reference_length
+    for reference_length, length in lengths:
+        if not math.isclose(length, factor * reference_length, rel_tol=tolerance):
+            return None
+    return factor
+
+
+def scale_solution(record, factor, frequency_unit="GHz"):
+    """Scale the results of a solved design to a copy of its geometry.
+
+    A PEC antenna in vacuum scaled by a factor has the solution of the original antenna at the frequencies
+    divided by the same factor. Gains and reflection coefficients are unchanged.
+
+    Parameters
+    ----------
+    record : dict
+        Analysis history record of the solved design, with its reflection coefficient curve.
+    factor : float
+        Ratio of the design lengths to the solved design lengths.
+    frequency_unit : str, optional
+        Frequency unit of the scaled results. The default is ``"GHz"``.
+
+    Returns
+    -------
+    dict
+        Scaled results, flagged with ``"scaled": True``, the scale factor and the key of the solved design.
+    """
+    record_unit = (record.get("synthesis") or {}).get("frequency_unit") or "GHz"
+    ratio = unit_converter(1.0, "Freq", record_unit, frequency_unit) / factor
+    solution = {
+        "scaled": True,
+        "scale_factor": factor,
+        "reference": record.get("key"),
+        "frequency_unit": frequency_unit,
+        "s11_frequencies": [frequency * ratio for frequency in record.get("s11_frequencies") or []],
+        "s11_db": list(record.get("s11_db") or []),
+    }
+    if record.get("farfield_metadata"):
+        # The far field of the solved design is scaled on request, see :func:`scale_farfield`
+        solution["farfield_metadata"] = record["farfield_metadata"]
+    for name in FREQUENCY_RESULTS:
+        if record.get(name) is not None:
+            solution[name] = record[name] * ratio
+    for name in INVARIANT_RESULTS:
+        if record.get(name) is not None:
+            solution[name] = record[name]
+    return solution
+
+
+def find_scaled_solution(antenna, synthesis, parameters, records, tolerance=1e-3):
+    """Find a solved design of which a design is a uniformly scaled copy, and scale its results.
+
+    Only antennas made of PEC and vacuum are scaled, see :func:`check_scalable`. The solved designs must
+    have the same antenna model and outer boundary, and their reflection coefficient curve must be stored
+    in the analysis history.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna model name.
+    synthesis : dict
+        Synthesis properties of the design.
+    parameters : dict
+        Synthesis parameters of the design.
+    records : list
+        Analysis history records, the preferred first.
+    tolerance : float, optional
+        Relative tolerance of the geometry comparisons. The default is ``1e-3``.
+
+    Returns
+    -------
+    dict or None
+        Scaled results, see :func:`scale_solution`. ``None`` when no solved design matches.
+
+    Raises
+    ------
+    ValueError
+        When the design has dielectrics or lossy materials.
+    """
+    check_scalable(antenna, synthesis)
+    for record in records:
+        reference = record.get("synthesis") or {}
+        if record.get("antenna") != antenna or not record.get("s11_frequencies"):
+            continue
+        if (reference.get("outer_boundary") or "") != (synthesis.get("outer_boundary") or ""):
+            continue
+        try:
+            check_scalable(antenna, reference)
+        except ValueError:
+            continue
+        factor = scale_factor(
+            record.get("parameters") or {},
+            parameters,
+            reference.get("length_unit") or "mm",
+            synthesis.get("length_unit") or "mm",
+            tolerance,
+        )
+        if factor:
+            return scale_solution(record, factor, synthesis.get("frequency_unit") or "GHz")
+    return None
+
+
+def _scale_touchstone(text, factor, ports):
+    """Divide the frequencies of a Touchstone file by the scale factor, keeping its layout."""
+    values_per_frequency = 1 + 2 * ports**2
+    lines = []
+    index = 0
+    for line in text.splitlines():
+        data, separator, comment = line.partition("!")
+        if not data.strip() or data.lstrip().startswith("#"):
+            lines.append(line)
+            continue
+        tokens = data.split()
+        for position, token in enumerate(tokens):
+            # Records of more than two ports span several lines, the frequency starts each record
+            if (index + position) % values_per_frequency == 0:
+                tokens[position] = repr(float(token) / factor)
+        index += len(tokens)
+        lines.append(" ".join(tokens) + (" " + separator + comment if separator else ""))
+    return "\n".join(lines) + "\n"
+
+
+def _scale_obj(text, factor):
+    """Scale the vertices of an OBJ geometry file."""
+    lines = []
+    for line in text.splitlines():
+        if line.startswith("v "):
+            coordinates = [float(value) * factor for value in line.split()[1:]]
+            line = "v " + " ".join(repr(value) for value in coordinates)
+        lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def scale_farfield(metadata_file, factor, output_dir, reference=None):
+    """Scale the far field export of a solved design to a copy of its geometry.
+
+    The pattern of a PEC antenna in vacuum scaled by a factor, at a frequency, is the pattern of the original
+    antenna at the frequency multiplied by the factor. The element patterns, powers and reflection coefficients
+    are relabeled to the frequencies divided by the factor, and the element locations and the geometry are
+    scaled.
+
+    Parameters
+    ----------
+    metadata_file : str or :class:`pathlib.Path`
+        PyAEDT antenna metadata file of the solved design, see
+        :meth:`ansys.aedt.core.hfss.Hfss.get_antenna_data`.
+    factor : float
+        Ratio of the design lengths to the solved design lengths.
+    output_dir : str or :class:`pathlib.Path`
+        Directory of the scaled export.
+    reference : str, optional
+        Key of the solved design, stored in the scaled metadata. The default is ``None``.
+
+    Returns
+    -------
+    tuple
+        Scaled metadata file and frequencies in Hz. The metadata is flagged with ``"scaled": True``, the scale
+        factor and the key of the solved design.
+    """
+    metadata_file = Path(metadata_file)
+    source_dir = metadata_file.parent
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
+
+    def relabel(values):
+        return {repr(float(frequency) / factor): value for frequency, value in (values or {}).items()}
+
+    frequencies = []
+    for element in metadata.get("element_pattern", {}).values():
+        lines = []
+        for line in (source_dir / element["file_name"]).read_text(encoding="utf-8").splitlines():
+            if line.startswith("Frequency"):
+                frequency = float(line.split()[1]) / factor
+                if frequency not in frequencies:
+                    frequencies.append(frequency)
+                line = "Frequency {!r}".format(frequency)
+            lines.append(line)
+        (output_dir / element["file_name"]).write_text("\n".join(lines) + "\n", encoding="utf-8")
+        element["location"] = [float(value) * factor for value in element["location"]]
+        for power in ("incident_power", "accepted_power", "radiated_power"):
+            element[power] = relabel(element.get(power))
+
+    for geometry in (metadata.get("model_info") or {}).get("object_list", {}).values():
+        geometry_file = output_dir / geometry[0]
+        geometry_file.parent.mkdir(parents=True, exist_ok=True)
+        geometry_text = (source_dir / geometry[0]).read_text(encoding="utf-8")
+        geometry_file.write_text(_scale_obj(geometry_text, factor), encoding="utf-8")
+
+    touchstone = metadata.get("touchstone_file")
+    match = _TOUCHSTONE_RE.search(touchstone or "")
+    if match and (source_dir / touchstone).is_file():
+        text = (source_dir / touchstone).read_text(encoding="utf-8")
+        (output_dir / touchstone).write_text(_scale_touchstone(text, factor, int(match.group(1))), encoding="utf-8")
+
+    metadata.update({"scaled": True, "scale_factor": factor, "reference": reference})
+    scaled_file = output_dir / metadata_file.name
+    scaled_file.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    return str(scaled_file), frequencies
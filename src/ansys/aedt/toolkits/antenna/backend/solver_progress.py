@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import re
+import threading
+import time
+
+_PASS_RE = re.compile(r"pass", re.IGNORECASE)
+_DELTA_RE = re.compile(r"delta", re.IGNORECASE)
+_ELEMENTS_RE = re.compile(r"(tetrahedra|elements|triangles)", re.IGNORECASE)
+_COLUMN_SEPARATOR_RE = re.compile(r"\t|\||,|\s{2,}")
+
+
+def _to_number(value):
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def parse_convergence(text):
+    """Parse an exported convergence table.
+
+    The table exported by ``ExportConvergence`` has one header line with the column names and one
+    line per adaptive pass. Columns are located by name, so extra columns and separators are ignored.
+
+    Parameters
+    ----------
+    text : str
+        Content of the convergence file.
+
+    Returns
+    -------
+    list
+        One dictionary per adaptive pass with the ``"pass"``, ``"delta_s"`` and ``"mesh_elements"`` keys.
+        Values that are not available, like the delta S of the first pass, are ``None``.
+    """
+    columns = None
+    passes = []
+    for line in text.splitlines():
+        cells = [cell.strip() for cell in _COLUMN_SEPARATOR_RE.split(line.strip()) if cell.strip()]
+        if not cells:
+            continue
+        if columns is None:
+            pass_column = next((i for i, cell in enumerate(cells) if _PASS_RE.search(cell)), None)
+            if pass_column is None or len(cells) < 2:
+                continue
+            columns = {
+                "pass": pass_column,
+                "delta_s": next((i for i, cell in enumerate(cells) if _DELTA_RE.search(cell)), None),
+                "mesh_elements": next((i for i, cell in enumerate(cells) if _ELEMENTS_RE.search(cell)), None),
+            }
+            continue
+
+        values = {}
+        for key, column in columns.items():
+            values[key] = _to_number(cells[column]) if column is not None and column < len(cells) else None
+        if values["pass"] is None:
+            continue
+        passes.append(values)
+    return passes
+
+
+class SolverProgress(object):
+    """Stores the progress of a running analysis.
+
+    The analysis thread updates the progress and the REST API reads a snapshot, so the state
+    is protected by a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start_time = None
+        self._state = {}
+        self.reset()
+
+    def reset(self, status="idle", setup=None):
+        """Clear the progress."""
+        with self._lock:
+            self._start_time = time.time() if status == "running" else None
+            self._state = {
+                "status": status,
+                "setup": setup,
+                "elapsed": 0.0,
+                "adaptive_pass": 0,
+                "delta_s": None,
+                "mesh_elements": None,
+                "sweep_points": 0,
+                "memory_gb": None,
+                "real_time": None,
+                "cpu_time": None,
+                "convergence": [],
+            }
+
+    def start(self, setup=None):
+        """Mark the analysis as running."""
+        self.reset("running", setup)
+
+    def finish(self, success=True):
+        """Mark the analysis as finished or failed."""
+        with self._lock:
+            self._update_elapsed()
+            self._state["status"] = "finished" if success else "failed"
+
+    def update(self, **values):
+        """Update progress values."""
+        with self._lock:
+            self._update_elapsed()
+            self._state.update(values)
+
+    def update_convergence(self, passes):
+        """Update the progress from the parsed convergence table.
+
+        Parameters
+        ----------
+        passes : list
+            Adaptive passes, as returned by :func:`parse_convergence`.
+        """
+        if not passes:
+            return
+        last_pass = passes[-1]
+        self.update(
+            adaptive_pass=last_pass["pass"],
+            delta_s=last_pass["delta_s"],
+            mesh_elements=last_pass["mesh_elements"],
+            convergence=[[item["pass"], item["delta_s"]] for item in passes if item["delta_s"] is not None],
+        )
+
+    def snapshot(self):
+        """Get a copy of the progress.
+
+        Returns
+        -------
+        dict
+            Progress values.
+        """
+        with self._lock:
+            self._update_elapsed()
+            state = dict(self._state)
+            state["convergence"] = [list(item) for item in self._state["convergence"]]
+            return state
+
+    @property
+    def is_running(self):
+        """Whether an analysis is running."""
+        return self._state["status"] == "running"
+
+    def _update_elapsed(self):
+        if self._start_time is not None and self._state["status"] == "running":
+            self._state["elapsed"] = round(time.time() - self._start_time, 3)
@@ -0,0 +1,485 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import resonance
+
+# Trained surrogate models of each antenna family
+DEFAULT_SURROGATE_FILE = Path.home() / ".ansys" / "antenna_toolkit" / "surrogate_models.json"
+
+# Simulated metrics stored in the analysis history, and their unit system
+METRICS = {"resonant_frequency": "Freq", "bandwidth": "Freq", "peak_gain": None}
+
+# Synthesis properties converted to common units before the fit
+FREQUENCY_FEATURES = ("frequency", "start_frequency", "stop_frequency")
+LENGTH_FEATURES = ("substrate_height", "feeder_length", "boom_spacing", "base_element_length", "base_element_radius")
+
+# Hyperparameter grids searched by maximizing the marginal likelihood
+LENGTHSCALES = np.geomspace(0.1, 10.0, 21)
+NOISE_RATIOS = (1e-8, 1e-6, 1e-4, 1e-2)
+
+
+def s11_metrics(frequencies, s11_db, threshold=-10.0):
+    """Get the resonance and the matched bandwidth from a reflection coefficient curve.
+
+    Parameters
+    ----------
+    frequencies : list
+        Frequencies.
+    s11_db : list
+        Reflection coefficient in dB.
+    threshold : float, optional
+        Reflection coefficient bounding the matched band, in dB. The default is ``-10.0``.
+
+    Returns
+    -------
+    dict
+        Resonant frequency and bandwidth, in the units of ``frequencies``, and minimum reflection
+        coefficient in dB. The bandwidth is ``0.0`` when the curve does not cross the threshold.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    s11_db = np.asarray(s11_db, dtype=float)
+    index = int(np.argmin(s11_db))
+    bandwidth = 0.0
+    if s11_db[index] < threshold:
+        # Walk from the minimum to the threshold crossings, interpolating between the samples
+        below = s11_db < threshold
+        low = index
+        while low > 0 and below[low - 1]:
+            low -= 1
+        high = index
+        while high < len(s11_db) - 1 and below[high + 1]:
+            high += 1
+        start = frequencies[low]
+        if low > 0:
+            start = np.interp(threshold, s11_db[[low, low - 1]], frequencies[[low, low - 1]])
+        stop = frequencies[high]
+        if high < len(s11_db) - 1:
+            stop = np.interp(threshold, s11_db[[high, high + 1]], frequencies[[high, high + 1]])
+        bandwidth = float(stop - start)
+    return {
+        "resonant_frequency": resonance(frequencies, s11_db),
+        "bandwidth": bandwidth,
+        "min_s11_db": float(s11_db[index]),
+    }
+
+
+def training_records(antenna, records):
+    """Get the analysis history records that a surrogate can be trained on.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    records : list
+        Analysis history records.
+
+    Returns
+    -------
+    list
+        Records of the antenna with synthesis properties and at least one metric. Failed analyses have no
+        metric and are skipped.
+    """
+    return [
+        record
+        for record in records
+        if record.get("antenna") == antenna
+        and record.get("synthesis")
+        and any(record.get(metric) is not None for metric in METRICS)
+    ]
+
+
+def synthesis_features(synthesis):
+    """Get the numeric synthesis properties of a design.
+
+    Frequencies are converted to GHz and lengths to millimeters, so that designs synthesized in
+    different units share the same features. Numeric material properties are prefixed with ``material_``.
+
+    Parameters
+    ----------
+    synthesis : dict
+        Synthesis properties.
+
+    Returns
+    -------
+    dict
+        Feature values.
+    """
+    features = {}
+    for name, value in synthesis.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if name in FREQUENCY_FEATURES:
+            value = unit_converter(value, "Freq", synthesis.get("frequency_unit", "GHz"), "GHz")
+        elif name in LENGTH_FEATURES:
+            value = unit_converter(value, "Length", synthesis.get("length_unit", "mm"), "mm")
+        features[name] = float(value)
+    for name, value in (synthesis.get("material_properties") or {}).items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            features["material_" + name] = float(value)
+    return features
+
+
+class GaussianProcess(object):
+    """Gaussian process regression with a linear mean and a squared exponential kernel.
+
+    Inputs are expected to be scaled, so that a single length scale fits all the inputs. The
+    length scale and the noise ratio are selected on a grid by maximizing the marginal likelihood,
+    and the signal variance has a closed form for each grid point.
+
+    Parameters
+    ----------
+    x : :class:`numpy.ndarray`
+        Training inputs, one row per sample.
+    y : :class:`numpy.ndarray`
+        Training outputs.
+    lengthscale : float, optional
+        Kernel length scale. The default is ``None``, in which case it is fitted.
+    noise : float, optional
+        Noise variance relative to the signal variance. The default is ``None``, in which case it is fitted.
+    """
+
+    def __init__(self, x, y, lengthscale=None, noise=None):
+        self.x = np.atleast_2d(np.asarray(x, dtype=float))
+        self.y = np.asarray(y, dtype=float)
+        samples, inputs = self.x.shape
+
+        # Linear trend when there are enough samples to fit it, constant mean otherwise
+        self._linear = samples > inputs + 2
+        basis = self._basis(self.x)
+        self.weights, *_ = np.linalg.lstsq(basis, self.y, rcond=None)
+        self._residuals = self.y - basis @ self.weights
+        self._distances = self._squared_distances(self.x, self.x)
+
+        if lengthscale is None or noise is None:
+            lengthscale, noise = max(
+                ((scale, ratio) for scale in LENGTHSCALES for ratio in NOISE_RATIOS),
+                key=lambda hyperparameters: self._log_likelihood(*hyperparameters),
+            )
+        self.lengthscale = float(lengthscale)
+        self.noise = float(noise)
+        self._cholesky, self._alpha, self.variance = self._factorize(self.lengthscale, self.noise)
+
+    def _basis(self, x):
+        if self._linear:
+            return np.hstack([np.ones((len(x), 1)), x])
+        return np.ones((len(x), 1))
+
+    @staticmethod
+    def _squared_distances(a, b):
+        return np.sum((a[:, None, :] - b[None, :, :]) ** 2, axis=-1)
+
+    def _factorize(self, lengthscale, noise):
+        kernel = np.exp(-0.5 * self._distances / lengthscale**2) + noise * np.eye(len(self.x))
+        cholesky = np.linalg.cholesky(kernel)
+        alpha = np.linalg.solve(cholesky.T, np.linalg.solve(cholesky, self._residuals))
+        variance = max(float(self._residuals @ alpha) / len(self.x), 1e-12)
+        return cholesky, alpha, variance
+
+    def _log_likelihood(self, lengthscale, noise):
+        try:
+            cholesky, _, variance = self._factorize(lengthscale, noise)
+        except np.linalg.LinAlgError:
+            return -math.inf
+        return -0.5 * len(self.x) * math.log(variance) - float(np.sum(np.log(np.diag(cholesky))))
+
+    def predict(self, x):
+        """Get the predicted mean and standard deviation.
+
+        Parameters
+        ----------
+        x : :class:`numpy.ndarray`
+            Inputs, one row per design.
+
+        Returns
+        -------
+        tuple
+            Mean and standard deviation of each design.
+        """
+        x = np.atleast_2d(np.asarray(x, dtype=float))
+        cross = np.exp(-0.5 * self._squared_distances(x, self.x) / self.lengthscale**2)
+        mean = self._basis(x) @ self.weights + cross @ self._alpha
+        projection = np.linalg.solve(self._cholesky, cross.T)
+        variance = self.variance * np.clip(1.0 + self.noise - np.sum(projection**2, axis=0), 0.0, None)
+        return mean, np.sqrt(variance)
+
+    def to_dict(self):
+        """Get the model as a dictionary that can be stored in JSON."""
+        return {
+            "x": self.x.tolist(),
+            "y": self.y.tolist(),
+            "lengthscale": self.lengthscale,
+            "noise": self.noise,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a model from a dictionary, without fitting the hyperparameters again."""
+        return cls(data["x"], data["y"], data["lengthscale"], data["noise"])
+
+
+class PerformanceSurrogate(object):
+    """Surrogate of the simulated performance of an antenna family.
+
+    One Gaussian process per metric maps the synthesis properties to the resonant frequency, the
+    matched bandwidth and the peak gain stored in the analysis history. Only the synthesis properties
+    that vary between the samples are used. Features that are positive in all the samples, such as
+    frequencies and lengths, are fitted in log scale, and so is the resonant frequency.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    features : list
+        Feature names.
+    log_features : list
+        Names of the features fitted in log scale.
+    center : list
+        Mean of the scaled features.
+    scale : list
+        Standard deviation of the scaled features.
+    bounds : list
+        Minimum and maximum of each feature over the samples.
+    models : dict
+        Gaussian process and output scaling of each metric.
+    samples : int, optional
+        Number of samples used for the fit. The default is ``0``.
+    """
+
+    LOG_METRICS = ("resonant_frequency",)
+
+    def __init__(self, antenna, features, log_features, center, scale, bounds, models, samples=0):
+        self.antenna = antenna
+        self.features = list(features)
+        self.log_features = list(log_features)
+        self.center = np.asarray(center, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+        self.bounds = np.asarray(bounds, dtype=float).reshape(-1, 2)
+        self.models = models
+        self.samples = samples
+
+    @classmethod
+    def train(cls, antenna, records):
+        """Train the surrogate of an antenna family from analysis history records.
+
+        Parameters
+        ----------
+        antenna : str
+            Antenna class name.
+        records : list
+            Analysis history records. Records of other antennas, and records without any metric, are skipped.
+
+        Returns
+        -------
+        :class:`PerformanceSurrogate`
+            Trained surrogate.
+        """
+        records = training_records(antenna, records)
+        if len(records) < 2:
+            raise ValueError("At least two simulated designs are needed to train the {} surrogate.".format(antenna))
+
+        rows = [synthesis_features(record["synthesis"]) for record in records]
+        names = sorted(set.intersection(*(set(row) for row in rows)))
+        values = np.array([[row[name] for name in names] for row in rows])
+        varying = np.ptp(values, axis=0) > 1e-12 * np.maximum(np.abs(values).max(axis=0), 1.0)
+        features = [name for name, keep in zip(names, varying) if keep]
+        values = values[:, varying]
+        if not features:
+            raise ValueError("The {} designs do not differ in any synthesis property.".format(antenna))
+
+        log_features = [name for name, column in zip(features, values.T) if np.all(column > 0)]
+        surrogate = cls(antenna, features, log_features, [], [], [], {}, len(records))
+        transformed = surrogate._transform(values)
+        surrogate.center = transformed.mean(axis=0)
+        surrogate.scale = np.where(transformed.std(axis=0) > 0, transformed.std(axis=0), 1.0)
+        surrogate.bounds = np.stack([values.min(axis=0), values.max(axis=0)], axis=1)
+        inputs = (transformed - surrogate.center) / surrogate.scale
+
+        for metric, unit_system in METRICS.items():
+            selected = [index for index, record in enumerate(records) if record.get(metric) is not None]
+            if len(selected) < 2:
+                continue
+            outputs = np.array([float(records[index][metric]) for index in selected])
+            if unit_system:
+                units = [records[index]["synthesis"].get("frequency_unit", "GHz") for index in selected]
+                outputs = np.array(
+                    [unit_converter(output, unit_system, unit, "GHz") for output, unit in zip(outputs, units)]
+                )
+            if metric in cls.LOG_METRICS:
+                if np.any(outputs <= 0):
+                    continue
+                outputs = np.log(outputs)
+            offset = float(outputs.mean())
+            spread = float(outputs.std()) or 1.0
+            process = GaussianProcess(inputs[selected], (outputs - offset) / spread)
+            surrogate.models[metric] = {"offset": offset, "spread": spread, "process": process}
+
+        if not surrogate.models:
+            raise ValueError("No simulated metric to train the {} surrogate.".format(antenna))
+        return surrogate
+
+    def _transform(self, values):
+        values = np.array(values, dtype=float)
+        for index, name in enumerate(self.features):
+            if name in self.log_features:
+                values[:, index] = np.log(values[:, index])
+        return values
+
+    def predict(self, synthesis, tolerance=0.02, gain_tolerance=0.5):
+        """Predict the simulated performance of designs.
+
+        Parameters
+        ----------
+        synthesis : dict or list
+            Synthesis properties of a design, or a list of them.
+        tolerance : float, optional
+            Relative standard deviation of the frequency metrics below which a prediction can replace a
+            simulation. The default is ``0.02``.
+        gain_tolerance : float, optional
+            Standard deviation of the peak gain below which a prediction can replace a simulation, in dB.
+            The default is ``0.5``.
+
+        Returns
+        -------
+        dict or list
+            Mean and standard deviation of each metric, in the synthesis frequency unit and in dB, whether
+            the design is inside the bounds of the trained designs and whether the simulation can be skipped.
+            A list is returned when a list of designs is given.
+        """
+        designs = synthesis if isinstance(synthesis, list) else [synthesis]
+        rows = [synthesis_features(design) for design in designs]
+        values = np.array([[row.get(name, math.nan) for name in self.features] for row in rows], dtype=float)
+        inside = np.all((values >= self.bounds[:, 0]) & (values <= self.bounds[:, 1]), axis=1)
+        # Missing or invalid features are replaced by the center of the trained designs
+        with np.errstate(invalid="ignore", divide="ignore"):
+            inputs = (self._transform(values) - self.center) / self.scale
+        inputs = np.where(np.isfinite(inputs), inputs, 0.0)
+
+        results = [
+            {"metrics": {}, "within_trained_region": bool(within), "skip_simulation": bool(within)} for within in inside
+        ]
+        for metric, model in self.models.items():
+            mean, std = model["process"].predict(inputs)
+            mean = model["offset"] + model["spread"] * mean
+            std = model["spread"] * std
+            if metric in self.LOG_METRICS:
+                # Log-normal mean and standard deviation
+                std = np.exp(mean) * np.sqrt(np.expm1(std**2))
+                mean = np.exp(mean)
+            for result, design, value, deviation in zip(results, designs, mean, std):
+                unit = "dB"
+                if METRICS[metric]:
+                    unit = design.get("frequency_unit", "GHz")
+                    value = unit_converter(float(value), METRICS[metric], "GHz", unit)
+                    deviation = unit_converter(float(deviation), METRICS[metric], "GHz", unit)
+                    # Frequency metrics are compared with the design frequency
+                    confident = deviation <= tolerance * float(design.get("frequency") or value)
+                else:
+                    confident = deviation <= gain_tolerance
+                result["metrics"][metric] = {"mean": float(value), "std": float(deviation), "unit": unit}
+                result["skip_simulation"] = result["skip_simulation"] and bool(confident)
+
+        return results if isinstance(synthesis, list) else results[0]
+
+    def to_dict(self):
+        """Get the surrogate as a dictionary that can be stored in JSON."""
+        return {
+            "antenna": self.antenna,
+            "features": self.features,
+            "log_features": self.log_features,
+            "center": self.center.tolist(),
+            "scale": self.scale.tolist(),
+            "bounds": self.bounds.tolist(),
+            "models": {
+                metric: {"offset": model["offset"], "spread": model["spread"], "process": model["process"].to_dict()}
+                for metric, model in self.models.items()
+            },
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a surrogate from a dictionary."""
+        models = {
+            metric: {
+                "offset": model["offset"],
+                "spread": model["spread"],
+                "process": GaussianProcess.from_dict(model["process"]),
+            }
+            for metric, model in data["models"].items()
+        }
+        return cls(
+            data["antenna"],
+            data["features"],
+            data["log_features"],
+            data["center"],
+            data["scale"],
+            data["bounds"],
+            models,
+            data.get("samples", 0),
+        )
+
+
+def load_surrogates(surrogate_file=None):
+    """Load the stored surrogates, keyed by antenna class name.
+
+    Parameters
+    ----------
+    surrogate_file : str or :class:`pathlib.Path`, optional
+        JSON file. The default is ``None``, in which case ``DEFAULT_SURROGATE_FILE`` is used.
+
+    Returns
+    -------
+    dict
+        Surrogates.
+    """
+    surrogate_file = Path(surrogate_file) if surrogate_file else DEFAULT_SURROGATE_FILE
+    if not surrogate_file.is_file():
+        return {}
+    data = json.loads(surrogate_file.read_text(encoding="utf-8"))
+    return {antenna: PerformanceSurrogate.from_dict(surrogate) for antenna, surrogate in data.items()}
+
+
+def save_surrogate(surrogate, surrogate_file=None):
+    """Store a surrogate, replacing the previous surrogate of the antenna family.
+
+    Parameters
+    ----------
+    surrogate : :class:`PerformanceSurrogate`
+        Surrogate.
+    surrogate_file : str or :class:`pathlib.Path`, optional
+        JSON file. The default is ``None``, in which case ``DEFAULT_SURROGATE_FILE`` is used.
+    """
+    surrogate_file = Path(surrogate_file) if surrogate_file else DEFAULT_SURROGATE_FILE
+    data = {}
+    if surrogate_file.is_file():
+        data = json.loads(surrogate_file.read_text(encoding="utf-8"))
+    data[surrogate.antenna] = surrogate.to_dict()
+    surrogate_file.parent.mkdir(parents=True, exist_ok=True)
+    surrogate_file.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
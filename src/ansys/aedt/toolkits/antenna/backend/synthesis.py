@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+from ansys.aedt.toolkits.antenna.backend.tracing import TracedObject
+from ansys.aedt.toolkits.antenna.backend.tracing import tracer
+
+
+def create_antenna(antenna, synthesis, app=None):
+    """Create an antenna object and synthesize it with the given synthesis properties.
+
+    Parameters
+    ----------
+    antenna : str
+        Name of the antenna class in :mod:`ansys.aedt.toolkits.antenna.backend.antenna_models`.
+    synthesis : :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`
+        Synthesis properties.
+    app : :class:`ansys.aedt.core.Hfss`, optional
+        HFSS application. The default is ``None``, in which case the antenna is only synthesized.
+
+    Returns
+    -------
+    :class:`ansys.aedt.toolkits.antenna.backend.antenna_models.common.CommonAntenna`
+        Antenna object.
+    """
+    antenna_module = getattr(antenna_models, antenna)
+
+    if app and tracer.enabled:
+        # Each call of the antenna model to the application and modeler is a span
+        app = TracedObject(app, "hfss")
+
+    # Synthesis inputs accepted by the antenna class are passed at once to the constructor, because most
+    # property setters of the antenna synthesize it again. The name and the material keep their setters,
+    # which check them against the HFSS design, and the direction keeps its setter, which converts
+    # ``"Left"`` and ``"Right"`` to ``0`` and ``1``.
+    inputs = antenna_inputs(antenna_module._default_input_parameters, synthesis)
+    checked_inputs = {key: inputs.pop(key) for key in ("name", "material", "direction") if key in inputs}
+
+    with tracer.span("{}.__init__".format(antenna), "model"):
+        oantenna = antenna_module(app, **inputs)
+
+    for key, value in checked_inputs.items():
+        setattr(oantenna, key, value)
+
+    with tracer.span("{}.synthesis".format(antenna), "model"):
+        oantenna._parameters = oantenna.synthesis()
+        oantenna.update_synthesis_parameters(oantenna._parameters)
+    return oantenna
+
+
+def antenna_inputs(defaults, synthesis):
+    """Get the antenna input parameters from the synthesis properties.
+
+    Only the non-empty synthesis properties that are input parameters of the antenna class are kept.
+
+    Parameters
+    ----------
+    defaults : dict
+        Default input parameters of the antenna class.
+    synthesis : :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`
+        Synthesis properties.
+
+    Returns
+    -------
+    dict
+        Input parameters.
+    """
+    values = synthesis.model_dump()
+    inputs = {"frequency_unit": values["frequency_unit"], "length_unit": values["length_unit"]}
+    for key, value in values.items():
+        if key not in defaults or not value:
+            continue
+        if key == "frequency" and "start_frequency" in defaults and "stop_frequency" in defaults:
+            continue
+        if key == "material_properties":
+            if "permittivity" in value:
+                inputs[key] = {**defaults[key], "permittivity": value["permittivity"]}
+            continue
+        inputs[key] = value
+    return inputs
+
+
+def update_synthesis(synthesis, values):
+    """Validate several synthesis properties at once.
+
+    Assigning the properties one by one validates the whole model on each assignment. This
+    function validates the updated properties once.
+
+    Parameters
+    ----------
+    synthesis : :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`
+        Synthesis properties.
+    values : dict
+        New synthesis property values. Keys that are not synthesis properties are ignored.
+
+    Returns
+    -------
+    :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`
+        Updated synthesis properties. The input synthesis is returned when there is nothing to update.
+    """
+    model = type(synthesis)
+    updates = {key: value for key, value in values.items() if key in model.model_fields}
+    if not updates:
+        return synthesis
+    # The field values are taken from the instance dictionary, dumping the model costs as much as validating it
+    return model.model_validate({**synthesis.__dict__, **updates})
+
+
+def antenna_parameters(oantenna):
+    """Get the public synthesis parameters of an antenna.
+
+    Parameters
+    ----------
+    oantenna : :class:`ansys.aedt.toolkits.antenna.backend.antenna_models.common.CommonAntenna`
+        Antenna object.
+
+    Returns
+    -------
+    dict
+        Synthesis parameter values.
+    """
+    parameters = {}
+    for name, value in oantenna.synthesis_parameters.__dict__.items():
+        if not name.startswith("_"):
+            parameters[name] = value.value
+    return parameters
+
+
+def synthesize_antenna(antenna, synthesis):
+    """Synthesize an antenna without AEDT.
+
+    Synthesis only evaluates the closed-form antenna equations, so it can run in any process
+    that has the antenna models available.
+
+    Parameters
+    ----------
+    antenna : str
+        Name of the antenna class in :mod:`ansys.aedt.toolkits.antenna.backend.antenna_models`.
+    synthesis : :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`
+        Synthesis properties.
+
+    Returns
+    -------
+    dict
+        Synthesis parameter values.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+    >>> from ansys.aedt.toolkits.antenna.backend.synthesis import synthesize_antenna
+    >>> synthesize_antenna("BowTieNormal", Synthesis(frequency=2.4))
+    """
+    return antenna_parameters(create_antenna(antenna, synthesis))
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from contextlib import contextmanager
+import functools
+import json
+import os
+from pathlib import Path
+import threading
+import time
+
+# Set this environment variable to a file path to trace the backend and write the trace at exit
+TRACE_ENVIRONMENT_VARIABLE = "ANTENNA_TOOLKIT_TRACE"
+
+
+class Tracer(object):
+    """Collects nested spans and exports them in the Chrome trace event format.
+
+    Tracing is disabled by default. When disabled, spans only check a flag, so instrumented code keeps
+    its speed. The exported file can be opened in ``chrome://tracing`` or Perfetto.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def start(self):
+        """Clear the spans and enable tracing."""
+        self.reset()
+        self.enabled = True
+
+    def stop(self):
+        """Disable tracing. Collected spans are kept until the next start."""
+        self.enabled = False
+
+    def reset(self):
+        """Clear the spans."""
+        with self._lock:
+            self._events = []
+        self._origin = time.perf_counter()
+
+    @property
+    def events(self):
+        """Collected trace events."""
+        with self._lock:
+            return list(self._events)
+
+    def begin(self, name, category="backend", **args):
+        """Begin a span.
+
+        Returns
+        -------
+        tuple or None
+            Span token to pass to :meth:`end`, ``None`` when tracing is disabled.
+        """
+        if not self.enabled:
+            return None
+        return name, category, args, time.perf_counter()
+
+    def end(self, token, **args):
+        """End a span started with :meth:`begin`."""
+        if token is None:
+            return
+        end_time = time.perf_counter()
+        name, category, begin_args, start_time = token
+        args = {key: value for key, value in args.items() if value is not None}
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start_time - self._origin) * 1e6, 3),
+            "dur": round((end_time - start_time) * 1e6, 3),
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if begin_args or args:
+            event["args"] = {key: _serializable(value) for key, value in {**begin_args, **args}.items()}
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name, category="backend", **args):
+        """Trace the enclosed block."""
+        token = self.begin(name, category, **args)
+        try:
+            yield
+        finally:
+            self.end(token)
+
+    def export(self, file_name):
+        """Write the spans to a Chrome trace JSON file.
+
+        Parameters
+        ----------
+        file_name : str or :class:`pathlib.Path`
+            Trace file.
+
+        Returns
+        -------
+        str
+            Trace file path.
+        """
+        file_name = Path(file_name)
+        file_name.parent.mkdir(parents=True, exist_ok=True)
+        events = sorted(self.events, key=lambda event: event["ts"])
+        with file_name.open("w", encoding="utf-8") as trace_handler:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_handler)
+        return str(file_name)
+
+
+def traced(name=None, category="backend"):
+    """Trace each call of the decorated function.
+
+    Parameters
+    ----------
+    name : str, optional
+        Span name. The default is ``None``, in which case the function qualified name is used.
+    category : str, optional
+        Span category. The default is ``"backend"``.
+    """
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            token = tracer.begin(span_name, category)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.end(token)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(category="backend"):
+    """Trace every public method of the decorated class, including the inherited ones."""
+
+    def decorator(cls):
+        for attribute_name in dir(cls):
+            if attribute_name.startswith("_"):
+                continue
+            attribute = _class_attribute(cls, attribute_name)
+            if callable(attribute) and not isinstance(attribute, (type, staticmethod, classmethod, property)):
+                span_name = "{}.{}".format(cls.__name__, attribute_name)
+                setattr(cls, attribute_name, traced(span_name, category)(attribute))
+        return cls
+
+    return decorator
+
+
+def _class_attribute(cls, attribute_name):
+    for klass in cls.__mro__:
+        if attribute_name in vars(klass):
+            return vars(klass)[attribute_name]
+    return None
+
+
+class TracedObject(object):
+    """Proxy that traces the method calls of an AEDT object.
+
+    Antenna models use it in place of the HFSS application while tracing is enabled, so that each modeler
+    call is a span.
+
+    Parameters
+    ----------
+    target : object
+        Traced object.
+    prefix : str
+        Span name prefix.
+    traced_attributes : tuple, optional
+        Attributes returned as traced proxies too. The default is ``("modeler",)``.
+    """
+
+    def __init__(self, target, prefix, traced_attributes=("modeler",)):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_traced_attributes", traced_attributes)
+
+    def __getattr__(self, name):
+        """Get an attribute of the target, traced when it is a public method."""
+        value = getattr(self._target, name)
+        if name in self._traced_attributes:
+            return TracedObject(value, "{}.{}".format(self._prefix, name), ())
+        if callable(value) and not name.startswith("_"):
+            return traced("{}.{}".format(self._prefix, name), "aedt")(value)
+        return value
+
+    def __setattr__(self, name, value):
+        """Set an attribute of the target."""
+        setattr(self._target, name, value)
+
+    def __getitem__(self, key):
+        """Get an item of the target."""
+        with tracer.span("{}.__getitem__".format(self._prefix), "aedt"):
+            return self._target[key]
+
+    def __setitem__(self, key, value):
+        """Set an item of the target."""
+        with tracer.span("{}.__setitem__".format(self._prefix), "aedt", variable=key):
+            self._target[key] = value
+
+    def __bool__(self):
+        """Get the truth value of the target."""
+        return bool(self._target)
+
+
+def _serializable(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+tracer = Tracer()
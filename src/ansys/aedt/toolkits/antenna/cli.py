@@ -32,6 +32,7 @@ required.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 import inspect
 import json
 from pathlib import Path
@@ -505,6 +506,14 @@ def _build_signature(is_create: bool) -> inspect.Signature:
             default=typer.Option(None, "--param", help="Extra key=value parameter (repeatable)."),
         )
     )
+    params.append(
+        inspect.Parameter(
+            "trace",
+            _P,
+            annotation=Optional[str],
+            default=typer.Option(None, "--trace", help="Write a Chrome trace JSON file of the command."),
+        )
+    )
 
     return inspect.Signature(params)
 
@@ -540,20 +549,39 @@ def list_antennas() -> None:
 # -- synthesize
 
 
+@contextmanager
+def _trace(trace_file: Optional[str]):
+    """Trace the enclosed command and write the spans to ``trace_file``."""
+    if not trace_file:
+        yield
+        return
+
+    from ansys.aedt.toolkits.antenna.backend.tracing import tracer
+
+    tracer.start()
+    try:
+        yield
+    finally:
+        tracer.stop()
+        tracer.export(trace_file)
+        if not common.json_mode:
+            typer.echo(f"Trace written to {trace_file}")
+
+
 def _synthesize_impl(**kwargs) -> None:
+    with _trace(kwargs.get("trace")):
+        _synthesize(**kwargs)
+
+
+def _synthesize(**kwargs) -> None:
     try:
         class_name = _resolve_antenna_type(kwargs["antenna_type"])
         overrides, _, extra = _merge_cli_inputs(kwargs, is_create=False)
 
         from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
-        from ansys.aedt.toolkits.antenna.backend.models import properties
-
-        for key, value in {**overrides, **extra}.items():
-            if hasattr(properties.antenna.synthesis, key):
-                setattr(properties.antenna.synthesis, key, value)
 
         toolkit = ToolkitBackend()
-        result = toolkit.get_antenna(class_name, synth_only=True)
+        result = toolkit.get_antenna(class_name, synth_only=True, synthesis={**overrides, **extra})
         if result is False:
             raise RuntimeError(f"Synthesis failed for {class_name}.")
 
@@ -587,50 +615,56 @@ antenna_app.command(name="synthesize")(_synthesize_impl)
 
 
 def _create_impl(**kwargs) -> None:
-    try:
-        class_name = _resolve_antenna_type(kwargs["antenna_type"])
-        port = kwargs["port"]
-        overrides, setup_values, extra = _merge_cli_inputs(kwargs, is_create=True)
+    with _trace(kwargs.get("trace")):
+        _create(**kwargs)
 
-        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
-        from ansys.aedt.toolkits.antenna.backend.models import properties
 
-        # Connection
-        properties.use_grpc = True
-        properties.selected_process = port
+def _create_antenna(kwargs: dict, class_name: str, create_setup: bool = False):
+    """Connect to the AEDT session of the command and create the antenna."""
+    port = kwargs["port"]
+    overrides, setup_values, extra = _merge_cli_inputs(kwargs, is_create=True)
 
-        toolkit = ToolkitBackend()
+    from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+    from ansys.aedt.toolkits.antenna.backend.models import properties
 
-        # Connect to AEDT session and populate project/design lists
-        toolkit.launch_aedt()
-        toolkit.wait_to_be_idle()
-
-        properties.active_project = _resolve_target_project(kwargs, class_name, properties)
-        _bootstrap_project_design_state(properties)
-        properties.active_design = _resolve_target_design(kwargs, class_name, properties)
-        if not toolkit.connect_design("HFSS"):
-            raise RuntimeError("Unable to connect to the selected HFSS design.")
-
-        # Synthesis
-        for key, value in {**overrides, **extra}.items():
-            if hasattr(properties.antenna.synthesis, key):
-                setattr(properties.antenna.synthesis, key, value)
-
-        # Setup
-        properties.antenna.setup.create_setup = setup_values.get("create_setup", False)
-        properties.antenna.setup.component_3d = setup_values.get("component_3d", False)
-        properties.antenna.setup.lattice_pair = setup_values.get("lattice_pair", False)
-        if setup_values.get("sweep") is not None:
-            properties.antenna.setup.sweep = setup_values["sweep"]
-        if setup_values.get("num_cores") is not None:
-            properties.antenna.setup.num_cores = setup_values["num_cores"]
+    # Connection
+    properties.use_grpc = True
+    properties.selected_process = port
 
-        if not common.json_mode:
-            typer.echo(f"Creating {kwargs['antenna_type']} ({class_name}) on port {port}...")
+    toolkit = ToolkitBackend()
 
-        result = toolkit.get_antenna(class_name, synth_only=False)
-        if result is False:
-            raise RuntimeError("Antenna creation failed. Check AEDT connection and design state.")
+    # Connect to AEDT session and populate project/design lists
+    toolkit.launch_aedt()
+    toolkit.wait_to_be_idle()
+
+    properties.active_project = _resolve_target_project(kwargs, class_name, properties)
+    _bootstrap_project_design_state(properties)
+    properties.active_design = _resolve_target_design(kwargs, class_name, properties)
+    if not toolkit.connect_design("HFSS"):
+        raise RuntimeError("Unable to connect to the selected HFSS design.")
+
+    # Setup
+    properties.antenna.setup.create_setup = setup_values.get("create_setup", create_setup)
+    properties.antenna.setup.component_3d = setup_values.get("component_3d", False)
+    properties.antenna.setup.lattice_pair = setup_values.get("lattice_pair", False)
+    if setup_values.get("sweep") is not None:
+        properties.antenna.setup.sweep = setup_values["sweep"]
+    if setup_values.get("num_cores") is not None:
+        properties.antenna.setup.num_cores = setup_values["num_cores"]
+
+    if not common.json_mode:
+        typer.echo(f"Creating {kwargs['antenna_type']} ({class_name}) on port {port}...")
+
+    result = toolkit.get_antenna(class_name, synth_only=False, synthesis={**overrides, **extra})
+    if result is False:
+        raise RuntimeError("Antenna creation failed. Check AEDT connection and design state.")
+    return toolkit, result
+
+
+def _create(**kwargs) -> None:
+    try:
+        class_name = _resolve_antenna_type(kwargs["antenna_type"])
+        _, result = _create_antenna(kwargs, class_name)
 
         if common.json_mode:
             common.print_output(data={"antenna": kwargs["antenna_type"], "class": class_name, "parameters": result})
@@ -656,3 +690,174 @@ _create_impl.__doc__ = (
 )
 _create_impl.__signature__ = _build_signature(is_create=True)
 antenna_app.command(name="create")(_create_impl)
+
+
+# -- optimize
+
+
+def _optimize_impl(**kwargs) -> None:
+    with _trace(kwargs.get("trace")):
+        _optimize(**kwargs)
+
+
+def _optimize(**kwargs) -> None:
+    try:
+        class_name = _resolve_antenna_type(kwargs["antenna_type"])
+        config = _load_params_file(kwargs["goals"])
+        toolkit, _ = _create_antenna(kwargs, class_name, create_setup=True)
+
+        if not common.json_mode:
+            typer.echo(f"Optimizing {kwargs['antenna_type']} ({class_name})...")
+
+        result = toolkit.optimize(config)
+        if result is False:
+            raise RuntimeError("Optimization failed. Check the goals file and the analysis setup.")
+
+        if common.json_mode:
+            common.print_output(data={"antenna": kwargs["antenna_type"], "class": class_name, "optimization": result})
+        else:
+            typer.secho(f"\nOptimization of {kwargs['antenna_type']} stopped ({result['stopped']}):\n", fg="green")
+            for k in config["variables"]:
+                typer.echo(f"  {k:<28s} {result['parameters'][k]}")
+            typer.echo(f"\n  {'cost':<28s} {result['cost']:.4g}")
+            typer.echo(f"  {'evaluations':<28s} {result['evaluations']} ({result['solved']} solved)")
+            typer.echo()
+    except typer.Exit:
+        raise
+    except Exception as e:
+        if common.json_mode:
+            common.print_output(error=str(e))
+        else:
+            typer.secho(f"Error: {e}", fg="red")
+        raise typer.Exit(code=1)
+
+
+_optimize_impl.__name__ = "optimize"
+_optimize_impl.__doc__ = (
+    "Create an antenna in a running AEDT/HFSS session and optimize its parameters.\n\n"
+    "The goals file is a YAML or JSON file with the 'variables' bounds and the 'goals', for example\n"
+    "'S11 < -10 dB over 2.4-2.5 GHz'. Designs are solved one at a time, and designs already in the\n"
+    "evaluation log are not solved again.\n\n"
+    "ANTENNA_TYPE is one of the names shown by 'pyaedt antenna list'."
+)
+_optimize_signature = _build_signature(is_create=True)
+_optimize_impl.__signature__ = _optimize_signature.replace(
+    parameters=[
+        *_optimize_signature.parameters.values(),
+        inspect.Parameter(
+            "goals",
+            _P,
+            annotation=str,
+            default=typer.Option(..., "--goals", help="YAML or JSON file with the variables and goals."),
+        ),
+    ]
+)
+antenna_app.command(name="optimize")(_optimize_impl)
+
+
+# -- history
+
+
+@antenna_app.command(name="history")
+def analysis_history(
+    antenna_type: Optional[str] = typer.Argument(None, help="Antenna type (run 'pyaedt antenna list')."),
+    key: Optional[str] = typer.Option(None, "--key", help="Design key of the antenna and synthesis properties."),
+    limit: int = typer.Option(20, "--limit", help="Maximum number of analyses (0 shows all of them)."),
+    history_file: Optional[str] = typer.Option(None, "--history-file", help="Analysis history file."),
+) -> None:
+    """Show the solver profile and convergence of previous analyses, the most recent first."""
+    try:
+        class_name = _resolve_antenna_type(antenna_type) if antenna_type else None
+
+        from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+        from ansys.aedt.toolkits.antenna.backend.models import properties
+
+        history = AnalysisHistory(history_file or properties.antenna.setup.history_file)
+        records = history.query(antenna=class_name, key=key, limit=limit or None)
+
+        if common.json_mode:
+            common.print_output(data={"history_file": str(history.history_file), "analyses": records})
+        elif not records:
+            typer.echo(f"No analyses found in {history.history_file}.")
+        else:
+            typer.secho(f"\nAnalyses in {history.history_file}:\n", fg="green")
+            typer.echo(
+                f"  {'Timestamp':<20s} {'Antenna':<24s} {'Key':<13s} {'Passes':>6s} "
+                f"{'Delta S':>9s} {'Elements':>9s} {'Memory GB':>9s} {'Elapsed s':>9s}"
+            )
+            for record in records:
+                delta_s = record.get("delta_s")
+                delta_s = f"{delta_s:.4g}" if isinstance(delta_s, (int, float)) else "-"
+                typer.echo(
+                    f"  {record.get('timestamp', '-'):<20s} {record.get('antenna', '-'):<24s} "
+                    f"{record.get('key', '-'):<13s} {record.get('adaptive_passes') or 0:>6d} {delta_s:>9s} "
+                    f"{record.get('mesh_elements') or 0:>9d} {record.get('memory_gb') or 0.0:>9.3f} "
+                    f"{record.get('elapsed') or 0.0:>9.1f}"
+                )
+            typer.echo()
+    except typer.Exit:
+        raise
+    except Exception as e:
+        if common.json_mode:
+            common.print_output(error=str(e))
+        else:
+            typer.secho(f"Error: {e}", fg="red")
+        raise typer.Exit(code=1)
+
+
+# -- predict
+
+
+def _predict(**kwargs) -> None:
+    try:
+        class_name = _resolve_antenna_type(kwargs["antenna_type"])
+        overrides, _, extra = _merge_cli_inputs(kwargs, is_create=False)
+
+        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+        from ansys.aedt.toolkits.antenna.backend.models import properties
+
+        if kwargs.get("history_file"):
+            properties.antenna.setup.history_file = kwargs["history_file"]
+
+        toolkit = ToolkitBackend()
+        result = toolkit.predict_performance(class_name, synthesis={**overrides, **extra})
+        if result is False:
+            raise RuntimeError(f"Not enough simulated {class_name} designs in the analysis history.")
+
+        if common.json_mode:
+            common.print_output(data={"antenna": kwargs["antenna_type"], "class": class_name, "prediction": result})
+        else:
+            typer.secho(f"\nPredicted performance of {kwargs['antenna_type']} ({class_name}):\n", fg="green")
+            for metric, value in result["metrics"].items():
+                typer.echo(f"  {metric:<28s} {value['mean']:.6g} +/- {value['std']:.2g} {value['unit']}")
+            typer.echo(f"\n  {'within_trained_region':<28s} {result['within_trained_region']}")
+            typer.echo(f"  {'skip_simulation':<28s} {result['skip_simulation']}")
+            typer.echo()
+    except typer.Exit:
+        raise
+    except Exception as e:
+        if common.json_mode:
+            common.print_output(error=str(e))
+        else:
+            typer.secho(f"Error: {e}", fg="red")
+        raise typer.Exit(code=1)
+
+
+_predict.__name__ = "predict"
+_predict.__doc__ = (
+    "Predict the simulated performance of an antenna from previous analyses, without running HFSS.\n\n"
+    "ANTENNA_TYPE is one of the names shown by 'pyaedt antenna list'."
+)
+_predict_signature = _build_signature(is_create=False)
+_predict.__signature__ = _predict_signature.replace(
+    parameters=[
+        *(parameter for parameter in _predict_signature.parameters.values() if parameter.name != "trace"),
+        inspect.Parameter(
+            "history_file",
+            _P,
+            annotation=Optional[str],
+            default=typer.Option(None, "--history-file", help="Analysis history file."),
+        ),
+    ]
+)
+antenna_app.command(name="predict")(_predict)
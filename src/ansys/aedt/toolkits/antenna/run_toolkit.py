@@ -26,48 +26,114 @@ import atexit
 import multiprocessing
 import os
 import sys
+import threading
 
+from ansys.aedt.toolkits.common.ui.logger_handler import logger
 from ansys.aedt.toolkits.common.utils import clean_python_processes
 from ansys.aedt.toolkits.common.utils import find_free_port
 from ansys.aedt.toolkits.common.utils import is_server_running
 from ansys.aedt.toolkits.common.utils import process_desktop_properties
+from ansys.aedt.toolkits.common.utils import wait_for_server
 from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 
 from ansys.aedt.toolkits.antenna.backend.models import properties as backend_properties
 from ansys.aedt.toolkits.antenna.ui.models import properties as frontend_properties
+from ansys.aedt.toolkits.antenna.ui.startup import startup_timeline
 
 backend = None
 ui = None
 url = None
 port = None
 
+# Interval between backend health checks in milliseconds
+BACKEND_POLL_INTERVAL = 100
+
+# Maximum time to wait for the backend before connecting to AEDT in seconds
+BACKEND_WARM_UP_TIMEOUT = 60.0
+
 
 def start_backend(pp):
     """Start the backend process."""
+    from ansys.aedt.toolkits.common.backend.logger_handler import logger
+
+    from ansys.aedt.toolkits.antenna.ui.startup import StartupTimeline
+
+    timeline = StartupTimeline("Backend startup", log=logger)
+
+    # Importing the backend loads every antenna model module
     from ansys.aedt.toolkits.antenna.backend.run_backend import run_backend
 
+    timeline.mark("antenna models imported")
+    timeline.report()
+
     print(f"Starting backend on port {pp}...")
     run_backend(pp)
 
 
-def show_splash_and_start_frontend(qt_app, url_backend):
+def warm_up_aedt(is_linux, backend_url, backend_port):
+    """Connect the backend to the AEDT session in a background thread.
+
+    The connection runs in parallel with the user interface construction instead of blocking it.
+    The user interface must wait for the thread before reading the backend properties.
+
+    Parameters
+    ----------
+    is_linux : bool
+        Whether the toolkit runs on Linux.
+    backend_url : str
+        Backend host.
+    backend_port : int
+        Backend port.
+
+    Returns
+    -------
+    :class:`threading.Thread` or None
+        Warm-up thread, or ``None`` when the toolkit was not launched from an AEDT session.
+    """
+    if not ("PYAEDT_SCRIPT_PORT" in os.environ or len(sys.argv) == 3):
+        return None
+
+    url_call = f"http://{backend_url}:{backend_port}"
+
+    def connect():
+        try:
+            if not wait_for_server(backend_url, backend_port, timeout=BACKEND_WARM_UP_TIMEOUT):
+                logger.error(f"Backend not available at {url_call}, AEDT session not connected.")
+                return
+            process_desktop_properties(is_linux, url_call)
+            startup_timeline.mark("AEDT session connected")
+        except Exception as error:
+            logger.error(f"AEDT session not connected: {error}")
+
+    thread = threading.Thread(target=connect, daemon=True)
+    thread.start()
+    return thread
+
+
+def show_splash_and_start_frontend(qt_app, url_backend, warm_up=None):
     from ansys.aedt.toolkits.common.utils import check_backend_communication
 
     from ansys.aedt.toolkits.antenna.ui.splash import show_splash_screen
 
     splash = show_splash_screen(qt_app)  # Should return the splash widget
+    startup_timeline.mark("splash shown")
 
-    def check_backend():
-        if check_backend_communication(url_backend):
-            # Import here to avoid circular imports and speed up initial loading
-            from ansys.aedt.toolkits.antenna.ui.run_frontend import run_frontend
+    # Import the user interface while the backend process starts.
+    from ansys.aedt.toolkits.antenna.ui.run_frontend import run_frontend
 
+    startup_timeline.mark("frontend modules imported")
+
+    def check_backend():
+        # The frontend reads the AEDT properties that the warm-up thread sets in the backend
+        if warm_up is not None and warm_up.is_alive():
+            QTimer.singleShot(BACKEND_POLL_INTERVAL, check_backend)
+        elif check_backend_communication(url_backend):
+            startup_timeline.mark("backend ready")
             splash.close()
             run_frontend(url, port, qt_app)
         else:  # pragma: no cover
-            # Check again in 0.5s
-            QTimer.singleShot(500, check_backend)
+            QTimer.singleShot(BACKEND_POLL_INTERVAL, check_backend)
 
     check_backend()
 
@@ -105,11 +171,13 @@ if __name__ == "__main__":  # pragma: no cover
     # Launch backend process
     backend_process = multiprocessing.Process(target=start_backend, args=(new_port,))
     backend_process.start()
+    startup_timeline.mark("backend process started")
 
-    # Connect to AEDT session if necessary
-    process_desktop_properties(is_linux, url_call)
+    # Connect to AEDT session if necessary, without blocking the user interface
+    warm_up = warm_up_aedt(is_linux, url, port)
 
     app = QApplication(sys.argv)
-    show_splash_and_start_frontend(app, url_call)
+    startup_timeline.mark("Qt application created")
+    show_splash_and_start_frontend(app, url_call, warm_up)
     app.aboutToQuit.connect(terminate_processes)
     sys.exit(app.exec())
@@ -26,9 +26,9 @@ import base64
 from pathlib import Path
 import re
 import tempfile
+import time
 
 from ansys.aedt.core.generic.file_utils import read_json
-from ansys.aedt.core.visualization.advanced.farfield_visualization import FfdSolutionData
 from PySide6.QtWidgets import QComboBox
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QLineEdit
@@ -56,13 +56,41 @@ class Frontend(FrontendGeneric):
         self.temp_folder = tempfile.mkdtemp()
 
     def antenna_synthesis(self):
-        """Antenna synthesis."""
+        """Antenna synthesis.
+
+        Synthesis only evaluates the antenna equations, so it runs in the user interface process with the same
+        antenna models as the backend. The backend is used as a fallback if the local synthesis fails.
+        """
+        from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+        from ansys.aedt.toolkits.antenna.backend.synthesis import synthesize_antenna
+
+        start = time.perf_counter()
+        new_properties = self.__get_antenna_properties()
+        synthesis_properties = {key: value for key, value in new_properties.items() if key in Synthesis.model_fields}
+        try:
+            synthesis = Synthesis(**synthesis_properties)
+            response = synthesize_antenna(self.properties.antenna.antenna_selected, synthesis)
+        except Exception as e:
+            msg = "Local synthesis failed: {}".format(e)
+            logger.debug(msg)
+            return self.__remote_antenna_synthesis()
+
+        elapsed = (time.perf_counter() - start) * 1e3
+        msg = "{} synthesis (local, {:.1f} ms)".format(self.properties.antenna.antenna_selected, elapsed)
+        self.ui.update_logger(msg)
+        logger.debug(msg)
+        return response
+
+    def __remote_antenna_synthesis(self):
+        """Antenna synthesis in the backend."""
+        start = time.perf_counter()
         if not self.__update_antenna_properties():
             return False
 
         response = requests.post(self.url + "/create_antenna", timeout=DEFAULT_REQUESTS_TIMEOUT)
         if response.ok:
-            msg = "{} synthesis".format(self.properties.antenna.antenna_selected)
+            elapsed = (time.perf_counter() - start) * 1e3
+            msg = "{} synthesis (remote, {:.1f} ms)".format(self.properties.antenna.antenna_selected, elapsed)
             self.ui.update_logger(msg)
             logger.debug(msg)
             return response.json()
@@ -124,9 +152,11 @@ class Frontend(FrontendGeneric):
             logger.debug(msg)
             return False
 
+        start = time.perf_counter()
         response = requests.post(self.url + "/create_antenna", timeout=DEFAULT_REQUESTS_TIMEOUT)
         if response.ok:
-            msg = "{} antenna created".format(self.properties.antenna.antenna_selected)
+            elapsed = time.perf_counter() - start
+            msg = "{} antenna created (remote, {:.1f} s)".format(self.properties.antenna.antenna_selected, elapsed)
             self.ui.update_logger(msg)
             logger.debug(msg)
             return response.json()
@@ -153,12 +183,16 @@ class Frontend(FrontendGeneric):
             logger.error(msg)
             return False
 
-    def analyze_design(self):
-        """Analyze design."""
-        response = requests.post(self.url + "/analyze")  # nosec B113
+    def analyze_design(self, blocking=True):
+        """Analyze design.
+
+        If ``blocking`` is ``False``, the analysis is started in the backend and its progress
+        is available with :meth:`analysis_progress`.
+        """
+        response = requests.post(self.url + "/analyze", json={"blocking": blocking})  # nosec B113
 
         if response.ok:
-            msg = "Antenna solved"
+            msg = "Antenna solved" if blocking else "Antenna analysis started"
             self.ui.update_logger(msg)
             logger.debug(msg)
             return response.json()
@@ -169,9 +203,25 @@ class Frontend(FrontendGeneric):
             logger.error(msg)
             return False
 
+    def analysis_progress(self):
+        """Get analysis progress."""
+        response = requests.get(self.url + "/analysis_progress", timeout=DEFAULT_REQUESTS_TIMEOUT)
+
+        if response.ok:
+            return response.json()
+
+        else:
+            msg = response.json()
+            logger.error(msg)
+            return False
+
     def export_farfield(self):
         """Get farfield data."""
+        # Far field visualization loads PyVista, import it only when results are requested
+        from ansys.aedt.core.visualization.advanced.farfield_visualization import FfdSolutionData
+
         farfield_data = None
+        data = None
         if self.properties.backend_url in ["127.0.0.1", "localhost"]:
             response = requests.get(self.url + "/export_farfield", json={"sphere": "3D", "encode": False})  # nosec B113
             if response.ok:
@@ -227,6 +277,8 @@ class Frontend(FrontendGeneric):
 
         if farfield_data:
             msg = "Far field results extracted"
+            if isinstance(data[-1], dict) and data[-1].get("scaled"):
+                msg += ", scaled from design {}".format(data[-1]["reference"])
             self.ui.update_logger(msg)
             logger.debug(msg)
             return farfield_data
@@ -253,9 +305,9 @@ class Frontend(FrontendGeneric):
             logger.error(msg)
             return False
 
-    def __update_antenna_properties(self, synth_only=True):
-        """Update antenna backend properties."""
-        be_properties = self.get_properties()
+    def __get_antenna_properties(self, synth_only=True):
+        """Get antenna properties from the synthesis inputs."""
+        from ansys.aedt.toolkits.antenna.backend.models import Synthesis
 
         new_properties = {
             "model": self.properties.antenna.antenna_selected,
@@ -279,7 +331,7 @@ class Frontend(FrontendGeneric):
                 if number_pattern.match(data):
                     data = float(data)
 
-                if label in be_properties["antenna"]["synthesis"]:
+                if label in Synthesis.model_fields:
                     new_properties[label] = data
                 elif label == "origin_x_position":
                     new_properties["origin"][0] = data
@@ -289,10 +341,16 @@ class Frontend(FrontendGeneric):
                     new_properties["origin"][2] = data
                 label = ""
             elif label and isinstance(antenna_input_lines, QComboBox):
-                if label in be_properties["antenna"]["synthesis"]:
+                if label in Synthesis.model_fields:
                     new_properties[label] = antenna_input_lines.currentText()
                 label = ""
 
+        return new_properties
+
+    def __update_antenna_properties(self, synth_only=True):
+        """Update antenna backend properties."""
+        new_properties = self.__get_antenna_properties(synth_only)
+
         if not self.set_properties(new_properties):
             msg = "Wrong parameters {}".format(new_properties)
             self.ui.update_logger(msg)
@@ -30,6 +30,7 @@ from ansys.aedt.toolkits.antenna import __version__
 
 # Default user interface properties
 from ansys.aedt.toolkits.antenna.ui.models import properties
+from ansys.aedt.toolkits.antenna.ui.startup import startup_timeline
 
 # isort: on
 
@@ -50,7 +51,6 @@ from ansys.aedt.toolkits.antenna.ui.actions import Frontend
 
 # New windows
 from ansys.aedt.toolkits.antenna.ui.windows.antenna_catalog.antenna_catalog_menu import AntennaCatalogMenu
-from ansys.aedt.toolkits.antenna.ui.windows.antenna_results.antenna_results_menu import AntennaResultsMenu
 from ansys.aedt.toolkits.antenna.ui.windows.antenna_synthesis.antenna_synthesis_menu import AntennaSynthesisMenu
 from ansys.aedt.toolkits.antenna.ui.windows.help.help_menu import HelpMenu
 
@@ -141,9 +141,8 @@ class ApplicationWindow(QMainWindow, Frontend):
         self.antenna_synthesis_menu.setup()
         self.ui.left_menu.clicked.connect(self.antenna_synthesis_menu_clicked)
 
-        # Results menu
-        self.antenna_results_menu = AntennaResultsMenu(self)
-        self.antenna_results_menu.setup()
+        # Results menu, loaded the first time it is opened
+        self.antenna_results_menu = None
         self.ui.left_menu.clicked.connect(self.antenna_results_menu_clicked)
 
         # Help menu
@@ -158,6 +157,7 @@ class ApplicationWindow(QMainWindow, Frontend):
 
         # Home page as first page
         self.ui.set_page(self.ui.load_pages.home_page)
+        startup_timeline.mark("main window constructed")
 
     def home_menu_clicked(self):
         selected_menu = self.ui.get_selected_menu()
@@ -244,6 +244,8 @@ class ApplicationWindow(QMainWindow, Frontend):
         self.ui.left_menu.select_only_one(selected_menu.objectName())
         if menu_name == "antenna_results_menu":
             selected_menu.set_active(True)
+            if self.antenna_results_menu is None:
+                self.load_antenna_results_menu()
             self.ui.set_page(self.antenna_results_menu.antenna_results_menu_widget)
             is_left_visible = self.ui.is_left_column_visible()
 
@@ -256,6 +258,14 @@ class ApplicationWindow(QMainWindow, Frontend):
             if not is_left_visible:
                 self.ui.toggle_left_column()
 
+    def load_antenna_results_menu(self):
+        """Load the results page and its plotting dependencies."""
+        from ansys.aedt.toolkits.antenna.ui.windows.antenna_results.antenna_results_menu import AntennaResultsMenu
+
+        self.antenna_results_menu = AntennaResultsMenu(self)
+        self.antenna_results_menu.setup()
+        startup_timeline.mark("results page loaded")
+
     def help_menu_clicked(self):
         selected_menu = self.ui.get_selected_menu()
         menu_name = selected_menu.objectName()
@@ -306,6 +316,8 @@ def run_frontend(backend_url="", backend_port=0, app=None):
     window = ApplicationWindow()
     window.show()
     app.processEvents()
+    startup_timeline.mark("main window shown")
+    startup_timeline.report()
     if run_separately:
         sys.exit(app.exec())
 
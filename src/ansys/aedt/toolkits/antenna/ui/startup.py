@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+from ansys.aedt.toolkits.common.ui.logger_handler import logger
+
+
+class StartupTimeline(object):
+    """Records the duration of each startup phase.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name used as prefix in the log messages. The default is ``"Startup"``.
+    log : :class:`logging.Logger`, optional
+        Logger used to report the phases. The default is the user interface logger.
+
+    Examples
+    --------
+    >>> from ansys.aedt.toolkits.antenna.ui.startup import StartupTimeline
+    >>> timeline = StartupTimeline()
+    >>> timeline.mark("Qt application created")
+    >>> timeline.report()
+    """
+
+    def __init__(self, name="Startup", log=None):
+        self.name = name
+        self.logger = log if log else logger
+        self.phases = []
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    @property
+    def elapsed(self):
+        """Time since the timeline was created in seconds."""
+        return time.perf_counter() - self._start
+
+    def mark(self, phase):
+        """Close the current phase.
+
+        Parameters
+        ----------
+        phase : str
+            Phase name.
+
+        Returns
+        -------
+        float
+            Phase duration in seconds.
+        """
+        now = time.perf_counter()
+        duration = now - self._last
+        self._last = now
+        self.phases.append((phase, duration, now - self._start))
+        self.logger.debug(f"{self.name}: {phase} in {duration * 1e3:.1f} ms")
+        return duration
+
+    def report(self):
+        """Log all phases and the total elapsed time."""
+        for phase, duration, elapsed in self.phases:
+            self.logger.info(f"{self.name}: {phase:<32s} {duration * 1e3:9.1f} ms (at {elapsed * 1e3:9.1f} ms)")
+        self.logger.info(f"{self.name}: time to interactive {self.elapsed * 1e3:.1f} ms")
+
+
+startup_timeline = StartupTimeline()
@@ -45,8 +45,6 @@ from PySide6.QtWidgets import QSpacerItem
 from PySide6.QtWidgets import QTextBrowser
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
-import pyvista as pv
-from pyvistaqt import BackgroundPlotter
 
 from ansys.aedt.toolkits.antenna.backend import antenna_models
 # toolkit PySide6 Widgets
@@ -86,6 +84,10 @@ class AntennaItem(QWidget):
 
         layout = QVBoxLayout(self)
 
+        # PyVista is only needed once a catalog family is opened
+        import pyvista as pv
+        from pyvistaqt import BackgroundPlotter
+
         self.plotter = BackgroundPlotter(show=False)
         antenna_path = antenna_info["path"]
         antenna_name = antenna_info["name"]
@@ -553,6 +555,7 @@ class AntennaCatalogMenu(object):
                 self.main_window.antenna_synthesis_menu.antenna_input.addLayout(line)
 
         self.main_window.ui.clear_layout(self.main_window.antenna_synthesis_menu.table_layout)
+        self.main_window.antenna_synthesis_menu.parameter_table = None
 
         # Populate synthesis page
         self.ui.set_page(self.main_window.antenna_synthesis_menu.antenna_synthesis_menu_widget)
@@ -621,6 +624,7 @@ class AntennaCatalogMenu(object):
             combobox.setFont(font)
             for i in range(combobox.count()):
                 combobox.setItemData(i, font, Qt.FontRole)
+            combobox.currentTextChanged.connect(self.main_window.antenna_synthesis_menu.input_changed)
         else:
             edit = QLineEdit()
             edit.setFont(font)
@@ -628,6 +632,7 @@ class AntennaCatalogMenu(object):
             edit.setFixedWidth(200)
             edit.setStyleSheet("border: 2px solid {};".format(self.ui.themes['app_color']['text_foreground']))
             layout_line.addWidget(edit)
+            edit.textChanged.connect(self.main_window.antenna_synthesis_menu.input_changed)
 
         spacer = QSpacerItem(40, 20, QSizePolicy.Fixed, QSizePolicy.Fixed)
         layout_line.addItem(spacer)
@@ -24,6 +24,7 @@ from pathlib import Path
 
 # toolkit PySide6 Widgets
 from ansys.aedt.toolkits.common.ui.utils.widgets import PyPushButton
+import numpy as np
 import pyqtgraph as pg
 from PySide6.QtCore import Qt
 from PySide6.QtCore import QThread
@@ -44,17 +45,67 @@ from pyvistaqt import BackgroundPlotter
 from ansys.aedt.toolkits.antenna.ui.windows.antenna_results.antenna_results_column import Ui_LeftColumn
 from ansys.aedt.toolkits.antenna.ui.windows.antenna_results.antenna_results_page import Ui_AntennaResults
 
+# Time in milliseconds between two analysis progress requests
+PROGRESS_POLL_INTERVAL = 2000
+
 
 class GetResultsThread(QThread):
     finished_signal = Signal(bool)
+    progress_signal = Signal(dict)
 
     def __init__(self, app):
         super().__init__()
         self.main_window = app.main_window
 
     def run(self):
-        success = self.main_window.analyze_design()
-        self.finished_signal.emit(success)
+        if not self.main_window.analyze_design(blocking=False):
+            self.finished_signal.emit(False)
+            return
+
+        progress = self.main_window.analysis_progress()
+        while progress and progress["status"] == "running":
+            self.progress_signal.emit(progress)
+            self.msleep(PROGRESS_POLL_INTERVAL)
+            progress = self.main_window.analysis_progress()
+
+        if progress:
+            self.progress_signal.emit(progress)
+        # Scaled results are taken from a solved design, the analysis is skipped
+        self.finished_signal.emit(bool(progress) and progress["status"] in ("finished", "scaled"))
+
+
+class FarfieldCutTable(object):
+    """Stores every phi and theta cut of a far field quantity.
+
+    The cuts are extracted once from the combined far field data and kept as
+    contiguous arrays, so switching between cuts is a row lookup.
+
+    Parameters
+    ----------
+    farfield_data : dict
+        Combined far field data, as returned by ``FfdSolutionData.farfield_data``.
+    quantity : str, optional
+        Far field quantity. The default is ``"RealizedGain"``.
+    """
+
+    def __init__(self, farfield_data, quantity="RealizedGain"):
+        self.theta = np.ascontiguousarray(farfield_data["Theta"], dtype=float)
+        self.phi = np.ascontiguousarray(farfield_data["Phi"], dtype=float)
+        with np.errstate(divide="ignore"):
+            values = 10.0 * np.log10(np.abs(np.asarray(farfield_data[quantity], dtype=float)))
+        # Rows are indexed by theta and columns by phi.
+        self.theta_cuts = np.ascontiguousarray(values)
+        self.phi_cuts = np.ascontiguousarray(values.T)
+
+    def phi_cut(self, phi):
+        """Return the cut closest to the given phi value as ``(theta, values)``."""
+        index = int(np.abs(self.phi - float(phi)).argmin())
+        return self.theta, self.phi_cuts[index]
+
+    def theta_cut(self, theta):
+        """Return the cut closest to the given theta value as ``(phi, values)``."""
+        index = int(np.abs(self.theta - float(theta)).argmin())
+        return self.phi, self.theta_cuts[index]
 
 
 class AntennaResultsMenu(object):
@@ -100,9 +151,16 @@ class AntennaResultsMenu(object):
         # Scattering
         self.scattering_data = None
         self.scattering_graph = None
+        self.convergence_curve = None
+        self.adaptive_pass = 0
+        self.sweep_points = 0
+        self.scaled = False
 
         # Farfield Cut
         self.farfield_data = None
+        self.farfield_cuts = None
+        self.farfield_2d_phi_curve = None
+        self.farfield_2d_theta_curve = None
         self.farfield_2d_phi_widget = None
         self.farfield_2d_phi_graph = None
         self.farfield_2d_theta_graph = None
@@ -173,6 +231,7 @@ class AntennaResultsMenu(object):
 
         # Scattering
         self.scattering_graph = pg.PlotWidget()
+        self.__enable_downsampling(self.scattering_graph)
         self.scattering_layout.addWidget(self.scattering_graph)
 
         # 2D Cut phi
@@ -199,6 +258,7 @@ class AntennaResultsMenu(object):
         self.farfield_2d_phi_layout.addLayout(line_farfield_2d_phi_layout)
 
         self.farfield_2d_phi_graph = pg.PlotWidget()
+        self.__enable_downsampling(self.farfield_2d_phi_graph)
         self.farfield_2d_phi_layout.addWidget(self.farfield_2d_phi_graph)
 
         # 2D Cut theta
@@ -224,6 +284,7 @@ class AntennaResultsMenu(object):
         self.farfield_2d_theta_layout.addLayout(line_farfield_2d_theta_layout)
 
         self.farfield_2d_theta_graph = pg.PlotWidget()
+        self.__enable_downsampling(self.farfield_2d_theta_graph)
         self.farfield_2d_theta_layout.addWidget(self.farfield_2d_theta_graph)
 
         # 3D
@@ -245,29 +306,71 @@ class AntennaResultsMenu(object):
             return
         self.ui.update_progress(50)
         self.antenna_results_thread = GetResultsThread(app=self)
+        self.antenna_results_thread.progress_signal.connect(self.antenna_results_progress)
         self.antenna_results_thread.finished_signal.connect(self.antenna_results_finished)
+
+        # Convergence is shown in the scattering graph while the design solves
+        self.adaptive_pass = 0
+        self.sweep_points = 0
+        self.scaled = False
+        self.scattering_graph.clear()
+        self.scattering_graph.setTitle("Convergence")
+        self.scattering_graph.setLabel("bottom", "Adaptive pass")
+        self.scattering_graph.setLabel("left", "Max Mag. Delta S")
+        self.convergence_curve = self.scattering_graph.plot([], [], pen=self.line_color, symbol="o")
         msg = "Analyzing antenna"
         self.ui.update_logger(msg)
 
         self.antenna_results_thread.start()
 
-    def antenna_results_finished(self):
+    def antenna_results_progress(self, progress):
+        if progress["status"] == "scaled":
+            self.scaled = True
+            self.ui.update_logger("Analysis skipped, results scaled from a solved design")
+            return
+
+        convergence = progress["convergence"]
+        if convergence:
+            passes, delta_s = zip(*convergence)
+            self.convergence_curve.setData(np.asarray(passes, dtype=float), np.asarray(delta_s, dtype=float))
+
+        if progress["adaptive_pass"] and progress["adaptive_pass"] != self.adaptive_pass:
+            self.adaptive_pass = progress["adaptive_pass"]
+            msg = "Adaptive pass {}, delta S {}, elapsed {:.0f} s".format(
+                self.adaptive_pass, progress["delta_s"], progress["elapsed"]
+            )
+            if progress["memory_gb"] is not None:
+                msg += ", memory {} GB".format(progress["memory_gb"])
+            self.ui.update_logger(msg)
+        if progress["sweep_points"] != self.sweep_points:
+            self.sweep_points = progress["sweep_points"]
+            self.ui.update_logger("Frequency sweep points solved: {}".format(self.sweep_points))
+
+    def antenna_results_finished(self, success):
         self.ui.update_progress(100)
 
+        if not success:
+            msg = "Antenna analysis failed"
+            self.ui.update_logger(msg)
+            self.main_window.logger.error(msg)
+            return
+
         try:
             self.scattering_data = self.main_window.scattering_results()
             if self.scattering_data and len(self.scattering_data):
                 # Scattering results
+                self.scattering_graph.clear()
+                self.convergence_curve = None
 
-                freq = self.scattering_data[0]
-                val = self.scattering_data[1]
+                freq = np.asarray(self.scattering_data[0], dtype=float)
+                val = np.asarray(self.scattering_data[1], dtype=float)
 
                 self.scattering_graph.plot(
                     freq,
                     val,
                     pen=self.line_color,
                 )
-                self.scattering_graph.setTitle("Scattering Plot")
+                self.scattering_graph.setTitle("Scattering Plot (scaled)" if self.scaled else "Scattering Plot")
                 self.scattering_graph.setLabel(
                     "bottom",
                     "Frequency {}".format(self.main_window.antenna_synthesis_menu.frequency_unit.text()),
@@ -285,8 +388,10 @@ class AntennaResultsMenu(object):
             self.farfield_data = self.main_window.export_farfield()
 
             if self.farfield_data:
-                phi = self.farfield_data.farfield_data["Phi"]
-                theta = self.farfield_data.farfield_data["Theta"]
+                # Extract all cuts once, combobox changes only swap curve data
+                self.farfield_cuts = FarfieldCutTable(self.farfield_data.farfield_data)
+                phi = self.farfield_cuts.phi
+                theta = self.farfield_cuts.theta
 
                 self.phi_cut_combobox.addItems([str(num) for num in phi])
 
@@ -296,31 +401,12 @@ class AntennaResultsMenu(object):
 
                 self.theta_cut_combobox.currentIndexChanged.connect(self.theta_cut_combobox_clicked)
 
-                data = self.farfield_data.plot_cut(quantity="RealizedGain",
-                                                   primary_sweep="theta",
-                                                   secondary_sweep_value=phi[0],
-                                                   phi=0,
-                                                   theta=0,
-                                                   title="Far Field Cut",
-                                                   quantity_format="dB10",
-                                                   output_file=None,
-                                                   show=False,
-                                                   is_polar=False)
-                if data:
-                    self.__plot_2d_cut(self.farfield_2d_phi_graph, data, phi[0], "Phi", "Theta")
-
-                data = self.farfield_data.plot_cut(quantity="RealizedGain",
-                                                   primary_sweep="phi",
-                                                   secondary_sweep_value=theta[0],
-                                                   phi=0,
-                                                   theta=0,
-                                                   title="Far Field Cut",
-                                                   quantity_format="dB10",
-                                                   output_file=None,
-                                                   show=False,
-                                                   is_polar=False)
-                if data:
-                    self.__plot_2d_cut(self.farfield_2d_theta_graph, data, theta[0], "Theta", "Phi")
+                self.farfield_2d_phi_curve = self.__plot_2d_cut(
+                    self.farfield_2d_phi_graph, self.farfield_cuts.phi_cut(phi[0]), phi[0], "Phi", "Theta"
+                )
+                self.farfield_2d_theta_curve = self.__plot_2d_cut(
+                    self.farfield_2d_theta_graph, self.farfield_cuts.theta_cut(theta[0]), theta[0], "Theta", "Phi"
+                )
 
                 # 3D Plot
                 background_hex = self.main_window.ui.themes["app_color"]["bg_one"]
@@ -335,49 +421,33 @@ class AntennaResultsMenu(object):
             self.ui.update_logger("An error occurred:{}".format(e))
 
     def phi_cut_combobox_clicked(self):
-        if self.farfield_data:
+        if self.farfield_cuts:
             phi = self.phi_cut_combobox.currentText()
-            data = self.farfield_data.plot_cut(quantity="RealizedGain",
-                                               primary_sweep="theta",
-                                               secondary_sweep_value=float(phi),
-                                               phi=0,
-                                               theta=0,
-                                               title="Far Field Cut",
-                                               quantity_format="dB10",
-                                               output_file=None,
-                                               show=False,
-                                               is_polar=False)
-            overlap = self.phi_cut_overlap.isChecked()
-            if not overlap:
-                self.farfield_2d_phi_graph.clear()
-            if data:
-                self.__plot_2d_cut(self.farfield_2d_phi_graph, data, phi, "Phi", "Theta")
+            data = self.farfield_cuts.phi_cut(phi)
+            if self.phi_cut_overlap.isChecked() or self.farfield_2d_phi_curve is None:
+                self.farfield_2d_phi_curve = self.__plot_2d_cut(self.farfield_2d_phi_graph, data, phi, "Phi", "Theta")
+            else:
+                self.__update_2d_cut(self.farfield_2d_phi_graph, self.farfield_2d_phi_curve, data, phi, "Phi")
 
     def theta_cut_combobox_clicked(self):
-        if self.farfield_data:
+        if self.farfield_cuts:
             theta = self.theta_cut_combobox.currentText()
-            data = self.farfield_data.plot_cut(quantity="RealizedGain",
-                                               primary_sweep="phi",
-                                               secondary_sweep_value=float(theta),
-                                               phi=0,
-                                               theta=0,
-                                               title="Far Field Cut",
-                                               quantity_format="dB10",
-                                               output_file=None,
-                                               show=False,
-                                               is_polar=False)
-            overlap = self.theta_cut_overlap.isChecked()
-            if not overlap:
-                self.farfield_2d_theta_graph.clear()
-            if data:
-                self.__plot_2d_cut(self.farfield_2d_theta_graph, data, theta, "Theta", "Phi")
+            data = self.farfield_cuts.theta_cut(theta)
+            if self.theta_cut_overlap.isChecked() or self.farfield_2d_theta_curve is None:
+                self.farfield_2d_theta_curve = self.__plot_2d_cut(
+                    self.farfield_2d_theta_graph, data, theta, "Theta", "Phi"
+                )
+            else:
+                self.__update_2d_cut(self.farfield_2d_theta_graph, self.farfield_2d_theta_curve, data, theta, "Theta")
+
+    @staticmethod
+    def __enable_downsampling(graph_obj):
+        graph_obj.setClipToView(True)
+        graph_obj.setDownsampling(auto=True, mode="peak")
 
     def __plot_2d_cut(self, graph_obj, data, cut, cut_name, sweep):
-        trace_name = data.trace_names[0]
-        cartesian_data = data.traces[trace_name].cartesian_data
-        x_data = cartesian_data[0]
-        y_data = cartesian_data[1]
-        graph_obj.plot(
+        x_data, y_data = data
+        curve = graph_obj.plot(
             x_data,
             y_data,
             pen=self.line_color
@@ -391,3 +461,14 @@ class AntennaResultsMenu(object):
             "bottom",
             sweep,
         )
+        return curve
+
+    @staticmethod
+    def __update_2d_cut(graph_obj, curve, data, cut, cut_name):
+        # Keep only the reused curve when overlap is disabled
+        for item in graph_obj.listDataItems():
+            if item is not curve:
+                graph_obj.removeItem(item)
+        x_data, y_data = data
+        curve.setData(x_data, y_data)
+        graph_obj.setTitle("Realized gain at {} {}".format(cut_name, cut))
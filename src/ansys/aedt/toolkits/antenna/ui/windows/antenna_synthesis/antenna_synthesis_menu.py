@@ -25,6 +25,7 @@ from pathlib import Path
 
 from PySide6.QtCore import Qt
 from PySide6.QtCore import QThread
+from PySide6.QtCore import QTimer
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QCheckBox
 from PySide6.QtWidgets import QFrame
@@ -39,11 +40,12 @@ from PySide6.QtWidgets import QTableWidget
 from PySide6.QtWidgets import QTableWidgetItem
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
-import pyvista as pv
-from pyvistaqt import BackgroundPlotter
 
 from ansys.aedt.toolkits.antenna.ui.windows.antenna_synthesis.antenna_synthesis_page import Ui_AntennaSynthesis
 
+# Delay in milliseconds between the last input change and the live synthesis
+LIVE_SYNTHESIS_DELAY = 300
+
 
 class GenerateAntennaThread(QThread):
     finished_signal = Signal(bool)
@@ -137,6 +139,12 @@ class AntennaSynthesisMenu(object):
         self.generate_antenna_thread = None
         self.model_info = None
 
+        # Live synthesis, restarted on each input change
+        self.live_synthesis_timer = QTimer()
+        self.live_synthesis_timer.setSingleShot(True)
+        self.live_synthesis_timer.setInterval(LIVE_SYNTHESIS_DELAY)
+        self.live_synthesis_timer.timeout.connect(self.live_synthesis)
+
     def setup(self):
         # Modify theme
         app_color = self.main_window.ui.themes["app_color"]
@@ -176,31 +184,33 @@ class AntennaSynthesisMenu(object):
         self.sweep_value.setText(str(self.sweep_slider.value()))
 
     def synthesis_button_clicked(self):
-        success = self.main_window.check_connection()
-        if not success:
-            self.ui.update_logger("Backend not running")
-            return
         if (
             not self.main_window.properties.antenna.antenna_model_selected
             or not self.main_window.properties.antenna.antenna_selected
         ):
             self.ui.update_logger("No antenna selected")
             return
-        elif (not isinstance(self.main_window.settings_menu.aedt_thread, bool) and
-              self.main_window.settings_menu.aedt_thread and self.main_window.settings_menu.aedt_thread.isRunning()):
-            self.ui.update_logger("AEDT launching")
+        self.__run_synthesis()
+        if self.parameter_table is not None and self.main_window.check_connection():
+            be_properties = self.main_window.get_properties()
+            if be_properties.get("selected_process") != 0:
+                self.generate_antenna_button.setEnabled(True)
+
+    def input_changed(self):
+        """Restart the live synthesis timer after an input change."""
+        self.live_synthesis_timer.start()
+
+    def live_synthesis(self):
+        """Synthesize the antenna again once the table is shown and the antenna is not created yet."""
+        if self.parameter_table is None or self.main_window.properties.antenna.antenna_created:
             return
-        else:
-            is_backend_busy = self.main_window.backend_busy()
-            if is_backend_busy:
-                self.ui.update_logger("Toolkit running")
-                return
-            self.main_window.properties.antenna.antenna_parameters = self.main_window.antenna_synthesis()
-            if self.main_window.properties.antenna.antenna_parameters:
-                self.__update_antenna_table()
-                be_properties = self.main_window.get_properties()
-                if be_properties.get("selected_process") != 0:
-                    self.generate_antenna_button.setEnabled(True)
+        self.__run_synthesis()
+
+    def __run_synthesis(self):
+        antenna_parameters = self.main_window.antenna_synthesis()
+        if antenna_parameters:
+            self.main_window.properties.antenna.antenna_parameters = antenna_parameters
+            self.__update_antenna_table()
 
     def generate_antenna_button_clicked(self):
         if (not self.main_window.settings_menu.aedt_thread or
@@ -265,6 +275,17 @@ class AntennaSynthesisMenu(object):
                 self.__update_antenna_model(encode)
 
     def __update_antenna_table(self):
+        antenna_parameters = self.main_window.properties.antenna.antenna_parameters
+        if self.parameter_table is not None and self.parameter_table.rowCount() == len(antenna_parameters):
+            keys = [self.parameter_table.item(row, 0).text() for row in range(self.parameter_table.rowCount())]
+            if keys == list(antenna_parameters):
+                # Same antenna, only the values change
+                self.parameter_table.blockSignals(True)
+                for row, value in enumerate(antenna_parameters.values()):
+                    self.parameter_table.item(row, 1).setText(str(value))
+                self.parameter_table.blockSignals(False)
+                return
+
         self.main_window.ui.clear_layout(self.main_window.antenna_synthesis_menu.table_layout)
         app_color = self.main_window.ui.themes["app_color"]
         num_rows = len(self.main_window.properties.antenna.antenna_parameters)
@@ -337,6 +358,10 @@ class AntennaSynthesisMenu(object):
 
     def __update_antenna_model(self, encode):
         if self.model_info:
+            # PyVista is only needed once an antenna is created
+            import pyvista as pv
+            from pyvistaqt import BackgroundPlotter
+
             self.main_window.ui.clear_layout(self.main_window.antenna_synthesis_menu.botton_image_layout)
 
             if hasattr(self, "synthesis_plotter") and self.synthesis_plotter is not None:
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+from ansys.aedt.toolkits.antenna.backend.analysis_history import design_key
+
+pytestmark = [pytest.mark.analysis_history]
+
+
+class TestClass:
+    """Class defining a workflow to test the analysis history without AEDT."""
+
+    def test_01_design_key(self):
+        key = design_key("BowTieNormal", {"frequency": 2.4, "length_unit": "mm"})
+
+        assert key == design_key("BowTieNormal", {"length_unit": "mm", "frequency": 2.4})
+        assert key != design_key("BowTieNormal", {"frequency": 2.5, "length_unit": "mm"})
+
+    def test_02_add_and_query(self, tmp_path):
+        history = AnalysisHistory(tmp_path / "history" / "analysis_history.jsonl")
+
+        assert history.query() == []
+
+        first = history.add("BowTieNormal", {"frequency": 2.4}, adaptive_passes=3, memory_gb=0.4)
+        history.add("BowTieNormal", {"frequency": 5.0}, adaptive_passes=4)
+        history.add("RectangularPatchProbe", {"frequency": 2.4}, adaptive_passes=6)
+
+        with history.history_file.open("a") as history_handler:
+            history_handler.write("{incomplete\n")
+
+        records = history.query()
+
+        assert len(records) == 3
+        assert records[0]["antenna"] == "RectangularPatchProbe"
+        assert len(history.query(antenna="BowTieNormal")) == 2
+        assert history.query(key=first["key"])[0]["memory_gb"] == 0.4
+        assert len(history.query(limit=1)) == 1
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import threading
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.optimization import EvaluationLog
+from ansys.aedt.toolkits.antenna.backend.optimization import Goal
+from ansys.aedt.toolkits.antenna.backend.optimization import OptimizationConfig
+from ansys.aedt.toolkits.antenna.backend.optimization import Optimizer
+from ansys.aedt.toolkits.antenna.backend.optimization import nelder_mead
+
+pytestmark = [pytest.mark.optimization]
+
+FREQUENCIES = np.linspace(2.0, 3.0, 101)
+
+
+def simulated_s11(parameters):
+    """Get the reflection coefficient of a fictitious dipole, resonating at 2.45 GHz for a 20 mm arm."""
+    resonance = 2.45 * 20.0 / parameters["arm_length"]
+    width = 0.05 * parameters["port_gap"]
+    return FREQUENCIES, -25.0 * np.exp(-(((FREQUENCIES - resonance) / width) ** 2))
+
+
+@pytest.fixture
+def config(tmp_path):
+    return OptimizationConfig.from_dict(
+        {
+            "variables": {"arm_length": [15.0, 25.0], "port_gap": {"bounds": [0.5, 3.0], "start": 1.0}},
+            "goals": ["S11 < -10 dB over 2.4-2.5 GHz"],
+            "max_evaluations": 60,
+            "log_file": str(tmp_path / "optimization_log.jsonl"),
+        }
+    )
+
+
+class TestClass:
+    """Class defining a workflow to test the optimization without AEDT."""
+
+    def test_01_parse_goals(self):
+        goal = Goal.parse("S11 < -10 dB over 2400-2500 MHz")
+
+        assert (goal.kind, goal.start, goal.stop, goal.threshold, goal.unit) == ("s11", 2400.0, 2500.0, -10.0, "MHz")
+        assert Goal.parse("resonance = 2.45 GHz").start == 2.45
+        assert Goal.parse({"kind": "s11", "start": 2.4, "stop": 2.5, "weight": 2.0}).weight == 2.0
+        with pytest.raises(ValueError):
+            Goal.parse("gain > 5 dBi")
+
+    def test_02_goal_costs(self):
+        frequencies, s11_db = simulated_s11({"arm_length": 20.0, "port_gap": 2.0})
+
+        assert Goal.parse("S11 < -10 dB over 2400-2500 MHz").cost(frequencies, s11_db) == 0.0
+        assert Goal.parse("S11 < -20 dB over 2.4-2.5 GHz").cost(frequencies, s11_db) > 0.0
+        assert Goal.parse("resonance = 2.45 GHz").cost(frequencies, s11_db) == pytest.approx(0.0, abs=1e-6)
+        assert Goal.parse("resonance = 2.5 GHz").cost(frequencies, s11_db) == pytest.approx(2.0, rel=1e-3)
+        with pytest.raises(ValueError):
+            Goal.parse("S11 < -10 dB over 3-4 GHz").cost(frequencies, s11_db)
+
+    def test_03_config_errors(self):
+        with pytest.raises(ValueError):
+            OptimizationConfig({}, ["resonance = 2.45 GHz"])
+        with pytest.raises(ValueError):
+            OptimizationConfig({"arm_length": [15.0, 25.0]}, [])
+        with pytest.raises(ValueError):
+            OptimizationConfig({"arm_length": [25.0, 15.0]}, ["resonance = 2.45 GHz"])
+
+    def test_04_nelder_mead(self):
+        def function(points):
+            return [float(np.sum((point - [0.3, 0.7]) ** 2)) for point in points]
+
+        point, cost, evaluations, reason = nelder_mead(function, [0.9, 0.1], max_evaluations=200, tolerance=1e-6)
+
+        assert point == pytest.approx([0.3, 0.7], abs=1e-3)
+        assert reason == "tolerance"
+        assert evaluations < 200
+        assert nelder_mead(function, [0.9, 0.1], max_evaluations=10)[3] == "max_evaluations"
+        assert nelder_mead(function, [0.9, 0.1], target=0.5)[3] == "target"
+
+    def test_05_optimize_in_parallel(self, config):
+        # The first two designs are only solved when both sessions run at the same time
+        barrier = threading.Barrier(2, timeout=10.0)
+        calls = []
+        lock = threading.Lock()
+
+        def session(parameters):
+            with lock:
+                calls.append(parameters)
+                first = len(calls) <= 2
+            if first:
+                barrier.wait()
+            return simulated_s11(parameters)
+
+        result = Optimizer("BowTieNormal", {"arm_length": "18mm", "port_gap": 1.0}, config, [session, session]).run()
+
+        assert result["stopped"] == "target"
+        assert result["cost"] == 0.0
+        assert result["solved"] == result["evaluations"]
+        assert not barrier.broken
+        assert Goal.parse("S11 < -10 dB over 2.4-2.5 GHz").cost(*simulated_s11(result["parameters"])) == 0.0
+
+    def test_06_resume_from_log(self, config):
+        first = Optimizer("BowTieNormal", {"arm_length": "18mm", "port_gap": 1.0}, config, [simulated_s11]).run()
+
+        def session(parameters):
+            raise AssertionError("Logged designs must not be solved again.")
+
+        resumed = Optimizer("BowTieNormal", {"arm_length": "18mm", "port_gap": 1.0}, config, [session]).run()
+
+        assert resumed["solved"] == 0
+        assert resumed["parameters"] == first["parameters"]
+        assert EvaluationLog(config.log_file).get(first["history"][0]["key"])["antenna"] == "BowTieNormal"
+
+    def test_07_setup_in_design_key(self, config):
+        parameters = {"arm_length": "18mm", "port_gap": 1.0}
+        narrow = Optimizer("BowTieNormal", parameters, config, [simulated_s11], setup={"sweep": [2.3, 2.6]})
+        wide = Optimizer("BowTieNormal", parameters, config, [simulated_s11], setup={"sweep": [2.0, 2.9]})
+        candidate = narrow.candidate([0.5])
+
+        assert narrow.design_key(candidate) != wide.design_key(candidate)
+        assert narrow.design_key(candidate) == narrow.design_key(dict(candidate))
+
+    def test_08_backend(self, config, monkeypatch):
+        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+
+        toolkit = ToolkitBackend()
+        goals = {"variables": {"arm_length": [15.0, 25.0]}, "goals": ["S11 < -10 dB over 2.4-2.5 GHz"]}
+
+        assert toolkit.optimize(goals) is False
+
+        updated = {}
+        monkeypatch.setattr(toolkit.properties.antenna, "parameters", {"arm_length": "18mm", "port_gap": "2mm"})
+        monkeypatch.setattr(toolkit.properties.antenna, "parameters_hfss", {"arm_length": "arm_length_bowtie"})
+        monkeypatch.setattr(toolkit, "update_hfss_parameters", lambda key, value: updated.update({key: value}))
+        monkeypatch.setattr(
+            toolkit, "_ToolkitBackend__evaluate_design", lambda parameters: simulated_s11({**parameters, "port_gap": 2})
+        )
+
+        analyzed = []
+        monkeypatch.setattr(toolkit, "analyze", lambda: analyzed.append(dict(updated)) or True)
+
+        result = toolkit.optimize({**goals, "log_file": str(config.log_file)})
+
+        assert result["cost"] == 0.0
+        assert updated == {"arm_length": str(result["parameters"]["arm_length"])}
+
+        # The designs are read from the log, the best design is solved again for its results
+        analyzed.clear()
+        assert toolkit.optimize({**goals, "log_file": str(config.log_file)})["solved"] == 0
+        assert analyzed == [updated]
+
+        # Designs logged with another sweep are solved again
+        monkeypatch.setattr(toolkit.properties.antenna.setup, "sweep", 40)
+        assert toolkit.optimize({**goals, "log_file": str(config.log_file)})["solved"] > 0
+        assert toolkit.optimize({**goals, "variables": {"unknown": [0.0, 1.0]}}) is False
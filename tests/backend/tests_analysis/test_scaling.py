@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.scaling import check_scalable
+from ansys.aedt.toolkits.antenna.backend.scaling import find_scaled_solution
+from ansys.aedt.toolkits.antenna.backend.scaling import scale_factor
+from ansys.aedt.toolkits.antenna.backend.scaling import scale_farfield
+from ansys.aedt.toolkits.antenna.backend.surrogate import s11_metrics
+from ansys.aedt.toolkits.antenna.backend.synthesis import synthesize_antenna
+
+pytestmark = [pytest.mark.scaling]
+
+FREQUENCIES = np.linspace(8.0, 12.0, 81)
+
+
+def solved_record(antenna="QuadRidged", frequency=10.0, **synthesis):
+    """Get the analysis history record of a fictitious solved design."""
+    synthesis = Synthesis(frequency=frequency, **synthesis).model_dump()
+    s11_db = -25.0 * np.exp(-(((FREQUENCIES - 1.03 * frequency) / 0.4) ** 2))
+    return {
+        "key": "reference",
+        "antenna": antenna,
+        "synthesis": synthesis,
+        "parameters": synthesize_antenna(antenna, Synthesis(**synthesis)),
+        "s11_frequencies": FREQUENCIES.tolist(),
+        "s11_db": s11_db.tolist(),
+        "peak_gain": 15.2,
+        **s11_metrics(FREQUENCIES, s11_db),
+    }
+
+
+def farfield_export(directory):
+    """Write a far field export of a fictitious solved design at 10 GHz."""
+    directory.mkdir(parents=True)
+    (directory / "geometry").mkdir()
+    (directory / "geometry" / "horn.obj").write_text("# horn\nv 1.0 2.0 -3.0\nvn 0.0 0.0 1.0\nf 1 1 1\n")
+    (directory / "horn_1.ffd").write_text("0 180 181\n0 360 361\nFrequencies 1\nFrequency 10000000000.0\n1 0 1 0\n")
+    (directory / "horn.s1p").write_text("! touchstone\n# HZ S RI R 50\n9000000000.0 0.1 0.2\n10000000000.0 0.3 0.4\n")
+    metadata = {
+        "element_pattern": {
+            "horn_1": {
+                "file_name": "horn_1.ffd",
+                "location": [0.0, 0.0, 1.0],
+                "incident_power": {"10000000000.0": 1.0},
+                "accepted_power": {"10000000000.0": 0.9},
+                "radiated_power": {"10000000000.0": 0.8},
+            }
+        },
+        "touchstone_file": "horn.s1p",
+        "model_info": {"object_list": {"horn": ["geometry/horn.obj", [255, 0, 0], 0.0, "mm"]}},
+    }
+    metadata_file = directory / "pyaedt_antenna_metadata.json"
+    metadata_file.write_text(json.dumps(metadata))
+    return metadata_file
+
+
+class TestClass:
+    """Class defining a workflow to test the scaling of solved designs without AEDT."""
+
+    def test_01_scale_factor(self):
+        reference = {"arm_length": 10.0, "port_gap": "1mm", "number_of_arms": 2, "pos_x": 0.0, "offset": 0.0}
+
+        assert scale_factor(reference, {**reference, "arm_length": 20.0, "port_gap": "2mm", "pos_x": 5.0}) == 2.0
+        assert scale_factor(reference, {**reference, "arm_length": 2.0, "port_gap": 0.2}, "mm", "cm") == 2.0
+        assert scale_factor(reference, {**reference, "arm_length": 20.0005, "port_gap": 2.0}) == 2.00005
+        assert scale_factor(reference, {**reference, "arm_length": 20.0}) is None
+        assert scale_factor(reference, {**reference, "arm_length": 20.0, "port_gap": 2.0, "offset": 1.0}) is None
+        assert scale_factor(reference, {**reference, "arm_length": 20.0, "port_gap": 2.0, "number_of_arms": 4}) is None
+        assert scale_factor(reference, {"arm_length": 20.0}) is None
+
+    def test_02_check_scalable(self):
+        check_scalable("Pyramidal", {"material": "PEC"})
+        check_scalable("WireDipole", {})
+        with pytest.raises(ValueError, match="copper"):
+            check_scalable("Pyramidal", {"material": "copper"})
+        with pytest.raises(ValueError, match="dielectrics"):
+            check_scalable("RectangularPatchProbe", {"material": "pec"})
+
+    def test_03_find_scaled_solution(self):
+        record = solved_record()
+        synthesis = Synthesis(frequency=12.5).model_dump()
+        parameters = synthesize_antenna("QuadRidged", Synthesis(**synthesis))
+
+        solution = find_scaled_solution("QuadRidged", synthesis, parameters, [record])
+
+        assert solution["scaled"] is True
+        assert solution["reference"] == "reference"
+        assert solution["scale_factor"] == pytest.approx(0.8)
+        assert np.allclose(solution["s11_frequencies"], FREQUENCIES / 0.8)
+        assert solution["s11_db"] == record["s11_db"]
+        assert solution["resonant_frequency"] == pytest.approx(12.5 * 1.03, rel=1e-3)
+        assert solution["bandwidth"] == pytest.approx(record["bandwidth"] / 0.8)
+        assert solution["peak_gain"] == 15.2
+
+        # The results are converted to the frequency unit of the design
+        in_mhz = find_scaled_solution("QuadRidged", {**synthesis, "frequency_unit": "MHz"}, parameters, [record])
+        assert in_mhz["resonant_frequency"] == pytest.approx(1000.0 * solution["resonant_frequency"])
+
+        assert find_scaled_solution("QuadRidged", {**synthesis, "outer_boundary": "PML"}, parameters, [record]) is None
+        assert find_scaled_solution("QuadRidged", synthesis, parameters, [solved_record(material="copper")]) is None
+        with pytest.raises(ValueError):
+            find_scaled_solution("QuadRidged", {**synthesis, "material": "copper"}, parameters, [record])
+
+    def test_04_backend(self, tmp_path, monkeypatch):
+        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+
+        toolkit = ToolkitBackend()
+        record = solved_record()
+        history_file = tmp_path / "analysis_history.jsonl"
+        AnalysisHistory(history_file).add(
+            "QuadRidged",
+            record["synthesis"],
+            parameters=record["parameters"],
+            farfield_metadata=str(farfield_export(tmp_path / "reference")),
+            **{name: record[name] for name in ("s11_frequencies", "s11_db", "resonant_frequency", "peak_gain")},
+        )
+        monkeypatch.setattr(toolkit.properties.antenna.setup, "history_file", str(history_file))
+
+        scaled = toolkit.scaled_results("QuadRidged", {"frequency": 5.0})
+        assert scaled["scaled"] is True
+        assert scaled["scale_factor"] == pytest.approx(2.0)
+        assert toolkit.scaled_results("QuadRidged", {"frequency": 5.0, "material": "copper"}) is False
+        assert toolkit.scaled_results("RectangularPatchProbe", {"frequency": 5.0}) is False
+
+        # The analysis of a scaled copy reuses the solved design instead of connecting to AEDT
+        monkeypatch.setattr(toolkit.properties.antenna, "model", "QuadRidged")
+        monkeypatch.setattr(toolkit.properties.antenna, "synthesis", Synthesis(frequency=5.0))
+        monkeypatch.setattr(
+            toolkit.properties.antenna, "parameters", synthesize_antenna("QuadRidged", Synthesis(frequency=5.0))
+        )
+        monkeypatch.setattr(toolkit.properties.antenna.setup, "reuse_scaled_solutions", True)
+
+        assert toolkit.analyze() is True
+        assert toolkit.analysis_progress()["status"] == "scaled"
+        frequencies, s11_db = toolkit.scattering_results()
+        assert np.allclose(frequencies, FREQUENCIES / 2.0)
+        assert s11_db == record["s11_db"]
+        assert len(toolkit.analysis_history("QuadRidged")) == 1
+
+        # The far field of the solved design is relabeled to the scaled frequency
+        metadata_file, frequencies, scaling = toolkit.export_farfield(frequencies=["5GHz"], encode=False)
+        assert frequencies == [5e9]
+        reference = toolkit.analysis_history("QuadRidged")[0]["key"]
+        assert scaling == {"scaled": True, "scale_factor": pytest.approx(2.0), "reference": reference}
+        assert json.loads(Path(metadata_file).read_text())["scaled"] is True
+        encoded = toolkit.export_farfield(frequencies=5.0)
+        assert len(encoded) == 5
+        assert len(encoded[1]) == 1 and len(encoded[2]) == 1 and encoded[3]
+        assert encoded[-1]["scaled"] is True
+        assert toolkit.export_farfield(frequencies=10.0) is False
+
+    def test_05_scale_farfield(self, tmp_path):
+        metadata_file = farfield_export(tmp_path / "reference")
+
+        scaled_file, frequencies = scale_farfield(metadata_file, 2.0, tmp_path / "scaled", "reference")
+
+        assert frequencies == [5e9]
+        metadata = json.loads((tmp_path / "scaled" / "pyaedt_antenna_metadata.json").read_text())
+        assert scaled_file == str(tmp_path / "scaled" / "pyaedt_antenna_metadata.json")
+        assert metadata["scaled"] is True
+        assert metadata["scale_factor"] == 2.0
+        assert metadata["reference"] == "reference"
+        element = metadata["element_pattern"]["horn_1"]
+        assert element["location"] == [0.0, 0.0, 2.0]
+        assert element["accepted_power"] == {"5000000000.0": 0.9}
+        assert "Frequency 5000000000.0" in (tmp_path / "scaled" / "horn_1.ffd").read_text().splitlines()
+        assert "v 2.0 4.0 -6.0" in (tmp_path / "scaled" / "geometry" / "horn.obj").read_text().splitlines()
+        touchstone = (tmp_path / "scaled" / "horn.s1p").read_text().splitlines()
+        assert touchstone[:2] == ["! touchstone", "# HZ S RI R 50"]
+        assert [float(line.split()[0]) for line in touchstone[2:]] == [4.5e9, 5e9]
+        assert touchstone[3].split()[1:] == ["0.3", "0.4"]
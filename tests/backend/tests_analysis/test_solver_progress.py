@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.solver_progress import SolverProgress
+from ansys.aedt.toolkits.antenna.backend.solver_progress import parse_convergence
+
+pytestmark = [pytest.mark.solver_progress]
+
+CONVERGENCE = """Solution: Setup1 : LastAdaptive
+Pass Number\tSolved Elements\tMax Mag. Delta S
+1\t1520\tN/A
+2\t1985\t0.1242
+3\t2577\t0.0183
+"""
+
+
+class TestClass:
+    """Class defining a workflow to test the analysis progress without AEDT."""
+
+    def test_01_parse_convergence(self):
+        passes = parse_convergence(CONVERGENCE)
+
+        assert len(passes) == 3
+        assert passes[0] == {"pass": 1, "delta_s": None, "mesh_elements": 1520}
+        assert passes[-1]["delta_s"] == pytest.approx(0.0183)
+        assert parse_convergence("") == []
+
+    def test_02_solver_progress(self):
+        progress = SolverProgress()
+
+        assert progress.snapshot()["status"] == "idle"
+
+        progress.start("Setup1")
+        progress.update_convergence(parse_convergence(CONVERGENCE))
+        progress.update(memory_gb=0.5)
+        snapshot = progress.snapshot()
+
+        assert progress.is_running
+        assert snapshot["adaptive_pass"] == 3
+        assert snapshot["mesh_elements"] == 2577
+        assert snapshot["convergence"] == [[2, 0.1242], [3, 0.0183]]
+
+        progress.finish(False)
+
+        assert progress.snapshot()["status"] == "failed"
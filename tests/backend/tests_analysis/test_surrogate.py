@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+from ansys.aedt.toolkits.antenna.backend.surrogate import GaussianProcess
+from ansys.aedt.toolkits.antenna.backend.surrogate import PerformanceSurrogate
+from ansys.aedt.toolkits.antenna.backend.surrogate import load_surrogates
+from ansys.aedt.toolkits.antenna.backend.surrogate import s11_metrics
+from ansys.aedt.toolkits.antenna.backend.surrogate import save_surrogate
+from ansys.aedt.toolkits.antenna.backend.surrogate import synthesis_features
+
+pytestmark = [pytest.mark.surrogate]
+
+
+def simulated_performance(frequency, permittivity):
+    """Get the performance of a fictitious solver."""
+    return {
+        "resonant_frequency": 0.95 * frequency * (permittivity / 4.4) ** -0.03,
+        "bandwidth": 0.04 * frequency / np.sqrt(permittivity),
+        "peak_gain": 7.5 - 0.3 * permittivity + 0.02 * frequency,
+    }
+
+
+def unexpected_training(*args):
+    raise AssertionError("The stored surrogate must be used.")
+
+
+@pytest.fixture
+def records():
+    return [
+        {
+            "antenna": "RectangularPatchProbe",
+            "synthesis": {
+                "frequency": frequency,
+                "frequency_unit": "GHz",
+                "length_unit": "mm",
+                "substrate_height": 1.6,
+                "material_properties": {"permittivity": permittivity},
+            },
+            **simulated_performance(frequency, permittivity),
+        }
+        for frequency in np.linspace(2.0, 10.0, 9)
+        for permittivity in (2.2, 3.3, 4.4)
+    ]
+
+
+class TestClass:
+    """Class defining a workflow to test the performance surrogate without AEDT."""
+
+    def test_01_s11_metrics(self):
+        frequencies = np.linspace(4.0, 6.0, 201)
+        s11_db = -20.0 * np.exp(-(((frequencies - 5.03) / 0.2) ** 2))
+
+        metrics = s11_metrics(frequencies, s11_db)
+
+        assert metrics["resonant_frequency"] == pytest.approx(5.03, abs=1e-3)
+        assert metrics["bandwidth"] == pytest.approx(2 * 0.2 * np.sqrt(np.log(2.0)), rel=1e-3)
+        assert metrics["min_s11_db"] == pytest.approx(-20.0, abs=1e-2)
+        assert s11_metrics(frequencies, s11_db / 4)["bandwidth"] == 0.0
+
+    def test_02_synthesis_features(self):
+        features = synthesis_features(
+            {
+                "frequency": 2400.0,
+                "frequency_unit": "MHz",
+                "substrate_height": 0.1,
+                "length_unit": "cm",
+                "num_sides": 6,
+                "lattice_pair": True,
+                "material_properties": {"permittivity": 4.4},
+            }
+        )
+
+        assert features == pytest.approx(
+            {"frequency": 2.4, "substrate_height": 1.0, "num_sides": 6.0, "material_permittivity": 4.4}
+        )
+
+    def test_03_gaussian_process(self):
+        x = np.linspace(-2.0, 2.0, 15)[:, None]
+        process = GaussianProcess(x, np.sin(2 * x[:, 0]))
+
+        mean, std = process.predict([[0.3], [6.0]])
+
+        assert mean[0] == pytest.approx(np.sin(0.6), abs=1e-3)
+        assert std[0] < 1e-2
+        assert std[1] > 10 * std[0]
+
+    def test_04_predict(self, records):
+        surrogate = PerformanceSurrogate.train("RectangularPatchProbe", records)
+
+        assert surrogate.features == ["frequency", "material_permittivity"]
+        assert sorted(surrogate.models) == ["bandwidth", "peak_gain", "resonant_frequency"]
+
+        inside = {"frequency": 5500.0, "frequency_unit": "MHz", "material_properties": {"permittivity": 3.0}}
+        expected = simulated_performance(5.5, 3.0)
+        prediction = surrogate.predict(inside)
+
+        assert prediction["within_trained_region"]
+        assert prediction["skip_simulation"]
+        assert prediction["metrics"]["resonant_frequency"]["unit"] == "MHz"
+        assert prediction["metrics"]["resonant_frequency"]["mean"] == pytest.approx(
+            1e3 * expected["resonant_frequency"], rel=1e-3
+        )
+        assert prediction["metrics"]["bandwidth"]["mean"] == pytest.approx(1e3 * expected["bandwidth"], rel=2e-2)
+        assert prediction["metrics"]["peak_gain"]["mean"] == pytest.approx(expected["peak_gain"], abs=1e-2)
+
+        outside = surrogate.predict([inside, {"frequency": 40.0, "material_properties": {"permittivity": 3.0}}])[1]
+
+        assert not outside["within_trained_region"]
+        assert not outside["skip_simulation"]
+
+    def test_05_train_errors(self, records):
+        with pytest.raises(ValueError):
+            PerformanceSurrogate.train("RectangularPatchProbe", records[:1])
+        with pytest.raises(ValueError):
+            PerformanceSurrogate.train("RectangularPatchProbe", [records[0], dict(records[0])])
+        with pytest.raises(ValueError):
+            PerformanceSurrogate.train("BowTieNormal", records)
+
+    def test_06_save_and_load(self, records, tmp_path):
+        surrogate_file = tmp_path / "surrogate_models.json"
+        surrogate = PerformanceSurrogate.train("RectangularPatchProbe", records)
+
+        assert load_surrogates(surrogate_file) == {}
+
+        save_surrogate(surrogate, surrogate_file)
+        loaded = load_surrogates(surrogate_file)["RectangularPatchProbe"]
+        design = {"frequency": 7.0, "material_properties": {"permittivity": 2.5}}
+
+        assert loaded.samples == len(records)
+        for metric, value in surrogate.predict(design)["metrics"].items():
+            assert loaded.predict(design)["metrics"][metric] == pytest.approx(value)
+
+    def test_07_backend(self, records, tmp_path, monkeypatch):
+        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+
+        history = AnalysisHistory(tmp_path / "analysis_history.jsonl")
+        for record in records[:-1]:
+            history.add(
+                record["antenna"],
+                record["synthesis"],
+                **simulated_performance(
+                    record["synthesis"]["frequency"], record["synthesis"]["material_properties"]["permittivity"]
+                ),
+            )
+
+        toolkit = ToolkitBackend()
+        setup = toolkit.properties.antenna.setup
+        setup.history_file = str(history.history_file)
+        setup.surrogate_file = str(tmp_path / "surrogate_models.json")
+        try:
+            trained = toolkit.train_surrogate("RectangularPatchProbe")
+            history.add(records[-1]["antenna"], records[-1]["synthesis"], peak_gain=records[-1]["peak_gain"])
+            prediction = toolkit.predict_performance(
+                "RectangularPatchProbe", {"frequency": 6.0, "material_properties": {"permittivity": 3.0}}
+            )
+            retrained = load_surrogates(setup.surrogate_file)["RectangularPatchProbe"]
+
+            # Failed analyses have no metric, they do not make the surrogate out of date
+            history.add(records[-1]["antenna"], records[-1]["synthesis"], status="failed")
+            monkeypatch.setattr(PerformanceSurrogate, "train", unexpected_training)
+            cached = toolkit.predict_performance(
+                "RectangularPatchProbe", {"frequency": 6.0, "material_properties": {"permittivity": 3.0}}
+            )
+            monkeypatch.undo()
+            missing = toolkit.predict_performance("BowTieNormal")
+        finally:
+            setup.history_file = ""
+            setup.surrogate_file = ""
+
+        assert trained["samples"] == len(records) - 1
+        assert retrained.samples == len(records)
+        assert prediction["metrics"]["resonant_frequency"]["mean"] == pytest.approx(
+            simulated_performance(6.0, 3.0)["resonant_frequency"], rel=1e-3
+        )
+        assert cached == prediction
+        assert missing is False
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.design_index import DesignIndex
+from ansys.aedt.toolkits.antenna.backend.metrics import MetricsRegistry
+from ansys.aedt.toolkits.antenna.backend.metrics import backend_calls_total
+from ansys.aedt.toolkits.antenna.backend.metrics import cache_hit_ratio
+from ansys.aedt.toolkits.antenna.backend.metrics import cache_requests_total
+from ansys.aedt.toolkits.antenna.backend.metrics import measure_methods
+from ansys.aedt.toolkits.antenna.backend.metrics import record_cache
+from ansys.aedt.toolkits.antenna.backend.tracing import tracer
+
+pytestmark = [pytest.mark.metrics]
+
+
+class TestClass:
+    """Class defining a workflow to test the backend metrics without AEDT."""
+
+    def test_01_counter_and_gauge(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("calls_total", "Calls.", ("route",))
+        gauge = registry.gauge("depth", "Depth.")
+
+        counter.inc(route="/a")
+        counter.inc(2, route='/b"')
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        text = registry.render()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{route="/a"} 1' in text
+        assert 'calls_total{route="/b\\""} 2' in text
+        assert "depth 1" in text
+        assert registry.counter("calls_total", "Calls.", ("route",)) is counter
+        with pytest.raises(ValueError):
+            counter.inc(other="/a")
+
+    def test_02_histogram(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.5, route="/a")
+        histogram.observe(5.0, route="/a")
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'latency_seconds_sum{route="/a"} 5.55' in text
+        assert histogram.count(route="/a") == 3
+
+    def test_03_gauge_callback(self):
+        registry = MetricsRegistry()
+        registry.gauge("busy", "Busy.", callback=lambda: 1)
+
+        assert "busy 1" in registry.render()
+
+    def test_04_measure_methods(self):
+        @measure_methods()
+        class Backend:
+            def succeed(self):
+                return True
+
+            def fail(self):
+                return False
+
+            def _private(self):
+                return True
+
+        backend = Backend()
+        succeeded = backend_calls_total.value(method="succeed", result="success")
+        failed = backend_calls_total.value(method="fail", result="failure")
+
+        tracer.start()
+        try:
+            backend.succeed()
+            backend.fail()
+            events = [event["name"] for event in tracer.events]
+        finally:
+            tracer.stop()
+            tracer.reset()
+
+        assert backend_calls_total.value(method="succeed", result="success") == succeeded + 1
+        assert backend_calls_total.value(method="fail", result="failure") == failed + 1
+        assert events == ["Backend.succeed", "Backend.fail"]
+        assert not hasattr(Backend._private, "__wrapped__")
+        assert not hasattr(Backend.succeed.__wrapped__, "__wrapped__")
+
+    def test_05_cache_hit_ratio(self):
+        record_cache("test_cache", True)
+        record_cache("test_cache", True)
+        record_cache("test_cache", False)
+        record_cache("test_cache", True)
+
+        assert cache_hit_ratio.value(cache="test_cache") == 0.75
+
+    def test_06_design_index_hit_ratio(self):
+        app = SimpleNamespace(materials=SimpleNamespace(mat_names_aedt=["vacuum", "pec"]))
+        hits = cache_requests_total.value(cache="design_index_materials", result="hit")
+        misses = cache_requests_total.value(cache="design_index_materials", result="miss")
+        index = DesignIndex(app)
+        index.has_material("PEC")
+        index.has_material("vacuum")
+        index.has_material("copper")
+        index.has_material("pec")
+
+        # The first lookup and the missing material read the materials from AEDT
+        assert cache_requests_total.value(cache="design_index_materials", result="hit") == hits + 2
+        assert cache_requests_total.value(cache="design_index_materials", result="miss") == misses + 2
+        assert index.queries_avoided == 2
+        assert cache_hit_ratio.value(cache="design_index_materials") == (hits + 2) / (hits + misses + 4)
+
+    def test_07_metrics_route(self):
+        from ansys.aedt.toolkits.antenna.backend.run_backend import app
+
+        client = app.test_client()
+        client.get("/health")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        text = response.get_data(as_text=True)
+        assert 'antenna_toolkit_requests_total{method="GET",route="/health",status="200"}' in text
+        assert 'antenna_toolkit_request_duration_seconds_count{method="GET",route="/health"}' in text
+        assert "antenna_toolkit_thread_busy 0" in text
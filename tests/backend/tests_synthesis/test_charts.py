@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.charts import BandChart
+from ansys.aedt.toolkits.antenna.backend.antenna_models.charts import DesignChart
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import StandardWaveguide
+from ansys.aedt.toolkits.antenna.backend.antenna_models.log_periodic import LogPeriodicArray
+from ansys.aedt.toolkits.antenna.backend.antenna_models.yagiuda import WireYagiUda
+
+pytestmark = [pytest.mark.synthesis]
+
+
+class TestClass:
+    """Class defining a workflow to test the design charts."""
+
+    def test_01_linear_chart(self):
+        chart = DesignChart([3.0, 1.0, 2.0], [40.0, 10.0, 20.0])
+
+        assert chart(1.5) == 15.0
+        assert np.allclose(chart([0.0, 2.5, 5.0]), [10.0, 30.0, 40.0])
+        columns = DesignChart([1.0, 2.0], [[1.0, 10.0], [2.0, 20.0]])
+        assert np.allclose(columns(1.5), [1.5, 15.0])
+        assert columns([1.0, 2.0]).shape == (2, 2)
+        with pytest.raises(ValueError):
+            DesignChart([1.0, 1.0], [1.0, 2.0])
+
+    def test_02_spline_chart(self):
+        x = np.linspace(0.0, np.pi, 9)
+        chart = DesignChart(x, np.sin(x), method="spline")
+
+        assert np.allclose(chart(x), np.sin(x))
+        samples = np.linspace(0.0, np.pi, 101)
+        assert np.abs(chart(samples) - np.sin(samples)).max() < 2e-3
+        assert np.abs(DesignChart(x, np.sin(x))(samples) - np.sin(samples)).max() > 5e-3
+
+    def test_03_band_chart(self):
+        lower = BandChart([0.0, 1.0, 2.0], ["low", "mid", "high"])
+        upper = BandChart([0.0, 1.0, 2.0], ["low", "mid", "high"], side="upper")
+
+        assert lower.select(1.0) == "mid"
+        assert upper.select(1.0) == "mid"
+        assert lower.select([-1.0, 0.5, 1.5, 3.0]) == ["low", "low", "mid", "high"]
+        assert upper.select([-1.0, 0.5, 1.5, 3.0]) == ["low", "mid", "high", "high"]
+        assert np.array_equal(BandChart([1.0, 0.0], np.array([10, 0])).select([0.5, 1.5]), [0, 10])
+
+    def test_04_model_charts(self):
+        assert WireYagiUda._design_for_gain(9.26).gain == 9.26
+        designs = WireYagiUda._design_for_gain([0.0, 11.0, 14.405, 20.0])
+        assert [design.gain for design in designs] == [9.26, 11.36, 14.41, 16.36]
+
+        tau, sigma = LogPeriodicArray._find_tau_sigma(np.array([5.0, 7.25, 10.0, 12.0]))
+        assert np.allclose(tau, [0.78, 0.802, 0.942, 0.967])
+        assert np.allclose(sigma, 0.237838 * tau - 0.047484)
+        assert LogPeriodicArray._find_tau_sigma(10.0) == pytest.approx((0.942, 0.176559396))
+
+        waveguide = StandardWaveguide()
+        assert waveguide.find_waveguide([0.0, 1.0, 10.0, 100.0], "GHz") == [None, "WR-975", "WR-102", "WR-10"]
+        assert waveguide.find_waveguide(10000.0, "MHz") == "WR-102"
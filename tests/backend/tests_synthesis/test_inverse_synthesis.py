@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import SynthesisCorrection
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import input_resistance
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import inverse_synthesis
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import load_corrections
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import probe_feed_offset
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import resonance
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import samples_from_history
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import save_correction
+from ansys.aedt.toolkits.antenna.backend.inverse_synthesis import solve_monotonic
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import synthesize_antenna
+
+pytestmark = [pytest.mark.synthesis]
+
+
+def simulated_shift(frequency, permittivity):
+    """Resonance shift of a fictitious solver."""
+    return 0.95 * (frequency / 10.0) ** 0.02 * (permittivity / 4.4) ** -0.03
+
+
+class SolvedPatch(object):
+    """HFSS application of a fictitious patch, resonating at 95 % of its synthesis frequency with 60 ohm."""
+
+    setup_names = []
+    field_setups = []
+    are_there_simulations_running = False
+
+    def __init__(self, frequency):
+        self.frequencies = np.linspace(0.8 * frequency, 1.2 * frequency, 201)
+        resonance = 0.95 * frequency
+        impedance = 60.0 / (1 + 20j * (self.frequencies / resonance - resonance / self.frequencies))
+        self.s11 = (impedance - 50.0) / (impedance + 50.0)
+        self.post = self
+        self.units_sweeps = {"Freq": "GHz"}
+
+    def get_solution_data(self):
+        return self
+
+    def get_expression_data(self, formula="real"):
+        values = {"dB20": 20 * np.log10(np.abs(self.s11)), "real": self.s11.real, "imag": self.s11.imag}
+        return self.frequencies, values[formula]
+
+    def save_project(self):
+        return True
+
+    def analyze(self, cores=None, blocking=True):
+        return True
+
+    def release_desktop(self, close_projects=False, close_on_exit=False):
+        return True
+
+
+@pytest.fixture
+def correction():
+    samples = [
+        {
+            "frequency": frequency,
+            "simulated_frequency": frequency * simulated_shift(frequency, permittivity),
+            "permittivity": permittivity,
+            "simulated_resistance": 60.0,
+        }
+        for frequency in (2.0, 5.0, 10.0, 20.0)
+        for permittivity in (2.2, 4.4)
+    ]
+    return SynthesisCorrection.fit("RectangularPatchProbe", samples)
+
+
+class TestClass:
+    """Class defining a workflow to test the inverse synthesis without AEDT."""
+
+    def test_01_solve_monotonic(self):
+        targets = np.linspace(1.0, 100.0, 1000)
+        solutions = solve_monotonic(lambda x: x**3 + x, targets, 0.0, 10.0)
+
+        assert np.allclose(solutions**3 + solutions, targets, rtol=1e-10)
+        assert np.isnan(solve_monotonic(lambda x: x**2, [-1.0], 0.0, 1.0)[0])
+
+    def test_02_resonance(self):
+        frequencies = np.linspace(1.0, 3.0, 21)
+
+        assert resonance(frequencies, (frequencies - 2.03) ** 2 - 20.0) == pytest.approx(2.03)
+        assert resonance([1.0, 2.0], [-5.0, -1.0]) == 1.0
+
+    def test_03_fit_correction(self, correction):
+        design = correction.design_frequency([2.4, 10.0], 4.4)
+
+        assert np.allclose(design * simulated_shift(design, 4.4), [2.4, 10.0])
+        assert correction.resistance_ratio(10.0, 4.4) == pytest.approx(1.2)
+        with pytest.raises(ValueError):
+            SynthesisCorrection.fit("RectangularPatchProbe", [{"frequency": 10.0}])
+
+    def test_04_store_corrections(self, correction, tmp_path):
+        corrections_file = tmp_path / "corrections.json"
+        save_correction(correction, corrections_file)
+        save_correction(SynthesisCorrection("BowTieNormal"), corrections_file)
+        corrections = load_corrections(corrections_file)
+
+        assert set(corrections) == {"RectangularPatchProbe", "BowTieNormal"}
+        assert corrections["RectangularPatchProbe"].to_dict() == correction.to_dict()
+
+    def test_05_inverse_synthesis(self, correction):
+        designs = inverse_synthesis("RectangularPatchProbe", Synthesis(), [2.4, 10.0], correction=correction)
+        uncorrected = synthesize_antenna("RectangularPatchProbe", Synthesis(frequency=10.0))
+
+        assert [design["target_frequency"] for design in designs] == [2.4, 10.0]
+        assert designs[1]["design_frequency"] > 10.0
+        assert designs[1]["parameters"]["patch_y"] < uncorrected["patch_y"]
+        # The simulated resistance is 20 % high, so the probe moves toward the center
+        assert designs[1]["parameters"]["feed_y"] < designs[1]["parameters"]["patch_y"] / 2
+
+    def test_06_probe_feed_offset(self):
+        offsets = probe_feed_offset(6.9, 1.2, [50.0, 25.0, 1000.0])
+
+        assert offsets[0] == pytest.approx(1.2)
+        assert offsets[1] < 1.2
+        assert offsets[2] == pytest.approx(3.45)
+
+    def test_07_without_correction(self):
+        designs = inverse_synthesis("Archimedean", Synthesis(), 5.0, correction=SynthesisCorrection("Archimedean"))
+
+        assert designs[0]["design_frequency"] == 5.0
+        assert designs[0]["parameters"]
+
+    def test_08_samples_from_history(self):
+        records = [
+            {"synthesis": {"frequency": 10.0, "frequency_unit": "GHz"}, "resonant_frequency": 9.5},
+            {"synthesis": {"frequency": 10.0}},
+        ]
+
+        assert samples_from_history(records) == [
+            {
+                "frequency": 10.0,
+                "frequency_unit": "GHz",
+                "permittivity": None,
+                "simulated_frequency": 9.5,
+                "simulated_resistance": None,
+            }
+        ]
+
+    def test_09_input_resistance(self):
+        patch = SolvedPatch(10.0)
+
+        assert input_resistance(patch.frequencies, patch.s11, 9.5) == pytest.approx(60.0)
+        assert input_resistance([1.0, 2.0], [0.0, 0.0], 1.5) == pytest.approx(50.0)
+
+    def test_10_backend(self, tmp_path):
+        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+
+        toolkit = ToolkitBackend()
+        toolkit.properties.antenna.setup.corrections_file = str(tmp_path / "corrections.json")
+        try:
+            samples = [{"frequency": 10.0, "simulated_frequency": 9.5}, {"frequency": 5.0, "simulated_frequency": 4.75}]
+            fitted = toolkit.fit_synthesis_correction("BowTieNormal", samples)
+            designs = toolkit.inverse_synthesis("BowTieNormal", [10.0])
+        finally:
+            toolkit.properties.antenna.setup.corrections_file = ""
+
+        assert fitted["samples"] == 2
+        assert designs[0]["design_frequency"] == pytest.approx(10.0 / 0.95)
+        assert toolkit.fit_synthesis_correction("BowTieNormal", []) is False
+        assert toolkit.inverse_synthesis("Unknown", [10.0]) is False
+
+    def test_11_fit_from_analyses(self, tmp_path, monkeypatch):
+        from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+
+        toolkit = ToolkitBackend()
+        monkeypatch.setattr(toolkit.properties.antenna.setup, "history_file", str(tmp_path / "history.jsonl"))
+        monkeypatch.setattr(toolkit.properties.antenna.setup, "corrections_file", str(tmp_path / "corrections.json"))
+        monkeypatch.setattr(toolkit.properties.antenna, "model", "RectangularPatchProbe")
+        for frequency in (5.0, 10.0):
+            monkeypatch.setattr(toolkit.properties.antenna, "synthesis", Synthesis(frequency=frequency))
+            toolkit.aedtapp = SolvedPatch(frequency)
+            assert toolkit.analyze() is True
+
+        samples = samples_from_history(toolkit.analysis_history("RectangularPatchProbe"))
+        fitted = toolkit.fit_synthesis_correction("RectangularPatchProbe")
+        correction = load_corrections(tmp_path / "corrections.json")["RectangularPatchProbe"]
+
+        assert [sample["simulated_frequency"] for sample in samples] == pytest.approx([9.5, 4.75], rel=1e-3)
+        assert [sample["simulated_resistance"] for sample in samples] == pytest.approx([60.0, 60.0], rel=1e-3)
+        assert fitted["samples"] == 2
+        assert correction.frequency_ratio(7.0, 4.4) == pytest.approx(0.95, rel=1e-3)
+        assert correction.resistance_ratio(7.0, 4.4) == pytest.approx(1.2, rel=1e-3)
+
+    def test_12_material_library(self, correction):
+        duroid = Synthesis(material="Rogers RT/duroid 5880 (tm)")
+        custom = Synthesis(material="my_substrate", material_properties={"permittivity": 2.2})
+        records = [{"antenna": "RectangularPatchProbe", "synthesis": duroid.model_dump(), "resonant_frequency": 9.5}]
+
+        from_library = inverse_synthesis("RectangularPatchProbe", duroid, 10.0, correction=correction)
+        from_properties = inverse_synthesis("RectangularPatchProbe", custom, 10.0, correction=correction)
+
+        # The correction is evaluated at the permittivity of the synthesis, not at the model default
+        assert samples_from_history(records)[0]["permittivity"] == pytest.approx(2.2, rel=1e-3)
+        assert from_library[0]["design_frequency"] == pytest.approx(from_properties[0]["design_frequency"])
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.materials import DjordjevicSarkar
+from ansys.aedt.toolkits.antenna.backend.antenna_models.materials import Material
+from ansys.aedt.toolkits.antenna.backend.antenna_models.materials import MaterialLibrary
+from ansys.aedt.toolkits.antenna.backend.antenna_models.materials import default_material_library
+from ansys.aedt.toolkits.antenna.backend.antenna_models.materials import load_material_library
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import synthesize_antenna
+
+pytestmark = [pytest.mark.synthesis]
+
+
+class TestClass:
+    """Class defining a workflow to test the offline material library."""
+
+    def test_01_default_library(self):
+        library = default_material_library()
+
+        assert "fr4_EPOXY" in library
+        assert library.get("FR4_epoxy").permittivity_at(2.4e9) == 4.4
+        assert library.get("copper").is_conductor()
+        assert library.get("unknown") is None
+        frequencies = np.array([1e9, 10e9])
+        assert np.allclose(library.get("Teflon (tm)").loss_tangent_at(frequencies), [0.001, 0.001])
+
+    def test_02_djordjevic_sarkar(self):
+        model = DjordjevicSarkar(4.4, 0.02, frequency=1e9)
+        frequencies = np.geomspace(1e6, 1e11, 11)
+        permittivity = model.permittivity(frequencies)
+
+        # The values at the measurement frequency are kept, and the permittivity decreases with the frequency
+        assert model.permittivity(1e9) == pytest.approx(4.4)
+        assert model.loss_tangent(1e9) == pytest.approx(0.02, rel=1e-3)
+        assert np.all(np.diff(permittivity) < 0)
+        assert isinstance(model.permittivity(1e9), float)
+        assert permittivity.shape == frequencies.shape
+
+    def test_03_load_files(self, tmp_path):
+        toml_file = tmp_path / "substrates.toml"
+        toml_file.write_text(
+            '[materials."Megtron 6"]\n'
+            "permittivity = 3.4\n"
+            "dielectric_loss_tangent = 0.002\n"
+            '[materials."Megtron 6".djordjevic_sarkar]\n'
+            "frequency = 10e9\n"
+        )
+        # Materials exported from AEDT keep the property values as strings
+        json_file = tmp_path / "aedt_materials.json"
+        json_file.write_text(
+            json.dumps(
+                {
+                    "materials": {
+                        "my_substrate": {"permittivity": "3.0", "dielectric_loss_tangent": "0.001"},
+                        "swept": {"permittivity": "2 + Freq / 1e9"},
+                    }
+                }
+            )
+        )
+        library = MaterialLibrary()
+
+        assert library.load(toml_file) == 1
+        assert library.load(json_file) == 1
+        assert library.get("megtron 6").permittivity_at(10e9) == pytest.approx(3.4)
+        assert library.get("megtron 6").permittivity_at(1e9) > 3.4
+        assert library.get("my_substrate").loss_tangent == 0.001
+        assert "swept" not in library
+
+        library.save(tmp_path / "saved.json")
+        loaded = MaterialLibrary()
+        loaded.load(tmp_path / "saved.json")
+        assert loaded.get("Megtron 6").dispersion.frequency == 10e9
+        assert load_material_library(toml_file) is load_material_library(toml_file)
+        assert "Megtron 6" in load_material_library(toml_file)
+
+    def test_04_synthesis_by_material_name(self):
+        default = synthesize_antenna("RectangularPatchProbe", Synthesis(frequency=2.4, material="FR4_epoxy"))
+        duroid = synthesize_antenna(
+            "RectangularPatchProbe", Synthesis(frequency=2.4, material="Rogers RT/duroid 5880 (tm)")
+        )
+        custom = synthesize_antenna(
+            "RectangularPatchProbe",
+            Synthesis(frequency=2.4, material="my_substrate", material_properties={"permittivity": 2.2}),
+        )
+
+        # A lower permittivity makes a larger patch, the library value matches the equivalent properties
+        assert duroid["patch_x"] > default["patch_x"]
+        assert duroid["patch_x"] == pytest.approx(custom["patch_x"])
+
+    def test_05_material_to_dict(self):
+        material = Material("substrate", 3.0, 0.001, dispersion=DjordjevicSarkar(3.0, 0.001))
+        loaded = Material.from_dict(material.name, material.to_dict())
+
+        assert loaded.permittivity_at(5e9) == pytest.approx(material.permittivity_at(5e9))
+        assert Material.from_dict("expression", {"permittivity": "eps_r"}) is None
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from ansys.aedt.toolkits.antenna.backend.synthesis import synthesize_antenna
+from ansys.aedt.toolkits.antenna.backend.synthesis import update_synthesis
+
+pytestmark = [pytest.mark.synthesis]
+
+
+class TestClass:
+    """Class defining a workflow to test the antenna synthesis without AEDT."""
+
+    def test_01_synthesize_antenna(self):
+        parameters = synthesize_antenna("BowTieNormal", Synthesis(frequency=2.4))
+
+        assert parameters
+        assert all(isinstance(value, (int, float, str)) for value in parameters.values())
+
+    def test_02_synthesis_properties(self):
+        synthesis = Synthesis(frequency=2.4, length_unit="cm")
+        oantenna = create_antenna("RectangularPatchProbe", synthesis)
+
+        assert oantenna.frequency == 2.4
+        assert oantenna.length_unit == "cm"
+        assert oantenna.object_list == {}
+
+    def test_03_frequency_sweep_antenna(self):
+        parameters = synthesize_antenna("Archimedean", Synthesis(frequency=2.4))
+
+        assert parameters
+
+    def test_04_update_synthesis(self):
+        synthesis = Synthesis()
+        updated = update_synthesis(synthesis, {"frequency": "2.4", "gain": 12, "unknown": 1})
+
+        assert updated.frequency == 2.4
+        assert updated.gain == 12.0
+        assert synthesis.frequency == 10.0
+        assert update_synthesis(synthesis, {"unknown": 1}) is synthesis
+        assert update_synthesis(synthesis, {"start_frequency": 1.0, "stop_frequency": 3.0}).frequency == 2.0
+        with pytest.raises(ValueError):
+            update_synthesis(synthesis, {"frequency": "high"})
+
+    def test_05_inputs_passed_at_once(self):
+        synthesis = Synthesis(frequency=2.4, substrate_height=0.8, material_properties={"permittivity": 2.2})
+        oantenna = create_antenna("RectangularPatchProbe", synthesis)
+
+        assert oantenna.substrate_height == 0.8
+        assert oantenna.material_properties["permittivity"] == 2.2
+        # Antennas without material inputs ignore them
+        assert create_antenna("WireDipole", synthesis).frequency == 2.4
+
+    def test_06_helix_direction(self):
+        assert create_antenna("AxialMode", Synthesis(direction="Right")).direction == 1
+        assert create_antenna("AxialMode", Synthesis(direction="Left")).direction == 0
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import math
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import StandardWaveguide
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import TransmissionLine
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+
+pytestmark = [pytest.mark.synthesis]
+
+
+class TestClass:
+    """Class defining a workflow to test the vectorized transmission line and waveguide calculators."""
+
+    def test_01_microstrip_arrays(self):
+        tl_calc = TransmissionLine()
+        width, length = tl_calc.microstrip_calculator(substrate_height=0.15, permittivity=4.4)
+        assert isinstance(width, float)
+        assert math.isclose(width, 0.2867789, rel_tol=1e-6)
+        assert math.isclose(length, 0.006849743, rel_tol=1e-6)
+
+        impedances = np.linspace(20.0, 120.0, 11)[:, None]
+        permittivities = np.array([2.2, 4.4, 10.2])
+        widths, lengths = tl_calc.microstrip_calculator(0.0008, permittivities, impedances)
+        assert widths.shape == (11, 3)
+        assert math.isclose(widths[3, 1], tl_calc.microstrip_calculator(0.0008, 4.4, impedances[3, 0])[0])
+        assert np.all(np.diff(widths, axis=0) < 0.0)
+        assert np.all(np.isfinite(lengths))
+
+    def test_02_microstrip_thickness_and_dispersion(self):
+        tl_calc = TransmissionLine(frequency=10)
+        width, length = tl_calc.microstrip_calculator(0.0008, 4.4, 50.0)
+        thick_width, _ = tl_calc.microstrip_calculator(0.0008, 4.4, 50.0, thickness=35e-6)
+        assert 0.9 * width < thick_width < width
+        assert np.isnan(tl_calc.microstrip_calculator(0.0008, 12.0, 120.0, thickness=35e-6)[0])
+
+        # The effective permittivity increases with the frequency towards the substrate permittivity
+        frequencies = [0.1, 10.0, 100.0, 1000.0]
+        effective = []
+        for frequency in frequencies:
+            tl_calc.frequency = frequency
+            length = tl_calc.microstrip_calculator(0.0008, 4.4, 50.0, dispersion=True)[1]
+            effective.append((math.radians(150.0) * 3.0e8 / (2.0 * math.pi * frequency * 1e9 * length)) ** 2)
+        assert np.all(np.diff(effective) > 0.0)
+        assert 3.0 < effective[0] < 3.5
+        assert effective[-1] == pytest.approx(4.4, rel=0.02)
+
+    def test_03_stripline_and_suspended_strip(self):
+        tl_calc = TransmissionLine()
+        widths = tl_calc.stripline_calculator(0.15, 4.4, np.array([50.0, 100.0]))
+        assert math.isclose(widths[1], 0.01211778667, rel_tol=1e-6)
+        assert math.isclose(widths[0], tl_calc.stripline_calculator(0.15, 4.4))
+
+        permittivities = np.array([2.2, 6.5, 12.0])
+        effective = tl_calc.suspended_strip_calculator(0.125, 0.125 / 80.0, 0.0008, permittivities)
+        for index, permittivity in enumerate(permittivities):
+            assert effective[index] == tl_calc.suspended_strip_calculator(0.125, 0.125 / 80.0, 0.0008, permittivity)
+        assert np.all(effective <= (permittivities + 1.0) / 2.0)
+
+    def test_04_waveguide_tables(self):
+        waveguide = StandardWaveguide()
+        assert math.isclose(waveguide.get_waveguide_dimensions("WR-2300", "cm")[0], 58.41999999, rel_tol=1e-6)
+        for units in ["mm", "meter", "mil"]:
+            expected = [unit_converter(value, "Length", "in", units) for value in waveguide.wg["WR-90"]]
+            assert waveguide.get_waveguide_dimensions("WR-90", units) == expected
+        dimensions = waveguide.get_waveguide_dimensions("WR-75")
+        dimensions[0] = 0.0
+        assert waveguide.get_waveguide_dimensions("WR-75")[0] == pytest.approx(19.05)
+        assert not waveguide.get_waveguide_dimensions("WR-0")
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import ansys.aedt.core.generic.constants as constants
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import conversion_factor
+from ansys.aedt.toolkits.antenna.backend.antenna_models.units import unit_converter
+
+pytestmark = [pytest.mark.synthesis]
+
+
+class TestClass:
+    """Class defining a workflow to test the unit conversions of the synthesis."""
+
+    @pytest.mark.parametrize(
+        "unit_system, input_units, output_units",
+        [("Length", "meter", "mm"), ("Length", "cm", "in"), ("Freq", "GHz", "Hz"), ("Angle", "deg", "rad")],
+    )
+    def test_01_same_as_pyaedt(self, unit_system, input_units, output_units):
+        for value in (0.0, 1.0, 0.0123, 2.4e9):
+            assert unit_converter(value, unit_system, input_units, output_units) == constants.unit_converter(
+                value, unit_system, input_units, output_units
+            )
+
+    def test_02_lists_and_arrays(self):
+        values = [0.001, 0.01, 0.1]
+
+        assert unit_converter(values) == [1.0, 10.0, 100.0]
+        converted = unit_converter(np.array(values), "Length", "meter", "cm")
+        assert isinstance(converted, np.ndarray)
+        assert np.allclose(converted, [0.1, 1.0, 10.0])
+
+    def test_03_factor_cache(self):
+        conversion_factor.cache_clear()
+        unit_converter(1.0, "Length", "meter", "mm")
+        unit_converter(2.0, "Length", "meter", "mm")
+
+        assert conversion_factor.cache_info().hits == 1
+        assert conversion_factor("Temperature", "cel", "kel") is None
+        assert conversion_factor("Length", "meter", "furlong") is None
+
+    def test_04_non_linear_units(self):
+        assert unit_converter(0.0, "Temperature", "cel", "kel") == constants.unit_converter(
+            0.0, "Temperature", "cel", "kel"
+        )
+        with pytest.warns(UserWarning):
+            assert unit_converter(1.0, "Length", "meter", "furlong") == 1.0
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from ansys.aedt.toolkits.antenna.backend.tracing import Tracer
+from ansys.aedt.toolkits.antenna.backend.tracing import traced
+from ansys.aedt.toolkits.antenna.backend.tracing import tracer
+from tests.benchmarks.fake_hfss import FakeHfss
+
+pytestmark = [pytest.mark.tracing]
+
+
+@pytest.fixture
+def enabled_tracer():
+    tracer.start()
+    yield tracer
+    tracer.stop()
+    tracer.reset()
+
+
+class TestClass:
+    """Class defining a workflow to test the tracing without AEDT."""
+
+    def test_01_disabled_tracer(self):
+        local_tracer = Tracer()
+
+        with local_tracer.span("disabled"):
+            pass
+
+        assert local_tracer.events == []
+
+    def test_02_nested_spans(self, tmp_path):
+        local_tracer = Tracer()
+        local_tracer.start()
+
+        with local_tracer.span("outer", "test", antenna="BowTieNormal"):
+            with local_tracer.span("inner", "test"):
+                pass
+
+        trace_file = local_tracer.export(tmp_path / "trace.json")
+        events = {event["name"]: event for event in json.loads(Path(trace_file).read_text())["traceEvents"]}
+
+        assert events["outer"]["args"] == {"antenna": "BowTieNormal"}
+        assert events["outer"]["ts"] <= events["inner"]["ts"]
+        assert events["inner"]["ts"] + events["inner"]["dur"] <= events["outer"]["ts"] + events["outer"]["dur"]
+
+    def test_03_traced_function(self, enabled_tracer):
+        @traced("function", "test")
+        def function(value):
+            return value * 2
+
+        assert function(2) == 4
+        assert [event["name"] for event in enabled_tracer.events] == ["function"]
+
+    def test_04_model_modeler_calls(self, enabled_tracer):
+        oantenna = create_antenna("BowTieNormal", Synthesis(frequency=2.4), FakeHfss())
+        oantenna.model_hfss()
+        names = [event["name"] for event in enabled_tracer.events]
+
+        assert "BowTieNormal.synthesis" in names
+        assert "CommonAntenna.set_variables_in_hfss" in names
+        assert "hfss.modeler.create_box" in names
+        assert "hfss.__setitem__" in names
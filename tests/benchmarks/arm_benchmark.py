@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import math
+import time
+
+import numpy as np
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import _arm_polygon
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import archimedean_arm
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import circular_arc
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import log_arm
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import sinuous_arm
+
+# Number of points of the arm edges
+SIZES = (1000, 10000, 100000)
+
+# Arm parameters of the default synthesis at 4 GHz to 10 GHz, in millimeters
+ARCHIMEDEAN = {"inner_radius": 4.77, "expansion_coefficient": 0.0159, "exponent": 1.0, "turns": 6.8, "offset": 90.0}
+LOG = {"inner_radius": 4.77, "expansion_coefficient": 1.24, "turns": 4.4, "offset": 90.0}
+SINUOUS = {"outer_radius": 21.5, "growth_rate": 0.84, "cells": 9, "alpha": 45.0, "delta": 22.5}
+
+
+def _spiral_samples(points, turns):
+    """Get the odd number of angles of a spiral edge and the angle step, as the spiral models do."""
+    n = int(points) + 1
+    if n % 2 == 0:
+        n += 1
+    n_per_turn = points / turns
+    step = math.radians(360.0 * (turns + 1.0 / n_per_turn)) / n
+    return n, step, max(1, int(n_per_turn / 4))
+
+
+def legacy_archimedean(points):
+    """Build the Archimedean arm polygon point by point, as the reference of the benchmark."""
+    inner_rad = ARCHIMEDEAN["inner_radius"]
+    a = ARCHIMEDEAN["expansion_coefficient"]
+    sc = ARCHIMEDEAN["exponent"]
+    offset = math.radians(ARCHIMEDEAN["offset"])
+    n, step, outer_facets = _spiral_samples(points, ARCHIMEDEAN["turns"])
+    phi = [i * step for i in range(n)]
+    num_points = int(2 * n + outer_facets)
+    positions = [None] * num_points
+    for i in range(n):
+        r = inner_rad + a * math.pow(phi[i], sc)
+        positions[i] = [r * math.cos(phi[i]), r * math.sin(phi[i]), 0]
+        j = n - i - 1
+        r2 = inner_rad + a * math.pow(phi[j], sc)
+        positions[i + n + outer_facets - 1] = [r2 * math.cos(phi[j] + offset), r2 * math.sin(phi[j] + offset), 0]
+    r_outer = inner_rad + a * math.pow(phi[n - 1], sc)
+    for k in range(1, outer_facets):
+        angle = phi[n - 1] + offset / outer_facets * k
+        positions[n + k - 1] = [r_outer * math.cos(angle), r_outer * math.sin(angle), 0]
+    positions[num_points - 1] = list(positions[0])
+    return positions
+
+
+def legacy_log(points):
+    """Build the logarithmic arm polygon point by point, as the reference of the benchmark."""
+    inner_rad = LOG["inner_radius"]
+    a = math.log(LOG["expansion_coefficient"]) / (2.0 * math.pi)
+    offset = math.radians(LOG["offset"])
+    n, step, outer_facets = _spiral_samples(points, LOG["turns"])
+    phi = [i * step for i in range(n)]
+    num_points = int(2 * n + outer_facets)
+    positions = [None] * num_points
+    for i in range(n):
+        r = inner_rad * math.exp(a * phi[i])
+        positions[i] = [r * math.cos(phi[i]), r * math.sin(phi[i]), 0]
+        j = n - i - 1
+        r2 = inner_rad * math.exp(a * phi[j])
+        positions[i + n + outer_facets - 1] = [r2 * math.cos(phi[j] + offset), r2 * math.sin(phi[j] + offset), 0]
+    r_outer = inner_rad * math.exp(a * phi[n - 1])
+    for k in range(1, outer_facets):
+        angle = phi[n - 1] + offset / outer_facets * k
+        positions[n + k - 1] = [r_outer * math.cos(angle), r_outer * math.sin(angle), 0]
+    positions[num_points - 1] = list(positions[0])
+    return positions
+
+
+def legacy_sinuous(points):
+    """Build the sinuous arm polygon point by point, as the reference of the benchmark."""
+    outer_rad = SINUOUS["outer_radius"]
+    t = SINUOUS["growth_rate"]
+    cells = SINUOUS["cells"]
+    alpha_rad = math.radians(SINUOUS["alpha"])
+    delta_rad = math.radians(SINUOUS["delta"])
+    step_size = outer_rad / points
+    rp = [0.0] * (cells + 1)
+    rp[0] = outer_rad
+    for i in range(1, cells):
+        rp[i] = rp[i - 1] * t
+    rp[cells] = rp[cells - 1]
+    phi1 = [0.0] * points
+    phi2 = [0.0] * points
+    rad = [0.0] * points
+    r = outer_rad
+    q = 0
+    for i in range(cells):
+        p = i + 1
+        while rp[i] >= r >= rp[i + 1]:
+            swing = ((-1.0) ** p) * alpha_rad * math.sin(math.log(r / rp[i]) / math.log(t) * math.pi)
+            phi1[q] = swing + delta_rad
+            phi2[q] = swing - delta_rad
+            rad[q] = r
+            r -= step_size
+            q += 1
+    outer_facets = 100
+    positions = []
+    for i in range(q):
+        positions.append([rad[i] * math.cos(phi1[i]), rad[i] * math.sin(phi1[i]), 0])
+    for i in range(q - 1, -1, -1):
+        positions.append([rad[i] * math.cos(phi2[i]), rad[i] * math.sin(phi2[i]), 0])
+    for k in range(1, outer_facets):
+        angle = -delta_rad + delta_rad / outer_facets * 2.0 * k
+        positions.append([outer_rad * math.cos(angle), outer_rad * math.sin(angle), 0])
+    positions.append(list(positions[0]))
+    return positions
+
+
+def vectorized_archimedean(points):
+    """Build the Archimedean arm polygon as an (N, 3) array with the vectorized generators."""
+    offset = math.radians(ARCHIMEDEAN["offset"])
+    n, step, outer_facets = _spiral_samples(points, ARCHIMEDEAN["turns"])
+    phi_end = step * (n - 1)
+    edge = archimedean_arm(
+        np.linspace(0.0, phi_end, n),
+        ARCHIMEDEAN["inner_radius"],
+        ARCHIMEDEAN["expansion_coefficient"],
+        ARCHIMEDEAN["exponent"],
+    )
+    tip = circular_arc(np.linspace(phi_end, phi_end + offset, outer_facets + 1), np.hypot(*edge[-1, :2]))
+    return _arm_polygon(edge, tip, offset)
+
+
+def vectorized_log(points):
+    """Build the logarithmic arm polygon as an (N, 3) array with the vectorized generators."""
+    offset = math.radians(LOG["offset"])
+    n, step, outer_facets = _spiral_samples(points, LOG["turns"])
+    phi_end = step * (n - 1)
+    growth = math.log(LOG["expansion_coefficient"]) / (2.0 * math.pi)
+    edge = log_arm(np.linspace(0.0, phi_end, n), LOG["inner_radius"], growth)
+    tip = circular_arc(np.linspace(phi_end, phi_end + offset, outer_facets + 1), np.hypot(*edge[-1, :2]))
+    return _arm_polygon(edge, tip, offset)
+
+
+def vectorized_sinuous(points):
+    """Build the sinuous arm polygon as an (N, 3) array with the vectorized generators."""
+    outer_rad = SINUOUS["outer_radius"]
+    t = SINUOUS["growth_rate"]
+    cells = SINUOUS["cells"]
+    delta_rad = math.radians(SINUOUS["delta"])
+    step_size = outer_rad / points
+    min_rp = outer_rad * math.pow(t, cells - 1)
+    max_phi = int(math.floor((outer_rad - min_rp) / step_size + 1e-9)) + 1
+    radius = outer_rad - step_size * np.arange(max_phi - 1, -1, -1)
+    edge = sinuous_arm(radius, outer_rad, t, cells, math.radians(SINUOUS["alpha"]), delta_rad)
+    tip = circular_arc(np.linspace(delta_rad, -delta_rad, 101), outer_rad)
+    return _arm_polygon(edge, tip, -2.0 * delta_rad)
+
+
+# Arm kernels, the planar spirals share them with the conical ones
+KERNELS = {
+    "Archimedean": (legacy_archimedean, vectorized_archimedean),
+    "Log": (legacy_log, vectorized_log),
+    "Sinuous": (legacy_sinuous, vectorized_sinuous),
+}
+
+
+def polygon_measures(positions):
+    """Get the number of vertices, the area and the perimeter of a closed polygon."""
+    points = np.asarray(positions, dtype=float)[:, :2]
+    x, y = points[:-1, 0], points[:-1, 1]
+    area = 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    perimeter = np.linalg.norm(np.diff(points, axis=0), axis=1).sum()
+    return len(points), float(area), float(perimeter)
+
+
+def _best(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1e3)
+    return round(min(timings), 3)
+
+
+def time_kernel(kernel, points, repeat=5):
+    """Time the legacy and the vectorized arm polygon of a kernel.
+
+    Parameters
+    ----------
+    kernel : str
+        Kernel name, a key of ``KERNELS``.
+    points : int
+        Number of points of the arm edges.
+    repeat : int, optional
+        Number of rounds. The default is ``5``.
+
+    Returns
+    -------
+    dict
+        Number of vertices, area and perimeter of both polygons, and best time in milliseconds
+        of the legacy polygon, of the vectorized array and of the vectorized array converted
+        to a point list for AEDT.
+    """
+    legacy, vectorized = KERNELS[kernel]
+    return {
+        "legacy": polygon_measures(legacy(points)),
+        "vectorized": polygon_measures(vectorized(points)),
+        "legacy_ms": _best(lambda: legacy(points), repeat),
+        "array_ms": _best(lambda: vectorized(points), repeat),
+        "vectorized_ms": _best(lambda: vectorized(points).tolist(), repeat),
+    }
+
+
+def run_arm_benchmark(kernels=None, sizes=SIZES, repeat=5):
+    """Time the arm kernels at each size.
+
+    Returns
+    -------
+    dict
+        Timings of each kernel for each number of points.
+    """
+    return {kernel: {points: time_kernel(kernel, points, repeat) for points in sizes} for kernel in kernels or KERNELS}
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<14s}{:>10s}{:>12s}{:>14s}{:>12s}{:>12s}{:>10s}".format(
+        "Kernel", "points", "vertices", "legacy ms", "array ms", "list ms", "speedup"
+    )
+    lines = [header, "-" * len(header)]
+    for kernel, result in results.items():
+        for points, timing in result.items():
+            lines.append(
+                "{:<14s}{:>10d}{:>12d}{:>14.2f}{:>12.2f}{:>12.2f}{:>9.1f}x".format(
+                    kernel,
+                    points,
+                    timing["vectorized"][0],
+                    timing["legacy_ms"],
+                    timing["array_ms"],
+                    timing["vectorized_ms"],
+                    timing["legacy_ms"] / timing["vectorized_ms"] if timing["vectorized_ms"] else 0.0,
+                )
+            )
+    lines.append("The list time includes the conversion of the array to the point list sent to AEDT.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time the legacy and vectorized arm polygon kernels.")
+    parser.add_argument("kernels", nargs="*", help="Kernel names. All the kernels by default.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Numbers of points of the edges.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing rounds.")
+    args = parser.parse_args()
+
+    print(format_report(run_arm_benchmark(args.kernels, args.sizes, args.repeat)))
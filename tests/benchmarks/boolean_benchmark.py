@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import time
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from tests.benchmarks.fake_hfss import BOOLEAN
+from tests.benchmarks.fake_hfss import CREATE
+from tests.benchmarks.fake_hfss import TRANSFORM
+from tests.benchmarks.fake_hfss import FakeHfss
+
+# Builders with one boolean per loop iteration, sized so that the loops are long
+CASES = {
+    "LogPeriodicToothed": {"tau_ratio": 0.9, "sigma_ratio": 0.95},
+    "LogPeriodicTrapezoidal": {"tau_ratio": 0.9, "sigma_ratio": 0.95},
+    "MbyNPatchArray": {"number_of_patches_x": 16, "number_of_patches_y": 16},
+    "SeqRotated2Patch": {},
+}
+
+
+def build_model(antenna, synthesis=None, deferred=True, latency=0.0):
+    """Build an antenna on a fake application, with deferred or immediate booleans.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    synthesis : dict, optional
+        Synthesis properties. The default is ``None``.
+    deferred : bool, optional
+        Whether the booleans are deferred. The default is ``True``.
+    latency : float, optional
+        Simulated time in seconds of each AEDT call. The default is ``0.0``.
+
+    Returns
+    -------
+    dict
+        Boolean operations, history nodes, round trips, build time and names of the final objects.
+    """
+    app = FakeHfss(latency=latency)
+    previous = CommonAntenna.defer_booleans
+    CommonAntenna.defer_booleans = deferred
+    try:
+        oantenna = create_antenna(antenna, Synthesis(name=antenna, **(synthesis or {})), app)
+        app.recorder.reset()
+        start = time.perf_counter()
+        oantenna.init_model()
+        oantenna.model_hfss()
+        elapsed = time.perf_counter() - start
+    finally:
+        CommonAntenna.defer_booleans = previous
+
+    counts = app.recorder.counts
+    return {
+        "booleans": counts[BOOLEAN],
+        # Every created, combined or transformed object adds a node to the modeler history
+        "history_nodes": counts[CREATE] + counts[BOOLEAN] + counts[TRANSFORM],
+        "round_trips": app.recorder.round_trips,
+        "elapsed": elapsed,
+        "objects": sorted(app.modeler.objects),
+    }
+
+
+def run_boolean_benchmark(cases=None, latency=0.0):
+    """Build each case with immediate and deferred booleans.
+
+    Returns
+    -------
+    dict
+        Results of each antenna class for the ``"immediate"`` and ``"deferred"`` builds.
+    """
+    return {
+        antenna: {
+            "immediate": build_model(antenna, synthesis, False, latency),
+            "deferred": build_model(antenna, synthesis, True, latency),
+        }
+        for antenna, synthesis in (cases or CASES).items()
+    }
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<28s}{:>16s}{:>18s}{:>18s}{:>20s}".format(
+        "Antenna", "booleans", "history nodes", "round trips", "build time ms"
+    )
+    lines = [header, "-" * len(header)]
+    for antenna, result in results.items():
+        immediate, deferred = result["immediate"], result["deferred"]
+        cells = [
+            "{:d} -> {:d}".format(immediate["booleans"], deferred["booleans"]),
+            "{:d} -> {:d}".format(immediate["history_nodes"], deferred["history_nodes"]),
+            "{:.0f} -> {:.0f}".format(immediate["round_trips"], deferred["round_trips"]),
+            "{:.1f} -> {:.1f}".format(1e3 * immediate["elapsed"], 1e3 * deferred["elapsed"]),
+        ]
+        lines.append("{:<28s}{:>16s}{:>18s}{:>18s}{:>20s}".format(antenna, *cells))
+    lines.append("Immediate booleans -> deferred booleans.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare immediate and deferred booleans of the model builders.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated time in seconds of each AEDT call.")
+    args = parser.parse_args()
+
+    print(format_report(run_boolean_benchmark(latency=args.latency)))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from tests.benchmarks.fake_hfss import CREATE
+from tests.benchmarks.fake_hfss import FakeHfss
+
+# Parameters of the taper, each one is referenced by the expressions of the taper edge
+UPDATES = {"taper_length": 1.05, "taper_width": 1.05, "slot_width": 0.95, "sub_y": 1.02}
+
+
+def update_timing(antenna="Vivaldi", points=100, equation_curves=True, latency=0.0, expression_latency=0.0):
+    """Build an antenna on a fake application and time ``update_hfss_parameters`` on its taper parameters.
+
+    Parameters
+    ----------
+    antenna : str, optional
+        Antenna class name. The default is ``"Vivaldi"``.
+    points : int, optional
+        Number of points of the taper. The default is ``100``.
+    equation_curves : bool, optional
+        Whether the taper is an equation-based curve or a polyline. The default is ``True``.
+    latency : float, optional
+        Simulated time in seconds of each AEDT call. The default is ``0.0``.
+    expression_latency : float, optional
+        Simulated time in seconds to evaluate one geometry expression again. The default is ``0.0``.
+
+    Returns
+    -------
+    dict
+        Geometry expressions, created objects, expressions evaluated again by the updates and update time.
+    """
+    from ansys.aedt.toolkits.antenna.backend.api import ToolkitBackend
+
+    app = FakeHfss(latency=latency, expression_latency=expression_latency)
+    previous = CommonAntenna.equation_curves, CommonAntenna.chord_tolerance
+    # The taper keeps the given number of points instead of adapting them to the wavelength
+    CommonAntenna.equation_curves, CommonAntenna.chord_tolerance = equation_curves, None
+    try:
+        oantenna = create_antenna(antenna, Synthesis(name=antenna), app)
+        oantenna.synthesis_parameters.number_of_points.value = points
+        oantenna.init_model()
+        oantenna.model_hfss()
+    finally:
+        CommonAntenna.equation_curves, CommonAntenna.chord_tolerance = previous
+    created = app.recorder.counts[CREATE]
+
+    toolkit = ToolkitBackend()
+    toolkit.properties.antenna.synthesis.length_unit = oantenna.length_unit
+    app.recorder.reset()
+    start = time.perf_counter()
+    for key, ratio in UPDATES.items():
+        toolkit.aedtapp = app
+        assert toolkit.update_hfss_parameters(key, str(getattr(oantenna.synthesis_parameters, key).value * ratio))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "expressions": len(app.expressions),
+        "created": created,
+        "evaluations": app.recorder.evaluations,
+        "elapsed": elapsed / len(UPDATES),
+    }
+
+
+def run_curve_benchmark(points=100, latency=0.0, expression_latency=0.0):
+    """Time the taper updates of a Vivaldi with polyline and equation-based tapers.
+
+    Returns
+    -------
+    dict
+        Results of the ``"polyline"`` and ``"equation"`` tapers.
+    """
+    return {
+        "polyline": update_timing("Vivaldi", points, False, latency, expression_latency),
+        "equation": update_timing("Vivaldi", points, True, latency, expression_latency),
+    }
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<10s}{:>14s}{:>18s}{:>24s}{:>20s}".format(
+        "Taper", "expressions", "created objects", "evaluations per update", "update time ms"
+    )
+    lines = [header, "-" * len(header)]
+    for taper, result in results.items():
+        lines.append(
+            "{:<10s}{:>14d}{:>18d}{:>24.1f}{:>20.2f}".format(
+                taper,
+                result["expressions"],
+                result["created"],
+                result["evaluations"] / len(UPDATES),
+                1e3 * result["elapsed"],
+            )
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare polyline and equation-based Vivaldi tapers.")
+    parser.add_argument("--points", type=int, default=100, help="Number of points of the taper.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated time in seconds of each AEDT call.")
+    parser.add_argument(
+        "--expression-latency",
+        type=float,
+        default=0.0,
+        help="Simulated time in seconds to evaluate one geometry expression again.",
+    )
+    args = parser.parse_args()
+
+    print(format_report(run_curve_benchmark(args.points, args.latency, args.expression_latency)))
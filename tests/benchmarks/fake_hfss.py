@@ -0,0 +1,772 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from collections import Counter
+import itertools
+import logging
+import re
+import time
+
+# Call categories
+CREATE = "create"
+BOOLEAN = "boolean"
+TRANSFORM = "transform"
+PROPERTY = "property"
+QUERY = "query"
+VARIABLE = "variable"
+MATERIAL = "material"
+BOUNDARY = "boundary"
+VIEW = "view"
+
+CATEGORIES = (CREATE, BOOLEAN, TRANSFORM, PROPERTY, QUERY, VARIABLE, MATERIAL, BOUNDARY, VIEW)
+
+# Relative cost of one call of each category, in round trips
+ROUND_TRIP_COST = {
+    CREATE: 1.0,
+    BOOLEAN: 2.0,
+    TRANSFORM: 1.0,
+    PROPERTY: 1.0,
+    QUERY: 1.0,
+    VARIABLE: 1.0,
+    MATERIAL: 1.0,
+    BOUNDARY: 1.0,
+    VIEW: 1.0,
+}
+
+DEFAULT_MATERIALS = {
+    "vacuum": (1.0, False),
+    "air": (1.0006, False),
+    "pec": (1.0, True),
+    "copper": (1.0, True),
+    "aluminum": (1.0, True),
+    "FR4_epoxy": (4.4, False),
+    "Rogers RT/duroid 5880 (tm)": (2.2, False),
+    "Duroid (tm)": (2.2, False),
+    "Teflon (tm)": (2.1, False),
+    "polystyrene": (2.6, False),
+}
+
+# Each fake application has its own project, so that the design indexes of the toolkit are not shared
+_PROJECT_NUMBERS = itertools.count(1)
+
+
+class CallRecorder(object):
+    """Records the calls made to the fake application."""
+
+    def __init__(self):
+        self.calls = []
+        self.counts = Counter()
+        self.elapsed = 0.0
+        self.evaluations = 0
+
+    def record(self, category, name):
+        self.calls.append((category, name))
+        self.counts[category] += 1
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    @property
+    def round_trips(self):
+        return sum(ROUND_TRIP_COST[category] * count for category, count in self.counts.items())
+
+    def summary(self):
+        summary = {category: self.counts.get(category, 0) for category in CATEGORIES}
+        summary["total"] = self.total
+        summary["round_trips"] = self.round_trips
+        return summary
+
+    def reset(self):
+        self.calls = []
+        self.counts = Counter()
+        self.evaluations = 0
+
+
+def _record(category):
+    """Record each call of the decorated method."""
+
+    def decorator(func):
+        def wrapper(self, *args, **kwargs):
+            self._recorder.record(category, func.__name__)
+            if category == CREATE and isinstance(self, FakeModeler):
+                self._app._track_expressions(args, kwargs)
+            return func(self, *args, **kwargs)
+
+        wrapper.__name__ = func.__name__
+        return wrapper
+
+    return decorator
+
+
+class FakeEdge(object):
+    _ids = itertools.count(1000)
+
+    def __init__(self):
+        self.id = next(self._ids)
+        self.midpoint = [0.0, 0.0, 0.0]
+        self.length = 1.0
+
+
+class FakeFace(object):
+    _ids = itertools.count(10)
+
+    def __init__(self, num_edges=4):
+        self.id = next(self._ids)
+        self.center = [0.0, 0.0, 0.0]
+        self.area = 1.0
+        self.edges = [FakeEdge() for _ in range(num_edges)]
+
+
+class FakeObject(object):
+    """Fake 3D object. Setting a public attribute is a property round trip."""
+
+    _tracked = ("color", "transparency", "group_name", "material_name", "solve_inside", "name", "display_wireframe")
+
+    def __init__(self, app, name, object_type="Solid", material="vacuum"):
+        object.__setattr__(self, "_app", app)
+        object.__setattr__(self, "_recorder", app._recorder)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "object_type", object_type)
+        object.__setattr__(self, "material_name", material)
+        object.__setattr__(self, "color", (143, 175, 143))
+        object.__setattr__(self, "transparency", 0.0)
+        object.__setattr__(self, "group_name", "")
+        object.__setattr__(self, "solve_inside", False)
+
+    def __setattr__(self, key, value):
+        """Record the assignment of the properties that AEDT updates."""
+        if key in self._tracked:
+            self._recorder.record(PROPERTY, key)
+            if key == "name":
+                self._app.modeler._rename(self.name, value)
+        object.__setattr__(self, key, value)
+
+    def __repr__(self):
+        """Get the object representation."""
+        return "FakeObject({})".format(self.name)
+
+    @property
+    def faces(self):
+        self._recorder.record(QUERY, "faces")
+        num_faces = 1 if self.object_type == "Sheet" else 6
+        return [FakeFace(2 if i == 0 else 4) for i in range(num_faces)]
+
+    @property
+    def edges(self):
+        self._recorder.record(QUERY, "edges")
+        return [FakeEdge() for _ in range(4)]
+
+    @property
+    def vertices(self):
+        self._recorder.record(QUERY, "vertices")
+        return []
+
+    @property
+    def touching_objects(self):
+        self._recorder.record(QUERY, "touching_objects")
+        # AEDT looks for the bodies at each vertex, edge midpoint and face center of the object
+        edges = self.edges
+        for point in [edge.midpoint for edge in edges] * 2 + [face.center for face in self.faces]:
+            self._app.modeler.get_bodynames_from_position(point)
+        return []
+
+    @property
+    def bounding_box(self):
+        self._recorder.record(QUERY, "bounding_box")
+        return [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+
+    @property
+    def bottom_face_x(self):
+        self._recorder.record(QUERY, "bottom_face_x")
+        return FakeFace()
+
+    @property
+    def top_face_x(self):
+        self._recorder.record(QUERY, "top_face_x")
+        return FakeFace()
+
+    @property
+    def bottom_face_y(self):
+        self._recorder.record(QUERY, "bottom_face_y")
+        return FakeFace()
+
+    @property
+    def top_face_y(self):
+        self._recorder.record(QUERY, "top_face_y")
+        return FakeFace()
+
+    @property
+    def bottom_face_z(self):
+        self._recorder.record(QUERY, "bottom_face_z")
+        return FakeFace()
+
+    @property
+    def top_face_z(self):
+        self._recorder.record(QUERY, "top_face_z")
+        return FakeFace()
+
+    @_record(TRANSFORM)
+    def move(self, vector):
+        return self
+
+    @_record(TRANSFORM)
+    def rotate(self, axis, angle=90.0, units="deg"):
+        return self
+
+    @_record(TRANSFORM)
+    def mirror(self, origin, vector, duplicate=False):
+        return self
+
+    @_record(TRANSFORM)
+    def duplicate_around_axis(self, axis, angle=90, clones=2, create_new_objects=True, **kwargs):
+        return [self._app.modeler._add(self.name, self.object_type).name for _ in range(clones - 1)]
+
+    @_record(TRANSFORM)
+    def duplicate_along_line(self, vector, clones=2, attach=False, **kwargs):
+        return [self._app.modeler._add(self.name, self.object_type).name for _ in range(clones - 1)]
+
+    @_record(CREATE)
+    def sweep_along_vector(self, sweep_vector, draft_angle=0, draft_type="Round"):
+        self.object_type = "Solid"
+        return self
+
+    @_record(CREATE)
+    def sweep_around_axis(self, axis, sweep_angle=360, draft_angle=0, number_of_segments=0):
+        object.__setattr__(self, "object_type", "Solid")
+        return self
+
+    @_record(BOOLEAN)
+    def subtract(self, tool_list, keep_originals=True):
+        self._app.modeler._boolean_tools(tool_list, keep_originals)
+        return self
+
+    @_record(BOOLEAN)
+    def unite(self, unite_list):
+        self._app.modeler._boolean_tools(unite_list, False)
+        return self
+
+    def split(self, plane, sides="Both"):
+        return self._app.modeler.split(self, plane, sides)
+
+    @_record(BOOLEAN)
+    def intersect(self, theList, keep_originals=False):  # noqa: N803
+        self._app.modeler._boolean_tools(theList, keep_originals)
+        return self
+
+    @_record(QUERY)
+    def history(self):
+        return self
+
+    @_record(PROPERTY)
+    def set_property_value(self, property_name, property_value):
+        return True
+
+    @_record(BOOLEAN)
+    def delete(self):
+        self._app.modeler._remove(self.name)
+
+
+class FakeEditor(object):
+    """Fake ``oEditor`` with the native calls used by the models."""
+
+    def __init__(self, app):
+        self._app = app
+        self._recorder = app._recorder
+
+    @_record(QUERY)
+    def GetObjectsInGroup(self, group):  # noqa: N802
+        return [name for name, obj in self._app.modeler.objects.items() if obj.group_name == group]
+
+    @_record(BOOLEAN)
+    def Delete(self, selections):  # noqa: N802
+        for name in selections[2].split(","):
+            self._app.modeler._remove(name)
+        return True
+
+
+class FakeModeler(object):
+    """Fake 3D modeler."""
+
+    def __init__(self, app):
+        self._app = app
+        self._recorder = app._recorder
+        self.objects = {}
+        self.model_units = "mm"
+        self.oeditor = FakeEditor(app)
+        self._counters = Counter()
+
+    def __getitem__(self, name):
+        """Get an object by name."""
+        self._recorder.record(QUERY, "__getitem__")
+        if isinstance(name, FakeObject):
+            return name
+        return self.objects.get(name)
+
+    def _unique_name(self, name):
+        if name not in self.objects:
+            return name
+        self._counters[name] += 1
+        while "{}_{}".format(name, self._counters[name]) in self.objects:
+            self._counters[name] += 1
+        return "{}_{}".format(name, self._counters[name])
+
+    def _add(self, name, object_type, material="vacuum"):
+        obj = FakeObject(self._app, self._unique_name(name), object_type, material)
+        self.objects[obj.name] = obj
+        return obj
+
+    def _create(self, prefix, object_type, name=None, material=None):
+        if not name:
+            self._counters[prefix] += 1
+            name = "{}{}".format(prefix, self._counters[prefix])
+        return self._add(name, object_type, material or "vacuum")
+
+    def _rename(self, old_name, new_name):
+        obj = self.objects.pop(old_name, None)
+        if obj is not None:
+            self.objects[new_name] = obj
+
+    def _remove(self, name):
+        self.objects.pop(_object_name(name), None)
+
+    def _boolean_tools(self, tools, keep_originals):
+        if not keep_originals:
+            for tool in _as_list(tools):
+                self._remove(tool)
+
+    # Primitives
+
+    @_record(CREATE)
+    def create_box(self, origin, sizes, name=None, material=None, **kwargs):
+        return self._create("Box", "Solid", name, material)
+
+    @_record(CREATE)
+    def create_cylinder(self, orientation, origin, radius, height, num_sides=0, name=None, material=None, **kwargs):
+        return self._create("Cylinder", "Solid", name, material)
+
+    @_record(CREATE)
+    def create_cone(self, orientation, origin, bottom_radius, top_radius, height, name=None, material=None, **kwargs):
+        return self._create("Cone", "Solid", name, material)
+
+    @_record(CREATE)
+    def create_rectangle(self, orientation, origin, sizes, name=None, material=None, **kwargs):
+        return self._create("Rectangle", "Sheet", name, material)
+
+    @_record(CREATE)
+    def create_circle(
+        self, orientation, origin, radius, num_sides=0, is_covered=True, name=None, material=None, **kwargs
+    ):
+        return self._create("Circle", "Sheet", name, material)
+
+    @_record(CREATE)
+    def create_ellipse(
+        self, orientation, origin, major_radius, ratio, is_covered=True, name=None, material=None, **kwargs
+    ):
+        return self._create("Ellipse", "Sheet", name, material)
+
+    @_record(CREATE)
+    def create_polyline(self, points, segment_type=None, cover_surface=False, name=None, material=None, **kwargs):
+        object_type = "Sheet" if cover_surface else "Line"
+        if kwargs.get("xsection_type") not in (None, "None"):
+            object_type = "Solid"
+        return self._create("Polyline", object_type, name, material)
+
+    @_record(CREATE)
+    def create_equationbased_curve(self, x_t=0, y_t=0, z_t=0, t_start=0, t_end=1, num_points=0, name=None, **kwargs):
+        return self._create("EquationCurve", "Line", name)
+
+    @_record(CREATE)
+    def create_udp(self, dll, parameters, library="syslib", name=None, **kwargs):
+        return self._create("UDP", "Solid", name)
+
+    @_record(CREATE)
+    def create_object_from_edge(self, assignment, non_model=False):
+        return self._create("Edge", "Line")
+
+    @_record(CREATE)
+    def create_object_from_face(self, assignment, non_model=False):
+        return self._create("Face", "Sheet")
+
+    @_record(CREATE)
+    def thicken_sheet(self, assignment, thickness, both_sides=False):
+        obj = self.objects.get(_object_name(assignment))
+        object.__setattr__(obj, "object_type", "Solid")
+        return obj
+
+    @_record(CREATE)
+    def sweep_along_vector(self, assignment, sweep_vector, draft_angle=0, draft_type="Round"):
+        return self.objects.get(_object_name(assignment))
+
+    @_record(CREATE)
+    def create_3dcomponent(self, output_file, name=None, **kwargs):
+        return True
+
+    @_record(CREATE)
+    def replace_3dcomponent(self, name=None, **kwargs):
+        return self._create(name or "Component", "Solid")
+
+    # Booleans
+
+    @_record(BOOLEAN)
+    def subtract(self, blank_list, tool_list, keep_originals=True, **kwargs):
+        self._boolean_tools(tool_list, keep_originals)
+        return True
+
+    @_record(BOOLEAN)
+    def unite(self, assignment, purge=False, keep_originals=False):
+        names = [_object_name(item) for item in _as_list(assignment)]
+        self._boolean_tools(names[1:], keep_originals)
+        return names[0]
+
+    @_record(BOOLEAN)
+    def intersect(self, assignment, keep_originals=False, **kwargs):
+        names = [_object_name(item) for item in _as_list(assignment)]
+        self._boolean_tools(names[1:], keep_originals)
+        return names[0]
+
+    @_record(BOOLEAN)
+    def connect(self, assignment):
+        names = [_object_name(item) for item in _as_list(assignment)]
+        self._boolean_tools(names[1:], False)
+        return self.objects.get(names[0])
+
+    @_record(BOOLEAN)
+    def split(self, assignment, plane=None, sides="Both", **kwargs):
+        names = []
+        for item in _as_list(assignment):
+            names.append(_object_name(item))
+            if sides == "Both":
+                obj = self.objects.get(_object_name(item))
+                names.append(self._add(_object_name(item) + "_Split", obj.object_type if obj else "Solid").name)
+        return names
+
+    @_record(BOOLEAN)
+    def delete(self, assignment=None):
+        for item in _as_list(assignment):
+            self._remove(item)
+        return True
+
+    # Transformations
+
+    @_record(TRANSFORM)
+    def move(self, assignment, vector):
+        return True
+
+    @_record(TRANSFORM)
+    def rotate(self, assignment, axis, angle=90.0, units="deg"):
+        return True
+
+    @_record(TRANSFORM)
+    def duplicate_along_line(self, assignment, vector, clones=2, attach=False, **kwargs):
+        names = []
+        for item in _as_list(assignment):
+            obj = self.objects.get(_object_name(item))
+            object_type = obj.object_type if obj else "Solid"
+            names.extend(self._add(_object_name(item), object_type).name for _ in range(clones - 1))
+        return True, names
+
+    @_record(TRANSFORM)
+    def duplicate_and_mirror(self, assignment, origin, vector, **kwargs):
+        return [self._add(_object_name(item), "Solid").name for item in _as_list(assignment)]
+
+    # Queries
+
+    @_record(QUERY)
+    def get_edgeid_from_position(self, position, assignment=None, units=None):
+        return next(FakeEdge._ids)
+
+    @_record(QUERY)
+    def get_faceid_from_position(self, position, assignment=None, units=None):
+        return next(FakeFace._ids)
+
+    @_record(QUERY)
+    def get_bodynames_from_position(self, position, units=None, include_non_model=True):
+        return []
+
+    @_record(QUERY)
+    def get_group_bounding_box(self, group):
+        return [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+
+    @_record(TRANSFORM)
+    def cover_lines(self, assignment):
+        obj = self.objects.get(_object_name(assignment))
+        object.__setattr__(obj, "object_type", "Sheet")
+        return True
+
+    @_record(QUERY)
+    def get_objects_by_name(self, assignment, case_sensitive=True):
+        return [obj for name, obj in self.objects.items() if assignment in name]
+
+    @_record(QUERY)
+    def get_object_from_name(self, assignment):
+        return self.objects.get(assignment)
+
+    # View
+
+    @_record(VIEW)
+    def fit_all(self):
+        return True
+
+    @_record(VIEW)
+    def set_working_coordinate_system(self, name):
+        return True
+
+
+class FakeMaterial(object):
+    class Value(object):  # noqa: D106
+        def __init__(self, value):
+            self.value = value
+
+    def __init__(self, name, permittivity=1.0, conductor=False):
+        self.name = name
+        self.permittivity = self.Value(permittivity)
+        self.conductivity = self.Value(5.8e7 if conductor else 0.0)
+        self.dielectric_loss_tangent = self.Value(0.0)
+        self._conductor = conductor
+
+    def is_conductor(self):
+        return self._conductor
+
+
+class FakeMaterials(object):
+    """Fake material library."""
+
+    def __init__(self, app):
+        self._recorder = app._recorder
+        self._materials = {name.lower(): FakeMaterial(name, *values) for name, values in DEFAULT_MATERIALS.items()}
+
+    @property
+    def mat_names_aedt(self):
+        self._recorder.record(MATERIAL, "mat_names_aedt")
+        return [material.name for material in self._materials.values()]
+
+    @property
+    def mat_names_aedt_lower(self):
+        self._recorder.record(MATERIAL, "mat_names_aedt_lower")
+        return list(self._materials)
+
+    def __getitem__(self, name):
+        """Get a material by name."""
+        self._recorder.record(MATERIAL, "__getitem__")
+        return self._materials.get(name.lower())
+
+    @_record(MATERIAL)
+    def exists_material(self, material):
+        return self._materials.get(material.lower(), False)
+
+    @_record(MATERIAL)
+    def add_material(self, name, properties=None):
+        self._materials[name.lower()] = FakeMaterial(name)
+        return self._materials[name.lower()]
+
+
+class FakeBoundary(object):
+    def __init__(self, name, boundary_type):
+        self.name = name
+        self.type = boundary_type
+        self.props = {}
+
+
+class FakeVariable(object):
+    def __init__(self, expression):
+        self.expression = str(expression)
+
+    @property
+    def numeric_value(self):
+        match = re.match(r"\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?", self.expression)
+        return float(match.group(0)) if match else 0.0
+
+
+class FakeVariableManager(object):
+    def __init__(self, recorder):
+        self._recorder = recorder
+        self._variables = {}
+
+    def __getitem__(self, name):
+        """Get a variable by name."""
+        self._recorder.record(VARIABLE, "__getitem__")
+        return FakeVariable(self._variables[name])
+
+    @property
+    def variables(self):
+        self._recorder.record(VARIABLE, "variables")
+        return {name: FakeVariable(value) for name, value in self._variables.items()}
+
+    @property
+    def independent_variable_names(self):
+        self._recorder.record(VARIABLE, "independent_variable_names")
+        return list(self._variables)
+
+
+class FakeHfss(object):
+    """Fake ``Hfss`` application that records every AEDT round trip.
+
+    Calls are recorded by category so that the benchmarks can count them without a license. Objects are
+    named like AEDT names them, and booleans and duplicates update the object list, which keeps the models
+    working when they look objects up by name.
+
+    Parameters
+    ----------
+    solution_type : str, optional
+        Solution type. The default is ``"Modal"``.
+    latency : float, optional
+        Simulated time in seconds of each call. The default is ``0.0``.
+    expression_latency : float, optional
+        Simulated time in seconds to evaluate one geometry expression again when a design variable
+        that it depends on changes. The default is ``0.0``.
+    """
+
+    def __init__(self, solution_type="Modal", latency=0.0, expression_latency=0.0):
+        self._recorder = CallRecorder()
+        self._latency = latency
+        self._expression_latency = expression_latency
+        # Expressions of the created geometry, AEDT evaluates them again when a variable changes
+        self.expressions = []
+        self.logger = logging.getLogger("FakeHfss")
+        self.modeler = FakeModeler(self)
+        self.materials = FakeMaterials(self)
+        self.variable_manager = FakeVariableManager(self._recorder)
+        self.oeditor = self.modeler.oeditor
+        self.working_directory = "."
+        self.project_name = "Project{}".format(next(_PROJECT_NUMBERS))
+        self.design_name = "HFSSDesign1"
+        self.boundaries = []
+        self._solution_type = solution_type
+        if latency:
+            self._recorder.record = self._delayed(self._recorder.record)
+
+    def _delayed(self, record):
+        def delayed_record(category, name):
+            time.sleep(self._latency)
+            record(category, name)
+
+        return delayed_record
+
+    @property
+    def recorder(self):
+        """Call recorder."""
+        return self._recorder
+
+    @property
+    def solution_type(self):
+        self._recorder.record(QUERY, "solution_type")
+        return self._solution_type
+
+    @solution_type.setter
+    def solution_type(self, value):
+        self._recorder.record(PROPERTY, "solution_type")
+        self._solution_type = value
+
+    def __setitem__(self, name, value):
+        """Set a design variable."""
+        self._recorder.record(VARIABLE, "__setitem__")
+        if name in self.variable_manager._variables:
+            self._evaluate_dependents(name)
+        self.variable_manager._variables[name] = value
+
+    def _track_expressions(self, *values):
+        for value in values:
+            if isinstance(value, str):
+                self.expressions.append(value)
+            elif isinstance(value, dict):
+                self._track_expressions(*[item for key, item in value.items() if key not in ("name", "material")])
+            elif isinstance(value, (list, tuple)):
+                self._track_expressions(*value)
+
+    def _evaluate_dependents(self, name):
+        variable = re.compile(r"\b{}\b".format(re.escape(name)))
+        count = sum(1 for expression in self.expressions if variable.search(expression))
+        self._recorder.evaluations += count
+        if self._expression_latency:
+            time.sleep(self._expression_latency * count)
+
+    def release_desktop(self, close_projects=True, close_on_exit=True):
+        return True
+
+    def __getitem__(self, name):
+        """Get a design variable."""
+        self._recorder.record(VARIABLE, "__getitem__")
+        return self.variable_manager._variables[name]
+
+    @_record(QUERY)
+    def get_oo_object(self, aedt_object, object_name):
+        return self.modeler.objects.get(object_name)
+
+    @_record(PROPERTY)
+    def set_oo_property_value(self, aedt_object, object_name, prop_name, value):
+        return True
+
+    def _boundary(self, name, boundary_type):
+        boundary = FakeBoundary(name or "{}{}".format(boundary_type, len(self.boundaries) + 1), boundary_type)
+        self.boundaries.append(boundary)
+        return boundary
+
+    @_record(BOUNDARY)
+    def create_open_region(self, frequency="1GHz", boundary="Radiation", **kwargs):
+        return True
+
+    @_record(BOUNDARY)
+    def assign_perfecte_to_sheets(self, assignment, name="", **kwargs):
+        return self._boundary(name, "PerfectE")
+
+    @_record(BOUNDARY)
+    def assign_radiation_boundary_to_objects(self, assignment, name=None):
+        return self._boundary(name, "Radiation")
+
+    @_record(BOUNDARY)
+    def lumped_port(self, assignment=None, reference=None, name=None, **kwargs):
+        boundary = self._boundary(name, "Lumped Port")
+        boundary.props = {"Objects": [assignment], "Reference": reference}
+        return boundary
+
+    @_record(BOUNDARY)
+    def wave_port(self, assignment, reference=None, name=None, **kwargs):
+        return self._boundary(name, "Wave Port")
+
+    @_record(BOUNDARY)
+    def assign_lattice_pair(self, assignment, name=None, **kwargs):
+        return self._boundary(name, "Lattice Pair")
+
+    @_record(BOUNDARY)
+    def edit_sources(self, assignment, **kwargs):
+        return True
+
+    @_record(MATERIAL)
+    def change_material_override(self, material_override=True):
+        return True
+
+
+def _as_list(assignment):
+    if assignment is None:
+        return []
+    if isinstance(assignment, (list, tuple)):
+        return list(assignment)
+    if isinstance(assignment, str):
+        return assignment.split(",")
+    return [assignment]
+
+
+def _object_name(item):
+    return item.name if isinstance(item, FakeObject) else str(item)
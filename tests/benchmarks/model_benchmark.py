@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+from pathlib import Path
+import time
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from tests.benchmarks.fake_hfss import CATEGORIES
+from tests.benchmarks.fake_hfss import FakeHfss
+
+MODEL_STEPS = ("init_model", "model_hfss", "setup_hfss")
+
+# Calls of each antenna class in the last accepted run
+BASELINE_FILE = Path(__file__).parent / "baselines" / "model_calls.json"
+
+
+def antenna_classes():
+    """Get the antenna classes exported by ``antenna_models``."""
+    return sorted(name for name, value in vars(antenna_models).items() if isinstance(value, type))
+
+
+def benchmark_model(antenna, synthesis=None):
+    """Run one antenna class through the HFSS model steps on a fake application.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    synthesis : :class:`ansys.aedt.toolkits.antenna.backend.models.Synthesis`, optional
+        Synthesis properties. The default is ``None``, in which case the antenna default input parameters
+        are used.
+
+    Returns
+    -------
+    dict
+        Calls per category for each step, total calls, round trips and elapsed time.
+    """
+    app = FakeHfss()
+    recorder = app.recorder
+    result = {"antenna": antenna, "steps": {}}
+
+    start = time.perf_counter()
+    if synthesis:
+        oantenna = create_antenna(antenna, synthesis, app)
+    else:
+        oantenna = getattr(antenna_models, antenna)(app)
+        oantenna.update_synthesis_parameters(oantenna.synthesis())
+    result["steps"]["synthesis"] = recorder.summary()
+    recorder.reset()
+
+    for step in MODEL_STEPS:
+        getattr(oantenna, step)()
+        result["steps"][step] = recorder.summary()
+        recorder.reset()
+
+    result["elapsed"] = time.perf_counter() - start
+    result["objects"] = len(app.modeler.objects)
+    result["calls"] = {category: sum(step[category] for step in result["steps"].values()) for category in CATEGORIES}
+    result["total"] = sum(step["total"] for step in result["steps"].values())
+    result["round_trips"] = sum(step["round_trips"] for step in result["steps"].values())
+    return result
+
+
+def run_model_benchmark(antennas=None):
+    """Run every antenna class through the HFSS model steps.
+
+    Parameters
+    ----------
+    antennas : list, optional
+        Antenna class names. The default is ``None``, in which case all classes are run.
+
+    Returns
+    -------
+    dict
+        Benchmark result of each antenna class.
+    """
+    return {antenna: benchmark_model(antenna) for antenna in antennas or antenna_classes()}
+
+
+def load_baseline():
+    """Load the accepted calls of each antenna class."""
+    if not BASELINE_FILE.is_file():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def save_baseline(results):
+    """Store the calls of each antenna class as the new baseline."""
+    baseline = {antenna: {"calls": result["calls"], "total": result["total"]} for antenna, result in results.items()}
+    BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<32s}".format("Antenna") + "".join("{:>10s}".format(category) for category in CATEGORIES)
+    header += "{:>8s}{:>13s}".format("total", "round trips")
+    lines = [header, "-" * len(header)]
+    for antenna, result in results.items():
+        line = "{:<32s}".format(antenna) + "".join("{:>10d}".format(result["calls"][c]) for c in CATEGORIES)
+        line += "{:>8d}{:>13.0f}".format(result["total"], result["round_trips"])
+        lines.append(line)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Count AEDT calls of every antenna model.")
+    parser.add_argument("antennas", nargs="*", help="Antenna class names. All classes by default.")
+    parser.add_argument("--output", help="JSON file to store the results.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = parser.parse_args()
+
+    benchmark_results = run_model_benchmark(args.antennas)
+    print(format_report(benchmark_results))
+    if args.output:
+        Path(args.output).write_text(json.dumps(benchmark_results, indent=2))
+    if args.update_baseline:
+        save_baseline({**load_baseline(), **benchmark_results})
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import copy
+import time
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.parameters import InputParameters
+from ansys.aedt.toolkits.antenna.backend.antenna_models.parameters import SynthesisParameters
+from tests.benchmarks.synthesis_benchmark import antenna_classes
+from tests.benchmarks.synthesis_benchmark import synthesis_cases
+from tests.benchmarks.synthesis_benchmark import synthesize
+
+
+class LegacyInputParameters(object):
+    """Previous input parameters container, kept as the reference of the microbenchmark."""
+
+    __isfrozen = False
+
+    def __init__(self, default_parameters):
+        self.__default_properties = copy.deepcopy(default_parameters)
+        for key, value in self.__default_properties.items():
+            setattr(self, key, copy.deepcopy(value))
+        self.__isfrozen = True
+
+    def __setattr__(self, key, value):
+        """Prevent adding attributes after the object is frozen."""
+        if self.__isfrozen and key not in dir(self):
+            raise AttributeError("{} is a frozen class. This key does not exist: {}".format(type(self).__name__, key))
+        object.__setattr__(self, key, value)
+
+
+class LegacyProperty:
+    """Previous synthesis parameter container, kept as the reference of the microbenchmark."""
+
+    def __init__(self, value, owner, name):
+        self.value = value
+        self._owner = owner
+        self._name = name
+
+
+class LegacySynthesisParameters:
+    """Previous synthesis parameters storage, kept as the reference of the microbenchmark."""
+
+    def add_parameter(self, name, value):
+        setattr(self, name, LegacyProperty(copy.deepcopy(value), self, name))
+
+
+IMPLEMENTATIONS = {
+    "current": (InputParameters, SynthesisParameters),
+    "legacy": (LegacyInputParameters, LegacySynthesisParameters),
+}
+
+
+def largest_antennas(count=5):
+    """Get the antenna classes with the most input and synthesis parameters.
+
+    Parameters
+    ----------
+    count : int, optional
+        Number of antenna classes. The default is ``5``.
+
+    Returns
+    -------
+    list
+        Antenna class names, largest first.
+    """
+    sizes = {}
+    for antenna in antenna_classes():
+        oantenna = synthesize(antenna, synthesis_cases(antenna)[0])
+        sizes[antenna] = len(oantenna._default_input_parameters) + len(oantenna.synthesis_parameters.__dict__)
+    return sorted(sizes, key=lambda name: (-sizes[name], name))[:count]
+
+
+def _best(function, repeat, number):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+    return round(min(timings), 3)
+
+
+def time_parameters(antenna, implementation="current", repeat=5, number=200):
+    """Time the parameter containers of an antenna class.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    implementation : str, optional
+        ``"current"`` or ``"legacy"`` containers. The default is ``"current"``.
+    repeat : int, optional
+        Number of rounds. The default is ``5``.
+    number : int, optional
+        Number of operations per round. The default is ``200``.
+
+    Returns
+    -------
+    dict
+        Best time in microseconds to construct the input parameters, to set every input parameter
+        once frozen and to add every synthesis parameter.
+    """
+    input_class, synthesis_class = IMPLEMENTATIONS[implementation]
+    oantenna = synthesize(antenna, synthesis_cases(antenna)[0])
+    defaults = oantenna._default_input_parameters
+    synthesized = {
+        name: parameter.value
+        for name, parameter in oantenna.synthesis_parameters.__dict__.items()
+        if hasattr(parameter, "value")
+    }
+    input_parameters = input_class(defaults)
+
+    def set_inputs():
+        for key, value in defaults.items():
+            setattr(input_parameters, key, value)
+
+    def add_synthesis():
+        synthesis_parameters = synthesis_class()
+        for key, value in synthesized.items():
+            synthesis_parameters.add_parameter(key, value)
+
+    return {
+        "inputs": len(defaults),
+        "synthesis": len(synthesized),
+        "construct_us": _best(lambda: input_class(defaults), repeat, number),
+        "set_us": _best(set_inputs, repeat, number),
+        "add_us": _best(add_synthesis, repeat, number),
+    }
+
+
+def run_parameters_benchmark(antennas=None, repeat=5, number=200):
+    """Time the current and legacy parameter containers of the largest antenna classes.
+
+    Returns
+    -------
+    dict
+        Timings of each implementation for each antenna class.
+    """
+    return {
+        antenna: {
+            implementation: time_parameters(antenna, implementation, repeat, number)
+            for implementation in IMPLEMENTATIONS
+        }
+        for antenna in antennas or largest_antennas()
+    }
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<32s}{:>8s}{:>8s}{:>16s}{:>16s}{:>16s}".format(
+        "Antenna", "inputs", "synth", "construct us", "set us", "add us"
+    )
+    lines = [header, "-" * len(header)]
+    for antenna, result in results.items():
+        current, legacy = result["current"], result["legacy"]
+        cells = [
+            "{:.1f} ({:.1f}x)".format(current[key], legacy[key] / current[key] if current[key] else 0.0)
+            for key in ("construct_us", "set_us", "add_us")
+        ]
+        lines.append(
+            "{:<32s}{:>8d}{:>8d}{:>16s}{:>16s}{:>16s}".format(antenna, current["inputs"], current["synthesis"], *cells)
+        )
+    lines.append("Speedup against the legacy containers in parentheses.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time the parameter containers of the largest antenna classes.")
+    parser.add_argument("antennas", nargs="*", help="Antenna class names. The five largest classes by default.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing rounds.")
+    parser.add_argument("--number", type=int, default=200, help="Number of operations per round.")
+    args = parser.parse_args()
+
+    print(format_report(run_parameters_benchmark(args.antennas, args.repeat, args.number)))
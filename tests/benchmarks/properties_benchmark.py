@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import antenna_parameters
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from ansys.aedt.toolkits.antenna.backend.synthesis import update_synthesis
+
+# Synthesis properties sent by a client for each call
+SYNTHESIS_VALUES = {
+    "frequency": 2.4,
+    "frequency_unit": "GHz",
+    "length_unit": "mm",
+    "substrate_height": 0.8,
+    "material_properties": {"permittivity": 2.2},
+    "origin": [1.0, 2.0, 0.0],
+    "gain": 12.0,
+}
+
+
+def legacy_update_synthesis(synthesis, values):
+    """Assign the synthesis properties one by one, as the previous backend did."""
+    for key, value in values.items():
+        if hasattr(synthesis, key):
+            setattr(synthesis, key, value)
+    return synthesis
+
+
+def legacy_create_antenna(antenna, synthesis):
+    """Create an antenna with the default inputs and apply each synthesis property with its setter."""
+    oantenna = getattr(antenna_models, antenna)(
+        None, frequency_unit=synthesis.frequency_unit, length_unit=synthesis.length_unit
+    )
+    for antenna_prop in type(synthesis).model_fields:
+        if antenna_prop == "frequency" and "start_frequency" in dir(oantenna) and "stop_frequency" in dir(oantenna):
+            pass
+        elif antenna_prop == "material_properties":
+            if synthesis.material_properties:
+                oantenna.material_properties["permittivity"] = synthesis.material_properties["permittivity"]
+        elif getattr(synthesis, antenna_prop):
+            setattr(oantenna, antenna_prop, getattr(synthesis, antenna_prop))
+    oantenna._parameters = oantenna.synthesis()
+    oantenna.update_synthesis_parameters(oantenna._parameters)
+    return oantenna
+
+
+IMPLEMENTATIONS = {
+    "current": (update_synthesis, create_antenna),
+    "legacy": (legacy_update_synthesis, legacy_create_antenna),
+}
+
+
+def _best(function, repeat, number):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+    return round(min(timings), 2)
+
+
+def time_synthesis_call(antenna, implementation="current", values=None, repeat=5, number=100):
+    """Time the update of the synthesis properties and the synthesis of one API call.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    implementation : str, optional
+        ``"current"`` bulk update or ``"legacy"`` per-property update. The default is ``"current"``.
+    values : dict, optional
+        Synthesis properties of the call. The default is ``None``, in which case
+        ``SYNTHESIS_VALUES`` is used.
+    repeat : int, optional
+        Number of rounds. The default is ``5``.
+    number : int, optional
+        Number of calls per round. The default is ``100``.
+
+    Returns
+    -------
+    dict
+        Best time in microseconds to update the synthesis properties, and to update them and
+        synthesize the antenna.
+    """
+    update, create = IMPLEMENTATIONS[implementation]
+    values = values or SYNTHESIS_VALUES
+
+    synthesis = Synthesis()
+
+    def call():
+        return antenna_parameters(create(antenna, update(synthesis, values)))
+
+    return {
+        "update_us": _best(lambda: update(synthesis, values), repeat, number),
+        "call_us": _best(call, repeat, number),
+    }
+
+
+def run_properties_benchmark(
+    antennas=("RectangularPatchProbe", "BowTieNormal", "SeqRotated2Patch"), repeat=5, number=100
+):
+    """Time the current and legacy synthesis calls of some antenna classes.
+
+    Returns
+    -------
+    dict
+        Timings of each implementation for each antenna class.
+    """
+    return {
+        antenna: {
+            implementation: time_synthesis_call(antenna, implementation, repeat=repeat, number=number)
+            for implementation in IMPLEMENTATIONS
+        }
+        for antenna in antennas
+    }
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<32s}{:>20s}{:>20s}".format("Antenna", "update us", "call us")
+    lines = [header, "-" * len(header)]
+    for antenna, result in results.items():
+        current, legacy = result["current"], result["legacy"]
+        cells = [
+            "{:.1f} ({:.1f}x)".format(current[key], legacy[key] / current[key]) for key in ("update_us", "call_us")
+        ]
+        lines.append("{:<32s}{:>20s}{:>20s}".format(antenna, *cells))
+    lines.append("Speedup against the per-property updates in parentheses.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time the synthesis properties update of one API call.")
+    parser.add_argument("antennas", nargs="*", help="Antenna class names.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing rounds.")
+    parser.add_argument("--number", type=int, default=100, help="Number of calls per round.")
+    args = parser.parse_args()
+
+    antenna_names = args.antennas or ("RectangularPatchProbe", "BowTieNormal", "SeqRotated2Patch")
+    print(format_report(run_properties_benchmark(antenna_names, args.repeat, args.number)))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.common import CommonAntenna
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from tests.benchmarks.fake_hfss import FakeHfss
+
+# Antennas with sampled curves, and whether their smooth edges are equation-based curves
+CASES = {
+    "Archimedean": True,
+    "Log": True,
+    "Sinuous": True,
+    "PlanarArchimedean": True,
+    "PlanarLog": True,
+    "PlanarSinuous": True,
+    "Vivaldi": True,
+    "Vivaldi (polygon)": False,
+}
+
+
+def sample_model(antenna, chord_tolerance, equation_curves=True):
+    """Build an antenna on a fake application and get the sampling of its curves.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    chord_tolerance : float
+        Chord deviation tolerance as a fraction of the wavelength. ``None`` samples the
+        curves evenly with the number of points of the synthesis.
+    equation_curves : bool, optional
+        Whether smooth edges are equation-based curves. The default is ``True``.
+
+    Returns
+    -------
+    dict
+        Vertex count, largest chord deviation and tolerance of each curve.
+    """
+    previous = CommonAntenna.chord_tolerance, CommonAntenna.equation_curves
+    CommonAntenna.chord_tolerance = chord_tolerance
+    CommonAntenna.equation_curves = equation_curves
+    try:
+        oantenna = create_antenna(antenna, Synthesis(name=antenna), FakeHfss())
+        oantenna.init_model()
+        oantenna.model_hfss()
+    finally:
+        CommonAntenna.chord_tolerance, CommonAntenna.equation_curves = previous
+    return oantenna.curve_samples
+
+
+def run_sampling_benchmark(cases=None, chord_tolerance=CommonAntenna.chord_tolerance):
+    """Sample the curves of each case evenly and adaptively.
+
+    Returns
+    -------
+    dict
+        Curve reports of each case for the ``"even"`` and ``"adaptive"`` sampling.
+    """
+    results = {}
+    for case, equation_curves in (cases or CASES).items():
+        antenna = case.split()[0]
+        results[case] = {
+            "even": sample_model(antenna, None, equation_curves),
+            "adaptive": sample_model(antenna, chord_tolerance, equation_curves),
+        }
+    return results
+
+
+def format_report(results):
+    """Format the benchmark results as a table."""
+    header = "{:<20s}{:<10s}{:>16s}{:>26s}{:>14s}".format("Antenna", "curve", "vertices", "max deviation", "tolerance")
+    lines = [header, "-" * len(header)]
+    for case, result in results.items():
+        for curve, adaptive in result["adaptive"].items():
+            even = result["even"][curve]
+            cells = [
+                "{:d} -> {:d}".format(even["vertices"], adaptive["vertices"]),
+                "{:.2e} -> {:.2e}".format(even["max_deviation"], adaptive["max_deviation"]),
+                "{:.2e}".format(adaptive["tolerance"]),
+            ]
+            lines.append("{:<20s}{:<10s}{:>16s}{:>26s}{:>14s}".format(case, curve, *cells))
+    lines.append("Even sampling of the synthesis -> adaptive sampling. Lengths in the model units.")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare even and adaptive sampling of the model curves.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=CommonAntenna.chord_tolerance,
+        help="Chord deviation tolerance as a fraction of the wavelength at the highest frequency.",
+    )
+    args = parser.parse_args()
+
+    print(format_report(run_sampling_benchmark(chord_tolerance=args.tolerance)))
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import itertools
+import json
+import os
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+
+# Synthesis grid
+FREQUENCIES = (0.5, 2.4, 10.0, 28.0)
+LENGTH_UNITS = ("mm", "cm", "meter")
+PERMITTIVITIES = (1.0, 2.2, 4.4)
+
+# Accepted synthesis time and allocations of each antenna class
+BASELINE_FILE = Path(__file__).parent / "baselines" / "synthesis.json"
+
+# Allowed slowdown and allocation growth compared with the baseline
+TIME_THRESHOLD = float(os.environ.get("ANTENNA_BENCHMARK_TIME_THRESHOLD", "2.5"))
+MEMORY_THRESHOLD = float(os.environ.get("ANTENNA_BENCHMARK_MEMORY_THRESHOLD", "1.5"))
+
+
+def antenna_classes():
+    """Get the antenna classes exported by ``antenna_models``."""
+    return sorted(name for name, value in vars(antenna_models).items() if isinstance(value, type))
+
+
+def synthesis_cases(antenna):
+    """Get the input parameters of every synthesis case of an antenna class.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+
+    Returns
+    -------
+    list
+        Keyword arguments of the antenna class for each frequency, length unit and permittivity.
+    """
+    defaults = getattr(antenna_models, antenna)._default_input_parameters
+    permittivities = PERMITTIVITIES if "material_properties" in defaults else (None,)
+    cases = []
+    for frequency, length_unit, permittivity in itertools.product(FREQUENCIES, LENGTH_UNITS, permittivities):
+        case = {"length_unit": length_unit}
+        if "frequency" in defaults:
+            case["frequency"] = frequency
+        else:
+            case["start_frequency"] = frequency / 2
+            case["stop_frequency"] = frequency * 2
+        if permittivity:
+            case["material_properties"] = {"permittivity": permittivity}
+        cases.append(case)
+    return cases
+
+
+def synthesize(antenna, case):
+    """Create an antenna without AEDT and synthesize it."""
+    oantenna = getattr(antenna_models, antenna)(None, **case)
+    oantenna.update_synthesis_parameters(oantenna.synthesis())
+    return oantenna
+
+
+def calibrate(repeat=5):
+    """Time a fixed Python workload, used to compare timings measured on different machines.
+
+    Returns
+    -------
+    float
+        Best time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        values = {}
+        for i in range(20000):
+            values[str(i)] = float(i) ** 0.5
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def time_synthesis(antenna, repeat=5):
+    """Time the construction and synthesis of an antenna class over the synthesis grid.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+    repeat : int, optional
+        Number of rounds. The default is ``5``.
+
+    Returns
+    -------
+    dict
+        Best and median time per synthesis in microseconds.
+    """
+    cases = synthesis_cases(antenna)
+    # Warm up caches and lazy imports
+    synthesize(antenna, cases[0])
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for case in cases:
+            synthesize(antenna, case)
+        timings.append((time.perf_counter() - start) / len(cases) * 1e6)
+    return {"best_us": round(min(timings), 2), "median_us": round(statistics.median(timings), 2), "cases": len(cases)}
+
+
+def memory_synthesis(antenna):
+    """Measure the allocations of one synthesis with ``tracemalloc``.
+
+    Parameters
+    ----------
+    antenna : str
+        Antenna class name.
+
+    Returns
+    -------
+    dict
+        Peak traced memory in bytes and number of memory blocks allocated and still alive after the synthesis.
+    """
+    case = synthesis_cases(antenna)[0]
+    synthesize(antenna, case)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        oantenna = synthesize(antenna, case)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    statistics_diff = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in statistics_diff if stat.count_diff > 0)
+    del oantenna
+    return {"peak_bytes": peak, "blocks": blocks}
+
+
+def run_synthesis_benchmark(antennas=None, repeat=5):
+    """Run the time and memory benchmarks of the antenna classes.
+
+    Parameters
+    ----------
+    antennas : list, optional
+        Antenna class names. The default is ``None``, in which case all classes are run.
+    repeat : int, optional
+        Number of timing rounds. The default is ``5``.
+
+    Returns
+    -------
+    dict
+        Calibration time and benchmark results of each antenna class.
+    """
+    results = {"calibration": calibrate(), "antennas": {}}
+    for antenna in antennas or antenna_classes():
+        results["antennas"][antenna] = {**time_synthesis(antenna, repeat), **memory_synthesis(antenna)}
+    return results
+
+
+def load_baseline():
+    """Load the accepted benchmark results."""
+    if not BASELINE_FILE.is_file():
+        return {}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def save_baseline(results):
+    """Store the benchmark results as the new baseline."""
+    baseline = load_baseline()
+    baseline["calibration"] = results["calibration"]
+    baseline.setdefault("antennas", {}).update(results["antennas"])
+    BASELINE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def check_regression(antenna, result, calibration, baseline):
+    """Compare one antenna class with the baseline.
+
+    Timings are scaled by the ratio of the calibration times, so that a baseline stored on one machine
+    can be checked on another one.
+
+    Returns
+    -------
+    list
+        Regression messages. The list is empty when the antenna class is within the thresholds.
+    """
+    accepted = baseline.get("antennas", {}).get(antenna)
+    if not accepted:
+        return []
+
+    messages = []
+    scale = calibration / baseline["calibration"]
+    allowed_time = accepted["best_us"] * scale * TIME_THRESHOLD
+    if result["best_us"] > allowed_time:
+        messages.append(
+            "{} synthesis takes {:.1f} us, more than {:.1f} us allowed".format(antenna, result["best_us"], allowed_time)
+        )
+    allowed_blocks = accepted["blocks"] * MEMORY_THRESHOLD
+    if result["blocks"] > allowed_blocks:
+        messages.append(
+            "{} synthesis allocates {} blocks, more than {:.0f} allowed".format(
+                antenna, result["blocks"], allowed_blocks
+            )
+        )
+    return messages
+
+
+def format_report(results, baseline=None):
+    """Format the benchmark results as a table."""
+    baseline = baseline or {}
+    accepted = baseline.get("antennas", {})
+    scale = results["calibration"] / baseline["calibration"] if baseline else 1.0
+    header = "{:<32s}{:>7s}{:>12s}{:>12s}{:>10s}{:>12s}{:>10s}".format(
+        "Antenna", "cases", "best us", "median us", "vs base", "peak KiB", "blocks"
+    )
+    lines = [header, "-" * len(header)]
+    for antenna, result in results["antennas"].items():
+        ratio = "-"
+        if antenna in accepted:
+            ratio = "{:.2f}x".format(result["best_us"] / (accepted[antenna]["best_us"] * scale))
+        lines.append(
+            "{:<32s}{:>7d}{:>12.1f}{:>12.1f}{:>10s}{:>12.1f}{:>10d}".format(
+                antenna,
+                result["cases"],
+                result["best_us"],
+                result["median_us"],
+                ratio,
+                result["peak_bytes"] / 1024,
+                result["blocks"],
+            )
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Time and measure the synthesis of every antenna class.")
+    parser.add_argument("antennas", nargs="*", help="Antenna class names. All classes by default.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timing rounds.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = parser.parse_args()
+
+    benchmark_results = run_synthesis_benchmark(args.antennas, args.repeat)
+    print(format_report(benchmark_results, load_baseline()))
+    if args.update_baseline:
+        save_baseline(benchmark_results)
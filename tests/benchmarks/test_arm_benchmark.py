@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import math
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import archimedean_arm
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import circular_arc
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import log_arm
+from ansys.aedt.toolkits.antenna.backend.antenna_models.conical_spiral import sinuous_arm
+from tests.benchmarks.arm_benchmark import KERNELS
+from tests.benchmarks.arm_benchmark import time_kernel
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def test_arm_generators():
+    phi = np.linspace(0.0, 4.0 * math.pi, 9)
+
+    archimedean = archimedean_arm(phi, 1.0, 0.5, 1.0)
+    assert archimedean.shape == (9, 3)
+    assert np.allclose(np.hypot(archimedean[:, 0], archimedean[:, 1]), 1.0 + 0.5 * phi)
+    assert not archimedean[:, 2].any()
+
+    logarithmic = log_arm(phi, 1.0, 0.1)
+    assert np.allclose(np.hypot(logarithmic[:, 0], logarithmic[:, 1]), np.exp(0.1 * phi))
+
+    arc = circular_arc(phi, 2.0)
+    assert np.allclose(np.arctan2(arc[:, 1], arc[:, 0]), np.arctan2(np.sin(phi), np.cos(phi)))
+
+    # The sinuous edge is at the offset angle at every cell boundary
+    boundaries = 10.0 * 0.8 ** np.arange(4)
+    sinuous = sinuous_arm(boundaries, 10.0, 0.8, 4, math.radians(45.0), math.radians(20.0))
+    assert np.allclose(np.arctan2(sinuous[:, 1], sinuous[:, 0]), math.radians(20.0))
+
+
+@pytest.mark.parametrize("kernel", sorted(KERNELS))
+def test_arm_benchmark(kernel):
+    # The timings are reported by the benchmark script, they are not compared on shared runners
+    result = time_kernel(kernel, 10000, repeat=1)
+
+    assert result["vectorized"] == pytest.approx(result["legacy"], rel=1e-9)
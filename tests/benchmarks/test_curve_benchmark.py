@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import ParametricCurve
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import polygon_points
+from tests.benchmarks.curve_benchmark import UPDATES
+from tests.benchmarks.curve_benchmark import update_timing
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def test_parametric_curve_points():
+    curve = ParametricCurve("2*_t", "sub_t+_t", "0", 0, 1, reverse=True)
+
+    # Variable names that contain the parameter name are not substituted
+    assert curve.point("x") == ["2*(x)", "sub_t+(x)", "0"]
+    assert curve.start == ["2*(1)", "sub_t+(1)", "0"]
+    points = polygon_points([curve, ["0", "0", "0"]], 4)
+    assert len(points) == 6
+    assert [eval(coordinate.replace("sub_t", "0")) for coordinate in points[1][:2]] == [1.5, 0.75]
+
+
+def test_equation_taper_update():
+    polyline = update_timing(points=100, equation_curves=False)
+    equation = update_timing(points=100, equation_curves=True)
+
+    assert polyline["evaluations"] >= 100 * len(UPDATES)
+    assert equation["evaluations"] < polyline["evaluations"] / 10
+    assert equation["expressions"] < polyline["expressions"] / 5
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend import antenna_models
+from ansys.aedt.toolkits.antenna.backend.antenna_models.design_index import design_index
+from tests.benchmarks.fake_hfss import MATERIAL
+from tests.benchmarks.fake_hfss import QUERY
+from tests.benchmarks.fake_hfss import VARIABLE
+from tests.benchmarks.fake_hfss import FakeHfss
+from tests.benchmarks.model_benchmark import MODEL_STEPS
+from tests.benchmarks.model_benchmark import antenna_classes
+from tests.benchmarks.model_benchmark import benchmark_model
+from tests.benchmarks.model_benchmark import load_baseline
+
+pytestmark = [pytest.mark.benchmark]
+
+BASELINE = load_baseline()
+
+
+@pytest.mark.parametrize("antenna", antenna_classes())
+def test_model_calls(antenna):
+    result = benchmark_model(antenna)
+
+    assert result["objects"] > 0
+    assert all(result["steps"][step]["total"] >= 0 for step in MODEL_STEPS)
+    # AEDT calls must not grow compared with the accepted baseline
+    if antenna in BASELINE:
+        assert result["total"] <= BASELINE[antenna]["total"], result["calls"]
+
+
+def _modeled_antenna(antenna):
+    app = FakeHfss()
+    oantenna = getattr(antenna_models, antenna)(app)
+    oantenna.update_synthesis_parameters(oantenna.synthesis())
+    oantenna.init_model()
+    oantenna.model_hfss()
+    app.recorder.reset()
+    return app, oantenna
+
+
+@pytest.mark.parametrize("antenna", antenna_classes())
+def test_declared_port_references(antenna):
+    app, oantenna = _modeled_antenna(antenna)
+    ports = [name for name in oantenna.object_list if "port_lump_" in name]
+
+    for port in ports:
+        assert oantenna.port_references[port]
+        assert all(reference in oantenna.object_list for reference in oantenna.port_references[port])
+
+    assert oantenna.setup_hfss()
+    assert (QUERY, "touching_objects") not in app.recorder.calls
+
+
+def test_port_references_fallback():
+    app, oantenna = _modeled_antenna("PlanarDipole")
+    port = next(name for name in oantenna.object_list if "port_lump_" in name)
+    assert oantenna.port_references[port] == ["ant_arm_1"]
+
+    # References that are no longer antenna objects are found from the geometry
+    oantenna.port_references[port] = ["deleted_arm"]
+    assert oantenna.setup_hfss()
+    assert (QUERY, "touching_objects") in app.recorder.calls
+
+
+def test_design_index_shared_by_antennas():
+    app = FakeHfss()
+    first = antenna_models.PlanarDipole(app, name="dipole")
+    first.update_synthesis_parameters(first.synthesis())
+    first.init_model()
+    first.model_hfss()
+    app.recorder.reset()
+
+    # The second antenna reads the group, variables, and materials from the index of the design
+    second = antenna_models.PlanarDipole(app, name="dipole")
+    second.update_synthesis_parameters(second.synthesis())
+    second.init_model()
+    second.model_hfss()
+
+    # Only the group of the new name is read, the used one is found in the index
+    assert second.name != "dipole"
+    assert app.recorder.calls.count((QUERY, "GetObjectsInGroup")) == 1
+    assert app.recorder.counts[MATERIAL] == 0
+    assert (VARIABLE, "variables") not in app.recorder.calls
+    assert design_index(app).queries_avoided > 0
+
+
+def test_design_index_refresh():
+    app = FakeHfss()
+    index = design_index(app)
+    assert not index.group_objects("outside")
+    assert not index.has_material("new_dielectric")
+
+    # Materials are read again when they are missing, groups only after a refresh
+    app.modeler.create_box([0, 0, 0], [1, 1, 1], name="box").group_name = "outside"
+    app.materials.add_material("new_dielectric")
+    assert index.has_material("New_Dielectric")
+    assert not index.group_objects("outside")
+
+    index.refresh()
+    assert index.group_objects("outside") == {"box"}
+
+
+def test_design_index_variables():
+    app = FakeHfss()
+    app["length"] = "1mm"
+    index = design_index(app)
+    assert index.is_independent_variable("length")
+
+    index.add_variable("width", "2mm")
+    index.add_variable("length", "2*width")
+    app.recorder.reset()
+    assert index.is_independent_variable("width")
+    assert "length" in index.variable_names()
+    assert not app.recorder.calls
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.parameters import InputParameters
+from ansys.aedt.toolkits.antenna.backend.antenna_models.parameters import SynthesisParameters
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from tests.benchmarks.parameters_benchmark import LegacyInputParameters
+from tests.benchmarks.parameters_benchmark import LegacySynthesisParameters
+from tests.benchmarks.parameters_benchmark import largest_antennas
+from tests.benchmarks.parameters_benchmark import time_parameters
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def test_input_parameters_copy_on_write():
+    defaults = {"frequency": 10.0, "origin": [0, 0, 0], "material_properties": {"permittivity": 4.4}}
+    first = InputParameters(defaults)
+    second = InputParameters(defaults)
+
+    first.origin[0] = 1
+    first.material_properties["permittivity"] = 2.2
+    first.frequency = 2.4
+
+    assert second.origin == [0, 0, 0]
+    assert second.material_properties == {"permittivity": 4.4}
+    assert defaults["origin"] == [0, 0, 0]
+    assert second.frequency == 10.0
+    with pytest.raises(AttributeError):
+        first.unknown = 1
+
+
+def test_synthesis_parameters_slots():
+    synthesis_parameters = SynthesisParameters()
+    synthesis_parameters.name = "patch"
+    synthesis_parameters.add_parameter("length", 1.5)
+
+    assert synthesis_parameters.length.hfss_variable == "length_patch"
+    with pytest.raises(AttributeError):
+        synthesis_parameters.length.unit = "mm"
+
+
+@pytest.mark.parametrize("antenna", largest_antennas(count=2))
+def test_parameters_match_legacy(antenna):
+    oantenna = create_antenna(antenna, Synthesis())
+    defaults = oantenna._default_input_parameters
+    current = InputParameters(defaults)
+    legacy = LegacyInputParameters(defaults)
+
+    assert {key: getattr(current, key) for key in defaults} == {key: getattr(legacy, key) for key in defaults}
+
+    synthesis_parameters = SynthesisParameters()
+    legacy_synthesis_parameters = LegacySynthesisParameters()
+    for name, parameter in oantenna.synthesis_parameters.__dict__.items():
+        if hasattr(parameter, "value"):
+            synthesis_parameters.add_parameter(name, parameter.value)
+            legacy_synthesis_parameters.add_parameter(name, parameter.value)
+            assert getattr(synthesis_parameters, name).value == getattr(legacy_synthesis_parameters, name).value
+
+
+@pytest.mark.parametrize("antenna", largest_antennas(count=2))
+def test_parameters_benchmark(antenna):
+    # The timings are reported by the benchmark script, they are not compared on shared runners
+    current = time_parameters(antenna, "current", repeat=1, number=1)
+    legacy = time_parameters(antenna, "legacy", repeat=1, number=1)
+
+    assert current["inputs"] == legacy["inputs"]
+    assert current["synthesis"] == legacy["synthesis"]
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.models import Synthesis
+from ansys.aedt.toolkits.antenna.backend.synthesis import antenna_parameters
+from ansys.aedt.toolkits.antenna.backend.synthesis import create_antenna
+from tests.benchmarks.properties_benchmark import SYNTHESIS_VALUES
+from tests.benchmarks.properties_benchmark import legacy_create_antenna
+from tests.benchmarks.properties_benchmark import time_synthesis_call
+
+pytestmark = [pytest.mark.benchmark]
+
+
+@pytest.mark.parametrize("antenna", ["BowTieNormal", "RectangularPatchProbe"])
+def test_bulk_update_matches_legacy(antenna):
+    synthesis = Synthesis(**SYNTHESIS_VALUES)
+
+    assert antenna_parameters(create_antenna(antenna, synthesis)) == antenna_parameters(
+        legacy_create_antenna(antenna, synthesis)
+    )
+
+
+def test_properties_benchmark():
+    # The timings are reported by the benchmark script, they are not compared on shared runners
+    current = time_synthesis_call("BowTieNormal", "current", repeat=1, number=1)
+    legacy = time_synthesis_call("BowTieNormal", "legacy", repeat=1, number=1)
+
+    assert current.keys() == legacy.keys() == {"update_us", "call_us"}
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+
+import numpy as np
+import pytest
+
+from ansys.aedt.toolkits.antenna.backend.antenna_models.curves import sample_curve
+from tests.benchmarks.sampling_benchmark import CASES
+from tests.benchmarks.sampling_benchmark import run_sampling_benchmark
+
+pytestmark = [pytest.mark.benchmark]
+
+
+def circle(t):
+    return np.cos(t), np.sin(t)
+
+
+def test_sample_curve():
+    even = sample_curve(circle, 0.0, math.pi, segments=10)
+    assert even.vertex_count == 11
+    assert even.max_deviation == pytest.approx(1.0 - math.cos(math.pi / 20.0), rel=1e-3)
+
+    adaptive = sample_curve(circle, 0.0, math.pi, tolerance=1e-3)
+    assert adaptive.max_deviation <= 1e-3
+    # The sagitta of the arc gives the fewest even segments within the tolerance
+    assert adaptive.vertex_count - 1 <= 1.3 * math.pi / (2.0 * math.acos(1.0 - 1e-3))
+
+    kinked = sample_curve(lambda t: (t, np.abs(t - 0.3)), 0.0, 1.0, tolerance=1e-6, segments=4, breaks=[0.3])
+    assert 0.3 in kinked.parameters
+    assert kinked.vertex_count == 6
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_adaptive_sampling(case):
+    result = run_sampling_benchmark({case: CASES[case]})[case]
+
+    for curve, adaptive in result["adaptive"].items():
+        assert adaptive["max_deviation"] <= adaptive["tolerance"]
+        assert adaptive["vertices"] < result["even"][curve]["vertices"]
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2023 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from tests.benchmarks.synthesis_benchmark import antenna_classes
+from tests.benchmarks.synthesis_benchmark import calibrate
+from tests.benchmarks.synthesis_benchmark import check_regression
+from tests.benchmarks.synthesis_benchmark import load_baseline
+from tests.benchmarks.synthesis_benchmark import memory_synthesis
+from tests.benchmarks.synthesis_benchmark import synthesis_cases
+from tests.benchmarks.synthesis_benchmark import synthesize
+from tests.benchmarks.synthesis_benchmark import time_synthesis
+
+pytestmark = [pytest.mark.benchmark]
+
+BASELINE = load_baseline()
+
+
+@pytest.fixture(scope="module")
+def calibration():
+    return calibrate()
+
+
+@pytest.mark.parametrize("antenna", antenna_classes())
+def test_synthesis_grid(antenna):
+    for case in synthesis_cases(antenna):
+        oantenna = synthesize(antenna, case)
+
+        assert oantenna.synthesis_parameters.__dict__
+
+
+@pytest.mark.parametrize("antenna", antenna_classes())
+def test_synthesis_benchmark(antenna, calibration):
+    result = {**time_synthesis(antenna, repeat=3), **memory_synthesis(antenna)}
+
+    assert not check_regression(antenna, result, calibration, BASELINE)
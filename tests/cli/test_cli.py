@@ -82,10 +82,23 @@ def mocked_cli_backend(monkeypatch: pytest.MonkeyPatch) -> dict:
             state["connect_design_called_with"] = design_type
             return state["connect_design_result"]
 
-        def get_antenna(self, class_name: str, synth_only: bool):
+        def get_antenna(self, class_name: str, synth_only: bool, synthesis: dict = None):
             state["get_antenna_called_with"] = (class_name, synth_only)
+            for key, value in (synthesis or {}).items():
+                if hasattr(properties.antenna.synthesis, key):
+                    setattr(properties.antenna.synthesis, key, value)
             return state["result"]
 
+        def optimize(self, config: dict):
+            state["optimize_called_with"] = config
+            return {
+                "parameters": {**state["result"], "arm_length": 20.1},
+                "cost": 0.0,
+                "evaluations": 12,
+                "solved": 9,
+                "stopped": "target",
+            }
+
     api_module = ModuleType("ansys.aedt.toolkits.antenna.backend.api")
     api_module.ToolkitBackend = DummyToolkitBackend
 
@@ -516,3 +529,87 @@ def test_create_command_supports_json_mode_and_param_sections(
     assert properties.antenna.setup.component_3d is True
     assert properties.antenna.setup.lattice_pair is True
     assert properties.antenna.setup.sweep == 15
+
+
+def test_history_command_displays_previous_analyses(runner: CliRunner, tmp_path: Path):
+    from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+
+    history_file = tmp_path / "history.jsonl"
+    history = AnalysisHistory(history_file)
+    record = history.add("BowTieNormal", {"frequency": 2.4}, adaptive_passes=3, delta_s=0.018, elapsed=12.5)
+    history.add("Conical", {"frequency": 5.0}, adaptive_passes=5)
+
+    result = runner.invoke(cli.antenna_app, ["history", "bowtie", "--history-file", str(history_file)])
+
+    assert result.exit_code == 0
+    assert record["key"] in result.output
+    assert "Conical" not in result.output
+
+    empty_result = runner.invoke(cli.antenna_app, ["history", "--history-file", str(tmp_path / "empty.jsonl")])
+
+    assert empty_result.exit_code == 0
+    assert "No analyses found" in empty_result.output
+
+
+def test_synthesize_command_writes_trace(runner: CliRunner, mocked_cli_backend: dict, tmp_path: Path):
+    trace_file = tmp_path / "trace.json"
+
+    result = runner.invoke(cli.antenna_app, ["synthesize", "bowtie", "--trace", str(trace_file)])
+
+    assert result.exit_code == 0
+    assert "traceEvents" in json.loads(trace_file.read_text())
+
+
+def test_predict_command_uses_previous_analyses(runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    from ansys.aedt.toolkits.antenna.backend.analysis_history import AnalysisHistory
+    from ansys.aedt.toolkits.antenna.backend.models import properties
+
+    monkeypatch.setattr(properties.antenna.setup, "history_file", "")
+    monkeypatch.setattr(properties.antenna.setup, "surrogate_file", str(tmp_path / "surrogate_models.json"))
+
+    history_file = tmp_path / "history.jsonl"
+    history = AnalysisHistory(history_file)
+    for frequency in (2.0, 3.0, 4.0, 5.0, 6.0):
+        history.add(
+            "BowTieNormal",
+            {"frequency": frequency, "frequency_unit": "GHz"},
+            resonant_frequency=0.9 * frequency,
+            peak_gain=2.0,
+        )
+
+    result = runner.invoke(
+        cli.antenna_app, ["predict", "bowtie", "--frequency", "3.5", "--history-file", str(history_file)]
+    )
+
+    assert result.exit_code == 0
+    assert "resonant_frequency" in result.output
+    assert "3.15" in result.output
+
+    empty_result = runner.invoke(
+        cli.antenna_app, ["predict", "RectangularPatchProbe", "--history-file", str(tmp_path / "empty.jsonl")]
+    )
+
+    assert empty_result.exit_code == 1
+    assert "Not enough simulated" in empty_result.output
+
+
+def test_optimize_command_creates_and_optimizes_antenna(runner: CliRunner, mocked_cli_backend: dict, tmp_path: Path):
+    goals_file = tmp_path / "goals.json"
+    goals_file.write_text(
+        json.dumps({"variables": {"arm_length": [15.0, 25.0]}, "goals": ["S11 < -10 dB over 2.4-2.5 GHz"]}),
+        encoding="utf-8",
+    )
+
+    result = runner.invoke(
+        cli.antenna_app, ["optimize", "bowtie", "--port", "50051", "--goals", str(goals_file), "--frequency", "2.45"]
+    )
+
+    properties = mocked_cli_backend["properties"]
+
+    assert result.exit_code == 0
+    assert mocked_cli_backend["get_antenna_called_with"] == ("BowTieNormal", False)
+    assert mocked_cli_backend["optimize_called_with"]["goals"] == ["S11 < -10 dB over 2.4-2.5 GHz"]
+    assert properties.antenna.setup.create_setup is True
+    assert properties.antenna.synthesis.frequency == 2.45
+    assert "20.1" in result.output
+    assert "12 (9 solved)" in result.output